@@ -35,7 +35,12 @@ from typing import (
 )
 
 from aea.agent import Agent
-from aea.agent_loop import AsyncAgentLoop, BaseAgentLoop, SyncAgentLoop
+from aea.agent_loop import (
+    AsyncAgentLoop,
+    BaseAgentLoop,
+    SyncAgentLoop,
+    TimerWheelAgentLoop,
+)
 from aea.configurations.base import PublicId
 from aea.configurations.constants import (
     DEFAULT_BUILD_DIR_NAME,
@@ -52,7 +57,9 @@ from aea.helpers.exception_policy import ExceptionPolicyEnum
 from aea.helpers.logging import AgentLoggerAdapter, WithLogger, get_logger
 from aea.identity.base import Identity
 from aea.mail.base import Envelope
-from aea.protocols.base import Message, Protocol
+from aea.multiplexer import BackpressurePolicyEnum
+from aea.protocols.base import DecodedMessageCache, Message, Protocol
+from aea.protocols.dialogue.base import Dialogues, PersistDialoguesStorage
 from aea.registries.filter import Filter
 from aea.registries.resources import Resources
 from aea.skills.base import Behaviour, Handler
@@ -64,6 +71,7 @@ class AEA(Agent):
     RUN_LOOPS: Dict[str, Type[BaseAgentLoop]] = {
         "async": AsyncAgentLoop,
         "sync": SyncAgentLoop,
+        "timer_wheel": TimerWheelAgentLoop,
     }
     DEFAULT_RUN_LOOP: str = "async"
 
@@ -95,6 +103,11 @@ class AEA(Agent):
         search_service_address: str = DEFAULT_SEARCH_SERVICE_ADDRESS,
         storage_uri: Optional[str] = None,
         task_manager_mode: Optional[str] = None,
+        decoded_message_cache_size: int = 0,
+        multiplexer_batch_size: int = 1,
+        send_queue_high_watermark: Optional[int] = None,
+        send_queue_low_watermark: Optional[int] = None,
+        backpressure_policy: BackpressurePolicyEnum = BackpressurePolicyEnum.block,
         **kwargs: Any,
     ) -> None:
         """
@@ -124,6 +137,11 @@ class AEA(Agent):
         :param search_service_address: the address of the search service used.
         :param storage_uri: optional uri to set generic storage
         :param task_manager_mode: task manager mode (threaded) to run tasks with.
+        :param decoded_message_cache_size: the maximum number of decoded messages to cache, 0 disables the cache.
+        :param multiplexer_batch_size: the maximum number of envelopes the multiplexer processes per wakeup of its send and receive loops.
+        :param send_queue_high_watermark: if set, every connection gets its own send queue, full once it holds this many envelopes.
+        :param send_queue_low_watermark: the number of envelopes down to which a full send queue must drain to accept envelopes again.
+        :param backpressure_policy: the policy applied when putting an envelope for a connection whose send queue is full.
         :param kwargs: keyword arguments to be attached in the agent context namespace.
         """
 
@@ -174,10 +192,19 @@ class AEA(Agent):
                 default_routing=default_routing,
                 default_connection=default_connection,
                 protocols=self.resources.get_all_protocols(),
+                batch_size=multiplexer_batch_size,
+                send_queue_high_watermark=send_queue_high_watermark,
+                send_queue_low_watermark=send_queue_low_watermark,
+                backpressure_policy=backpressure_policy,
             ),
         )
 
         self.max_reactions = max_reactions
+        self._decoded_message_cache: Optional[DecodedMessageCache] = (
+            DecodedMessageCache(decoded_message_cache_size)
+            if decoded_message_cache_size > 0
+            else None
+        )
 
         if decision_maker_handler_class is None:
             from aea.decision_maker.default import (  # isort:skip  # pylint: disable=import-outside-toplevel
@@ -230,6 +257,7 @@ class AEA(Agent):
         self._filter = Filter(
             self.resources, self.runtime.decision_maker.message_out_queue
         )
+        self._subscribe_to_behaviours_updates(self.resources)
 
         self._setup_loggers()
 
@@ -251,13 +279,22 @@ class AEA(Agent):
     @resources.setter
     def resources(self, resources: "Resources") -> None:
         """Set resources."""
+        self._resources.behaviour_registry.remove_callback(
+            self._on_behaviour_registry_update
+        )
         self._resources = resources
+        self._subscribe_to_behaviours_updates(resources)
 
     @property
     def filter(self) -> Filter:
         """Get the filter."""
         return self._filter
 
+    @property
+    def decoded_message_cache(self) -> Optional[DecodedMessageCache]:
+        """Get the decoded message cache, if enabled."""
+        return self._decoded_message_cache
+
     @property
     def active_behaviours(self) -> List[Behaviour]:
         """Get all active behaviours to use in act."""
@@ -285,7 +322,7 @@ class AEA(Agent):
 
     def _get_msg_and_handlers_for_envelope(
         self, envelope: Envelope
-    ) -> Tuple[Optional[Message], List[Handler]]:
+    ) -> Tuple[Optional[Message], Sequence[Handler]]:
         """Get the msg and its handlers."""
         protocol = self.resources.get_protocol_by_specification_id(
             envelope.protocol_specification_id
@@ -306,7 +343,7 @@ class AEA(Agent):
         envelope: Envelope,
         protocol: Protocol,
         error_handler: AbstractErrorHandler,
-    ) -> Tuple[Optional[Message], List[Handler]]:
+    ) -> Tuple[Optional[Message], Sequence[Handler]]:
 
         handlers = self.filter.get_active_handlers(
             protocol.public_id, envelope.to_as_public_id
@@ -321,11 +358,16 @@ class AEA(Agent):
             error_handler.send_no_active_handler(envelope, reason, self.logger)
             return None, []
 
-        if isinstance(envelope.message, Message):
-            msg = envelope.message
+        msg = envelope.message_object
+        if msg is not None:
             return msg, handlers
         try:
-            msg = protocol.serializer.decode(envelope.message)
+            if self._decoded_message_cache is None:
+                msg = protocol.serializer.decode(envelope.message_bytes)
+            else:
+                msg = self._decoded_message_cache.decode(
+                    protocol.public_id, protocol.serializer, envelope.message_bytes
+                )
             msg.sender = envelope.sender
             msg.to = envelope.to
             return msg, handlers
@@ -348,7 +390,7 @@ class AEA(Agent):
         :param envelope: the envelope to handle.
         :return: None
         """
-        self.logger.debug("Handling envelope: {}".format(envelope))
+        self.logger.debug("Handling envelope: %s", envelope)
         msg, handlers = self._get_msg_and_handlers_for_envelope(envelope)
 
         if msg is None:
@@ -383,9 +425,43 @@ class AEA(Agent):
         :return: dict of callable with period specified
         """
         tasks = super().get_periodic_tasks()
+        tasks[self._flush_dialogues] = (
+            PersistDialoguesStorage.WRITE_BEHIND_FLUSH_INTERVAL,
+            None,
+        )
         tasks.update(self._get_behaviours_tasks())
         return tasks
 
+    def _flush_dialogues(self) -> None:
+        """Write the changed dialogues of the skills to the generic storage when due, so the changes of an idle agent are persisted."""
+        for model in self.resources.model_registry.fetch_all():
+            if isinstance(model, Dialogues):
+                model.flush_if_due()
+
+    def _subscribe_to_behaviours_updates(self, resources: Resources) -> None:
+        """
+        Forward the registrations and unregistrations of behaviours to the agent loop.
+
+        The behaviours already registered are forwarded too.
+
+        :param resources: the resources of the agent.
+        """
+        resources.behaviour_registry.add_callback(self._on_behaviour_registry_update)
+        for behaviour in resources.behaviour_registry.fetch_all():
+            self._on_behaviour_registry_update(behaviour, True)
+
+    def _on_behaviour_registry_update(
+        self, behaviour: Behaviour, is_registered: bool
+    ) -> None:
+        """
+        Notify the agent loop of a behaviour registered or unregistered.
+
+        :param behaviour: the behaviour.
+        :param is_registered: True if the behaviour was registered, False otherwise.
+        """
+        agent_loop = cast(AsyncAgentLoop, self.runtime.agent_loop)
+        agent_loop.update_behaviour(behaviour, is_registered)
+
     def _get_behaviours_tasks(
         self,
     ) -> Dict[Callable, Tuple[float, Optional[datetime.datetime]]]:
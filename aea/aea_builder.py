@@ -99,6 +99,7 @@ from aea.helpers.install_dependency import install_dependency
 from aea.helpers.io import open_file
 from aea.helpers.logging import AgentLoggerAdapter, WithLogger, get_logger
 from aea.identity.base import Identity
+from aea.multiplexer import BackpressurePolicyEnum
 from aea.registries.resources import Resources
 
 
@@ -310,6 +311,9 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
     DEFAULT_AGENT_ACT_PERIOD = 0.05  # seconds
     DEFAULT_EXECUTION_TIMEOUT = 0
     DEFAULT_MAX_REACTIONS = 20
+    DEFAULT_DECODED_MESSAGE_CACHE_SIZE = 0
+    DEFAULT_MULTIPLEXER_BATCH_SIZE = 1
+    DEFAULT_BACKPRESSURE_POLICY = BackpressurePolicyEnum.block
     DEFAULT_SKILL_EXCEPTION_POLICY = ExceptionPolicyEnum.propagate
     DEFAULT_CONNECTION_EXCEPTION_POLICY = ExceptionPolicyEnum.propagate
     DEFAULT_LOOP_MODE = "async"
@@ -388,6 +392,11 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
         self._period: Optional[float] = None
         self._execution_timeout: Optional[float] = None
         self._max_reactions: Optional[int] = None
+        self._decoded_message_cache_size: Optional[int] = None
+        self._multiplexer_batch_size: Optional[int] = None
+        self._send_queue_high_watermark: Optional[int] = None
+        self._send_queue_low_watermark: Optional[int] = None
+        self._backpressure_policy: Optional[BackpressurePolicyEnum] = None
         self._decision_maker_handler_class: Optional[Type[DecisionMakerHandler]] = None
         self._decision_maker_handler_dotted_path: Optional[str] = None
         self._decision_maker_handler_file_path: Optional[str] = None
@@ -452,6 +461,71 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
         self._max_reactions = max_reactions
         return self
 
+    def set_decoded_message_cache_size(
+        self, decoded_message_cache_size: Optional[int]
+    ) -> "AEABuilder":
+        """
+        Set the maximum number of decoded messages the agent caches.
+
+        :param decoded_message_cache_size: the cache size, 0 disables the cache.
+
+        :return: self
+        """
+        self._decoded_message_cache_size = decoded_message_cache_size
+        return self
+
+    def set_multiplexer_batch_size(
+        self, multiplexer_batch_size: Optional[int]
+    ) -> "AEABuilder":
+        """
+        Set the maximum number of envelopes the multiplexer processes per wakeup of its send and receive loops.
+
+        :param multiplexer_batch_size: the batch size, 1 processes envelopes one by one.
+
+        :return: self
+        """
+        self._multiplexer_batch_size = multiplexer_batch_size
+        return self
+
+    def set_send_queue_high_watermark(
+        self, send_queue_high_watermark: Optional[int]
+    ) -> "AEABuilder":
+        """
+        Set the number of envelopes at which the send queue of a connection becomes full.
+
+        :param send_queue_high_watermark: the high watermark, if None the connections share the multiplexer send queue.
+
+        :return: self
+        """
+        self._send_queue_high_watermark = send_queue_high_watermark
+        return self
+
+    def set_send_queue_low_watermark(
+        self, send_queue_low_watermark: Optional[int]
+    ) -> "AEABuilder":
+        """
+        Set the number of envelopes down to which a full send queue must drain to accept envelopes again.
+
+        :param send_queue_low_watermark: the low watermark, if None half the high watermark.
+
+        :return: self
+        """
+        self._send_queue_low_watermark = send_queue_low_watermark
+        return self
+
+    def set_backpressure_policy(
+        self, backpressure_policy: Optional[BackpressurePolicyEnum]
+    ) -> "AEABuilder":
+        """
+        Set the policy applied when putting an envelope for a connection whose send queue is full.
+
+        :param backpressure_policy: the policy
+
+        :return: self
+        """
+        self._backpressure_policy = backpressure_policy
+        return self
+
     def set_decision_maker_handler_details(
         self,
         decision_maker_handler_dotted_path: str,
@@ -1375,6 +1449,11 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
             connection_ids=connection_ids,
             search_service_address=self._get_search_service_address(),
             storage_uri=self._get_storage_uri(),
+            decoded_message_cache_size=self._get_decoded_message_cache_size(),
+            multiplexer_batch_size=self._get_multiplexer_batch_size(),
+            send_queue_high_watermark=self._send_queue_high_watermark,
+            send_queue_low_watermark=self._send_queue_low_watermark,
+            backpressure_policy=self._get_backpressure_policy(),
             **deepcopy(self._context_namespace),
         )
         self._load_and_add_components(
@@ -1433,6 +1512,42 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
             else self.DEFAULT_MAX_REACTIONS
         )
 
+    def _get_decoded_message_cache_size(self) -> int:
+        """
+        Return the decoded message cache size.
+
+        :return: the decoded message cache size if set else default value.
+        """
+        return (
+            self._decoded_message_cache_size
+            if self._decoded_message_cache_size is not None
+            else self.DEFAULT_DECODED_MESSAGE_CACHE_SIZE
+        )
+
+    def _get_multiplexer_batch_size(self) -> int:
+        """
+        Return the multiplexer batch size.
+
+        :return: the multiplexer batch size if set else default value.
+        """
+        return (
+            self._multiplexer_batch_size
+            if self._multiplexer_batch_size is not None
+            else self.DEFAULT_MULTIPLEXER_BATCH_SIZE
+        )
+
+    def _get_backpressure_policy(self) -> BackpressurePolicyEnum:
+        """
+        Return the backpressure policy.
+
+        :return: the backpressure policy if set else default value.
+        """
+        return (
+            self._backpressure_policy
+            if self._backpressure_policy is not None
+            else self.DEFAULT_BACKPRESSURE_POLICY
+        )
+
     def _get_error_handler_class(self,) -> Optional[Type]:
         """
         Return the error handler class.
@@ -1720,6 +1835,18 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
         self.set_period(agent_configuration.period)
         self.set_execution_timeout(agent_configuration.execution_timeout)
         self.set_max_reactions(agent_configuration.max_reactions)
+        self.set_decoded_message_cache_size(
+            agent_configuration.decoded_message_cache_size
+        )
+        self.set_multiplexer_batch_size(agent_configuration.multiplexer_batch_size)
+        self.set_send_queue_high_watermark(
+            agent_configuration.send_queue_high_watermark
+        )
+        self.set_send_queue_low_watermark(agent_configuration.send_queue_low_watermark)
+        if agent_configuration.backpressure_policy is not None:
+            self.set_backpressure_policy(
+                BackpressurePolicyEnum(agent_configuration.backpressure_policy)
+            )
 
         if agent_configuration.decision_maker_handler != {}:
             dotted_path = agent_configuration.decision_maker_handler["dotted_path"]
@@ -24,19 +24,39 @@ from asyncio import CancelledError
 from asyncio.events import AbstractEventLoop
 from asyncio.queues import Queue
 from asyncio.tasks import Task
+from collections import deque
 from contextlib import suppress
 from enum import Enum
 from functools import partial
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 from aea.abstract_agent import AbstractAgent
 from aea.configurations.constants import LAUNCH_SUCCEED_MESSAGE
 from aea.exceptions import AEAException
-from aea.helpers.async_utils import AsyncState, PeriodicCaller, Runnable
-from aea.helpers.exec_timeout import ExecTimeoutThreadGuard, TimeoutException
+from aea.helpers.async_utils import (
+    AsyncState,
+    PeriodicCaller,
+    Runnable,
+    TimerWheel,
+    WheelPeriodicCaller,
+)
+from aea.helpers.exec_timeout import ExecTimeoutWatchdog, TimeoutException
 from aea.helpers.logging import WithLogger, get_logger
 from aea.mail.base import Envelope, EnvelopeContext
 from aea.protocols.base import Message
+from aea.skills.base import Behaviour
 
 
 class AgentLoopException(AEAException):
@@ -113,12 +133,12 @@ class BaseAgentLoop(Runnable, WithLogger, ABC):
     def _setup(self) -> None:  # pylint: disable=no-self-use
         """Set up agent loop before started."""
         # start and stop methods are classmethods cause one instance shared across multiple threads
-        ExecTimeoutThreadGuard.start()
+        ExecTimeoutWatchdog.start()
 
     def _teardown(self) -> None:  # pylint: disable=no-self-use
         """Tear down loop on stop."""
         # start and stop methods are classmethods cause one instance shared across multiple threads
-        ExecTimeoutThreadGuard.stop()
+        ExecTimeoutWatchdog.stop()
 
     async def run(self) -> None:
         """Run agent loop."""
@@ -182,7 +202,9 @@ class BaseAgentLoop(Runnable, WithLogger, ABC):
 class AsyncAgentLoop(BaseAgentLoop):
     """Asyncio based agent loop suitable only for AEA."""
 
-    NEW_BEHAVIOURS_PROCESS_SLEEP = 1  # check new behaviours registered every second.
+    NEW_BEHAVIOURS_PROCESS_SLEEP = (
+        1  # check behaviours of inactive skills every second.
+    )
 
     def __init__(
         self,
@@ -200,13 +222,20 @@ class AsyncAgentLoop(BaseAgentLoop):
         super().__init__(agent=agent, loop=loop, threaded=threaded)
         self._agent: AbstractAgent = self._agent
 
-        self._periodic_tasks: Dict[Callable, PeriodicCaller] = {}
+        self._periodic_tasks: Dict[
+            Callable, Union[PeriodicCaller, WheelPeriodicCaller]
+        ] = {}
+        self._periodic_behaviours: Dict[Callable, Behaviour] = {}
+        self._inactive_behaviours: Set[Behaviour] = set()
+        self._behaviours_updates: Deque[Tuple[Behaviour, bool]] = deque()
+        self._behaviours_updated: Optional[asyncio.Event] = None
         self._skill2skill_message_queue: Optional[asyncio.Queue] = None
 
     def _setup(self) -> None:
         """Set up agent loop before started."""
         super()._setup()
         self._skill2skill_message_queue = asyncio.Queue()
+        self._behaviours_updated = asyncio.Event()
 
     @property
     def skill2skill_queue(self) -> Queue:
@@ -279,7 +308,7 @@ class AsyncAgentLoop(BaseAgentLoop):
         execution_timeout = getattr(self.agent, "_execution_timeout", 0)
 
         try:
-            with ExecTimeoutThreadGuard(execution_timeout):
+            with ExecTimeoutWatchdog(execution_timeout):
                 return fn(*(args or []), **(kwargs or {}))
         except TimeoutException:  # pragma: nocover
             self.logger.warning(
@@ -312,20 +341,39 @@ class AsyncAgentLoop(BaseAgentLoop):
 
         :return: None
         """
-        if task_callable in self._periodic_tasks:  # pragma: nocover
+        if task_callable in self._periodic_tasks:
             # already registered
             return
 
-        periodic_caller = PeriodicCaller(
-            partial(self._execution_control, task_callable),
+        behaviour = getattr(task_callable, "__self__", None)
+        if isinstance(behaviour, Behaviour):
+            self._periodic_behaviours[task_callable] = behaviour
+
+        periodic_caller = self._make_periodic_caller(
+            partial(self._run_periodic_task, task_callable), period, start_at
+        )
+        self._periodic_tasks[task_callable] = periodic_caller
+        periodic_caller.start()
+        self.logger.debug("Periodic task %s registered.", task_callable)
+
+    def _make_periodic_caller(
+        self, callback: Callable, period: float, start_at: Optional[datetime.datetime],
+    ) -> Union[PeriodicCaller, WheelPeriodicCaller]:
+        """
+        Make a periodic caller, not started.
+
+        :param callback: function to call periodically
+        :param period: float in seconds
+        :param start_at: optional datetime, when to run task for the first time, otherwise call it right now
+        :return: the periodic caller.
+        """
+        return PeriodicCaller(
+            callback,
             period=period,
             start_at=start_at,
             exception_callback=self._periodic_task_exception_callback,
             loop=self._loop,
         )
-        self._periodic_tasks[task_callable] = periodic_caller
-        periodic_caller.start()
-        self.logger.debug(f"Periodic task {task_callable} registered.")
 
     def _register_periodic_tasks(self) -> None:
         """Register all AEA related periodic tasks."""
@@ -342,11 +390,81 @@ class AsyncAgentLoop(BaseAgentLoop):
         :param task_callable: function to be called periodically.
         :return: None
         """
+        self._periodic_behaviours.pop(task_callable, None)
         periodic_caller = self._periodic_tasks.pop(task_callable, None)
-        if periodic_caller is None:  # pragma: nocover
+        if periodic_caller is None:
             return
         periodic_caller.stop()
 
+    def _run_periodic_task(self, task_callable: Callable) -> None:
+        """
+        Run a periodic task.
+
+        A behaviour acts only while its skill is active and it is not done:
+        otherwise its task is unregistered, or put aside until the skill is
+        active again.
+
+        :param task_callable: function to be called
+        :return: None
+        """
+        behaviour = self._periodic_behaviours.get(task_callable, None)
+        if behaviour is None:
+            self._execution_control(task_callable)
+            return
+        if not behaviour.context.is_active:
+            self._unregister_periodic_task(task_callable)
+            self._inactive_behaviours.add(behaviour)
+            self._wake_up_behaviours_updates()
+        elif self._execution_control(behaviour.is_done):
+            self._unregister_periodic_task(task_callable)
+        else:
+            self._execution_control(task_callable)
+
+    def update_behaviour(self, behaviour: Behaviour, is_registered: bool) -> None:
+        """
+        Notify the loop that a behaviour was registered or unregistered.
+
+        It is safe to call it from any thread, the update is applied by the loop.
+
+        :param behaviour: the behaviour.
+        :param is_registered: True if the behaviour was registered, False otherwise.
+        """
+        self._behaviours_updates.append((behaviour, is_registered))
+        self._wake_up_behaviours_updates()
+
+    def _wake_up_behaviours_updates(self) -> None:
+        """Wake up the task applying the behaviours updates."""
+        if self._behaviours_updated is None:
+            return
+        with suppress(RuntimeError):  # the event loop is closed
+            self._loop.call_soon_threadsafe(self._behaviours_updated.set)
+
+    def _register_behaviour(self, behaviour: Behaviour) -> None:
+        """Register the periodic task of a behaviour if it is not done yet."""
+        if behaviour.is_done():
+            return
+        if not behaviour.context.is_active:
+            self._inactive_behaviours.add(behaviour)
+            return
+        self._register_periodic_task(
+            behaviour.act_wrapper, behaviour.tick_interval, behaviour.start_at
+        )
+
+    def _apply_behaviours_updates(self) -> None:
+        """Apply the pending behaviours updates and resume the behaviours of skills active again."""
+        while self._behaviours_updates:
+            behaviour, is_registered = self._behaviours_updates.popleft()
+            if is_registered:
+                self._register_behaviour(behaviour)
+            else:
+                self._inactive_behaviours.discard(behaviour)
+                self._unregister_periodic_task(behaviour.act_wrapper)
+
+        for behaviour in list(self._inactive_behaviours):
+            if behaviour.context.is_active:
+                self._inactive_behaviours.discard(behaviour)
+                self._register_behaviour(behaviour)
+
     def _stop_all_behaviours(self) -> None:
         """Unregister periodic execution of all registered behaviours."""
         for task_callable in list(self._periodic_tasks.keys()):
@@ -412,10 +530,72 @@ class AsyncAgentLoop(BaseAgentLoop):
         await asyncio.gather(*coros)
 
     async def _task_register_periodic_tasks(self) -> None:
-        """Process new behaviours added to skills in runtime."""
+        """Register the periodic tasks and keep them up to date with the behaviours updates."""
+        behaviours_updated = cast(asyncio.Event, self._behaviours_updated)
+        self._register_periodic_tasks()
         while self.is_running:
-            self._register_periodic_tasks()  # re register, cause new may appear
-            await asyncio.sleep(self.NEW_BEHAVIOURS_PROCESS_SLEEP)
+            self._apply_behaviours_updates()
+            if self._inactive_behaviours:
+                # skills can be activated again, with no notification
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(
+                        behaviours_updated.wait(), self.NEW_BEHAVIOURS_PROCESS_SLEEP
+                    )
+            else:
+                await behaviours_updated.wait()
+            behaviours_updated.clear()
+
+
+class TimerWheelAgentLoop(AsyncAgentLoop):
+    """Asyncio based agent loop scheduling all the periodic tasks with one timer wheel."""
+
+    TIMER_WHEEL_TICK = 0.01
+
+    def __init__(
+        self,
+        agent: AbstractAgent,
+        loop: AbstractEventLoop = None,
+        threaded: bool = False,
+    ) -> None:
+        """
+        Init agent loop.
+
+        :param agent: AEA instance
+        :param loop: asyncio loop to use. optional
+        :param threaded: is a new thread to be started for the agent loop
+        """
+        super().__init__(agent=agent, loop=loop, threaded=threaded)
+        self._timer_wheel: Optional[TimerWheel] = None
+
+    @property
+    def timer_wheel(self) -> TimerWheel:
+        """Get the timer wheel, with its statistics."""
+        if self._timer_wheel is None:  # pragma: nocover
+            raise ValueError("Timer wheel is not set!")
+        return self._timer_wheel
+
+    def _setup(self) -> None:
+        """Set up agent loop before started."""
+        super()._setup()
+        self._timer_wheel = TimerWheel(tick=self.TIMER_WHEEL_TICK, loop=self._loop)
+
+    def _make_periodic_caller(
+        self, callback: Callable, period: float, start_at: Optional[datetime.datetime],
+    ) -> Union[PeriodicCaller, WheelPeriodicCaller]:
+        """
+        Make a periodic caller scheduled by the timer wheel, not started.
+
+        :param callback: function to call periodically
+        :param period: float in seconds
+        :param start_at: optional datetime, when to run task for the first time, otherwise call it right now
+        :return: the periodic caller.
+        """
+        return self.timer_wheel.call_periodic(
+            callback,
+            period=period,
+            start_at=start_at,
+            exception_callback=self._periodic_task_exception_callback,
+        )
 
 
 SyncAgentLoop = AsyncAgentLoop  # temporary solution!
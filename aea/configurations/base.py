@@ -759,9 +759,16 @@ class ProtocolConfig(ComponentConfiguration):
     default_configuration_filename = DEFAULT_PROTOCOL_CONFIG_FILE
     package_type = PackageType.PROTOCOL
     schema = "protocol-config_schema.json"
-    FIELDS_ALLOWED_TO_UPDATE: FrozenSet[str] = frozenset()
+    FIELDS_ALLOWED_TO_UPDATE: FrozenSet[str] = frozenset(
+        ["check_consistency_on_decode"]
+    )
 
-    __slots__ = ("dependencies", "description", "protocol_specification_id")
+    __slots__ = (
+        "dependencies",
+        "description",
+        "protocol_specification_id",
+        "check_consistency_on_decode",
+    )
 
     def __init__(
         self,
@@ -777,6 +784,7 @@ class ProtocolConfig(ComponentConfiguration):
         dependencies: Optional[Dependencies] = None,
         description: str = "",
         protocol_specification_id: Optional[str] = None,
+        check_consistency_on_decode: Optional[bool] = None,
     ) -> None:
         """Initialize a connection configuration object."""
         super().__init__(
@@ -800,6 +808,7 @@ class ProtocolConfig(ComponentConfiguration):
         self.protocol_specification_id = PublicId.from_str(
             str(protocol_specification_id)
         )
+        self.check_consistency_on_decode = check_consistency_on_decode
 
     @property
     def json(self) -> Dict:
@@ -823,6 +832,8 @@ class ProtocolConfig(ComponentConfiguration):
             result["build_entrypoint"] = self.build_entrypoint
         if self.build_directory:
             result["build_directory"] = self.build_directory
+        if self.check_consistency_on_decode is not None:
+            result["check_consistency_on_decode"] = self.check_consistency_on_decode
         return result
 
     @classmethod
@@ -847,6 +858,9 @@ class ProtocolConfig(ComponentConfiguration):
             build_directory=cast(Optional[str], obj.get("build_directory")),
             dependencies=dependencies,
             description=cast(str, obj.get("description", "")),
+            check_consistency_on_decode=cast(
+                Optional[bool], obj.get("check_consistency_on_decode")
+            ),
         )
         instance = cast(ProtocolConfig, cls._apply_params_to_instance(params, instance))
 
@@ -1146,6 +1160,11 @@ class AgentConfig(PackageConfiguration):
             "timeout",
             "period",
             "max_reactions",
+            "decoded_message_cache_size",
+            "multiplexer_batch_size",
+            "send_queue_high_watermark",
+            "send_queue_low_watermark",
+            "backpressure_policy",
             "skill_exception_policy",
             "connection_exception_policy",
             "default_connection",
@@ -1182,6 +1201,11 @@ class AgentConfig(PackageConfiguration):
         "period",
         "execution_timeout",
         "max_reactions",
+        "decoded_message_cache_size",
+        "multiplexer_batch_size",
+        "send_queue_high_watermark",
+        "send_queue_low_watermark",
+        "backpressure_policy",
         "skill_exception_policy",
         "connection_exception_policy",
         "error_handler",
@@ -1210,6 +1234,11 @@ class AgentConfig(PackageConfiguration):
         period: Optional[float] = None,
         execution_timeout: Optional[float] = None,
         max_reactions: Optional[int] = None,
+        decoded_message_cache_size: Optional[int] = None,
+        multiplexer_batch_size: Optional[int] = None,
+        send_queue_high_watermark: Optional[int] = None,
+        send_queue_low_watermark: Optional[int] = None,
+        backpressure_policy: Optional[str] = None,
         error_handler: Optional[Dict] = None,
         decision_maker_handler: Optional[Dict] = None,
         skill_exception_policy: Optional[str] = None,
@@ -1268,6 +1297,11 @@ class AgentConfig(PackageConfiguration):
         self.period: Optional[float] = period
         self.execution_timeout: Optional[float] = execution_timeout
         self.max_reactions: Optional[int] = max_reactions
+        self.decoded_message_cache_size: Optional[int] = decoded_message_cache_size
+        self.multiplexer_batch_size: Optional[int] = multiplexer_batch_size
+        self.send_queue_high_watermark: Optional[int] = send_queue_high_watermark
+        self.send_queue_low_watermark: Optional[int] = send_queue_low_watermark
+        self.backpressure_policy: Optional[str] = backpressure_policy
 
         self.skill_exception_policy: Optional[str] = skill_exception_policy
         self.connection_exception_policy: Optional[str] = connection_exception_policy
@@ -1414,6 +1448,16 @@ class AgentConfig(PackageConfiguration):
             config["execution_timeout"] = self.execution_timeout
         if self.max_reactions is not None:
             config["max_reactions"] = self.max_reactions
+        if self.decoded_message_cache_size is not None:
+            config["decoded_message_cache_size"] = self.decoded_message_cache_size
+        if self.multiplexer_batch_size is not None:
+            config["multiplexer_batch_size"] = self.multiplexer_batch_size
+        if self.send_queue_high_watermark is not None:
+            config["send_queue_high_watermark"] = self.send_queue_high_watermark
+        if self.send_queue_low_watermark is not None:
+            config["send_queue_low_watermark"] = self.send_queue_low_watermark
+        if self.backpressure_policy is not None:
+            config["backpressure_policy"] = self.backpressure_policy
         if self.error_handler != {}:
             config["error_handler"] = self.error_handler
         if self.decision_maker_handler != {}:
@@ -1459,6 +1503,11 @@ class AgentConfig(PackageConfiguration):
             period=cast(float, obj.get("period")),
             execution_timeout=cast(float, obj.get("execution_timeout")),
             max_reactions=cast(int, obj.get("max_reactions")),
+            decoded_message_cache_size=cast(int, obj.get("decoded_message_cache_size")),
+            multiplexer_batch_size=cast(int, obj.get("multiplexer_batch_size")),
+            send_queue_high_watermark=cast(int, obj.get("send_queue_high_watermark")),
+            send_queue_low_watermark=cast(int, obj.get("send_queue_low_watermark")),
+            backpressure_policy=cast(str, obj.get("backpressure_policy")),
             error_handler=cast(Dict, obj.get("error_handler", {})),
             decision_maker_handler=cast(Dict, obj.get("decision_maker_handler", {})),
             skill_exception_policy=cast(str, obj.get("skill_exception_policy")),
@@ -30,6 +30,7 @@ from typing import (
     Optional,
     Set,
     Tuple,
+    Type,
     TypeVar,
     Union,
     cast,
@@ -226,9 +227,15 @@ class PublicId(JSONSerializable):
     <author/my_package:latest>
     >>> latest_public_id.package_version.is_latest
     True
+
+    Public ids are immutable: their string form and hash are computed once, and
+    the public ids parsed from the same string are the same object.
+
+    >>> PublicId.from_str("author/my_package:0.1.0") is PublicId.from_str("author/my_package:0.1.0")
+    True
     """
 
-    __slots__ = ("_author", "_name", "_package_version")
+    __slots__ = ("_author", "_name", "_package_version", "_str", "_hash")
 
     AUTHOR_REGEX = SIMPLE_ID_REGEX
     PACKAGE_NAME_REGEX = SIMPLE_ID_REGEX
@@ -242,6 +249,9 @@ class PublicId(JSONSerializable):
     ANY_VERSION = "any"
     LATEST_VERSION = "latest"
 
+    # maximum number of distinct strings to public ids parsing results kept
+    FROM_STR_CACHE_SIZE = 1024
+
     def __init__(
         self,
         author: SimpleIdOrStr,
@@ -256,6 +266,10 @@ class PublicId(JSONSerializable):
             if version is not None
             else PackageVersion(self.LATEST_VERSION)
         )
+        self._str = "{author}/{name}:{version}".format(
+            author=self.author, name=self.name, version=self.version
+        )
+        self._hash = hash(self._str)
 
     @property
     def author(self) -> str:
@@ -314,6 +328,17 @@ class PublicId(JSONSerializable):
         ...
         ValueError: Input 'bad/formatted:input' is not well formatted.
 
+        :param public_id_string: the public id in string format.
+        :return: the public id object.
+        :raises ValueError: if the string in input is not well formatted.  # noqa: DAR402
+        """
+        return _public_id_from_str(public_id_string)
+
+    @classmethod
+    def _parse_str(cls, public_id_string: str) -> "PublicId":
+        """
+        Parse the public id from the string, bypassing the cache.
+
         :param public_id_string: the public id in string format.
         :return: the public id object.
         :raises ValueError: if the string in input is not well formatted.
@@ -393,13 +418,15 @@ class PublicId(JSONSerializable):
 
     def __hash__(self) -> int:
         """Get the hash."""
-        return hash((self.author, self.name, self.version))
+        return self._hash
+
+    def __reduce__(self) -> Tuple[Type["PublicId"], Tuple[str, str, str]]:
+        """Get the pickling arguments, the hash of strings differs across processes."""
+        return self.__class__, (self.author, self.name, self.version)
 
     def __str__(self) -> str:
         """Get the string representation."""
-        return "{author}/{name}:{version}".format(
-            author=self.author, name=self.name, version=self.version
-        )
+        return self._str
 
     def __repr__(self) -> str:
         """Get the representation."""
@@ -407,11 +434,13 @@ class PublicId(JSONSerializable):
 
     def __eq__(self, other: Any) -> bool:
         """Compare with another object."""
+        if self is other:
+            return True
+        # author and name can not contain '/' nor ':', so the strings identify the triple
         return (
             isinstance(other, PublicId)
-            and self.author == other.author
-            and self.name == other.name
-            and self.version == other.version
+            and self._hash == other._hash
+            and self._str == other._str
         )
 
     def __lt__(self, other: Any) -> bool:
@@ -448,6 +477,17 @@ class PublicId(JSONSerializable):
         )
 
 
+@functools.lru_cache(maxsize=PublicId.FROM_STR_CACHE_SIZE)
+def _public_id_from_str(public_id_string: str) -> PublicId:
+    """
+    Parse the public id from the string, returning the same object for the same string.
+
+    :param public_id_string: the public id in string format.
+    :return: the public id object.
+    """
+    return PublicId._parse_str(public_id_string)  # pylint: disable=protected-access
+
+
 class PackageId:
     """A package identifier."""
 
@@ -25,7 +25,17 @@ from concurrent.futures.thread import ThreadPoolExecutor
 from contextlib import contextmanager
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Generator, Optional, Set, TYPE_CHECKING, cast
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TYPE_CHECKING,
+    cast,
+)
 
 from aea.components.base import Component, load_aea_package
 from aea.configurations.base import ComponentType, ConnectionConfig, PublicId
@@ -228,6 +238,35 @@ class Connection(Component, ABC):
         :return: the received envelope, or None if an error occurred.
         """
 
+    async def send_batch(self, envelopes: Sequence["Envelope"]) -> None:
+        """
+        Send a batch of envelopes.
+
+        The default implementation sends the envelopes one by one, in order.
+        Connections able to write several envelopes at once should override it.
+
+        :param envelopes: the envelopes to send.
+        """
+        for envelope in envelopes:
+            await self.send(envelope)
+
+    async def receive_batch(  # pylint: disable=unused-argument
+        self, max_size: int, *args: Any, **kwargs: Any
+    ) -> List["Envelope"]:
+        """
+        Receive a batch of envelopes.
+
+        The default implementation waits for a single envelope.
+        Connections with an internal buffer should override it to return up to max_size envelopes at once.
+
+        :param max_size: the maximum number of envelopes to return.
+        :param args: positional arguments
+        :param kwargs: keyword arguments
+        :return: the received envelopes, empty if none was received.
+        """
+        envelope = await self.receive(*args, **kwargs)
+        return [envelope] if envelope is not None else []
+
     @classmethod
     def from_dir(
         cls,
@@ -20,6 +20,7 @@
 import asyncio
 import datetime
 import logging
+import math
 import time
 from abc import ABC, abstractmethod
 from asyncio.events import AbstractEventLoop, TimerHandle
@@ -255,6 +256,326 @@ class PeriodicCaller:
         self._timerhandle = None
 
 
+class TimerWheelStats:
+    """Statistics of the wakeups of a timer wheel."""
+
+    __slots__ = ("wakeups", "calls", "lag", "max_lag", "jitter", "overruns")
+
+    def __init__(self) -> None:
+        """Init the statistics."""
+        self.wakeups = 0
+        self.calls = 0
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self.jitter = 0.0
+        self.overruns = 0
+
+    def __repr__(self) -> str:
+        """Get the string representation."""
+        return (
+            f"TimerWheelStats(wakeups={self.wakeups}, calls={self.calls}, "
+            f"lag={self.lag:.6f}, max_lag={self.max_lag:.6f}, "
+            f"jitter={self.jitter:.6f}, overruns={self.overruns})"
+        )
+
+
+class WheelPeriodicCaller:
+    """
+    Schedule a periodic call of callable using a timer wheel.
+
+    Same interface as PeriodicCaller.
+    """
+
+    __slots__ = (
+        "_wheel",
+        "_periodic_callable",
+        "_start_at",
+        "_exception_callback",
+        "period_ticks",
+        "expires",
+        "generation",
+        "is_active",
+    )
+
+    def __init__(
+        self,
+        wheel: "TimerWheel",
+        callback: Callable,
+        period: float,
+        start_at: Optional[datetime.datetime] = None,
+        exception_callback: Optional[Callable[[Callable, Exception], None]] = None,
+    ) -> None:
+        """
+        Init periodic caller.
+
+        :param wheel: the timer wheel to schedule calls with.
+        :param callback: function to call periodically
+        :param period: period in seconds.
+        :param start_at: optional first call datetime
+        :param exception_callback: optional handler to call on exception raised.
+        """
+        self._wheel = wheel
+        self._periodic_callable = callback
+        self._start_at = start_at
+        self._exception_callback = exception_callback
+        self.period_ticks = max(1, int(round(period / wheel.tick)))
+        self.expires = 0
+        self.generation = 0
+        self.is_active = False
+
+    def _call(self) -> None:
+        """Call the callable, stop on exception raised."""
+        try:
+            self._periodic_callable()
+        except Exception as exception:  # pylint: disable=broad-except
+            self.stop()
+            if not self._exception_callback:  # pragma: nocover
+                _default_logger.exception(
+                    f"Exception on calling {self._periodic_callable}"
+                )
+                return
+            self._exception_callback(self._periodic_callable, exception)
+
+    def start(self) -> None:
+        """Activate period calls."""
+        if self.is_active:  # pragma: nocover
+            return
+        delay = 0.0
+        if self._start_at is not None:
+            delay = max(0.0, self._start_at.timestamp() - time.time())
+        self._wheel.add(self, delay)
+
+    def stop(self) -> None:
+        """Remove from schedule."""
+        if not self.is_active:  # pragma: nocover
+            return
+        self._wheel.remove(self)
+
+
+class TimerWheel:
+    """
+    Hierarchical timer wheel to schedule many periodic calls with few event loop wakeups.
+
+    Time is split in ticks. Level 0 has a slot per tick, every upper level has
+    a slot per rotation of the level below: calls are inserted in constant time,
+    and moved down a level when their slot is reached.
+    The calls due on the same tick are run in one wakeup, and the wheel sleeps
+    till the next tick with calls due.
+    """
+
+    JITTER_SMOOTHING = 16
+    TICK_TOLERANCE = 0.001
+
+    def __init__(
+        self,
+        tick: float = 0.01,
+        slots: int = 64,
+        levels: int = 4,
+        loop: Optional[AbstractEventLoop] = None,
+    ) -> None:
+        """
+        Init the timer wheel.
+
+        :param tick: the resolution of the wheel, in seconds.
+        :param slots: the number of slots of every level.
+        :param levels: the number of levels.
+        :param loop: optional asyncio event loop
+        """
+        if tick <= 0 or slots < 2 or levels < 1:
+            raise ValueError(
+                "Tick must be positive, with at least 2 slots and 1 level."
+            )
+        self.tick = tick
+        self._slots = slots
+        self._levels = levels
+        self._spans = [slots ** level for level in range(levels + 1)]
+        self._loop = loop or asyncio.get_event_loop()
+        self._origin = self._loop.time()
+        self._current_tick = 0
+        self._wheels: List[List[List[Tuple[int, WheelPeriodicCaller]]]] = [
+            [[] for _ in range(slots)] for _ in range(levels)
+        ]
+        self._active_callers = 0
+        self._timerhandle: Optional[TimerHandle] = None
+        self._wakeup_at = 0.0
+        self.stats = TimerWheelStats()
+
+    def call_periodic(
+        self,
+        callback: Callable,
+        period: float,
+        start_at: Optional[datetime.datetime] = None,
+        exception_callback: Optional[Callable[[Callable, Exception], None]] = None,
+    ) -> WheelPeriodicCaller:
+        """
+        Make a periodic caller scheduled by the wheel, to be started.
+
+        :param callback: function to call periodically
+        :param period: period in seconds.
+        :param start_at: optional first call datetime
+        :param exception_callback: optional handler to call on exception raised.
+        :return: the periodic caller.
+        """
+        return WheelPeriodicCaller(self, callback, period, start_at, exception_callback)
+
+    def add(self, caller: WheelPeriodicCaller, delay: float) -> None:
+        """
+        Schedule the first call of a periodic caller.
+
+        :param caller: the periodic caller.
+        :param delay: the delay of the first call, in seconds.
+        """
+        now_tick = self._get_tick(self._loop.time())
+        if self._active_callers == 0:
+            # nothing scheduled, restart from now with empty slots
+            for wheel in self._wheels:
+                for slot in wheel:
+                    slot.clear()
+            self._current_tick = now_tick
+        caller.expires = max(
+            self._current_tick + 1, now_tick + int(math.ceil(delay / self.tick))
+        )
+        caller.generation += 1
+        caller.is_active = True
+        self._active_callers += 1
+        self._insert(caller)
+        self._schedule_wakeup()
+
+    def remove(self, caller: WheelPeriodicCaller) -> None:
+        """
+        Unschedule a periodic caller.
+
+        It stays in its slot, and it is dropped when the slot is reached:
+        a caller started again is inserted with a new generation.
+
+        :param caller: the periodic caller.
+        """
+        caller.is_active = False
+        self._active_callers -= 1
+        if self._active_callers == 0:
+            self.stop()
+
+    def stop(self) -> None:
+        """Cancel the next wakeup."""
+        if self._timerhandle is not None:
+            self._timerhandle.cancel()
+            self._timerhandle = None
+
+    def _get_tick(self, loop_time: float) -> int:
+        """Get the tick of an event loop time, the loop can wake up a bit before the time scheduled."""
+        return int((loop_time - self._origin) / self.tick + self.TICK_TOLERANCE)
+
+    def _insert(self, caller: WheelPeriodicCaller) -> None:
+        """Insert a caller in the lowest level it is less than a rotation away from the current tick."""
+        expires, current = caller.expires, self._current_tick
+        for level in range(self._levels):
+            span = self._spans[level]
+            if expires // span - current // span < self._slots:
+                self._wheels[level][(expires // span) % self._slots].append(
+                    (caller.generation, caller)
+                )
+                return
+        # beyond the top level rotation, park in its farthest slot and insert again from there
+        top = self._levels - 1
+        self._wheels[top][(current // self._spans[top] - 1) % self._slots].append(
+            (caller.generation, caller)
+        )
+
+    def _next_tick(self) -> int:
+        """Get the next tick with a non empty slot to process."""
+        current = self._current_tick
+        next_tick = current + self._spans[self._levels]
+        for level in range(self._levels):
+            span = self._spans[level]
+            wheel = self._wheels[level]
+            position = current // span + 1
+            while (
+                position * span < next_tick
+                and position <= current // span + self._slots
+            ):
+                if wheel[position % self._slots]:
+                    next_tick = position * span
+                    break
+                position += 1
+        return next_tick
+
+    def _advance(self, tick: int) -> List[Tuple[int, WheelPeriodicCaller]]:
+        """Move to a tick: cascade the upper level slots reached and get the callers due."""
+        self._current_tick = tick
+        for level in range(self._levels - 1, 0, -1):
+            if tick % self._spans[level] == 0:
+                index = (tick // self._spans[level]) % self._slots
+                entries = self._wheels[level][index]
+                self._wheels[level][index] = []
+                for generation, caller in entries:
+                    if caller.is_active and caller.generation == generation:
+                        self._insert(caller)
+        index = tick % self._slots
+        entries = self._wheels[0][index]
+        self._wheels[0][index] = []
+        due = []
+        for generation, caller in entries:
+            if caller.expires > tick:  # parked beyond the top level rotation
+                if caller.is_active and caller.generation == generation:
+                    self._insert(caller)
+            else:
+                due.append((generation, caller))
+        return due
+
+    def _schedule_wakeup(self) -> None:
+        """Schedule the wakeup on the next tick with callers."""
+        if self._active_callers == 0:
+            return
+        wakeup_at = self._origin + self._next_tick() * self.tick
+        if self._timerhandle is not None:
+            if self._wakeup_at <= wakeup_at:
+                return
+            self._timerhandle.cancel()
+        self._wakeup_at = wakeup_at
+        self._timerhandle = self._loop.call_at(wakeup_at, self._wakeup)
+
+    def _update_stats(self, lag: float) -> None:
+        """Update the wakeup lag and its jitter, as interarrival jitter in RFC 3550."""
+        stats = self.stats
+        stats.wakeups += 1
+        stats.jitter += (abs(lag - stats.lag) - stats.jitter) / self.JITTER_SMOOTHING
+        stats.lag = lag
+        stats.max_lag = max(stats.max_lag, lag)
+
+    def _wakeup(self) -> None:
+        """Run the callers due, reschedule them and the next wakeup."""
+        self._timerhandle = None
+        now = self._loop.time()
+        self._update_stats(max(0.0, now - self._wakeup_at))
+        now_tick = self._get_tick(now)
+
+        due: List[Tuple[int, WheelPeriodicCaller]] = []
+        while self._current_tick < now_tick:
+            tick = self._next_tick()
+            if tick > now_tick:
+                self._current_tick = now_tick
+                break
+            due.extend(self._advance(tick))
+
+        try:
+            for generation, caller in due:
+                if not caller.is_active or caller.generation != generation:
+                    continue
+                self.stats.calls += 1
+                caller._call()  # pylint: disable=protected-access
+                if not caller.is_active or caller.generation != generation:
+                    continue
+                caller.expires += caller.period_ticks
+                if caller.expires <= now_tick:
+                    # the calls missed are skipped
+                    missed = (now_tick - caller.expires) // caller.period_ticks + 1
+                    self.stats.overruns += missed
+                    caller.expires += missed * caller.period_ticks
+                self._insert(caller)
+        finally:
+            self._schedule_wakeup()
+
+
 class AnotherThreadTask:
     """
     Schedule a task to run on the loop in another thread.
@@ -23,12 +23,14 @@ import ctypes
 import logging
 import signal
 import threading
+import time
 from abc import ABC, abstractmethod
 from asyncio import Future
 from asyncio.events import AbstractEventLoop
+from collections import deque
 from threading import Lock
 from types import TracebackType
-from typing import Any, Optional, Type
+from typing import Any, Deque, List, Optional, Type
 
 
 _default_logger = logging.getLogger(__file__)
@@ -270,3 +272,250 @@ class ExecTimeoutThreadGuard(BaseExecTimeout):
         if self._future_guard_task and not self._future_guard_task.done():
             self._future_guard_task.cancel()
             self._future_guard_task = None
+
+
+class _WatchedCall:  # pylint: disable=too-few-public-methods
+    """A call watched by ExecTimeoutWatchdog."""
+
+    __slots__ = ("thread_id", "deadline", "exception_class", "done", "fired")
+
+    def __init__(
+        self, thread_id: int, deadline: float, exception_class: Type[BaseException]
+    ) -> None:
+        """
+        Init a watched call.
+
+        :param thread_id: the id of the thread executing the call.
+        :param deadline: the monotonic time the call has to be completed by.
+        :param exception_class: the exception to raise in the thread on timeout.
+        """
+        self.thread_id = thread_id
+        self.deadline = deadline
+        self.exception_class = exception_class
+        self.done = False
+        self.fired = False
+
+
+class ExecTimeoutStats:  # pylint: disable=too-few-public-methods
+    """Statistics of the calls watched by ExecTimeoutWatchdog."""
+
+    __slots__ = ("calls", "interrupted", "min_time_to_deadline")
+
+    def __init__(
+        self,
+        calls: int = 0,
+        interrupted: int = 0,
+        min_time_to_deadline: Optional[float] = None,
+    ) -> None:
+        """
+        Init the statistics.
+
+        :param calls: the number of calls completed or interrupted.
+        :param interrupted: the number of calls interrupted on timeout.
+        :param min_time_to_deadline: the smallest time left before the deadline when a call completed, in seconds.
+        """
+        self.calls = calls
+        self.interrupted = interrupted
+        self.min_time_to_deadline = min_time_to_deadline
+
+    def __repr__(self) -> str:
+        """Get the representation of the statistics."""
+        return "ExecTimeoutStats(calls={}, interrupted={}, min_time_to_deadline={})".format(
+            self.calls, self.interrupted, self.min_time_to_deadline
+        )
+
+
+class ExecTimeoutWatchdog(BaseExecTimeout):
+    """
+    ExecTimeout context manager implementation using a shared watchdog thread and PyThreadState_SetAsyncExc.
+
+    Support threads.
+    Entering and exiting only records the deadline of the call in a timer wheel,
+    a single supervisor thread checks the deadlines once per tick.
+    Requires supervisor thread start/stop to control execution time.
+    The timeout is applied with the accuracy of a tick.
+    """
+
+    TICK = 0.01
+    WHEEL_SIZE = 512
+
+    _supervisor_thread: Optional[threading.Thread] = None
+    _stopped: Optional[threading.Event] = None
+    _wheel: List[Deque[_WatchedCall]] = []
+    _start_count: int = 0
+    _lock: Lock = Lock()
+    _calls_lock: Lock = Lock()
+    _stats: ExecTimeoutStats = ExecTimeoutStats()
+
+    def __init__(self, timeout: float = 0.0) -> None:
+        """
+        Init ExecTimeoutWatchdog variables.
+
+        :param timeout: number of seconds to execute code before interruption
+        """
+        super().__init__(timeout=timeout)
+        self._watched_call: Optional[_WatchedCall] = None
+
+    @classmethod
+    def start(cls) -> None:
+        """
+        Start supervisor thread to check timeouts.
+
+        Supervisor starts once but number of start counted.
+        """
+        with cls._lock:
+            cls._start_count += 1
+
+            if cls._supervisor_thread:
+                return
+
+            cls._wheel = [deque() for _ in range(cls.WHEEL_SIZE)]
+            cls._stopped = threading.Event()
+            cls._supervisor_thread = threading.Thread(
+                target=cls._supervise,
+                args=(cls._stopped, cls._wheel),
+                daemon=True,
+                name="ExecTimeoutWatchdog",
+            )
+            cls._supervisor_thread.start()
+
+    @classmethod
+    def stop(cls, force: bool = False) -> None:
+        """
+        Stop supervisor thread.
+
+        Actual stop performed on force == True or if  number of stops == number of starts
+
+        :param force: force stop regardless number of start.
+        """
+        with cls._lock:
+            if not cls._supervisor_thread:  # pragma: nocover
+                return
+
+            cls._start_count -= 1
+
+            if cls._start_count <= 0 or force:
+                cls._stopped.set()  # type: ignore
+                if cls._supervisor_thread.is_alive():
+                    cls._supervisor_thread.join()
+                cls._supervisor_thread = None
+                cls._start_count = 0
+
+    @classmethod
+    def get_stats(cls) -> ExecTimeoutStats:
+        """Get a copy of the statistics of the watched calls."""
+        with cls._calls_lock:
+            return ExecTimeoutStats(
+                cls._stats.calls,
+                cls._stats.interrupted,
+                cls._stats.min_time_to_deadline,
+            )
+
+    @classmethod
+    def reset_stats(cls) -> None:
+        """Reset the statistics of the watched calls."""
+        with cls._calls_lock:
+            cls._stats = ExecTimeoutStats()
+
+    @classmethod
+    def _supervise(
+        cls, stopped: threading.Event, wheel: List[Deque[_WatchedCall]]
+    ) -> None:
+        """
+        Check the deadlines of the watched calls once per tick.
+
+        :param stopped: the event set to stop the supervisor.
+        :param wheel: the timer wheel of the watched calls.
+        """
+        next_tick = int(time.monotonic() / cls.TICK)
+        while not stopped.wait(cls.TICK):
+            now = time.monotonic()
+            current_tick = int(now / cls.TICK)
+            # catch up with the ticks missed, at most one full turn of the wheel
+            for tick in range(
+                max(next_tick, current_tick - cls.WHEEL_SIZE + 1), current_tick + 1
+            ):
+                cls._check_slot(wheel[tick % cls.WHEEL_SIZE], now)
+            next_tick = current_tick + 1
+
+    @classmethod
+    def _check_slot(cls, slot: Deque[_WatchedCall], now: float) -> None:
+        """
+        Interrupt the calls of a wheel slot past their deadline.
+
+        Completed calls are dropped, calls due in a later turn of the wheel are kept.
+
+        :param slot: the slot of the timer wheel.
+        :param now: the current monotonic time.
+        """
+        for _ in range(len(slot)):
+            watched_call = slot.popleft()
+            if watched_call.done:
+                continue
+            if watched_call.deadline > now:
+                slot.append(watched_call)
+                continue
+            with cls._calls_lock:
+                if watched_call.done:  # pragma: nocover
+                    continue
+                watched_call.fired = True
+                cls._stats.interrupted += 1
+                cls._set_thread_exception(
+                    watched_call.thread_id, watched_call.exception_class
+                )
+
+    @staticmethod
+    def _set_thread_exception(
+        thread_id: int, exception_class: Optional[Type[BaseException]]
+    ) -> None:
+        """Set the exception to raise in a thread, or clear it if None."""
+        ctypes.pythonapi.PyThreadState_SetAsyncExc(
+            ctypes.c_long(thread_id),
+            ctypes.py_object(exception_class) if exception_class else None,
+        )
+
+    def _set_timeout_watch(self) -> None:
+        """
+        Start control over execution time.
+
+        Record the deadline of the call in the timer wheel.
+        ExecTimeoutWatchdog.start is required at least once in project before usage!
+        """
+        if not self._supervisor_thread:
+            _default_logger.warning(
+                "ExecTimeoutWatchdog is used but not started! No timeout wil be applied!"
+            )
+            return
+
+        deadline = time.monotonic() + self.timeout
+        self._watched_call = _WatchedCall(
+            threading.get_ident(), deadline, self.exception_class
+        )
+        # the call is checked on the first tick at or after its deadline
+        self._wheel[-int(-deadline // self.TICK) % self.WHEEL_SIZE].append(
+            self._watched_call
+        )
+
+    def _remove_timeout_watch(self) -> None:
+        """
+        Stop control over execution time.
+
+        Mark the call completed, the supervisor drops it from the timer wheel.
+        """
+        watched_call = self._watched_call
+        if watched_call is None:
+            return
+        self._watched_call = None
+        time_to_deadline = watched_call.deadline - time.monotonic()
+        with self._calls_lock:
+            watched_call.done = True
+            stats = self._stats
+            stats.calls += 1
+            if watched_call.fired:
+                # the call may have completed before the exception was raised
+                self._set_thread_exception(watched_call.thread_id, None)
+            elif (
+                stats.min_time_to_deadline is None
+                or time_to_deadline < stats.min_time_to_deadline
+            ):
+                stats.min_time_to_deadline = time_to_deadline
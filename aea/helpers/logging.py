@@ -19,7 +19,7 @@
 """Logging helpers."""
 import logging
 from logging import Logger, LoggerAdapter
-from typing import Any, MutableMapping, Optional, Tuple, cast
+from typing import Any, Dict, MutableMapping, Optional, Tuple, cast
 
 from aea.helpers.base import _get_aea_logger_name_prefix
 
@@ -31,7 +31,14 @@ def get_logger(module_path: str, agent_name: str) -> Logger:
 
 
 class AgentLoggerAdapter(LoggerAdapter):
-    """This class is a logger adapter that prepends the agent name to log messages."""
+    """
+    This class is a logger adapter that prepends the agent name to log messages.
+
+    Log calls are meant to pass their arguments lazily, e.g.
+    `logger.debug("Handling envelope: %s", envelope)`: the level check is
+    answered from the level cache of the underlying logger, and neither the
+    agent name prefix nor the arguments are formatted unless the record is emitted.
+    """
 
     def __init__(self, logger: Logger, agent_name: str) -> None:
         """
@@ -41,12 +48,35 @@ class AgentLoggerAdapter(LoggerAdapter):
         :param agent_name: the agent name.
         """
         super().__init__(logger, dict(agent_name=agent_name))
+        self._prefix = f"[{agent_name}] "
+        base_logger: Any = logger
+        while isinstance(base_logger, LoggerAdapter):
+            base_logger = base_logger.logger
+        self._base_logger = cast(Logger, base_logger)
+        # the logging module clears this cache in place whenever levels change (Python 3.7+)
+        self._level_cache: Optional[Dict[int, bool]] = getattr(
+            base_logger, "_cache", None
+        )
+
+    def isEnabledFor(self, level: int) -> bool:
+        """
+        Check whether the logger is enabled for a level, using the level cache when available.
+
+        :param level: the logging level.
+        :return: True if a record of that level would be processed, False otherwise.
+        """
+        if self._level_cache is not None and not self._base_logger.disabled:
+            try:
+                return self._level_cache[level]
+            except KeyError:
+                pass
+        return self.logger.isEnabledFor(level)
 
     def process(
         self, msg: Any, kwargs: MutableMapping[str, Any]
     ) -> Tuple[Any, MutableMapping[str, Any]]:
         """Prepend the agent name to every log message."""
-        return f"[{self.extra['agent_name']}] {msg}", kwargs
+        return f"{self._prefix}{msg}", kwargs
 
 
 class WithLogger:
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains a cache of the results of the search queries."""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from aea.common import Address
+from aea.exceptions import enforce
+from aea.helpers.search.models import Query
+
+
+SEARCH_CACHE_HIT = "hit"
+SEARCH_CACHE_MISS = "miss"
+
+SearchCacheObserver = Callable[[str, str], None]
+
+_observers: Dict[Address, List[SearchCacheObserver]] = {}
+_observers_lock = threading.Lock()
+
+
+def add_search_cache_observer(address: Address, observer: SearchCacheObserver) -> None:
+    """
+    Observe the lookups in the search caches of an agent.
+
+    :param address: the address of the agent.
+    :param observer: the callable to call with the cache name and the event, a hit or a miss, on each lookup.
+    """
+    with _observers_lock:
+        _observers[address] = _observers.get(address, []) + [observer]
+
+
+def remove_search_cache_observer(
+    address: Address, observer: SearchCacheObserver
+) -> None:
+    """
+    Stop observing the lookups in the search caches of an agent.
+
+    :param address: the address of the agent.
+    :param observer: the observer to remove.
+    """
+    with _observers_lock:
+        observers = [o for o in _observers.get(address, []) if o != observer]
+        if observers:
+            _observers[address] = observers
+        else:
+            _observers.pop(address, None)
+
+
+def get_query_key(query: Query) -> bytes:
+    """
+    Get the canonical encoding of a query, its constraints and its data model.
+
+    :param query: the query.
+    :return: the encoded query.
+    """
+    return query._encode().SerializeToString(  # pylint: disable=protected-access
+        deterministic=True
+    )
+
+
+class SearchResultCache:
+    """
+    A bounded LRU cache of search results, expiring after a time to live.
+
+    Results are cached by the canonical encoding of their query. The owner
+    invalidates the cache when its registrations change, results of searches
+    started before an invalidation are not cached.
+    """
+
+    __slots__ = (
+        "_ttl",
+        "_max_size",
+        "_owner",
+        "_name",
+        "_results",
+        "_generation",
+        "_stats",
+    )
+
+    def __init__(
+        self, ttl: float, max_size: int, owner: Address, name: str = ""
+    ) -> None:
+        """
+        Initialize the cache.
+
+        :param ttl: the time a result is kept, in seconds.
+        :param max_size: the maximum number of results kept in the cache.
+        :param owner: the address of the agent searching, its observers are notified of the lookups.
+        :param name: the cache name, reported to the observers.
+        """
+        enforce(ttl > 0, "Time to live must be positive.")
+        enforce(
+            isinstance(max_size, int) and max_size > 0,
+            "Max size must be a positive integer.",
+        )
+        self._ttl = ttl
+        self._max_size = max_size
+        self._owner = owner
+        self._name = name
+        self._results: "OrderedDict[bytes, Tuple[float, Any]]" = OrderedDict()
+        self._generation = 0
+        self._stats = dict.fromkeys(
+            ["hits", "misses", "evictions", "expirations", "invalidations"], 0
+        )
+
+    @property
+    def ttl(self) -> float:
+        """Get the time a result is kept, in seconds."""
+        return self._ttl
+
+    @property
+    def max_size(self) -> int:
+        """Get the maximum number of results kept in the cache."""
+        return self._max_size
+
+    @property
+    def generation(self) -> int:
+        """Get the number of invalidations, to tell the results obtained since the last one."""
+        return self._generation
+
+    def __len__(self) -> int:
+        """Get the number of results in the cache."""
+        return len(self._results)
+
+    def get(self, query: Query) -> Optional[Any]:
+        """
+        Get the result of a query, if cached and not expired.
+
+        :param query: the query.
+        :return: the result, or None on a miss.
+        """
+        key = get_query_key(query)
+        entry = self._results.get(key)
+        if entry is not None and entry[0] <= time.monotonic():
+            del self._results[key]
+            self._stats["expirations"] += 1
+            entry = None
+        if entry is None:
+            self._stats["misses"] += 1
+            self._notify(SEARCH_CACHE_MISS)
+            return None
+        self._results.move_to_end(key)
+        self._stats["hits"] += 1
+        self._notify(SEARCH_CACHE_HIT)
+        return entry[1]
+
+    def put(self, query: Query, result: Any, generation: Optional[int] = None) -> None:
+        """
+        Cache the result of a query.
+
+        :param query: the query.
+        :param result: the result.
+        :param generation: the generation of the cache when the search started, the result is dropped if the cache was invalidated since.
+        """
+        if generation is not None and generation != self._generation:
+            return
+        key = get_query_key(query)
+        self._results[key] = (time.monotonic() + self._ttl, result)
+        self._results.move_to_end(key)
+        if len(self._results) > self._max_size:
+            self._results.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def invalidate(self) -> None:
+        """Drop all the results, e.g. when the registrations of the owner change."""
+        self._results.clear()
+        self._generation += 1
+        self._stats["invalidations"] += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get the statistics of the cache.
+
+        :return: the lookup hits and misses, the results evicted, expired and the invalidations, and the cache size.
+        """
+        return {**self._stats, "size": len(self._results)}
+
+    def _notify(self, event: str) -> None:
+        """Notify the observers of the owner of a lookup."""
+        for observer in _observers.get(self._owner, []):
+            observer(self._name, event)
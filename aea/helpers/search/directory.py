@@ -0,0 +1,439 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains an in-memory directory of service descriptions, indexed to be searched with queries."""
+import math
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from aea.common import Address
+from aea.exceptions import enforce
+from aea.helpers.search.models import (
+    And,
+    Constraint,
+    ConstraintExpr,
+    ConstraintTypes,
+    Description,
+    Location,
+    Or,
+    Query,
+)
+
+
+EARTH_RADIUS = 6372.8  # km, the radius used by the haversine distance of the locations
+DEFAULT_GRID_CELL_SIZE = 1.0  # degrees
+# the candidates of the expressions of a conjunction at most this many times less selective than the most selective are intersected
+MAX_INTERSECTION_RATIO = 16
+RANGE_CONSTRAINT_TYPES = {
+    ConstraintTypes.LESS_THAN,
+    ConstraintTypes.LESS_THAN_EQ,
+    ConstraintTypes.GREATER_THAN,
+    ConstraintTypes.GREATER_THAN_EQ,
+    ConstraintTypes.WITHIN,
+}
+
+# the number of candidate entries of an expression, and the function to get them
+Candidates = Tuple[int, Callable[[], Set[int]]]
+
+
+def _union(entry_sets: Iterable[Set[int]]) -> Set[int]:
+    """Get the union of sets of entries."""
+    result: Set[int] = set()
+    for entries in entry_sets:
+        result |= entries
+    return result
+
+
+class _AttributeIndex:
+    """The indexes of the values of an attribute."""
+
+    __slots__ = ("values", "numbers", "strings", "cells", "unindexed")
+
+    def __init__(self) -> None:
+        """Initialize the indexes."""
+        # hash index of the values, for the equality constraints
+        self.values: Dict[Any, Set[int]] = defaultdict(set)
+        # sorted (value, entry id) pairs, for the range constraints
+        self.numbers: List[Tuple[Any, int]] = []
+        self.strings: List[Tuple[str, int]] = []
+        # grid of the locations, for the distance constraints
+        self.cells: Dict[Tuple[int, int], Set[int]] = defaultdict(set)
+        # the entries with a value none of the indexes can hold, always candidates
+        self.unindexed: Set[int] = set()
+
+    def __bool__(self) -> bool:
+        """Check whether any entry has a value for the attribute."""
+        return bool(self.values or self.cells or self.unindexed)
+
+    def get_sorted_values(self, value: Any) -> Optional[List[Tuple[Any, int]]]:
+        """Get the sorted index of the values comparable with a value."""
+        if isinstance(value, str):
+            return self.strings
+        if isinstance(value, (int, float)) and not math.isnan(value):
+            return self.numbers
+        return None
+
+
+class ServiceDirectory:
+    """
+    A directory of the service descriptions registered by agents.
+
+    The directory keeps, for each attribute, a hash index of the values, sorted
+    indexes of the numbers and the strings, and a grid of the locations. A search
+    gets its candidates from the most selective index of each conjunction of its
+    query, and checks them with the query, so the results are those of
+    :meth:`Query.check`, restricted to the descriptions of the query data model.
+    """
+
+    __slots__ = (
+        "_entries",
+        "_entries_by_address",
+        "_entries_by_model",
+        "_attributes",
+        "_last_entry_id",
+        "_cell_size",
+        "_longitude_cells",
+    )
+
+    def __init__(self, grid_cell_size: float = DEFAULT_GRID_CELL_SIZE) -> None:
+        """
+        Initialize the directory.
+
+        :param grid_cell_size: the size of the cells of the grid of the locations, in degrees. It is rounded to divide the 360 degrees of longitude.
+        """
+        enforce(
+            0 < grid_cell_size <= 360, "Grid cell size must be in (0, 360] degrees."
+        )
+        self._entries: Dict[int, Tuple[Address, Description]] = {}
+        self._entries_by_address: Dict[Address, List[int]] = {}
+        self._entries_by_model: Dict[str, Set[int]] = defaultdict(set)
+        self._attributes: Dict[str, _AttributeIndex] = defaultdict(_AttributeIndex)
+        self._last_entry_id = 0
+        self._longitude_cells = max(1, round(360 / grid_cell_size))
+        self._cell_size = 360 / self._longitude_cells
+
+    def __len__(self) -> int:
+        """Get the number of descriptions in the directory."""
+        return len(self._entries)
+
+    def add(self, address: Address, description: Description) -> None:
+        """
+        Add the service description of an agent.
+
+        :param address: the address of the agent.
+        :param description: the service description.
+        """
+        self._last_entry_id += 1
+        entry_id = self._last_entry_id
+        self._entries[entry_id] = (address, description)
+        self._entries_by_address.setdefault(address, []).append(entry_id)
+        self._entries_by_model[description.data_model.name].add(entry_id)
+        for name, value in description.values.items():
+            self._index_value(self._attributes[name], entry_id, value)
+
+    def remove(self, address: Address, description: Description) -> bool:
+        """
+        Remove a service description of an agent.
+
+        :param address: the address of the agent.
+        :param description: the service description.
+        :return: whether the agent had registered the description.
+        """
+        for entry_id in self._entries_by_address.get(address, []):
+            if self._entries[entry_id][1] == description:
+                self._remove_entry(entry_id)
+                return True
+        return False
+
+    def remove_address(self, address: Address) -> None:
+        """
+        Remove all the service descriptions of an agent.
+
+        :param address: the address of the agent.
+        """
+        for entry_id in list(self._entries_by_address.get(address, [])):
+            self._remove_entry(entry_id)
+
+    def search(self, query: Query) -> Set[Address]:
+        """
+        Search the agents with a service description satisfying a query.
+
+        :param query: the query.
+        :return: the addresses of the agents.
+        """
+        conjunction = [self._get_candidates(c) for c in query.constraints]
+        if query.model is not None:
+            entries = self._entries_by_model.get(query.model.name, set())
+            conjunction.append((len(entries), lambda: entries))
+        candidates = self._intersect(conjunction)
+        entry_ids = candidates[1]() if candidates is not None else self._entries
+
+        result: Set[Address] = set()
+        for entry_id in entry_ids:
+            address, description = self._entries[entry_id]
+            if address in result:
+                continue
+            if (
+                query.model is None or description.data_model == query.model
+            ) and query.check(description):
+                result.add(address)
+        return result
+
+    def _remove_entry(self, entry_id: int) -> None:
+        """Remove an entry from the directory and its indexes."""
+        address, description = self._entries.pop(entry_id)
+        self._entries_by_address[address].remove(entry_id)
+        if not self._entries_by_address[address]:
+            del self._entries_by_address[address]
+        model_entries = self._entries_by_model[description.data_model.name]
+        model_entries.discard(entry_id)
+        if not model_entries:
+            del self._entries_by_model[description.data_model.name]
+        for name, value in description.values.items():
+            index = self._attributes[name]
+            self._unindex_value(index, entry_id, value)
+            if not index:
+                del self._attributes[name]
+
+    def _index_value(self, index: _AttributeIndex, entry_id: int, value: Any) -> None:
+        """Add the value of an attribute of an entry to the attribute indexes."""
+        if isinstance(value, Location):
+            index.cells[self._get_cell(value)].add(entry_id)
+            return
+        sorted_values = index.get_sorted_values(value)
+        if sorted_values is None:
+            index.unindexed.add(entry_id)
+            return
+        index.values[value].add(entry_id)
+        sorted_values.insert(
+            bisect_left(sorted_values, (value, entry_id)), (value, entry_id)
+        )
+
+    def _unindex_value(self, index: _AttributeIndex, entry_id: int, value: Any) -> None:
+        """Remove the value of an attribute of an entry from the attribute indexes."""
+        if isinstance(value, Location):
+            cell = self._get_cell(value)
+            index.cells[cell].discard(entry_id)
+            if not index.cells[cell]:
+                del index.cells[cell]
+            return
+        sorted_values = index.get_sorted_values(value)
+        if sorted_values is None:
+            index.unindexed.discard(entry_id)
+            return
+        index.values[value].discard(entry_id)
+        if not index.values[value]:
+            del index.values[value]
+        position = bisect_left(sorted_values, (value, entry_id))
+        del sorted_values[position]
+
+    def _get_cell(self, location: Location) -> Tuple[int, int]:
+        """Get the grid cell of a location."""
+        return (
+            math.floor(location.latitude / self._cell_size),
+            math.floor(location.longitude / self._cell_size) % self._longitude_cells,
+        )
+
+    @staticmethod
+    def _intersect(conjunction: List[Optional[Candidates]]) -> Optional[Candidates]:
+        """
+        Get the candidates of a conjunction.
+
+        They are those of its most selective expression, intersected with those
+        of the expressions of a comparable selectivity; the others are left to the check.
+
+        :param conjunction: the candidates of the expressions in conjunction.
+        :return: the candidates, or None if no index narrows them.
+        """
+        known = sorted((c for c in conjunction if c is not None), key=lambda c: c[0])
+        if not known:
+            return None
+        max_size = max(known[0][0], 1) * MAX_INTERSECTION_RATIO
+        selected = [get for size, get in known if size <= max_size]
+        if len(selected) == 1:
+            return known[0]
+
+        def get_intersection() -> Set[int]:
+            result = selected[0]()
+            for get in selected[1:]:
+                if not result:
+                    break
+                result = result & get()
+            return result
+
+        return known[0][0], get_intersection
+
+    def _get_candidates(self, expression: ConstraintExpr) -> Optional[Candidates]:
+        """
+        Get the entries which may satisfy an expression.
+
+        :param expression: the constraint expression.
+        :return: the candidates, or None if no index narrows them.
+        """
+        if isinstance(expression, Constraint):
+            return self._get_constraint_candidates(expression)
+        if isinstance(expression, And):
+            return self._intersect(
+                [self._get_candidates(c) for c in expression.constraints]
+            )
+        if isinstance(expression, Or):
+            disjunction: List[Candidates] = []
+            for sub_expression in expression.constraints:
+                candidates = self._get_candidates(sub_expression)
+                if candidates is None:
+                    return None
+                disjunction.append(candidates)
+            return (
+                sum(size for size, _ in disjunction),
+                lambda: _union(get() for _, get in disjunction),
+            )
+        return None
+
+    def _get_constraint_candidates(  # pylint: disable=too-many-return-statements
+        self, constraint: Constraint
+    ) -> Optional[Candidates]:
+        """
+        Get the entries which may satisfy a constraint, from the indexes of its attribute.
+
+        :param constraint: the constraint.
+        :return: the candidates, or None if no index narrows them.
+        """
+        index = self._attributes.get(constraint.attribute_name)
+        if index is None:
+            return 0, lambda: set()  # pylint: disable=unnecessary-lambda
+        type_ = constraint.constraint_type.type
+        value = constraint.constraint_type.value
+        unindexed = index.unindexed
+
+        if type_ == ConstraintTypes.EQUAL:
+            entries = index.values.get(value, set())
+            return len(entries) + len(unindexed), lambda: entries | unindexed
+        if type_ == ConstraintTypes.IN:
+            if not all(isinstance(item, (str, int, float)) for item in value):
+                return None
+            sets = [index.values.get(item, set()) for item in value]
+            return (
+                sum(map(len, sets)) + len(unindexed),
+                lambda: _union([unindexed, *sets]),
+            )
+        if type_ == ConstraintTypes.DISTANCE:
+            cells = [
+                index.cells[cell]
+                for cell in self._get_cells_around(index, value[0], value[1])
+            ]
+            return (
+                sum(map(len, cells)) + len(unindexed),
+                lambda: _union([unindexed, *cells]),
+            )
+        if type_ in RANGE_CONSTRAINT_TYPES:
+            bounds = self._get_range(index, type_, value)
+            if bounds is None:
+                return None
+            pairs, start, end = bounds
+            return (
+                max(0, end - start) + len(unindexed),
+                lambda: unindexed.union(entry_id for _, entry_id in pairs[start:end]),
+            )
+        return None
+
+    @staticmethod
+    def _get_range(
+        index: _AttributeIndex, type_: ConstraintTypes, value: Any
+    ) -> Optional[Tuple[List[Tuple[Any, int]], int, int]]:
+        """
+        Get the sorted (value, entry id) pairs of an attribute within the bounds of a range constraint.
+
+        :param index: the indexes of the attribute.
+        :param type_: the range constraint type.
+        :param value: the value of the constraint.
+        :return: the sorted pairs and the bounds of the slice within the range, or None if the bounds are not comparable.
+        """
+        low, high = value if type_ == ConstraintTypes.WITHIN else (value, value)
+        sorted_values = index.get_sorted_values(low)
+        if sorted_values is None or index.get_sorted_values(high) is None:
+            return None
+        # a pair (value,) sorts before the pairs (value, entry id), (value, inf) after them
+        start, end = 0, len(sorted_values)
+        if type_ in {ConstraintTypes.GREATER_THAN_EQ, ConstraintTypes.WITHIN}:
+            start = bisect_left(sorted_values, (low,))
+        elif type_ == ConstraintTypes.GREATER_THAN:
+            start = bisect_right(sorted_values, (low, math.inf))
+        if type_ in {ConstraintTypes.LESS_THAN_EQ, ConstraintTypes.WITHIN}:
+            end = bisect_right(sorted_values, (high, math.inf))
+        elif type_ == ConstraintTypes.LESS_THAN:
+            end = bisect_left(sorted_values, (high,))
+        return sorted_values, start, end
+
+    def _get_cells_around(
+        self, index: _AttributeIndex, center: Location, distance: float
+    ) -> List[Tuple[int, int]]:
+        """
+        Get the grid cells of the locations of an attribute which may be within a distance of a center.
+
+        The cells cover the bounding box of the circle around the center, on the sphere of the haversine distance.
+
+        :param index: the indexes of the attribute.
+        :param center: the center.
+        :param distance: the distance, in km.
+        :return: the non-empty cells.
+        """
+        angle = max(0.0, distance) / EARTH_RADIUS
+        latitude = math.radians(center.latitude)
+        min_latitude = math.degrees(latitude - angle)
+        max_latitude = math.degrees(latitude + angle)
+        latitude_cells = range(
+            math.floor(max(min_latitude, -90.0) / self._cell_size - 1e-9),
+            math.floor(min(max_latitude, 90.0) / self._cell_size + 1e-9) + 1,
+        )
+
+        longitude_cells: Optional[Set[int]] = None
+        if min_latitude > -90.0 and max_latitude < 90.0:
+            delta = math.degrees(
+                math.asin(min(1.0, math.sin(angle) / math.cos(latitude)))
+            )
+            first = math.floor((center.longitude - delta) / self._cell_size - 1e-9)
+            last = math.floor((center.longitude + delta) / self._cell_size + 1e-9)
+            if last - first + 1 < self._longitude_cells:
+                longitude_cells = {
+                    cell % self._longitude_cells for cell in range(first, last + 1)
+                }
+
+        cells_to_probe = len(latitude_cells) * (
+            self._longitude_cells if longitude_cells is None else len(longitude_cells)
+        )
+        if cells_to_probe > len(index.cells):
+            return [
+                cell
+                for cell in index.cells
+                if cell[0] in latitude_cells
+                and (longitude_cells is None or cell[1] in longitude_cells)
+            ]
+        return [
+            cell
+            for cell in (
+                (latitude_cell, longitude_cell)
+                for latitude_cell in latitude_cells
+                for longitude_cell in (
+                    range(self._longitude_cells)
+                    if longitude_cells is None
+                    else longitude_cells
+                )
+            )
+            if cell in index.cells
+        ]
@@ -19,7 +19,8 @@
 """This module contains storage abstract backend class."""
 import re
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple, Union
+from types import TracebackType
+from typing import List, Optional, Tuple, Type, Union
 
 from aea.helpers.constants import JSON_TYPES
 
@@ -28,6 +29,34 @@ EQUALS_TYPE = Union[int, float, str, bool]
 OBJECT_ID_AND_BODY = Tuple[str, JSON_TYPES]
 
 
+class StorageTransaction:
+    """Async context manager running the storage operations it wraps in one transaction."""
+
+    def __init__(self, storage_backend: "AbstractStorageBackend") -> None:
+        """
+        Init transaction.
+
+        :param storage_backend: storage backend to run the transaction on.
+        """
+        self._storage_backend = storage_backend
+
+    async def __aenter__(self) -> None:
+        """Begin the transaction."""
+        await self._storage_backend.begin_transaction()
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Commit the transaction, or roll it back if an exception was raised."""
+        if exc_type is None:
+            await self._storage_backend.commit_transaction()
+        else:
+            await self._storage_backend.rollback_transaction()
+
+
 class AbstractStorageBackend(ABC):
     """Abstract base class for storage backend."""
 
@@ -123,3 +152,63 @@ class AbstractStorageBackend(ABC):
         :param collection_name: str.
         :return: Tuple of objects keys, bodies.
         """
+
+    async def put_many(
+        self, collection_name: str, objects: List[OBJECT_ID_AND_BODY]
+    ) -> None:
+        """
+        Put objects into collection.
+
+        :param collection_name: str.
+        :param objects: list of object ids and bodies.
+        """
+        for object_id, object_body in objects:
+            await self.put(collection_name, object_id, object_body)
+
+    async def get_many(
+        self, collection_name: str, object_ids: List[str]
+    ) -> List[OBJECT_ID_AND_BODY]:
+        """
+        Get objects from the collection.
+
+        :param collection_name: str.
+        :param object_ids: list of object ids.
+
+        :return: list of ids and bodies of the objects existing in the collection, in the order of the ids
+        """
+        objects: List[OBJECT_ID_AND_BODY] = []
+        for object_id in object_ids:
+            object_body = await self.get(collection_name, object_id)
+            if object_body is not None:
+                objects.append((object_id, object_body))
+        return objects
+
+    async def remove_many(self, collection_name: str, object_ids: List[str]) -> None:
+        """
+        Remove objects from the collection.
+
+        :param collection_name: str.
+        :param object_ids: list of object ids.
+        """
+        for object_id in object_ids:
+            await self.remove(collection_name, object_id)
+
+    def transaction(self) -> StorageTransaction:
+        """
+        Get a context manager running the operations it wraps in one transaction.
+
+        Transactions are not isolated from the operations run concurrently on the backend,
+        and nested transactions are part of the outermost one.
+
+        :return: async context manager.
+        """
+        return StorageTransaction(self)
+
+    async def begin_transaction(self) -> None:
+        """Begin a transaction, no-op if transactions are not supported."""
+
+    async def commit_transaction(self) -> None:
+        """Commit the transaction, no-op if transactions are not supported."""
+
+    async def rollback_transaction(self) -> None:
+        """Roll back the transaction, no-op if transactions are not supported."""
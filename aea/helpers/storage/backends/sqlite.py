@@ -26,7 +26,7 @@ import sys
 import threading
 from concurrent.futures.thread import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Callable, List, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 
 from aea.helpers.storage.backends.base import (
@@ -40,6 +40,9 @@ from aea.helpers.storage.backends.base import (
 class SqliteStorageBackend(AbstractStorageBackend):
     """Sqlite storage backend."""
 
+    # object ids bound per statement, below the default sqlite limit of variables
+    MAX_VARIABLES_PER_STATEMENT = 500
+
     def __init__(self, uri: str) -> None:
         """Init backend."""
         super().__init__(uri)
@@ -49,6 +52,7 @@ class SqliteStorageBackend(AbstractStorageBackend):
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._lock = threading.Lock()
         self._executor = ThreadPoolExecutor(max_workers=1)
+        self._transaction_depth = 0
 
     def _execute_sql_sync(self, query: str, args: Optional[List] = None) -> List[Tuple]:
         """
@@ -63,9 +67,59 @@ class SqliteStorageBackend(AbstractStorageBackend):
             raise ValueError("Not connected")
         with self._lock:
             result = self._connection.execute(query, args or []).fetchall()
-            self._connection.commit()
+            if not self._transaction_depth:
+                self._connection.commit()
             return result
 
+    def _execute_many_sql_sync(self, query: str, args_list: Sequence[Sequence]) -> None:
+        """
+        Execute sql command for every sequence of arguments, in one transaction.
+
+        :param query: sql query string
+        :param args_list: sequences of arguments to set into sql query.
+        """
+        if not self._connection:  # pragma: nocover
+            raise ValueError("Not connected")
+        with self._lock:
+            self._connection.executemany(query, args_list)
+            if not self._transaction_depth:
+                self._connection.commit()
+
+    def _begin_transaction_sync(self) -> None:
+        """Begin a transaction, or join the current one."""
+        with self._lock:
+            self._transaction_depth += 1
+
+    def _end_transaction_sync(self, commit: bool) -> None:
+        """
+        End a transaction, committing or rolling it back if it is the outermost one.
+
+        :param commit: commit the transaction if True, roll it back otherwise.
+        """
+        if not self._connection:  # pragma: nocover
+            raise ValueError("Not connected")
+        with self._lock:
+            self._transaction_depth -= 1
+            if self._transaction_depth:
+                return
+            if commit:
+                self._connection.commit()
+            else:
+                self._connection.rollback()
+
+    async def _run_in_executor(self, fn: Callable, *args: Any) -> Any:
+        """
+        Run a function in the executor.
+
+        :param fn: the function to run.
+        :param args: the arguments of the function.
+
+        :return: the result of the function.
+        """
+        if not self._loop:  # pragma: nocover
+            raise ValueError("Not connected")
+        return await self._loop.run_in_executor(self._executor, fn, *args)
+
     async def _executute_sql(
         self, query: str, args: Optional[List] = None
     ) -> Optional[JSON_TYPES]:
@@ -77,11 +131,19 @@ class SqliteStorageBackend(AbstractStorageBackend):
 
         :return: List of tuples with sql records
         """
-        if not self._loop:  # pragma: nocover
-            raise ValueError("Not connected")
-        return await self._loop.run_in_executor(
-            self._executor, self._execute_sql_sync, query, args
-        )
+        return await self._run_in_executor(self._execute_sql_sync, query, args)
+
+    async def begin_transaction(self) -> None:
+        """Begin a transaction, or join the current one."""
+        await self._run_in_executor(self._begin_transaction_sync)
+
+    async def commit_transaction(self) -> None:
+        """Commit the transaction if it is the outermost one."""
+        await self._run_in_executor(self._end_transaction_sync, True)
+
+    async def rollback_transaction(self) -> None:
+        """Roll back the transaction if it is the outermost one."""
+        await self._run_in_executor(self._end_transaction_sync, False)
 
     async def connect(self) -> None:
         """Connect to backend."""
@@ -93,6 +155,8 @@ class SqliteStorageBackend(AbstractStorageBackend):
     @staticmethod
     def _do_connect(fname: str) -> sqlite3.Connection:
         con = sqlite3.connect(fname)
+        # readers do not block the writer and a commit appends to the log only
+        con.execute("PRAGMA journal_mode=WAL")
         if (
             platform.system() == "Windows"
             and sys.version_info.major == 3
@@ -164,6 +228,68 @@ class SqliteStorageBackend(AbstractStorageBackend):
             return json.loads(result[0][0])
         return None
 
+    async def put_many(
+        self, collection_name: str, objects: List[OBJECT_ID_AND_BODY]
+    ) -> None:
+        """
+        Put objects into collection, in one transaction.
+
+        :param collection_name: str.
+        :param objects: list of object ids and bodies.
+        """
+        self._check_collection_name(collection_name)
+        sql = f"""INSERT OR REPLACE INTO {collection_name} (object_id, object_body)
+            VALUES (?, ?);
+        """  # nosec
+        await self._run_in_executor(
+            self._execute_many_sql_sync,
+            sql,
+            [
+                (object_id, json.dumps(object_body))
+                for object_id, object_body in objects
+            ],
+        )
+
+    async def get_many(
+        self, collection_name: str, object_ids: List[str]
+    ) -> List[OBJECT_ID_AND_BODY]:
+        """
+        Get objects from the collection.
+
+        :param collection_name: str.
+        :param object_ids: list of object ids.
+
+        :return: list of ids and bodies of the objects existing in the collection, in the order of the ids
+        """
+        self._check_collection_name(collection_name)
+        bodies = {}
+        for i in range(0, len(object_ids), self.MAX_VARIABLES_PER_STATEMENT):
+            chunk = object_ids[i : i + self.MAX_VARIABLES_PER_STATEMENT]
+            placeholders = ", ".join("?" * len(chunk))
+            sql = f"""SELECT object_id, object_body FROM {collection_name} WHERE object_id IN ({placeholders});"""  # nosec
+            for object_id, object_body in await self._executute_sql(sql, chunk):  # type: ignore
+                bodies[object_id] = object_body
+        return [
+            (object_id, json.loads(bodies[object_id]))
+            for object_id in object_ids
+            if object_id in bodies
+        ]
+
+    async def remove_many(self, collection_name: str, object_ids: List[str]) -> None:
+        """
+        Remove objects from the collection, in one transaction.
+
+        :param collection_name: str.
+        :param object_ids: list of object ids.
+        """
+        self._check_collection_name(collection_name)
+        sql = f"""DELETE FROM {collection_name} WHERE object_id = ?;"""  # nosec
+        await self._run_in_executor(
+            self._execute_many_sql_sync,
+            sql,
+            [(object_id,) for object_id in object_ids],
+        )
+
     async def remove(self, collection_name: str, object_id: str) -> None:
         """
         Remove object from the collection.
@@ -18,7 +18,9 @@
 # ------------------------------------------------------------------------------
 """This module contains the storage implementation."""
 import asyncio
-from typing import Any, Coroutine, List, Optional
+import sys
+from contextlib import contextmanager
+from typing import Any, Coroutine, Generator, List, Optional
 from urllib.parse import urlparse
 
 from aea.helpers.async_utils import AsyncState, Runnable
@@ -27,6 +29,7 @@ from aea.helpers.storage.backends.base import (
     EQUALS_TYPE,
     JSON_TYPES,
     OBJECT_ID_AND_BODY,
+    StorageTransaction,
 )
 from aea.helpers.storage.backends.sqlite import SqliteStorageBackend
 
@@ -101,6 +104,45 @@ class AsyncCollection:
         """
         return await self._storage_backend.list(self._collection_name)
 
+    async def put_many(self, objects: List[OBJECT_ID_AND_BODY]) -> None:
+        """
+        Put objects into collection.
+
+        :param objects: list of object ids and bodies.
+        :return: None
+        """
+        return await self._storage_backend.put_many(self._collection_name, objects)
+
+    async def get_many(self, object_ids: List[str]) -> List[OBJECT_ID_AND_BODY]:
+        """
+        Get objects from the collection.
+
+        :param object_ids: list of object ids.
+
+        :return: list of ids and bodies of the objects existing in the collection
+        """
+        return await self._storage_backend.get_many(self._collection_name, object_ids)
+
+    async def remove_many(self, object_ids: List[str]) -> None:
+        """
+        Remove objects from the collection.
+
+        :param object_ids: list of object ids.
+
+        :return: None
+        """
+        return await self._storage_backend.remove_many(
+            self._collection_name, object_ids
+        )
+
+    def transaction(self) -> StorageTransaction:
+        """
+        Get a context manager running the operations it wraps in one transaction.
+
+        :return: async context manager.
+        """
+        return self._storage_backend.transaction()
+
 
 class SyncCollection:
     """Async collection."""
@@ -169,6 +211,51 @@ class SyncCollection:
         """
         return self._run_sync(self._async_collection.list())
 
+    def put_many(self, objects: List[OBJECT_ID_AND_BODY]) -> None:
+        """
+        Put objects into collection.
+
+        :param objects: list of object ids and bodies.
+        :return: None
+        """
+        return self._run_sync(self._async_collection.put_many(objects))
+
+    def get_many(self, object_ids: List[str]) -> List[OBJECT_ID_AND_BODY]:
+        """
+        Get objects from the collection.
+
+        :param object_ids: list of object ids.
+
+        :return: list of ids and bodies of the objects existing in the collection
+        """
+        return self._run_sync(self._async_collection.get_many(object_ids))
+
+    def remove_many(self, object_ids: List[str]) -> None:
+        """
+        Remove objects from the collection.
+
+        :param object_ids: list of object ids.
+
+        :return: None
+        """
+        return self._run_sync(self._async_collection.remove_many(object_ids))
+
+    @contextmanager
+    def transaction(self) -> Generator[None, None, None]:
+        """
+        Run the operations of the wrapped block in one transaction.
+
+        :yield: generator
+        """
+        transaction = self._async_collection.transaction()
+        self._run_sync(transaction.__aenter__())
+        try:
+            yield
+        except BaseException:
+            self._run_sync(transaction.__aexit__(*sys.exc_info()))
+            raise
+        self._run_sync(transaction.__aexit__(None, None, None))
+
 
 class Storage(Runnable):
     """Generic storage."""
@@ -20,7 +20,7 @@
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 from urllib.parse import urlparse
 
 from aea.common import Address
@@ -32,6 +32,27 @@ from aea.protocols.base import Message
 
 _default_logger = logging.getLogger(__name__)
 
+_ENVELOPE_TO_FIELD = 1
+_ENVELOPE_SENDER_FIELD = 2
+_ENVELOPE_PROTOCOL_ID_FIELD = 3
+_ENVELOPE_MESSAGE_FIELD = 4
+_ENVELOPE_URI_FIELD = 5
+_WIRETYPE_VARINT = 0
+_WIRETYPE_FIXED64 = 1
+_WIRETYPE_LENGTH_DELIMITED = 2
+_WIRETYPE_FIXED32 = 5
+_ENVELOPE_TO_TAG = bytes((_ENVELOPE_TO_FIELD << 3 | _WIRETYPE_LENGTH_DELIMITED,))
+_ENVELOPE_SENDER_TAG = bytes(
+    (_ENVELOPE_SENDER_FIELD << 3 | _WIRETYPE_LENGTH_DELIMITED,)
+)
+_ENVELOPE_PROTOCOL_ID_TAG = bytes(
+    (_ENVELOPE_PROTOCOL_ID_FIELD << 3 | _WIRETYPE_LENGTH_DELIMITED,)
+)
+_ENVELOPE_MESSAGE_TAG = bytes(
+    (_ENVELOPE_MESSAGE_FIELD << 3 | _WIRETYPE_LENGTH_DELIMITED,)
+)
+_ENVELOPE_URI_TAG = bytes((_ENVELOPE_URI_FIELD << 3 | _WIRETYPE_LENGTH_DELIMITED,))
+
 
 class URI:
     """URI following RFC3986."""
@@ -172,6 +193,10 @@ class Empty(Exception):
     """Exception for when the inbox is empty."""
 
 
+class Full(Exception):
+    """Exception for when the outbox is full."""
+
+
 class EnvelopeSerializer(ABC):
     """Abstract class to specify the serialization layer for the envelope."""
 
@@ -204,22 +229,66 @@ class ProtobufEnvelopeSerializer(EnvelopeSerializer):
         :param envelope: the envelope to encode
         :return: the encoded envelope
         """
-        envelope_pb = base_pb2.Envelope()
-        envelope_pb.to = envelope.to
-        envelope_pb.sender = envelope.sender
-        envelope_pb.protocol_id = str(envelope.protocol_specification_id)
-        envelope_pb.message = envelope.message_bytes
-        if envelope.context is not None and envelope.context.uri is not None:
-            envelope_pb.uri = str(envelope.context.uri)
+        if isinstance(envelope, LazyEnvelope):
+            wire_bytes = envelope.wire_bytes
+            if wire_bytes is not None:
+                return wire_bytes
 
-        envelope_bytes = envelope_pb.SerializeToString()
-        return envelope_bytes
+        uri = ""
+        if envelope.context is not None and envelope.context.uri is not None:
+            uri = str(envelope.context.uri)
+
+        # the fields are written as protobuf would, with the message payload
+        # copied once into the encoded envelope
+        parts: List[Union[bytes, memoryview]] = []
+        for tag, value in (
+            (_ENVELOPE_TO_TAG, envelope.to.encode("utf-8")),
+            (_ENVELOPE_SENDER_TAG, envelope.sender.encode("utf-8")),
+            (
+                _ENVELOPE_PROTOCOL_ID_TAG,
+                str(envelope.protocol_specification_id).encode("utf-8"),
+            ),
+            (_ENVELOPE_MESSAGE_TAG, envelope.message_bytes),
+            (_ENVELOPE_URI_TAG, uri.encode("utf-8")),
+        ):
+            if value:  # proto3 does not encode fields set to the default
+                parts += (tag, _encode_varint(len(value)), value)
+        return b"".join(parts)
 
     def decode(self, envelope_bytes: bytes) -> "Envelope":
         """
         Decode the envelope.
 
-        The default serializer doesn't decode the message field.
+        Only the header fields are parsed: the returned envelope keeps a view
+        over the encoded envelope, the message field is copied on first access
+        and the context is built on first access.
+        The encoded envelope must not be modified afterwards.
+
+        :param envelope_bytes: the encoded envelope
+        :return: the envelope
+        """
+        wire = memoryview(envelope_bytes)
+        try:
+            to, sender, raw_protocol_id, message_view, uri_raw = _parse_envelope_header(
+                wire
+            )
+        except ValueError:
+            # let the protobuf parser deal with whatever the header parser does not support
+            return self._decode_eagerly(envelope_bytes)
+
+        return LazyEnvelope(
+            to=to,
+            sender=sender,
+            protocol_specification_id=PublicId.from_str(raw_protocol_id),
+            message=message_view,
+            uri_raw=uri_raw,
+            wire=envelope_bytes,
+        )
+
+    @staticmethod
+    def _decode_eagerly(envelope_bytes: bytes) -> "Envelope":
+        """
+        Decode the envelope with the protobuf parser.
 
         :param envelope_bytes: the encoded envelope
         :return: the envelope
@@ -255,6 +324,94 @@ class ProtobufEnvelopeSerializer(EnvelopeSerializer):
         return envelope
 
 
+def _encode_varint(value: int) -> bytes:
+    """
+    Encode a non negative integer as a protobuf varint.
+
+    :param value: the integer to encode.
+    :return: the varint.
+    """
+    if value < 0x80:
+        return bytes((value,))
+    encoded = bytearray()
+    while value >= 0x80:
+        encoded.append(value & 0x7F | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _decode_varint(buffer: memoryview, position: int) -> Tuple[int, int]:
+    """
+    Decode a protobuf varint.
+
+    :param buffer: the buffer to read from.
+    :param position: the position of the varint in the buffer.
+    :return: the value and the position right after the varint.
+    """
+    result = 0
+    shift = 0
+    while True:
+        try:
+            byte = buffer[position]
+        except IndexError:
+            raise ValueError("Truncated varint.")
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, position
+        shift += 7
+        if shift >= 64:
+            raise ValueError("Too many bytes when decoding varint.")
+
+
+def _parse_envelope_header(wire: memoryview,) -> Tuple[str, str, str, memoryview, str]:
+    """
+    Parse the fields of an encoded envelope without copying the message field.
+
+    :param wire: the encoded envelope.
+    :return: to, sender, protocol id, a view over the message and uri.
+    :raises ValueError: if the encoded envelope is malformed.
+    """
+    if wire.format != "B":
+        raise ValueError("Unsupported buffer format.")
+    fields: Dict[int, memoryview] = {}
+    position = 0
+    end = len(wire)
+    while position < end:
+        tag, position = _decode_varint(wire, position)
+        field_number, wire_type = tag >> 3, tag & 0x07
+        if field_number == 0:
+            raise ValueError("Invalid field number.")
+        if wire_type == _WIRETYPE_LENGTH_DELIMITED:
+            length, position = _decode_varint(wire, position)
+            # as in protobuf, the last occurrence of a field wins
+            fields[field_number] = wire[position : position + length]
+            position += length
+        elif wire_type == _WIRETYPE_VARINT:
+            _, position = _decode_varint(wire, position)
+        elif wire_type == _WIRETYPE_FIXED64:
+            position += 8
+        elif wire_type == _WIRETYPE_FIXED32:
+            position += 4
+        else:
+            raise ValueError(f"Unsupported wire type: {wire_type}.")
+    if position != end:
+        raise ValueError("Truncated envelope.")
+
+    def _get_str(field_number: int) -> str:
+        value = fields.get(field_number)
+        return str(value, "utf-8") if value is not None else ""
+
+    return (
+        _get_str(_ENVELOPE_TO_FIELD),
+        _get_str(_ENVELOPE_SENDER_FIELD),
+        _get_str(_ENVELOPE_PROTOCOL_ID_FIELD),
+        fields.get(_ENVELOPE_MESSAGE_FIELD, wire[0:0]),
+        _get_str(_ENVELOPE_URI_FIELD),
+    )
+
+
 DefaultEnvelopeSerializer = ProtobufEnvelopeSerializer
 
 
@@ -377,6 +534,11 @@ class Envelope:
             return self._message.encode()
         return self._message
 
+    @property
+    def message_object(self) -> Optional[Message]:
+        """Get the protocol-specific message, if it is not in serialized form."""
+        return self._message if isinstance(self._message, Message) else None
+
     @property
     def context(self) -> Optional[EnvelopeContext]:
         """Get the envelope context."""
@@ -469,3 +631,121 @@ class Envelope:
             if isinstance(self.message, bytes)
             else self.message,
         )
+
+
+class LazyEnvelope(Envelope):
+    """
+    An envelope decoded from its wire representation on demand.
+
+    The message field is kept as a view over the encoded envelope until it is
+    accessed, so that envelopes which are only routed, forwarded or dropped
+    are never copied. As long as the envelope is not modified, encoding it
+    again returns the original encoded envelope.
+    """
+
+    __slots__ = ("_message_view", "_uri_raw", "_wire")
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self,
+        to: Address,
+        sender: Address,
+        protocol_specification_id: PublicId,
+        message: memoryview,
+        uri_raw: str = "",
+        wire: Optional[bytes] = None,
+    ) -> None:
+        """
+        Initialize a lazy envelope.
+
+        :param to: the address of the receiver.
+        :param sender: the address of the sender.
+        :param protocol_specification_id: the protocol specification id (wire id).
+        :param message: the view over the serialized protocol-specific message.
+        :param uri_raw: the raw uri of the envelope context, or empty string if not set.
+        :param wire: the encoded envelope, if any.
+        """
+        self._to = to
+        self._sender = sender
+        enforce(
+            self.is_to_public_id == self.is_sender_public_id,
+            "To and sender must either both be agent addresses or both be public ids of AEA components.",
+        )
+        self._protocol_specification_id = protocol_specification_id
+        self._message = b""
+        self._message_view: Optional[memoryview] = message
+        if self.is_component_to_component_message:
+            enforce(
+                uri_raw == "",
+                "EnvelopeContext must be None for component to component messages.",
+            )
+        self._context = None
+        self._uri_raw = uri_raw
+        self._wire = wire
+
+    @property
+    def to(self) -> Address:
+        """Get address of receiver."""
+        return self._to
+
+    @to.setter
+    def to(self, to: Address) -> None:
+        """Set address of receiver."""
+        enforce(isinstance(to, str), f"To must be string. Found '{type(to)}'")
+        self._to = to
+        self._wire = None
+
+    @property
+    def sender(self) -> Address:
+        """Get address of sender."""
+        return self._sender
+
+    @sender.setter
+    def sender(self, sender: Address) -> None:
+        """Set address of sender."""
+        enforce(
+            isinstance(sender, str), f"Sender must be string. Found '{type(sender)}'"
+        )
+        self._sender = sender
+        self._wire = None
+
+    @property
+    def message(self) -> Union[Message, bytes]:
+        """Get the protocol-specific message."""
+        if self._message_view is not None:
+            self._message = self._message_view.tobytes()
+            self._message_view = None
+        return self._message
+
+    @message.setter
+    def message(self, message: Union[Message, bytes]) -> None:
+        """Set the protocol-specific message."""
+        self._message = message
+        self._message_view = None
+        self._wire = None
+
+    @property
+    def message_bytes(self) -> bytes:
+        """Get the protocol-specific message."""
+        if self._message_view is not None:
+            return cast(bytes, self.message)
+        return super().message_bytes
+
+    @property
+    def context(self) -> Optional[EnvelopeContext]:
+        """Get the envelope context."""
+        if self._uri_raw != "":
+            self._context = EnvelopeContext(uri=URI(uri_raw=self._uri_raw))
+            self._uri_raw = ""
+        return self._context
+
+    @property
+    def is_message_loaded(self) -> bool:
+        """Check whether the protocol-specific message has been copied out of the encoded envelope."""
+        return self._message_view is None
+
+    @property
+    def wire_bytes(self) -> Optional[bytes]:
+        """Get the encoded envelope it was decoded from, or None if it has been modified since."""
+        if self._wire is None:
+            return None
+        return bytes(self._wire)
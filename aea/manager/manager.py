@@ -25,7 +25,7 @@ from asyncio.tasks import FIRST_COMPLETED
 from collections import defaultdict
 from shutil import rmtree
 from threading import Thread
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from aea.aea import AEA
 from aea.configurations.constants import AEA_MANAGER_DATA_DIRNAME, DEFAULT_REGISTRY_NAME
@@ -33,6 +33,17 @@ from aea.configurations.data_types import PublicId
 from aea.crypto.plugin import load_all_plugins
 from aea.helpers.io import open_file
 from aea.manager.project import AgentAlias, Project
+from aea.manager.scheduler import (
+    SharedLoopShard,
+    is_shared_loop_supported,
+    run_in_agent_context,
+)
+from aea.manager.workers import (
+    COMMAND_GET_AGENT_METRICS,
+    COMMAND_START_AGENT,
+    COMMAND_STOP_AGENT,
+    WorkerProcessShard,
+)
 
 
 class ProjectNotFoundError(ValueError):
@@ -141,10 +152,137 @@ class AgentRunThreadTask(AgentRunAsyncTask):
             self._thread.join()
 
 
+class AgentRunSharedLoopTask(AgentRunAsyncTask):
+    """Wrapper to run agent on a loop shared with other agents."""
+
+    def __init__(
+        self, agent: AEA, loop: asyncio.AbstractEventLoop, shard: SharedLoopShard
+    ) -> None:
+        """Init task with agent, caller loop and the shard to run the agent on."""
+        AgentRunAsyncTask.__init__(self, agent, loop)
+        self.shard = shard
+        self.run_loop = shard.loop
+
+    def start(self) -> None:
+        """Schedule the task on the shared loop, in a context bound to the agent."""
+        self._done_future = asyncio.Future(loop=self.caller_loop)
+        self.shard.agents.add(self.agent.name)
+        run_in_agent_context(
+            self.agent.name, self.run_loop.call_soon_threadsafe, self._create_task
+        )
+
+    def _create_task(self) -> None:
+        """Add the agent to the shared loop and create the task, it inherits the agent context."""
+        self.shard.loop.add_agent(self.agent.name)
+        self.task = self.run_loop.create_task(self._run_wrapper())
+        self.task.add_done_callback(self._on_task_done)
+
+    def _on_task_done(self, _task: asyncio.Future) -> None:
+        """Remove the agent from the shared loop, and set the result if the task was cancelled before it started."""
+        self.shard.loop.remove_agent(self.agent.name)
+        self.caller_loop.call_soon_threadsafe(self._release_shard)
+
+    def _release_shard(self) -> None:
+        """Release the agent from the shard and set the result, from the caller loop."""
+        self.shard.agents.discard(self.agent.name)
+        self._set_result(None)
+
+    def stop(self) -> None:
+        """Stop task."""
+        self.run_loop.call_soon_threadsafe(self._cancel)
+
+    def _cancel(self) -> None:
+        """Cancel the task, from the shared loop."""
+        if self.task is not None:
+            self.task.cancel()
+
+
+class AgentRunProcessTask:
+    """Wrapper to run agent in a worker process, its methods are called from the caller loop."""
+
+    def __init__(
+        self,
+        agent_alias: AgentAlias,
+        data_dir: str,
+        password: Optional[str],
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        """Init task with agent alias, data dir and password of the agent, and caller loop."""
+        self.agent_alias = agent_alias
+        self.data_dir = data_dir
+        self.password = password
+        self.caller_loop = loop
+        self.shard: Optional[WorkerProcessShard] = None
+        self._done_future: asyncio.Future = asyncio.Future(loop=loop)
+
+    @property
+    def agent_name(self) -> str:
+        """Get the agent name."""
+        return self.agent_alias.agent_name
+
+    async def start(self, shard: WorkerProcessShard) -> None:
+        """
+        Start the agent in a worker process.
+
+        A failure to start the agent is reported as the task result.
+
+        :param shard: the worker process to run the agent in.
+        """
+        self.shard = shard
+        shard.agents.add(self.agent_name)
+        try:
+            await shard.request(
+                COMMAND_START_AGENT,
+                agent_name=self.agent_name,
+                public_id=str(self.agent_alias.project.public_id),
+                project_path=os.path.abspath(self.agent_alias.project.path),
+                data_dir=self.data_dir,
+                config=self.agent_alias.config_json,
+                password=self.password,
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            shard.agents.discard(self.agent_name)
+            self.set_result(e)
+
+    def wait(self) -> asyncio.Future:
+        """Return future to wait task completed."""
+        return self._done_future
+
+    async def stop(self) -> None:
+        """Stop the agent, the task result is set when the worker reports it stopped."""
+        if self.shard is None:  # pragma: nocover
+            raise ValueError("Task was not started!")
+        await self.shard.request(COMMAND_STOP_AGENT, agent_name=self.agent_name)
+
+    async def get_metrics(self) -> Dict[str, Any]:
+        """Get the queue depths of the agent and its worker process."""
+        if self.shard is None:  # pragma: nocover
+            raise ValueError("Task was not started!")
+        metrics = await self.shard.request(
+            COMMAND_GET_AGENT_METRICS, agent_name=self.agent_name
+        )
+        metrics.update({"shard": self.shard.name, "pid": self.shard.pid})
+        return metrics
+
+    def set_result(self, exc: Optional[BaseException]) -> None:
+        """Set result of task execution."""
+        if self._done_future.done():  # pragma: nocover
+            return
+        if exc:
+            self._done_future.set_exception(exc)
+        else:
+            self._done_future.set_result(None)
+
+    @property
+    def is_running(self) -> bool:
+        """Return is task running."""
+        return not self.wait().done()
+
+
 class MultiAgentManager:
     """Multi agents manager."""
 
-    MODES = ["async", "threaded"]
+    MODES = ["async", "threaded", "shared", "multiprocess"]
     DEFAULT_TIMEOUT_FOR_BLOCKING_OPERATIONS = 60
     SAVE_FILENAME = "save.json"
 
@@ -155,15 +293,25 @@ class MultiAgentManager:
         registry_path: str = DEFAULT_REGISTRY_NAME,
         auto_add_remove_project: bool = False,
         password: Optional[str] = None,
+        shards: int = 1,
     ) -> None:
         """
         Initialize manager.
 
+        In shared mode, the agents run on `shards` event loops, each in its own thread,
+        and an agent is assigned to the loop with the fewest agents when it starts.
+        Agents should use the async runtime mode to not spawn threads of their own.
+
+        In multiprocess mode, the agents run in `shards` worker processes. An agent
+        is assigned to the process with the fewest agents when it starts, and stays
+        in it until it stops.
+
         :param working_dir: directory to store base agents.
-        :param mode: str. async or threaded
+        :param mode: str. async, threaded, shared or multiprocess
         :param registry_path: str. path to the local packages registry
         :param auto_add_remove_project: bool. add/remove project on the first agent add/last agent remove
         :param password: the password to encrypt/decrypt the private key.
+        :param shards: int. number of event loops in shared mode, of worker processes in multiprocess mode.
         """
         self.working_dir = working_dir
         self._auto_add_remove_project = auto_add_remove_project
@@ -178,7 +326,9 @@ class MultiAgentManager:
             os.path.join(self.working_dir, AEA_MANAGER_DATA_DIRNAME)
         )
         self._agents: Dict[str, AgentAlias] = {}
-        self._agents_tasks: Dict[str, AgentRunAsyncTask] = {}
+        self._agents_tasks: Dict[
+            str, Union[AgentRunAsyncTask, AgentRunProcessTask]
+        ] = {}
 
         self._thread: Optional[Thread] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
@@ -200,8 +350,15 @@ class MultiAgentManager:
             raise ValueError(
                 f'Invalid mode {mode}. Valid modes are {", ".join(self.MODES)}'
             )
+        if mode == "shared" and not is_shared_loop_supported():  # pragma: nocover
+            raise ValueError("Shared mode requires Python 3.7 or later.")
+        if shards < 1:
+            raise ValueError(f"Invalid shards number {shards}. It must be positive.")
         self._started_event = threading.Event()
         self._mode = mode
+        self._shards_num = shards
+        self._shards: List[SharedLoopShard] = []
+        self._worker_shards: List[WorkerProcessShard] = []
         self._password = password
 
         # this flags will control whether we have already printed the warning message
@@ -273,6 +430,40 @@ class MultiAgentManager:
                 else:
                     await task
 
+    async def _start_worker_shards(self) -> None:
+        """Start the worker processes of the agents."""
+        self._worker_shards = [
+            WorkerProcessShard(f"agents_worker_{i}", self._on_worker_agent_done)
+            for i in range(self._shards_num)
+        ]
+        await asyncio.gather(*[shard.start() for shard in self._worker_shards])
+
+    async def _stop_worker_shards(self) -> None:
+        """Stop the worker processes of the agents."""
+        await asyncio.gather(
+            *[
+                shard.stop(self.DEFAULT_TIMEOUT_FOR_BLOCKING_OPERATIONS)
+                for shard in self._worker_shards
+            ]
+        )
+        self._worker_shards = []
+
+    def _on_worker_agent_done(
+        self, agent_name: str, exc: Optional[BaseException]
+    ) -> None:
+        """Set the result of the task of an agent stopped in a worker process."""
+        task = self._agents_tasks.get(agent_name)
+        if isinstance(task, AgentRunProcessTask):
+            task.set_result(exc)
+
+    def _run_in_manager_loop(self, coro: Awaitable) -> Any:
+        """Run a coroutine in the manager loop, and wait for its result."""
+        if not self._loop:  # pragma: nocover
+            raise ValueError("Manager was not started!")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(  # type: ignore
+            self.DEFAULT_TIMEOUT_FOR_BLOCKING_OPERATIONS
+        )
+
     def add_error_callback(
         self, error_callback: Callable[[str, BaseException], None]
     ) -> "MultiAgentManager":
@@ -305,11 +496,21 @@ class MultiAgentManager:
         self._ensure_working_dir()
         self._last_start_status = self._load_state(local=local, remote=remote)
 
+        if self._mode == "shared":
+            self._shards = [
+                SharedLoopShard(f"agents_shard_{i}") for i in range(self._shards_num)
+            ]
+            for shard in self._shards:
+                shard.start()
+
         self._started_event.clear()
         self._is_running = True
         self._thread = Thread(target=self._run_thread, daemon=True)
         self._thread.start()
         self._started_event.wait(self.DEFAULT_TIMEOUT_FOR_BLOCKING_OPERATIONS)
+
+        if self._mode == "multiprocess":
+            self._run_in_manager_loop(self._start_worker_shards())
         return self
 
     @property
@@ -358,6 +559,9 @@ class MultiAgentManager:
                 self.remove_project(project, keep_files=save)
             self._cleanup(only_data=save)
 
+        if self._worker_shards:
+            self._run_in_manager_loop(self._stop_worker_shards())
+
         self._is_running = False
 
         self._loop.call_soon_threadsafe(self._event.set)
@@ -365,6 +569,10 @@ class MultiAgentManager:
         if self._thread.ident != threading.get_ident():
             self._thread.join(self.DEFAULT_TIMEOUT_FOR_BLOCKING_OPERATIONS)
 
+        for shard in self._shards:
+            shard.stop(self.DEFAULT_TIMEOUT_FOR_BLOCKING_OPERATIONS)
+        self._shards = []
+
         self._thread = None
         self._warning_message_printed_for_agent = {}
         return self
@@ -652,18 +860,90 @@ class MultiAgentManager:
         if self._is_agent_running(agent_name):
             raise ValueError(f"{agent_name} is already started!")
 
+        if self._mode == "multiprocess":
+            self._start_agent_in_worker(agent_alias)
+            return self
+
         aea = agent_alias.get_aea_instance()
 
         if self._mode == "async":
             task = AgentRunAsyncTask(aea, self._loop)
         elif self._mode == "threaded":
             task = AgentRunThreadTask(aea, self._loop)
+        elif self._mode == "shared":
+            shard = min(self._shards, key=lambda shard: shard.agents_num)
+            task = AgentRunSharedLoopTask(aea, self._loop, shard)
 
         task.start()
         self._agents_tasks[agent_name] = task
         self._loop.call_soon_threadsafe(self._event.set)
         return self
 
+    def _start_agent_in_worker(self, agent_alias: AgentAlias) -> None:
+        """Start an agent in the worker process with the fewest agents."""
+        if not self._loop or not self._event or not self._thread:  # pragma: nocover
+            raise ValueError("Manager was not started!")
+        agent_name = agent_alias.agent_name
+        task = AgentRunProcessTask(
+            agent_alias,
+            self.get_data_dir_of_agent(agent_name),
+            self._password,
+            self._loop,
+        )
+        shard = min(self._worker_shards, key=lambda shard: shard.agents_num)
+        self._agents_tasks[agent_name] = task
+        future = asyncio.run_coroutine_threadsafe(task.start(shard), self._loop)
+        self._loop.call_soon_threadsafe(self._event.set)
+        if self._thread.ident != threading.get_ident():
+            future.result(self.DEFAULT_TIMEOUT_FOR_BLOCKING_OPERATIONS)
+
+    def get_agent_metrics(self, agent_name: str) -> Dict[str, Any]:
+        """
+        Get the queue depths of a running agent and, in shared mode, its scheduling metrics.
+
+        The scheduling metrics are the shard of the agent, the time spent running its callbacks,
+        its share of the time spent by the agents of the shard, the callbacks run, and the
+        callbacks deferred because the agent exceeded its fair share of the loop.
+
+        :param agent_name: agent name
+        :return: the metrics
+        """
+        if not self._is_agent_running(agent_name):
+            raise ValueError(f"{agent_name} is not running!")
+
+        task = self._agents_tasks[agent_name]
+        if isinstance(task, AgentRunProcessTask):
+            return self._run_in_manager_loop(task.get_metrics())
+
+        multiplexer = task.agent.runtime.multiplexer
+        try:
+            outbox_size = multiplexer.out_queue.qsize()
+        except ValueError:  # pragma: nocover
+            outbox_size = 0
+        metrics: Dict[str, Any] = {
+            "inbox_size": multiplexer.in_queue.qsize(),
+            "outbox_size": outbox_size,
+            "decision_maker_queue_size": task.agent.runtime.decision_maker.message_in_queue.qsize(),
+        }
+        if isinstance(task, AgentRunSharedLoopTask):
+            metrics.update(
+                task.shard.get_agent_stats(
+                    agent_name, self.DEFAULT_TIMEOUT_FOR_BLOCKING_OPERATIONS
+                )
+            )
+        return metrics
+
+    def get_agents_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the metrics of all the running agents.
+
+        :return: the metrics by agent name, see get_agent_metrics.
+        """
+        return {
+            agent_name: self.get_agent_metrics(agent_name)
+            for agent_name in self.list_agents(running_only=True)
+        }
+
     def _is_agent_running(self, agent_name: str) -> bool:
         """Return is agent running state."""
         if agent_name not in self._agents_tasks:
@@ -703,7 +983,7 @@ class MultiAgentManager:
 
         if self._thread.ident == threading.get_ident():  # pragma: nocover
             # In same thread do not perform blocking operations!
-            agent_task.stop()
+            self._stop_task(agent_task)
             return self
 
         wait_future = agent_task.wait()
@@ -720,11 +1000,20 @@ class MultiAgentManager:
                 wait_future.add_done_callback(event_set)  # pragma: nocover
 
         self._loop.call_soon_threadsafe(_add_cb)
-        agent_task.stop()
+        self._stop_task(agent_task)
         event.wait(self.DEFAULT_TIMEOUT_FOR_BLOCKING_OPERATIONS)
 
         return self
 
+    def _stop_task(self, task: Union[AgentRunAsyncTask, AgentRunProcessTask]) -> None:
+        """Stop the task of an agent, without waiting for it."""
+        if not isinstance(task, AgentRunProcessTask):
+            task.stop()
+            return
+        if not self._loop:  # pragma: nocover
+            raise ValueError("Manager was not started!")
+        asyncio.run_coroutine_threadsafe(task.stop(), self._loop)
+
     def stop_all_agents(self) -> "MultiAgentManager":
         """
         Stop all agents running.
@@ -0,0 +1,341 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the event loops shared by the agents of the multi agents manager."""
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Set
+
+
+try:
+    import contextvars  # Python 3.7+
+except ImportError:  # pragma: nocover
+    contextvars = None  # type: ignore
+
+
+CURRENT_AGENT: Optional["contextvars.ContextVar[str]"] = (
+    contextvars.ContextVar("aea_manager_current_agent")
+    if contextvars is not None
+    else None
+)
+
+
+def is_shared_loop_supported() -> bool:
+    """Check whether agents can be scheduled on shared loops, it requires context variables."""
+    return CURRENT_AGENT is not None
+
+
+def run_in_agent_context(agent_name: str, func: Callable, *args: Any) -> Any:
+    """
+    Run a function in a copy of the current context, bound to an agent.
+
+    Tasks and callbacks scheduled by the function inherit the context,
+    so their time is accounted to the agent by the shared loops.
+
+    :param agent_name: the agent name.
+    :param func: the function to run.
+    :param args: the positional arguments of the function.
+    :return: the result of the function.
+    """
+    if CURRENT_AGENT is None:  # pragma: nocover
+        raise ValueError("Context variables are not supported.")
+    context = contextvars.copy_context()
+    context.run(CURRENT_AGENT.set, agent_name)
+    return context.run(func, *args)
+
+
+class AgentSchedulingStats:
+    """Scheduling statistics of an agent on a shared loop."""
+
+    __slots__ = (
+        "cpu_time",
+        "callbacks",
+        "deferred",
+        "period",
+        "period_cpu_time",
+        "ready_handles",
+        "deferred_handles",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.cpu_time = 0.0
+        self.callbacks = 0
+        self.deferred = 0
+        self.period = 0
+        self.period_cpu_time = 0.0
+        self.ready_handles: Deque[asyncio.Handle] = deque()
+        self.deferred_handles: Deque[asyncio.TimerHandle] = deque()
+
+    def add(self, elapsed: float, period: int) -> None:
+        """
+        Account the time spent in a callback of the agent.
+
+        :param elapsed: the time spent, in seconds.
+        :param period: the current scheduling period of the loop.
+        """
+        self.cpu_time += elapsed
+        self.callbacks += 1
+        if self.period != period:
+            self.period = period
+            self.period_cpu_time = 0.0
+        self.period_cpu_time += elapsed
+
+
+def _pending(handles: Deque) -> bool:
+    """Drop the cancelled handles at the head of a queue, and check whether handles are left."""
+    while handles and handles[0].cancelled():
+        handles.popleft()
+    return bool(handles)
+
+
+class AgentsSharedLoop(asyncio.SelectorEventLoop):  # type: ignore
+    """
+    Event loop running the runtimes of many agents.
+
+    Callbacks are attributed to the agent whose context scheduled them, and
+    the time spent running them is accounted per agent. Within a scheduling
+    period, an agent that used more than its fair share of the period has
+    its new ready callbacks deferred to the end of the period, as long as
+    callbacks of other agents are waiting to run. Once an agent has deferred
+    callbacks, its later ones are deferred behind them, so they all run in
+    the order they were scheduled.
+
+    The agents must be added and removed from the loop thread.
+    """
+
+    SCHEDULING_PERIOD = 0.05
+    DEFERRED_TIME_STEP = 1e-6
+
+    def __init__(self, selector: Any = None) -> None:
+        """
+        Initialize the loop.
+
+        :param selector: the selector, the default one if None.
+        """
+        super().__init__(selector)
+        self._agents_stats: Dict[str, AgentSchedulingStats] = {}
+        self._period = 0
+        self._period_end = 0.0
+        self._last_deferred_time = 0.0
+        self._running_stats: Optional[AgentSchedulingStats] = None
+        self._running_start_time = 0.0
+
+    @property
+    def agents_stats(self) -> Dict[str, AgentSchedulingStats]:
+        """Get the scheduling statistics of the agents on the loop."""
+        return self._agents_stats
+
+    def add_agent(self, agent_name: str) -> None:
+        """
+        Start accounting the callbacks of an agent.
+
+        :param agent_name: the agent name.
+        """
+        self._agents_stats[agent_name] = AgentSchedulingStats()
+
+    def remove_agent(self, agent_name: str) -> None:
+        """
+        Stop accounting the callbacks of an agent.
+
+        :param agent_name: the agent name.
+        """
+        self._agents_stats.pop(agent_name, None)
+
+    def call_soon(
+        self, callback: Callable, *args: Any, context: Any = None
+    ) -> asyncio.Handle:
+        """Schedule a callback, deferring it if its agent exceeded the fair share of the period."""
+        stats = self._get_agent_stats(context)
+        if stats is None:
+            return super().call_soon(callback, *args, context=context)
+        if _pending(stats.deferred_handles) or self._is_over_fair_share(stats):
+            stats.deferred += 1
+            timer_handle = super().call_at(
+                self._next_deferred_time(),
+                self._run_deferred,
+                stats,
+                callback,
+                *args,
+                context=context,
+            )
+            stats.deferred_handles.append(timer_handle)
+            return timer_handle
+        handle = super().call_soon(
+            self._run_ready, stats, callback, *args, context=context
+        )
+        stats.ready_handles.append(handle)
+        return handle
+
+    def call_at(
+        self, when: float, callback: Callable, *args: Any, context: Any = None
+    ) -> asyncio.TimerHandle:
+        """Schedule a callback at a given time, accounting it to its agent."""
+        stats = self._get_agent_stats(context)
+        if stats is None:
+            return super().call_at(when, callback, *args, context=context)
+        return super().call_at(
+            when, self._run_accounted, stats, callback, *args, context=context
+        )
+
+    def _get_agent_stats(self, context: Any) -> Optional[AgentSchedulingStats]:
+        """Get the statistics of the agent a callback is scheduled for, if any."""
+        if context is None:
+            agent_name = CURRENT_AGENT.get(None)  # type: ignore
+        else:
+            agent_name = context.get(CURRENT_AGENT)
+        if agent_name is None:
+            return None
+        return self._agents_stats.get(agent_name)
+
+    def _next_deferred_time(self) -> float:
+        """Get the time to run a deferred callback at: the end of the period, after the callbacks deferred before."""
+        when = self._period_end
+        if when <= self._last_deferred_time:
+            when = self._last_deferred_time + self.DEFERRED_TIME_STEP
+        self._last_deferred_time = when
+        return when
+
+    def _is_over_fair_share(self, stats: AgentSchedulingStats) -> bool:
+        """Check whether an agent used more than its share of the current period, while others wait."""
+        now = self.time()
+        if now >= self._period_end:
+            self._period += 1
+            self._period_end = now + self.SCHEDULING_PERIOD
+            return False
+        used_time = stats.period_cpu_time if stats.period == self._period else 0.0
+        if stats is self._running_stats:
+            # the callback scheduling this one is not accounted yet
+            used_time += time.perf_counter() - self._running_start_time
+        fair_share = self.SCHEDULING_PERIOD / len(self._agents_stats)
+        return used_time > fair_share and any(
+            _pending(other.ready_handles)
+            for other in self._agents_stats.values()
+            if other is not stats
+        )
+
+    def _run_ready(
+        self, stats: AgentSchedulingStats, callback: Callable, *args: Any
+    ) -> None:
+        """Run a ready callback, the first one of its agent not cancelled."""
+        if _pending(stats.ready_handles):
+            stats.ready_handles.popleft()
+        self._run_accounted(stats, callback, *args)
+
+    def _run_deferred(
+        self, stats: AgentSchedulingStats, callback: Callable, *args: Any
+    ) -> None:
+        """Run a deferred callback, the first one of its agent not cancelled."""
+        if _pending(stats.deferred_handles):
+            stats.deferred_handles.popleft()
+        self._run_accounted(stats, callback, *args)
+
+    def _run_accounted(
+        self, stats: AgentSchedulingStats, callback: Callable, *args: Any
+    ) -> None:
+        """Run a callback and account the time spent to its agent."""
+        self._running_stats = stats
+        self._running_start_time = start_time = time.perf_counter()
+        try:
+            callback(*args)
+        finally:
+            self._running_stats = None
+            stats.add(time.perf_counter() - start_time, self._period)
+
+
+class SharedLoopShard:
+    """A shared loop running in its own thread, with the agents assigned to it."""
+
+    def __init__(self, name: str) -> None:
+        """
+        Initialize the shard.
+
+        :param name: the shard name, used for the thread name.
+        """
+        self.name = name
+        self.loop = AgentsSharedLoop()
+        self.agents: Set[str] = set()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def agents_num(self) -> int:
+        """Get the number of agents assigned to the shard."""
+        return len(self.agents)
+
+    def start(self) -> None:
+        """Start the loop in a dedicated thread."""
+        if self._thread is not None:  # pragma: nocover
+            return
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name=self.name, daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the loop and wait for the thread to finish.
+
+        :param timeout: the time to wait for the thread, in seconds.
+        """
+        if self._thread is None:  # pragma: nocover
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
+        self._thread = None
+        if not self.loop.is_running():
+            self.loop.close()
+
+    def get_agent_stats(
+        self, agent_name: str, timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Get the scheduling metrics of an agent on the shard.
+
+        The statistics are read on the loop thread, which updates them.
+
+        :param agent_name: the agent name.
+        :param timeout: the time to wait for the loop thread, in seconds.
+        :return: the cpu time, the share of the shard cpu time, the callbacks run and the callbacks deferred.
+        """
+        if self._thread is None or self._thread is threading.current_thread():
+            return self._get_agent_stats(agent_name)
+        future = asyncio.run_coroutine_threadsafe(
+            self._read_agent_stats(agent_name), self.loop
+        )
+        return future.result(timeout)
+
+    async def _read_agent_stats(self, agent_name: str) -> Dict[str, Any]:
+        """Get the scheduling metrics of an agent, from the loop thread."""
+        return self._get_agent_stats(agent_name)
+
+    def _get_agent_stats(self, agent_name: str) -> Dict[str, Any]:
+        """Get the scheduling metrics of an agent."""
+        agents_stats = self.loop.agents_stats
+        stats = agents_stats.get(agent_name)
+        if stats is None:
+            return {}
+        total_cpu_time = sum(s.cpu_time for s in agents_stats.values())
+        return {
+            "shard": self.name,
+            "cpu_time": stats.cpu_time,
+            "cpu_share": stats.cpu_time / total_cpu_time if total_cpu_time else 0.0,
+            "callbacks": stats.callbacks,
+            "deferred": stats.deferred,
+        }
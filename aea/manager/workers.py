@@ -0,0 +1,360 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the worker processes hosting shards of the agents of the multi agents manager."""
+import asyncio
+import logging
+import multiprocessing
+import pickle  # nosec
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from aea.aea import AEA
+from aea.configurations.data_types import PublicId
+from aea.crypto.plugin import load_all_plugins
+from aea.helpers.pipe import IPCChannel, make_ipc_channel, make_ipc_channel_client
+from aea.manager.project import AgentAlias, Project
+
+
+_default_logger = logging.getLogger(__name__)
+
+COMMAND_START_AGENT = "start_agent"
+COMMAND_STOP_AGENT = "stop_agent"
+COMMAND_GET_AGENT_METRICS = "get_agent_metrics"
+COMMAND_SHUTDOWN = "shutdown"
+EVENT_AGENT_DONE = "agent_done"
+
+
+class AgentsWorkerError(Exception):
+    """Error raised in a worker process, when the original one cannot be sent to the manager."""
+
+
+def _dump_error(error: Optional[BaseException]) -> Optional[bytes]:
+    """Serialize an error raised in a worker, falling back to its representation."""
+    if error is None:
+        return None
+    try:
+        return pickle.dumps(error)
+    except Exception:  # pylint: disable=broad-except
+        return pickle.dumps(AgentsWorkerError(repr(error)))
+
+
+def _load_error(data: Optional[bytes]) -> Optional[BaseException]:
+    """Deserialize an error raised in a worker, its class may not be importable in the manager."""
+    if data is None:
+        return None
+    try:
+        return pickle.loads(data)  # nosec
+    except Exception as e:  # pylint: disable=broad-except
+        return AgentsWorkerError(f"Cannot load the worker error: {e}")
+
+
+class AgentsWorker:
+    """
+    The agents of a worker process.
+
+    The worker executes the commands of the manager read from the IPC channel,
+    and notifies the manager when an agent stops on its own.
+    """
+
+    AGENT_START_TIMEOUT = 10.0
+    AGENT_START_POLL_PERIOD = 0.05
+
+    def __init__(self, in_path: str, out_path: str) -> None:
+        """
+        Initialize the worker.
+
+        :param in_path: the rendezvous point of the commands.
+        :param out_path: the rendezvous point of the responses and events.
+        """
+        self._channel = make_ipc_channel_client(in_path, out_path)
+        self._tasks: Dict[str, asyncio.Future] = {}
+        self._agents: Dict[str, AEA] = {}
+        self._requests: List[asyncio.Future] = []
+
+    async def run(self) -> None:
+        """Execute the commands of the manager, till it asks for a shutdown or disconnects."""
+        await self._channel.connect()
+        load_all_plugins(is_raising_exception=False)
+        while True:
+            data = await self._channel.read()
+            if data is None:
+                break
+            message = pickle.loads(data)  # nosec
+            if message["command"] == COMMAND_SHUTDOWN:
+                await self._stop_agents()
+                await self._respond(message["id"], None, None)
+                break
+            self._requests.append(asyncio.ensure_future(self._handle(message)))
+            self._requests = [task for task in self._requests if not task.done()]
+        await self._stop_agents()
+        await self._channel.close()
+
+    async def _handle(self, message: Dict[str, Any]) -> None:
+        """Execute a command and respond with its result."""
+        result, error = None, None
+        try:
+            handler = getattr(self, "_" + message["command"])
+            result = await handler(**message["params"])
+        except Exception as e:  # pylint: disable=broad-except
+            error = e
+        await self._respond(message["id"], result, error)
+
+    async def _respond(
+        self, request_id: int, result: Any, error: Optional[BaseException]
+    ) -> None:
+        """Send the response to a command."""
+        await self._channel.write(
+            pickle.dumps(
+                {"id": request_id, "result": result, "error": _dump_error(error)}
+            )
+        )
+
+    async def _notify_agent_done(
+        self, agent_name: str, error: Optional[BaseException]
+    ) -> None:
+        """Notify the manager an agent stopped."""
+        await self._channel.write(
+            pickle.dumps(
+                {
+                    "event": EVENT_AGENT_DONE,
+                    "agent_name": agent_name,
+                    "error": _dump_error(error),
+                }
+            )
+        )
+
+    async def _start_agent(
+        self,
+        agent_name: str,
+        public_id: str,
+        project_path: str,
+        data_dir: str,
+        config: List[Dict],
+        password: Optional[str],
+    ) -> None:
+        """Build an agent from its project and configuration, and run it."""
+        if agent_name in self._tasks:
+            raise ValueError(f"{agent_name} is already started!")
+        project = Project(PublicId.from_str(public_id), project_path)
+        agent_alias = AgentAlias(project, agent_name, data_dir, password)
+        agent_alias.set_agent_config_from_data(config)
+        aea = agent_alias.get_aea_instance()
+        aea.runtime.set_loop(asyncio.get_event_loop())
+        task = asyncio.ensure_future(aea.runtime.run())
+        task.add_done_callback(lambda task: self._on_agent_done(agent_name, task))
+        self._tasks[agent_name] = task
+        self._agents[agent_name] = aea
+
+    def _on_agent_done(self, agent_name: str, task: asyncio.Future) -> None:
+        """Release an agent and notify the manager."""
+        self._tasks.pop(agent_name, None)
+        self._agents.pop(agent_name, None)
+        error = None if task.cancelled() else task.exception()
+        self._requests.append(
+            asyncio.ensure_future(self._notify_agent_done(agent_name, error))
+        )
+
+    async def _stop_agent(self, agent_name: str) -> None:
+        """Stop an agent and wait for it to finish."""
+        task = self._tasks.get(agent_name)
+        if task is None:
+            return
+        # an agent stopped while its multiplexer connects may never finish, let it start first
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + self.AGENT_START_TIMEOUT
+        runtime = self._agents[agent_name].runtime
+        while not runtime.is_running and not task.done() and loop.time() < deadline:
+            await asyncio.sleep(self.AGENT_START_POLL_PERIOD)
+        task.cancel()
+        await asyncio.wait([task])
+
+    async def _get_agent_metrics(self, agent_name: str) -> Dict[str, Any]:
+        """Get the queue depths of an agent."""
+        aea = self._agents.get(agent_name)
+        if aea is None:
+            raise ValueError(f"{agent_name} is not running!")
+        multiplexer = aea.runtime.multiplexer
+        try:
+            outbox_size = multiplexer.out_queue.qsize()
+        except ValueError:  # pragma: nocover
+            outbox_size = 0
+        return {
+            "inbox_size": multiplexer.in_queue.qsize(),
+            "outbox_size": outbox_size,
+            "decision_maker_queue_size": aea.runtime.decision_maker.message_in_queue.qsize(),
+        }
+
+    async def _stop_agents(self) -> None:
+        """Stop all the agents and send the pending notifications."""
+        for agent_name in list(self._tasks):
+            await self._stop_agent(agent_name)
+        if self._requests:
+            await asyncio.wait(self._requests)
+            self._requests = []
+
+
+def run_agents_worker(in_path: str, out_path: str) -> None:  # pragma: nocover
+    """
+    Run a worker, it is the entry point of the worker processes.
+
+    :param in_path: the rendezvous point of the commands.
+    :param out_path: the rendezvous point of the responses and events.
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_until_complete(AgentsWorker(in_path, out_path).run())
+    finally:
+        loop.close()
+
+
+class WorkerProcessShard:
+    """
+    A worker process hosting a shard of the agents, driven over an IPC channel.
+
+    Its methods are to be called from the event loop of the manager.
+    """
+
+    START_TIMEOUT = 30.0
+
+    def __init__(
+        self,
+        name: str,
+        on_agent_done: Callable[[str, Optional[BaseException]], None],
+        logger: logging.Logger = _default_logger,
+    ) -> None:
+        """
+        Initialize the shard.
+
+        :param name: the shard name, used for the process name.
+        :param on_agent_done: the callback to call with the agent name and the error, if any, when an agent of the shard stops.
+        :param logger: the logger.
+        """
+        self.name = name
+        self.agents: Set[str] = set()
+        self._on_agent_done = on_agent_done
+        self.logger = logger
+        self._channel: Optional[IPCChannel] = None
+        self._process: Optional[Any] = None
+        self._reader_task: Optional[asyncio.Future] = None
+        self._last_request_id = 0
+        self._pending: Dict[int, asyncio.Future] = {}
+
+    @property
+    def agents_num(self) -> int:
+        """Get the number of agents on the shard."""
+        return len(self.agents)
+
+    @property
+    def pid(self) -> Optional[int]:
+        """Get the worker process id."""
+        return self._process.pid if self._process is not None else None
+
+    async def start(self) -> None:
+        """Spawn the worker process and connect to it."""
+        self._channel = make_ipc_channel(self.logger)
+        self._process = multiprocessing.get_context("spawn").Process(  # type: ignore
+            target=run_agents_worker,
+            args=(self._channel.out_path, self._channel.in_path),
+            name=self.name,
+            daemon=True,
+        )
+        self._process.start()
+        if not await self._channel.connect(self.START_TIMEOUT):  # pragma: nocover
+            self._process.terminate()
+            raise ValueError(f"Cannot connect to the worker process {self.name}.")
+        self._reader_task = asyncio.ensure_future(self._read_loop())
+
+    async def stop(self, timeout: float) -> None:
+        """
+        Stop the agents of the worker, and wait for the process to exit.
+
+        :param timeout: the time to wait for the process, in seconds.
+        """
+        if self._channel is None or self._process is None:  # pragma: nocover
+            return
+        try:
+            await asyncio.wait_for(self.request(COMMAND_SHUTDOWN), timeout)
+        except (asyncio.TimeoutError, ConnectionError):  # pragma: nocover
+            self.logger.warning(f"Worker process {self.name} did not shut down.")
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            await asyncio.wait([self._reader_task])
+        await self._channel.close()
+        process = self._process
+        await asyncio.get_event_loop().run_in_executor(None, process.join, timeout)
+        if process.is_alive():  # pragma: nocover
+            process.terminate()
+        self._channel = None
+        self._process = None
+
+    async def request(self, command: str, **params: Any) -> Any:
+        """
+        Send a command to the worker and wait for its result.
+
+        :param command: the command name.
+        :param params: the command parameters.
+        :return: the result of the command.
+        """
+        if self._channel is None:  # pragma: nocover
+            raise ConnectionError(f"Worker process {self.name} is not running.")
+        self._last_request_id += 1
+        request_id = self._last_request_id
+        future = asyncio.get_event_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            await self._channel.write(
+                pickle.dumps({"id": request_id, "command": command, "params": params})
+            )
+            return await future
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _read_loop(self) -> None:
+        """Dispatch the responses and the events of the worker."""
+        if self._channel is None:  # pragma: nocover
+            raise ValueError("Shard was not started!")
+        while True:
+            data = await self._channel.read()
+            if data is None:
+                break
+            message = pickle.loads(data)  # nosec
+            error = _load_error(message["error"])
+            if message.get("event") == EVENT_AGENT_DONE:
+                # agents released by the manager, e.g. to move them, are not notified
+                if message["agent_name"] in self.agents:
+                    self.agents.remove(message["agent_name"])
+                    self._on_agent_done(message["agent_name"], error)
+                continue
+            future = self._pending.get(message["id"])
+            if future is None or future.done():  # pragma: nocover
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(message["result"])
+        for future in self._pending.values():
+            if not future.done():  # pragma: nocover
+                future.set_exception(
+                    ConnectionError(f"Worker process {self.name} disconnected.")
+                )
+        for agent_name in list(self.agents):  # pragma: nocover
+            self.agents.remove(agent_name)
+            self._on_agent_done(
+                agent_name, AgentsWorkerError(f"Worker process {self.name} exited.")
+            )
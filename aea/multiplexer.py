@@ -24,8 +24,11 @@ from asyncio.events import AbstractEventLoop
 from concurrent.futures._base import CancelledError
 from concurrent.futures._base import TimeoutError as FuturesTimeoutError
 from contextlib import suppress
+from enum import Enum
+from logging import Logger
 from typing import (
     Any,
+    Awaitable,
     Callable,
     Collection,
     Dict,
@@ -45,7 +48,7 @@ from aea.helpers.async_friendly_queue import AsyncFriendlyQueue
 from aea.helpers.async_utils import AsyncState, Runnable, ThreadedAsyncRunner
 from aea.helpers.exception_policy import ExceptionPolicyEnum
 from aea.helpers.logging import WithLogger, get_logger
-from aea.mail.base import AEAConnectionError, Empty, Envelope, EnvelopeContext
+from aea.mail.base import AEAConnectionError, Empty, Envelope, EnvelopeContext, Full
 from aea.protocols.base import Message, Protocol
 
 
@@ -79,6 +82,341 @@ class MultiplexerStatus(AsyncState):
         return self.get() == ConnectionStates.disconnecting
 
 
+class BackpressurePolicyEnum(Enum):
+    """Policy applied when putting an envelope for a connection whose send queue is full."""
+
+    block = "block"
+    drop = "drop"
+    error = "error"
+
+
+class ConnectionSendWorker(WithLogger):
+    """
+    Send the envelopes of a single connection from its own bounded queue.
+
+    The queue becomes full when the number of pending envelopes reaches the high watermark,
+    and accepts envelopes again only once it has drained down to the low watermark.
+    """
+
+    def __init__(
+        self,
+        connection: Connection,
+        send_fn: Callable[[Connection, List[Envelope]], Awaitable[None]],
+        high_watermark: int,
+        low_watermark: int,
+        policy: BackpressurePolicyEnum = BackpressurePolicyEnum.block,
+        batch_size: int = 1,
+        threaded: bool = False,
+        logger: Optional[Logger] = None,
+    ) -> None:
+        """
+        Initialize the send worker.
+
+        :param connection: the connection to send the envelopes with.
+        :param send_fn: the coroutine function sending a list of envelopes with the connection.
+        :param high_watermark: the number of pending envelopes at which the queue becomes full.
+        :param low_watermark: the number of pending envelopes at which a full queue accepts envelopes again.
+        :param policy: the policy applied when putting an envelope while the queue is full.
+        :param batch_size: the maximum number of envelopes passed to send_fn at once.
+        :param threaded: whether envelopes are put from a thread other than the event loop one.
+        :param logger: the logger.
+        """
+        WithLogger.__init__(self, logger=logger)
+        enforce(
+            0 <= low_watermark < high_watermark,
+            "Watermarks must satisfy 0 <= low_watermark < high_watermark.",
+        )
+        self._connection = connection
+        self._send_fn = send_fn
+        self._high_watermark = high_watermark
+        self._low_watermark = low_watermark
+        self._policy = policy
+        self._batch_size = batch_size
+        self._threaded = threaded
+
+        self._condition = threading.Condition()
+        self._size = 0
+        self._is_full = False
+        self._dropped = 0
+        self._async_waiters: List[asyncio.Future] = []
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+
+    @property
+    def connection(self) -> Connection:
+        """Get the connection."""
+        return self._connection
+
+    @property
+    def size(self) -> int:
+        """Get the number of envelopes put and not sent yet."""
+        return self._size
+
+    @property
+    def is_full(self) -> bool:
+        """Check whether the queue refuses envelopes."""
+        return self._is_full
+
+    @property
+    def dropped(self) -> int:
+        """Get the number of envelopes dropped because the queue was full."""
+        return self._dropped
+
+    def reset(self) -> None:
+        """Reset the queue, dropping the envelopes not sent. Must be called from the multiplexer event loop."""
+        with self._condition:
+            if self._queue is not None and not self._queue.empty():
+                self.logger.warning(
+                    f"Dropping {self._queue.qsize()} envelopes not sent by connection {self._connection.connection_id}."
+                )
+            self._loop = asyncio.get_event_loop()
+            self._loop_thread_id = threading.get_ident()
+            self._queue = asyncio.Queue()
+            self._size = 0
+            self._set_full(False)
+
+    def put(self, envelope: Envelope) -> None:
+        """
+        Put an envelope to be sent.
+
+        With the 'block' policy, the caller waits until the queue has drained down to the low watermark.
+        Waiting is not possible from the multiplexer event loop thread itself, so there Full is raised instead.
+
+        :param envelope: the envelope.
+        :raises Full: if the queue is full and the policy is 'error' or the caller cannot block.  # noqa: DAR402
+        """
+        queue = self._get_queue()
+        from_other_thread = (
+            self._threaded and self._loop_thread_id != threading.get_ident()
+        )
+        with self._condition:
+            if self._is_full and not self._handle_full(can_wait=from_other_thread):
+                return
+            self._size += 1
+            if self._size >= self._high_watermark:
+                self._set_full(True)
+        if from_other_thread:
+            cast(AbstractEventLoop, self._loop).call_soon_threadsafe(
+                queue.put_nowait, envelope
+            )
+        else:
+            self._get_queue().put_nowait(envelope)
+
+    async def async_put(self, envelope: Envelope) -> None:
+        """
+        Put an envelope to be sent, awaiting the queue to drain with the 'block' policy.
+
+        Must be called from the multiplexer event loop.
+
+        :param envelope: the envelope.
+        :raises Full: if the queue is full and the policy is 'error'.  # noqa: DAR402
+        """
+        while True:
+            with self._condition:
+                if not self._is_full:
+                    self._size += 1
+                    if self._size >= self._high_watermark:
+                        self._set_full(True)
+                    break
+                if self._policy != BackpressurePolicyEnum.block:
+                    self._handle_full(can_wait=False)
+                    return
+                waiter = cast(AbstractEventLoop, self._loop).create_future()
+                self._async_waiters.append(waiter)
+            await waiter
+        self._get_queue().put_nowait(envelope)
+
+    def _handle_full(self, can_wait: bool) -> bool:
+        """
+        Apply the policy on a full queue. Must be called with the condition acquired.
+
+        :param can_wait: whether the caller can wait for the queue to drain.
+        :return: whether the envelope can be enqueued.
+        """
+        if self._policy == BackpressurePolicyEnum.drop:
+            self._dropped += 1
+            self.logger.warning(
+                f"Dropping envelope, send queue of connection {self._connection.connection_id} is full."
+            )
+            return False
+        if self._policy == BackpressurePolicyEnum.block and can_wait:
+            self._condition.wait_for(lambda: not self._is_full)
+            return True
+        raise Full(
+            f"Send queue of connection {self._connection.connection_id} is full."
+        )
+
+    def _set_full(self, is_full: bool) -> None:
+        """Set the full flag and wake up the waiters. Must be called with the condition acquired."""
+        self._is_full = is_full
+        if is_full:
+            return
+        self._condition.notify_all()
+        for waiter in self._async_waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        self._async_waiters = []
+
+    def _task_done(self, count: int) -> None:
+        """Mark envelopes as sent, releasing the queue under the low watermark."""
+        with self._condition:
+            self._size -= count
+            if self._is_full and self._size <= self._low_watermark:
+                self._set_full(False)
+
+    def _get_queue(self) -> asyncio.Queue:
+        """Get the queue."""
+        if self._queue is None:
+            raise ValueError("Accessing send queue before loop is started.")
+        return self._queue
+
+    async def run(self) -> None:
+        """Send the envelopes put in the queue until cancelled."""
+        queue = self._get_queue()
+        while True:
+            envelopes = [await queue.get()]
+            while len(envelopes) < self._batch_size:
+                try:
+                    envelopes.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                await self._send_fn(self._connection, envelopes)
+            finally:
+                self._task_done(len(envelopes))
+
+
+def _find_connection(
+    id_to_connection: Dict[PublicId, Connection], connection_id: PublicId
+) -> Optional[Connection]:
+    """
+    Find a connection by id, falling back to a connection with the same prefix.
+
+    :param id_to_connection: the connections by id.
+    :param connection_id: the connection id.
+    :return: the connection, or None if not found.
+    """
+    connection = id_to_connection.get(connection_id, None)
+    if connection is not None:
+        return connection
+    for id_, connection in id_to_connection.items():
+        if id_.same_prefix(connection_id):
+            return connection
+    return None
+
+
+def _get_unsupported_protocol_reason(
+    connection: Connection, protocol_id: PublicId
+) -> Optional[str]:
+    """
+    Get the reason a connection does not support a protocol.
+
+    :param connection: the connection.
+    :param protocol_id: the protocol id.
+    :return: the reason, or None if the protocol is supported.
+    """
+    if protocol_id in connection.excluded_protocols:
+        return f"Connection {connection.connection_id} does not support protocol {protocol_id}. It is explicitly excluded."
+
+    if (
+        connection.restricted_to_protocols
+        and protocol_id not in connection.restricted_to_protocols
+    ):
+        return f"Connection {connection.connection_id} does not support protocol {protocol_id}. The connection is restricted to protocols in {connection.restricted_to_protocols}."
+
+    return None
+
+
+Route = Tuple[Optional[Connection], Optional[str]]
+
+
+class RoutingTable:
+    """
+    Immutable routing index of the multiplexer.
+
+    Routes are keyed by protocol specification id and by the id of the connection
+    an envelope is explicitly addressed to, that is by its `to` field, its context or the routing helper.
+    The key is None for envelopes falling back to the default routing and the default connection.
+
+    A route holds the connection to send with and a message to log:
+    if the connection is None, the envelope is dropped and the message explains why.
+    """
+
+    __slots__ = ("_routes",)
+
+    def __init__(
+        self, routes: Dict[Tuple[PublicId, Optional[PublicId]], Route]
+    ) -> None:
+        """
+        Initialize the routing table.
+
+        :param routes: the routes.
+        """
+        self._routes = routes
+
+    @classmethod
+    def build(
+        cls,
+        id_to_connection: Dict[PublicId, Connection],
+        specification_id_to_protocol_id: Dict[PublicId, PublicId],
+        default_routing: Dict[PublicId, PublicId],
+        default_connection: Optional[Connection],
+    ) -> "RoutingTable":
+        """
+        Build the routing table.
+
+        Envelopes of protocols not in specification_id_to_protocol_id,
+        or routed to connections not registered, are not indexed.
+
+        :param id_to_connection: the connections by id.
+        :param specification_id_to_protocol_id: the protocol ids by protocol specification id.
+        :param default_routing: the default routing.
+        :param default_connection: the default connection.
+        :return: the routing table.
+        """
+        routes: Dict[Tuple[PublicId, Optional[PublicId]], Route] = {}
+        for specification_id, protocol_id in specification_id_to_protocol_id.items():
+            for connection_id, connection in id_to_connection.items():
+                reason = _get_unsupported_protocol_reason(connection, protocol_id)
+                routes[(specification_id, connection_id)] = (
+                    (None, reason) if reason is not None else (connection, None)
+                )
+
+            if protocol_id in default_routing:
+                connection_id = default_routing[protocol_id]
+                message = f"Using default routing: {connection_id}"
+            elif default_connection is not None:
+                connection_id = default_connection.connection_id
+                message = f"Using default connection: {connection_id}"
+            else:
+                continue
+            default = _find_connection(id_to_connection, connection_id)
+            if default is None:
+                continue
+            reason = _get_unsupported_protocol_reason(default, protocol_id)
+            routes[(specification_id, None)] = (
+                (None, reason) if reason is not None else (default, message)
+            )
+        return cls(routes)
+
+    def get(
+        self, protocol_specification_id: PublicId, connection_id: Optional[PublicId]
+    ) -> Optional[Route]:
+        """
+        Get a route.
+
+        :param protocol_specification_id: the protocol specification id of the envelope.
+        :param connection_id: the connection id the envelope is explicitly addressed to, if any.
+        :return: the route, or None if not indexed.
+        """
+        return self._routes.get((protocol_specification_id, connection_id))
+
+    def __len__(self) -> int:
+        """Get the number of routes."""
+        return len(self._routes)
+
+
 class AsyncMultiplexer(Runnable, WithLogger):
     """This class can handle multiple connections at once."""
 
@@ -97,6 +435,10 @@ class AsyncMultiplexer(Runnable, WithLogger):
         default_routing: Optional[Dict[PublicId, PublicId]] = None,
         default_connection: Optional[PublicId] = None,
         protocols: Optional[List[Union[Protocol, Message]]] = None,
+        batch_size: int = 1,
+        send_queue_high_watermark: Optional[int] = None,
+        send_queue_low_watermark: Optional[int] = None,
+        backpressure_policy: BackpressurePolicyEnum = BackpressurePolicyEnum.block,
     ) -> None:
         """
         Initialize the connection multiplexer.
@@ -112,8 +454,29 @@ class AsyncMultiplexer(Runnable, WithLogger):
         :param default_routing: default routing map
         :param default_connection: default connection
         :param protocols: protocols used
+        :param batch_size: the maximum number of envelopes processed per wakeup of the send and receive loops.
+            Envelopes of a batch are grouped by connection and handed to `Connection.send_batch`.
+            If 1, envelopes are processed one by one.
+        :param send_queue_high_watermark: if set, every connection gets its own send queue and worker,
+            so that a slow connection does not hold up the others. A send queue is full once it holds this many envelopes.
+        :param send_queue_low_watermark: the number of envelopes down to which a full send queue must drain
+            before accepting envelopes again. Defaults to half the high watermark.
+        :param backpressure_policy: the policy applied when putting an envelope for a connection whose send queue is full.
         """
         self._exception_policy: ExceptionPolicyEnum = exception_policy
+        enforce(batch_size >= 1, "Batch size must be a positive integer.")
+        self._batch_size = batch_size
+        self._send_queue_high_watermark = send_queue_high_watermark
+        self._send_queue_low_watermark = (
+            send_queue_low_watermark
+            if send_queue_low_watermark is not None
+            else (send_queue_high_watermark or 0) // 2
+        )
+        self._backpressure_policy = backpressure_policy
+        self._send_workers: Dict[PublicId, ConnectionSendWorker] = {}
+        self._loop_thread_id: Optional[int] = None
+        self._routing_table: Optional[RoutingTable] = None
+        self._routing_table_stats = {"rebuilds": 0, "hits": 0, "misses": 0}
         logger = get_logger(__name__, agent_name)
         WithLogger.__init__(self, logger=logger)
         Runnable.__init__(self, loop=loop, threaded=threaded)
@@ -183,6 +546,16 @@ class AsyncMultiplexer(Runnable, WithLogger):
         """Get the connections."""
         return tuple(self._connections)
 
+    @property
+    def batch_size(self) -> int:
+        """Get the maximum number of envelopes processed per loop wakeup."""
+        return self._batch_size
+
+    @property
+    def send_workers(self) -> Dict[PublicId, ConnectionSendWorker]:
+        """Get the send workers by connection id, empty if send queues are not enabled."""
+        return dict(self._send_workers)
+
     @property
     def is_connected(self) -> bool:
         """Check whether the multiplexer is processing envelopes."""
@@ -197,6 +570,25 @@ class AsyncMultiplexer(Runnable, WithLogger):
     def default_routing(self, default_routing: Dict[PublicId, PublicId]) -> None:
         """Set the default routing."""
         self._default_routing = default_routing
+        self._routing_table = None
+
+    @property
+    def routing_table(self) -> RoutingTable:
+        """Get the routing table, building it if connections or default routing changed."""
+        if self._routing_table is None:
+            self._routing_table = RoutingTable.build(
+                self._id_to_connection,
+                self._specification_id_to_protocol_id,
+                self._default_routing,
+                self._default_connection,
+            )
+            self._routing_table_stats["rebuilds"] += 1
+        return self._routing_table
+
+    @property
+    def routing_table_stats(self) -> Dict[str, int]:
+        """Get the routing table statistics: number of routes, rebuilds, and lookup hits and misses."""
+        return {"routes": len(self.routing_table), **self._routing_table_stats}
 
     @property
     def connection_status(self) -> MultiplexerStatus:
@@ -218,8 +610,9 @@ class AsyncMultiplexer(Runnable, WithLogger):
 
     def _get_protocol_id_for_envelope(self, envelope: Envelope) -> PublicId:
         """Get protocol id for envelope."""
-        if isinstance(envelope.message, Message):
-            return cast(Message, envelope.message).protocol_id
+        message = envelope.message_object
+        if message is not None:
+            return message.protocol_id
 
         protocol_id = self._specification_id_to_protocol_id.get(
             envelope.protocol_specification_id
@@ -271,8 +664,20 @@ class AsyncMultiplexer(Runnable, WithLogger):
 
         self._connections.append(connection)
         self._id_to_connection[connection.connection_id] = connection
+        if self._send_queue_high_watermark is not None:
+            self._send_workers[connection.connection_id] = ConnectionSendWorker(
+                connection,
+                self._send_with_connection,
+                high_watermark=self._send_queue_high_watermark,
+                low_watermark=self._send_queue_low_watermark,
+                policy=self._backpressure_policy,
+                batch_size=self._batch_size,
+                threaded=self._threaded,
+                logger=self.logger,
+            )
         if is_default:
             self._default_connection = connection
+        self._routing_table = None
 
     def _connection_consistency_checks(self) -> None:
         """
@@ -293,14 +698,18 @@ class AsyncMultiplexer(Runnable, WithLogger):
         """Set the default connection if it is none."""
         if self._default_connection is None and bool(self.connections):
             self._default_connection = self.connections[0]
+            self._routing_table = None
 
     async def connect(self) -> None:
         """Connect the multiplexer."""
         self._loop = asyncio.get_event_loop()
+        self._loop_thread_id = threading.get_ident()
         self.logger.debug("Multiplexer connecting...")
         self._connection_consistency_checks()
         self._set_default_connection_if_none()
         self._out_queue = asyncio.Queue()
+        for worker in self._send_workers.values():
+            worker.reset()
 
         async with self._lock:
             if self.connection_status.is_connected:
@@ -366,13 +775,18 @@ class AsyncMultiplexer(Runnable, WithLogger):
         self.logger.debug("Stopping send loop...")
 
         if self._send_loop_task:
-            # send a 'stop' token (a None value) to wake up the coroutine waiting for outgoing envelopes.
+            # send a 'stop' token (a None value) after the outgoing envelopes, and
+            # give the send loop some time to send them before cancelling it.
             await self.out_queue.put(None)
-            self._send_loop_task.cancel()
             with suppress(Exception, asyncio.CancelledError):
-                await self._send_loop_task
+                await asyncio.wait_for(
+                    self._send_loop_task, timeout=self.DISCONNECT_TIMEOUT
+                )
 
         self._send_loop_task = None
+        # release the callers waiting for a full send queue
+        for worker in self._send_workers.values():
+            worker.reset()
         self.logger.debug("Send loop stopped.")
 
     def _check_and_set_disconnected_state(self) -> None:
@@ -429,7 +843,7 @@ class AsyncMultiplexer(Runnable, WithLogger):
         :param connection_id: the id of the connection.
         """
         connection = self._id_to_connection[connection_id]
-        self.logger.debug("Processing connection {}".format(connection.connection_id))
+        self.logger.debug("Processing connection %s", connection.connection_id)
         if connection.is_connected:
             self.logger.debug(
                 "Connection {} already established.".format(connection.connection_id)
@@ -468,7 +882,7 @@ class AsyncMultiplexer(Runnable, WithLogger):
         :param connection_id: the id of the connection.
         """
         connection = self._id_to_connection[connection_id]
-        self.logger.debug("Processing connection {}".format(connection.connection_id))
+        self.logger.debug("Processing connection %s", connection.connection_id)
         if not connection.is_connected:
             self.logger.debug(
                 "Connection {} already disconnected.".format(connection.connection_id)
@@ -490,15 +904,28 @@ class AsyncMultiplexer(Runnable, WithLogger):
             return
 
         try:
-            while self.is_connected:
+            if self._send_workers:
+                await self._run_send_workers()
+                return None
+            # the loop runs till the 'stop' token put on disconnect
+            while True:
                 self.logger.debug("Waiting for outgoing envelopes...")
                 envelope = await self.out_queue.get()
-                if envelope is None:  # pragma: nocover
+                if envelope is None:
                     self.logger.debug(
                         "Received empty envelope. Quitting the sending loop..."
                     )
                     return None
-                self.logger.debug("Sending envelope {}".format(str(envelope)))
+                if self._batch_size > 1:
+                    envelopes, stop = self._drain_out_queue(envelope)
+                    await self._send_batch(envelopes)
+                    if stop:
+                        self.logger.debug(
+                            "Received empty envelope. Quitting the sending loop..."
+                        )
+                        return None
+                    continue
+                self.logger.debug("Sending envelope %s", envelope)
                 await self._send(envelope)
 
         except asyncio.CancelledError:
@@ -512,7 +939,7 @@ class AsyncMultiplexer(Runnable, WithLogger):
         """Process incoming envelopes."""
         self.logger.debug("Starting receving loop...")
         task_to_connection = {
-            asyncio.ensure_future(conn.receive()): conn for conn in self.connections
+            self._make_receiving_task(conn): conn for conn in self.connections
         }
 
         try:
@@ -524,14 +951,18 @@ class AsyncMultiplexer(Runnable, WithLogger):
                 # process completed receiving tasks.
                 for task in done:
                     connection = task_to_connection.pop(task)
-                    envelope = task.result()
-                    if envelope is not None:
-                        self._update_routing_helper(envelope, connection)
-                        self.in_queue.put_nowait(envelope)
+                    if self._batch_size > 1:
+                        envelopes = task.result()
+                    else:
+                        envelopes = [task.result()]
+                    for envelope in envelopes:
+                        if envelope is not None:
+                            self._update_routing_helper(envelope, connection)
+                            self.in_queue.put_nowait(envelope)
 
                     # reinstantiate receiving task, but only if the connection is still up.
                     if connection.is_connected:
-                        new_task = asyncio.ensure_future(connection.receive())
+                        new_task = self._make_receiving_task(connection)
                         task_to_connection[new_task] = connection
 
         except asyncio.CancelledError:  # pragma: nocover
@@ -546,16 +977,156 @@ class AsyncMultiplexer(Runnable, WithLogger):
                 t.cancel()
             self.logger.debug("Receiving loop terminated.")
 
+    async def _run_send_workers(self) -> None:
+        """Run the send workers until the 'stop' token is received or a worker fails."""
+        worker_tasks = [
+            asyncio.ensure_future(worker.run())
+            for worker in self._send_workers.values()
+        ]
+        stop_task = asyncio.ensure_future(self.out_queue.get())
+        try:
+            done, _pending = await asyncio.wait(
+                [stop_task, *worker_tasks], return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                # reraise the exception of a failed worker
+                task.result()
+            self.logger.debug("Received empty envelope. Quitting the sending loop...")
+        finally:
+            for task in [stop_task, *worker_tasks]:
+                task.cancel()
+
+    def _make_receiving_task(self, connection: Connection) -> asyncio.Future:
+        """
+        Schedule the next receive call on a connection.
+
+        :param connection: the connection to receive from.
+        :return: the future resolving to an envelope, or to a list of envelopes in batch mode.
+        """
+        if self._batch_size > 1:
+            return asyncio.ensure_future(connection.receive_batch(self._batch_size))
+        return asyncio.ensure_future(connection.receive())
+
+    def _drain_out_queue(self, first_envelope: Envelope) -> Tuple[List[Envelope], bool]:
+        """
+        Collect up to batch size envelopes from the out queue without waiting.
+
+        :param first_envelope: the envelope already taken from the queue.
+        :return: the envelopes collected, and whether the 'stop' token was found.
+        """
+        envelopes = [first_envelope]
+        while len(envelopes) < self._batch_size:
+            try:
+                envelope = self.out_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if envelope is None:
+                return envelopes, True
+            envelopes.append(envelope)
+        return envelopes, False
+
+    async def _send_batch(self, envelopes: Sequence[Envelope]) -> None:
+        """
+        Send a batch of envelopes.
+
+        Envelopes are grouped by the connection they are routed to,
+        keeping the order of the envelopes in each group.
+
+        :param envelopes: the envelopes to send.
+        """
+        batches: Dict[PublicId, Tuple[Connection, List[Envelope]]] = {}
+        for envelope in envelopes:
+            connection = self._get_connection_for_envelope(envelope)
+            if connection is None:
+                continue
+            batches.setdefault(connection.connection_id, (connection, []))[1].append(
+                envelope
+            )
+
+        for connection, batch in batches.values():
+            await self._send_with_connection(connection, batch)
+
+    async def _send_with_connection(
+        self, connection: Connection, envelopes: List[Envelope]
+    ) -> None:
+        """
+        Send envelopes already routed to a connection.
+
+        :param connection: the connection.
+        :param envelopes: the envelopes to send, in order.
+        """
+        self.logger.debug(
+            "Sending %s envelopes with connection %s",
+            len(envelopes),
+            connection.connection_id,
+        )
+        try:
+            if len(envelopes) == 1:
+                await asyncio.wait_for(
+                    connection.send(envelopes[0]), timeout=self.SEND_TIMEOUT
+                )
+            else:
+                # the send timeout applies per envelope
+                await asyncio.wait_for(
+                    connection.send_batch(envelopes),
+                    timeout=self.SEND_TIMEOUT * len(envelopes),
+                )
+        except Exception as e:  # pylint: disable=broad-except
+            self._handle_exception(self._send_with_connection, e)
+
     async def _send(self, envelope: Envelope) -> None:
         """
         Send an envelope.
 
         :param envelope: the envelope to send.
         """
-        envelope_protocol_id = self._get_protocol_id_for_envelope(envelope)
-        connection_id = self._get_connection_id_from_envelope(
-            envelope, envelope_protocol_id
+        connection = self._get_connection_for_envelope(envelope)
+        if connection is None:
+            return
+
+        try:
+            await asyncio.wait_for(connection.send(envelope), timeout=self.SEND_TIMEOUT)
+        except Exception as e:  # pylint: disable=broad-except
+            self._handle_exception(self._send, e)
+
+    def _get_connection_for_envelope(self, envelope: Envelope) -> Optional[Connection]:
+        """
+        Get the connection to send an envelope with.
+
+        The route is looked up in the routing table, and resolved rule by rule if not indexed.
+
+        :param envelope: the envelope to route.
+        :return: the connection, or None if the envelope has to be dropped.
+        """
+        connection_id = self._get_explicit_connection_id(envelope)
+        route = self.routing_table.get(
+            envelope.protocol_specification_id, connection_id
         )
+        if route is None:
+            self._routing_table_stats["misses"] += 1
+            return self._resolve_connection_for_envelope(envelope, connection_id)
+
+        self._routing_table_stats["hits"] += 1
+        connection, message = route
+        if connection is None:
+            self.logger.warning(message)
+        elif message is not None:
+            self.logger.debug(message)
+        return connection
+
+    def _resolve_connection_for_envelope(
+        self, envelope: Envelope, connection_id: Optional[PublicId]
+    ) -> Optional[Connection]:
+        """
+        Resolve the connection to send an envelope with, applying the routing rules.
+
+        :param envelope: the envelope to route.
+        :param connection_id: the connection id the envelope is explicitly addressed to, if any.
+        :return: the connection, or None if the envelope has to be dropped.
+        """
+        envelope_protocol_id = self._get_protocol_id_for_envelope(envelope)
+        if connection_id is None:
+            connection_id = self._get_default_connection_id(envelope_protocol_id)
 
         connection = (
             self._get_connection(connection_id) if connection_id is not None else None
@@ -566,15 +1137,12 @@ class AsyncMultiplexer(Runnable, WithLogger):
             self.logger.warning(
                 f"Dropping envelope, no connection available for sending: {envelope}"
             )
-            return
+            return None
 
         if not self._is_connection_supported_protocol(connection, envelope_protocol_id):
-            return
+            return None
 
-        try:
-            await asyncio.wait_for(connection.send(envelope), timeout=self.SEND_TIMEOUT)
-        except Exception as e:  # pylint: disable=broad-except
-            self._handle_exception(self._send, e)
+        return connection
 
     def _get_connection_id_from_envelope(
         self, envelope: Envelope, envelope_protocol_id: PublicId
@@ -594,12 +1162,27 @@ class AsyncMultiplexer(Runnable, WithLogger):
         :param envelope_protocol_id: the protocol id of the message contained in the envelope
         :return: public id if found
         """
-        self.logger.debug(f"Routing envelope: {envelope}")
+        connection_id = self._get_explicit_connection_id(envelope)
+        if connection_id is not None:
+            return connection_id
+        return self._get_default_connection_id(envelope_protocol_id)
+
+    def _get_explicit_connection_id(self, envelope: Envelope) -> Optional[PublicId]:
+        """
+        Get the id of the connection an envelope is explicitly addressed to.
+
+        That is the component id for component to component messages, or else
+        the envelope context connection id or the routing helper entry.
+
+        :param envelope: the Envelope
+        :return: public id if found, None if the default routing applies.
+        """
+        self.logger.debug("Routing envelope: %s", envelope)
         # component to component messages are routed by their component id
         if envelope.is_component_to_component_message:
             connection_id = envelope.to_as_public_id
             self.logger.debug(
-                "Using envelope `to` field as connection_id: {}".format(connection_id)
+                "Using envelope `to` field as connection_id: %s", connection_id
             )
             enforce(
                 connection_id is not None,
@@ -611,64 +1194,57 @@ class AsyncMultiplexer(Runnable, WithLogger):
         # first, try to route by envelope context connection id
         if envelope.context is not None and envelope.context.connection_id is not None:
             connection_id = envelope.context.connection_id
-            self.logger.debug(
-                "Using envelope context connection_id: {}".format(connection_id)
-            )
+            self.logger.debug("Using envelope context connection_id: %s", connection_id)
             return connection_id
 
         # second, try to route by routing helper
         if envelope.to in self._routing_helper:
             connection_id = self._routing_helper[envelope.to]
             self.logger.debug(
-                "Using routing helper with connection_id: {}".format(connection_id)
+                "Using routing helper with connection_id: %s", connection_id
             )
             return connection_id
+        return None
+
+    def _get_default_connection_id(
+        self, envelope_protocol_id: PublicId
+    ) -> Optional[PublicId]:
+        """
+        Get the connection id by default routing, or else the default connection.
 
+        :param envelope_protocol_id: the protocol id of the message contained in the envelope
+        :return: public id if found
+        """
         # third, try to route by default routing
         if envelope_protocol_id in self.default_routing:
             connection_id = self.default_routing[envelope_protocol_id]
-            self.logger.debug("Using default routing: {}".format(connection_id))
+            self.logger.debug("Using default routing: %s", connection_id)
             return connection_id
 
         # forth, using default connection
-        connection_id = (
+        default_connection_id = (
             self.default_connection.connection_id
             if self.default_connection is not None
             else None
         )
-        self.logger.debug("Using default connection: {}".format(connection_id))
-        return connection_id
+        self.logger.debug("Using default connection: %s", default_connection_id)
+        return default_connection_id
 
     def _get_connection(self, connection_id: PublicId) -> Optional[Connection]:
         """Check if the connection id is registered."""
-        conn_ = self._id_to_connection.get(connection_id, None)
-        if conn_ is not None:
-            return conn_
-        for id_, conn_ in self._id_to_connection.items():
-            if id_.same_prefix(connection_id):
-                return conn_
-        self.logger.error(f"No connection registered with id: {connection_id}")
-        return None
+        conn_ = _find_connection(self._id_to_connection, connection_id)
+        if conn_ is None:
+            self.logger.error(f"No connection registered with id: {connection_id}")
+        return conn_
 
     def _is_connection_supported_protocol(
         self, connection: Connection, protocol_id: PublicId
     ) -> bool:
         """Check protocol id is supported by the connection."""
-        if protocol_id in connection.excluded_protocols:
-            self.logger.warning(
-                f"Connection {connection.connection_id} does not support protocol {protocol_id}. It is explicitly excluded."
-            )
-            return False
-
-        if (
-            connection.restricted_to_protocols
-            and protocol_id not in connection.restricted_to_protocols
-        ):
-            self.logger.warning(
-                f"Connection {connection.connection_id} does not support protocol {protocol_id}. The connection is restricted to protocols in {connection.restricted_to_protocols}."
-            )
+        reason = _get_unsupported_protocol_reason(connection, protocol_id)
+        if reason is not None:
+            self.logger.warning(reason)
             return False
-
         return True
 
     def get(
@@ -714,6 +1290,11 @@ class AsyncMultiplexer(Runnable, WithLogger):
 
         :param envelope: the envelope to be sent.
         """
+        if envelope is not None and self._send_workers:
+            connection = self._get_connection_for_envelope(envelope)
+            if connection is not None:
+                await self._send_workers[connection.connection_id].async_put(envelope)
+            return
         await self.out_queue.put(envelope)
 
     def put(self, envelope: Envelope) -> None:
@@ -724,7 +1305,13 @@ class AsyncMultiplexer(Runnable, WithLogger):
         running on a different thread than the one used in this function.
 
         :param envelope: the envelope to be sent.
+        :raises Full: if the send queue of the connection is full, depending on the backpressure policy.  # noqa: DAR402
         """
+        if envelope is not None and self._send_workers:
+            connection = self._get_connection_for_envelope(envelope)
+            if connection is not None:
+                self._send_workers[connection.connection_id].put(envelope)
+            return
         if self._threaded:
             self._loop.call_soon_threadsafe(self.out_queue.put_nowait, envelope)
         else:
@@ -748,6 +1335,8 @@ class AsyncMultiplexer(Runnable, WithLogger):
         # replace connections
         self._connections = []
         self._id_to_connection = {}
+        self._send_workers = {}
+        self._routing_table = None
 
         for c in connections:
             self.add_connection(c, c.public_id == default_connection)
@@ -846,9 +1435,19 @@ class Multiplexer(AsyncMultiplexer):
         Notice that the output queue is an asyncio.Queue which uses an event loop
         running on a different thread than the one used in this function.
 
+        When called from the event loop thread, the envelope is put without waiting
+        for the send queue of the connection to drain, so Full is raised instead.
+
         :param envelope: the envelope to be sent.
+        :raises Full: if the send queue of the connection is full, depending on the backpressure policy.  # noqa: DAR402
         """
-        self._thread_runner.call(super()._put(envelope))  # .result(240)
+        if self._send_workers and self._loop_thread_id == threading.get_ident():
+            super().put(envelope)
+            return
+        task = self._thread_runner.call(super()._put(envelope))
+        if self._send_workers:
+            # wait to surface the backpressure of the connection send queue
+            task.result()
 
 
 class InBox:
@@ -887,7 +1486,7 @@ class InBox:
         if envelope is None:  # pragma: nocover
             raise Empty()
 
-        self._multiplexer.logger.debug(f"Incoming {envelope}")
+        self._multiplexer.logger.debug("Incoming %s", envelope)
         return envelope
 
     def get_nowait(self) -> Optional[Envelope]:
@@ -915,7 +1514,7 @@ class InBox:
         if envelope is None:  # pragma: nocover
             raise Empty()
 
-        self._multiplexer.logger.debug(f"Incoming envelope: {envelope}")
+        self._multiplexer.logger.debug("Incoming envelope: %s", envelope)
         return envelope
 
     async def async_wait(self) -> None:
@@ -951,8 +1550,9 @@ class OutBox:
         Put an envelope into the queue.
 
         :param envelope: the envelope.
+        :raises Full: if the send queue of the connection is full, depending on the multiplexer backpressure policy.  # noqa: DAR402
         """
-        self._multiplexer.logger.debug(f"Put an envelope in the queue: {envelope}.")
+        self._multiplexer.logger.debug("Put an envelope in the queue: %s.", envelope)
         if not isinstance(envelope.message, Message):
             raise ValueError(
                 "Only Message type allowed in envelope message field when putting into outbox."
@@ -17,12 +17,14 @@
 #
 # ------------------------------------------------------------------------------
 """This module contains the base message and serialization definition."""
+import hashlib
 import importlib
 import inspect
 import logging
 import re
 from abc import ABC, abstractmethod
 from base64 import b64decode, b64encode
+from collections import OrderedDict
 from copy import copy
 from enum import Enum
 from pathlib import Path
@@ -47,6 +49,7 @@ class Message:
     protocol_id = None  # type: PublicId
     protocol_specification_id = None  # type: PublicId
     serializer = None  # type: Type["Serializer"]
+    check_consistency_on_decode = True
 
     __slots__ = ("_slots", "_to", "_sender")
 
@@ -67,11 +70,20 @@ class Message:
 
     _performatives: Set[str] = set()
 
-    def __init__(self, _body: Optional[Dict] = None, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        _body: Optional[Dict] = None,
+        _check_consistency: bool = True,
+        **kwargs: Any,
+    ) -> None:
         """
         Initialize a Message object.
 
+        Serializers skip the consistency check of the messages they decode
+        if 'check_consistency_on_decode' is set to False on the message class.
+
         :param _body: the dictionary of values to hold.
+        :param _check_consistency: whether to check that the message is consistent.
         :param kwargs: any additional value to add to the body. It will overwrite the body values.
         """
         self._slots = self._SlotsCls()
@@ -82,6 +94,8 @@ class Message:
         self._update_slots_from_dict(copy(_body) if _body else {})
         self._update_slots_from_dict(kwargs)
 
+        if not _check_consistency:
+            return
         try:
             self._is_consistent()
         except Exception as e:  # pylint: disable=broad-except
@@ -288,6 +302,20 @@ class Message:
             and self.is_set("dialogue_reference")
         )
 
+    def _clone_body(self) -> "Message":
+        """
+        Get a new message with the same body, with sender and receiver not set.
+
+        The body values are shared with this message, not copied.
+
+        :return: the new message.
+        """
+        message = self.__class__.__new__(self.__class__)
+        message._slots = copy(self._slots)
+        message._to = None
+        message._sender = None
+        return message
+
 
 class Encoder(ABC):
     """Encoder interface."""
@@ -321,6 +349,89 @@ class Serializer(Encoder, Decoder, ABC):
     """The implementations of this class defines a serialization layer for a protocol."""
 
 
+class DecodedMessageCache:
+    """
+    A bounded LRU cache of decoded messages.
+
+    Messages are cached by protocol id and digest of the encoded message,
+    without sender and receiver. A hit returns a new message sharing the
+    body values of the cached one, hence message bodies must not be
+    modified in place by their handlers.
+    """
+
+    __slots__ = ("_max_size", "_messages", "_hits", "_misses")
+
+    def __init__(self, max_size: int) -> None:
+        """
+        Initialize the cache.
+
+        :param max_size: the maximum number of messages kept in the cache.
+        """
+        enforce(
+            isinstance(max_size, int) and max_size > 0,
+            "Max size must be a positive integer.",
+        )
+        self._max_size = max_size
+        self._messages: "OrderedDict[Tuple[PublicId, bytes], Message]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_size(self) -> int:
+        """Get the maximum number of messages kept in the cache."""
+        return self._max_size
+
+    @property
+    def hits(self) -> int:
+        """Get the number of messages served from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Get the number of messages decoded by the serializer."""
+        return self._misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the ratio of messages served from the cache."""
+        total = self._hits + self._misses
+        return self._hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        """Get the number of messages in the cache."""
+        return len(self._messages)
+
+    def decode(
+        self, protocol_id: PublicId, serializer: Type[Serializer], data: bytes
+    ) -> Message:
+        """
+        Decode a message, using the cache if the same message was already decoded.
+
+        :param protocol_id: the id of the protocol of the message.
+        :param serializer: the serializer to decode the message with on a miss.
+        :param data: the encoded message.
+        :return: the decoded message, with sender and receiver not set.
+        """
+        key = (protocol_id, hashlib.blake2b(data, digest_size=16).digest())
+        message = self._messages.get(key)
+        if message is None:
+            self._misses += 1
+            message = serializer.decode(data)
+            self._messages[key] = message
+            if len(self._messages) > self._max_size:
+                self._messages.popitem(last=False)
+        else:
+            self._hits += 1
+            self._messages.move_to_end(key)
+        return message._clone_body()  # pylint: disable=protected-access
+
+    def clear(self) -> None:
+        """Remove all the messages from the cache and reset the counters."""
+        self._messages.clear()
+        self._hits = 0
+        self._misses = 0
+
+
 class Protocol(Component):
     """
     This class implements a specifications for a protocol.
@@ -402,6 +513,10 @@ class Protocol(Component):
             )
         serialize_class = serializer_classes[0][1]
         message_class.serializer = serialize_class
+        if configuration.check_consistency_on_decode is not None:
+            message_class.check_consistency_on_decode = (
+                configuration.check_consistency_on_decode
+            )
 
         return Protocol(configuration, message_class, **kwargs)
 
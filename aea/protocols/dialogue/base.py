@@ -24,9 +24,12 @@ This module contains the classes required for dialogue management.
 - Dialogues: The dialogues class keeps track of all dialogues.
 """
 import inspect
+import logging
 import secrets
 import sys
-from collections import defaultdict, namedtuple
+import threading
+import time
+from collections import OrderedDict, defaultdict, namedtuple
 from enum import Enum
 from inspect import signature
 from typing import (
@@ -46,11 +49,15 @@ from typing import (
 from aea.common import Address
 from aea.exceptions import AEAEnforceError, enforce
 from aea.helpers.base import cached_property
+from aea.helpers.storage.backends.base import OBJECT_ID_AND_BODY
 from aea.helpers.storage.generic_storage import SyncCollection
 from aea.protocols.base import Message
 from aea.skills.base import SkillComponent
 
 
+_default_logger = logging.getLogger(__name__)
+
+
 if sys.version_info[0] < 3 or (sys.version_info[0] == 3 and sys.version_info[1] < 7):
     DialogueMessage = namedtuple(  # pragma: no cover
         "DialogueMessage",
@@ -69,6 +76,9 @@ else:
     )
 
 
+MessageHeader = namedtuple("MessageHeader", ["message_id", "target", "performative"])
+
+
 class InvalidDialogueMessage(Exception):
     """Exception for adding invalid message to a dialogue."""
 
@@ -241,11 +251,14 @@ class Dialogue(metaclass=_DialogueMeta):
         "_dialogue_label",
         "_role",
         "_message_class",
-        "_outgoing_messages",
-        "_incoming_messages",
+        "_messages",
+        "_message_headers",
         "_terminal_state_callbacks",
+        "_update_callbacks",
         "_last_message_id",
-        "_ordered_message_ids",
+        "_last_incoming_message_id",
+        "_last_outgoing_message_id",
+        "_max_message_bodies",
     )
 
     class Rules:
@@ -328,6 +341,9 @@ class Dialogue(metaclass=_DialogueMeta):
 
     _rules: Optional[Rules] = None
 
+    # the number of the most recent message bodies kept, None to keep all of them
+    MAX_MESSAGE_BODIES: Optional[int] = None
+
     def __init__(
         self,
         dialogue_label: DialogueLabel,
@@ -347,8 +363,9 @@ class Dialogue(metaclass=_DialogueMeta):
         self._dialogue_label = dialogue_label
         self._role = role
 
-        self._outgoing_messages = []  # type: List[Message]
-        self._incoming_messages = []  # type: List[Message]
+        # message bodies and headers, by message id in the order of the dialogue
+        self._messages: Dict[int, Message] = {}
+        self._message_headers: Dict[int, MessageHeader] = {}
 
         enforce(
             issubclass(message_class, Message),
@@ -356,8 +373,11 @@ class Dialogue(metaclass=_DialogueMeta):
         )
         self._message_class = message_class
         self._terminal_state_callbacks: Set[Callable[["Dialogue"], None]] = set()
+        self._update_callbacks: Set[Callable[["Dialogue"], None]] = set()
         self._last_message_id: Optional[int] = None
-        self._ordered_message_ids: List[int] = []
+        self._last_incoming_message_id: Optional[int] = None
+        self._last_outgoing_message_id: Optional[int] = None
+        self._max_message_bodies = self.MAX_MESSAGE_BODIES
 
     def add_terminal_state_callback(self, fn: Callable[["Dialogue"], None]) -> None:
         """
@@ -367,14 +387,21 @@ class Dialogue(metaclass=_DialogueMeta):
         """
         self._terminal_state_callbacks.add(fn)
 
+    def add_update_callback(self, fn: Callable[["Dialogue"], None]) -> None:
+        """
+        Add callback to be called on a new message added to the dialogue.
+
+        :param fn: callable to be called with one argument: Dialogue
+        """
+        self._update_callbacks.add(fn)
+
     def __eq__(self, other: Any) -> bool:
         """Compare two dialogues."""
         return (
             type(self) == type(other)  # pylint: disable=unidiomatic-typecheck
             and self.dialogue_label == other.dialogue_label
             and self.message_class == other.message_class
-            and self._incoming_messages == other._incoming_messages
-            and self._outgoing_messages == other._outgoing_messages
+            and self._messages == other._messages
             and self._ordered_message_ids == other._ordered_message_ids
             and self.role == other.role
             and self.self_address == other.self_address
@@ -390,6 +417,11 @@ class Dialogue(metaclass=_DialogueMeta):
             "outgoing_messages": [i.json() for i in self._outgoing_messages],
             "last_message_id": self._last_message_id,
             "ordered_message_ids": self._ordered_message_ids,
+            "message_headers": [
+                [header.message_id, header.target, header.performative.value]
+                for header in self._message_headers.values()
+            ],
+            "max_message_bodies": self._max_message_bodies,
         }
         return data
 
@@ -410,17 +442,32 @@ class Dialogue(metaclass=_DialogueMeta):
                 self_address=Address(data["self_address"]),
                 role=cls.Role(data["role"]),
             )
-            obj._incoming_messages = [  # pylint: disable=protected-access
-                message_class.from_json(i) for i in data["incoming_messages"]
-            ]
-            obj._outgoing_messages = [  # pylint: disable=protected-access
-                message_class.from_json(i) for i in data["outgoing_messages"]
-            ]
-            last_message_id = int(data["last_message_id"])
-            obj._last_message_id = last_message_id  # pylint: disable=protected-access
-            obj._ordered_message_ids = [  # pylint: disable=protected-access
-                int(el) for el in data["ordered_message_ids"]
-            ]
+            obj._max_message_bodies = data.get(  # pylint: disable=protected-access
+                "max_message_bodies", cls.MAX_MESSAGE_BODIES
+            )
+            messages = {
+                message.message_id: message
+                for message in (
+                    message_class.from_json(i)
+                    for i in data["incoming_messages"] + data["outgoing_messages"]
+                )
+            }
+            headers = {
+                int(message_id): MessageHeader(
+                    int(message_id), int(target), message_class.Performative(value)
+                )
+                for message_id, target, value in data.get("message_headers", [])
+            }
+            for message_id in map(int, data["ordered_message_ids"]):
+                message = messages.get(message_id)
+                header = headers.get(message_id)
+                if header is None:
+                    header = MessageHeader(
+                        message_id,
+                        cast(Message, message).target,
+                        cast(Message, message).performative,
+                    )
+                obj._add_message(header, message)  # pylint: disable=protected-access
             return obj
         except KeyError:  # pragma: nocover
             raise ValueError(f"Dialogue representation is invalid: {data}")
@@ -506,6 +553,89 @@ class Dialogue(metaclass=_DialogueMeta):
             is not self.dialogue_label.dialogue_starter_addr
         )
 
+    @property
+    def max_message_bodies(self) -> Optional[int]:
+        """
+        Get the number of the most recent message bodies kept in the dialogue.
+
+        The last incoming and the last outgoing messages are always kept. Only the
+        headers of the other messages are kept, which are sufficient to validate new ones.
+
+        :return: the number of message bodies kept, None if all of them are kept
+        """
+        return self._max_message_bodies
+
+    @max_message_bodies.setter
+    def max_message_bodies(self, max_message_bodies: Optional[int]) -> None:
+        """
+        Set the number of the most recent message bodies kept in the dialogue.
+
+        :param max_message_bodies: the number of message bodies kept, None to keep all of them
+        """
+        enforce(
+            max_message_bodies is None or max_message_bodies >= 0,
+            "Max message bodies must be non negative.",
+        )
+        self._max_message_bodies = max_message_bodies
+        self._release_message_bodies()
+
+    @property
+    def _incoming_messages(self) -> List[Message]:
+        """Get the incoming messages which bodies are kept."""
+        return [
+            message
+            for message_id, message in self._messages.items()
+            if not self._is_outgoing_message_id(message_id)
+        ]
+
+    @_incoming_messages.setter
+    def _incoming_messages(self, messages: List[Message]) -> None:
+        """Replace the incoming messages."""
+        self._replace_messages(messages, is_outgoing=False)
+
+    @property
+    def _outgoing_messages(self) -> List[Message]:
+        """Get the outgoing messages which bodies are kept."""
+        return [
+            message
+            for message_id, message in self._messages.items()
+            if self._is_outgoing_message_id(message_id)
+        ]
+
+    @_outgoing_messages.setter
+    def _outgoing_messages(self, messages: List[Message]) -> None:
+        """Replace the outgoing messages."""
+        self._replace_messages(messages, is_outgoing=True)
+
+    def _replace_messages(self, messages: List[Message], is_outgoing: bool) -> None:
+        """
+        Replace the messages of one direction, without validating them.
+
+        :param messages: the new messages
+        :param is_outgoing: whether the outgoing or the incoming messages are replaced
+        """
+        for message_id in list(self._message_headers):
+            if self._is_outgoing_message_id(message_id) == is_outgoing:
+                del self._message_headers[message_id]
+                self._messages.pop(message_id, None)
+        if is_outgoing:
+            self._last_outgoing_message_id = None
+        else:
+            self._last_incoming_message_id = None
+        self._last_message_id = (
+            list(self._message_headers)[-1] if self._message_headers else None
+        )
+        for message in messages:
+            self._add_message(
+                MessageHeader(message.message_id, message.target, message.performative),
+                message,
+            )
+
+    @property
+    def _ordered_message_ids(self) -> List[int]:
+        """Get the ids of all the messages in the order of the dialogue."""
+        return list(self._message_headers)
+
     @property
     def last_incoming_message(self) -> Optional[Message]:
         """
@@ -513,7 +643,9 @@ class Dialogue(metaclass=_DialogueMeta):
 
         :return: the last incoming message if it exists, None otherwise
         """
-        return self._incoming_messages[-1] if len(self._incoming_messages) > 0 else None
+        if self._last_incoming_message_id is None:
+            return None
+        return self._messages.get(self._last_incoming_message_id)
 
     @property
     def last_outgoing_message(self) -> Optional[Message]:
@@ -522,7 +654,9 @@ class Dialogue(metaclass=_DialogueMeta):
 
         :return: the last outgoing message if it exists, None otherwise
         """
-        return self._outgoing_messages[-1] if len(self._outgoing_messages) > 0 else None
+        if self._last_outgoing_message_id is None:
+            return None
+        return self._messages.get(self._last_outgoing_message_id)
 
     @property
     def last_message(self) -> Optional[Message]:
@@ -533,13 +667,7 @@ class Dialogue(metaclass=_DialogueMeta):
         """
         if self._last_message_id is None:
             return None
-
-        if (
-            self.last_incoming_message
-            and self.last_incoming_message.message_id == self._last_message_id
-        ):
-            return self.last_incoming_message
-        return self.last_outgoing_message
+        return self._messages.get(self._last_message_id)
 
     @property
     def is_empty(self) -> bool:
@@ -548,7 +676,16 @@ class Dialogue(metaclass=_DialogueMeta):
 
         :return: True if empty, False otherwise
         """
-        return len(self._outgoing_messages) == 0 and len(self._incoming_messages) == 0
+        return len(self._message_headers) == 0
+
+    def _is_outgoing_message_id(self, message_id: int) -> bool:
+        """
+        Check whether the message id is the one of an outgoing message.
+
+        :param message_id: the message id
+        :return: True if the message with that id is by this agent, False otherwise
+        """
+        return (message_id > 0) == self.is_self_initiated
 
     def _counterparty_from_message(self, message: Message) -> Address:
         """
@@ -587,7 +724,7 @@ class Dialogue(metaclass=_DialogueMeta):
         :param message_id: the message id
         :return: True if message with that id exists in this dialogue, False otherwise
         """
-        return self.get_message_by_id(message_id) is not None
+        return message_id in self._message_headers
 
     def _update(self, message: Message) -> None:
         """
@@ -618,18 +755,55 @@ class Dialogue(metaclass=_DialogueMeta):
                 )
             )
 
-        if self._is_message_by_self(message):
-            self._outgoing_messages.append(message)
-        else:
-            self._incoming_messages.append(message)
+        self._add_message(
+            MessageHeader(message.message_id, message.target, message.performative),
+            message,
+        )
 
-        self._last_message_id = message.message_id
-        self._ordered_message_ids.append(message.message_id)
+        for fn in self._update_callbacks:
+            fn(self)
 
         if message.performative in self.rules.terminal_performatives:
             for fn in self._terminal_state_callbacks:
                 fn(self)
 
+    def _add_message(self, header: MessageHeader, message: Optional[Message]) -> None:
+        """
+        Add a message to the history of the dialogue.
+
+        :param header: the header of the message
+        :param message: the message, None if its body has been released
+        """
+        message_id = header.message_id
+        self._message_headers[message_id] = header
+        if message is not None:
+            self._messages[message_id] = message
+        if self._is_outgoing_message_id(message_id):
+            self._last_outgoing_message_id = message_id
+        else:
+            self._last_incoming_message_id = message_id
+        self._last_message_id = message_id
+        self._release_message_bodies()
+
+    def _release_message_bodies(self) -> None:
+        """Release the bodies of the oldest messages exceeding the max message bodies."""
+        if self._max_message_bodies is None:
+            return
+        nb_to_release = len(self._messages) - self._max_message_bodies
+        if nb_to_release <= 0:
+            return
+        kept_message_ids = {
+            self._last_incoming_message_id,
+            self._last_outgoing_message_id,
+        }
+        for message_id in list(self._messages):
+            if nb_to_release <= 0:
+                break
+            if message_id in kept_message_ids:
+                continue
+            del self._messages[message_id]
+            nb_to_release -= 1
+
     def _is_belonging_to_dialogue(self, message: Message) -> bool:
         """
         Check if the message is belonging to the dialogue.
@@ -855,11 +1029,11 @@ class Dialogue(metaclass=_DialogueMeta):
         # quick target check.
         latest_ids: List[int] = []
 
-        if self.last_incoming_message:
-            latest_ids.append(abs(self.last_incoming_message.message_id))
+        if self._last_incoming_message_id is not None:
+            latest_ids.append(abs(self._last_incoming_message_id))
 
-        if self.last_outgoing_message:
-            latest_ids.append(abs(self.last_outgoing_message.message_id))
+        if self._last_outgoing_message_id is not None:
+            latest_ids.append(abs(self._last_outgoing_message_id))
 
         if abs(target) > max(latest_ids):
             return "Invalid target. Expected a value less than or equal to abs({}). Found abs({}).".format(
@@ -867,14 +1041,14 @@ class Dialogue(metaclass=_DialogueMeta):
             )
 
         # detailed target check
-        target_message = self.get_message_by_id(target)
+        target_header = self._message_headers.get(target)
 
-        if not target_message:
+        if not target_header:
             return "Invalid target {}. target_message can not be found.".format(
                 target
             )  # pragma: nocover
 
-        target_performative = target_message.performative
+        target_performative = target_header.performative
         if performative not in self.rules.get_valid_replies(target_performative):
             return "Invalid performative. Expected one of {}. Found {}.".format(
                 self.rules.get_valid_replies(target_performative), performative
@@ -901,32 +1075,21 @@ class Dialogue(metaclass=_DialogueMeta):
         return None
 
     def get_message_by_id(self, message_id: int) -> Optional[Message]:
-        """Get message by id, if not presents return None."""
+        """Get message by id, if not presents or its body has been released return None."""
         if self.is_empty:
             return None
 
         if message_id == 0:
             raise ValueError("message_id == 0 is invalid!")  # pragma: nocover
 
-        if bool(message_id > 0) == self.is_self_initiated:
-            messages_list = self._outgoing_messages
-        else:
-            messages_list = self._incoming_messages
-
-        if len(messages_list) == 0:
-            return None
-
-        if abs(message_id) > abs(messages_list[-1].message_id):
-            return None
-
-        return messages_list[abs(message_id) - 1]
+        return self._messages.get(message_id)
 
     def get_outgoing_next_message_id(self) -> int:
         """Get next outgoing message id."""
         next_message_id = Dialogue.STARTING_MESSAGE_ID
 
-        if self.last_outgoing_message:
-            next_message_id = abs(self.last_outgoing_message.message_id) + 1
+        if self._last_outgoing_message_id is not None:
+            next_message_id = abs(self._last_outgoing_message_id) + 1
 
         if not self.is_self_initiated:
             next_message_id = 0 - next_message_id
@@ -937,8 +1100,8 @@ class Dialogue(metaclass=_DialogueMeta):
         """Get next incoming message id."""
         next_message_id = Dialogue.STARTING_MESSAGE_ID
 
-        if self.last_incoming_message:
-            next_message_id = abs(self.last_incoming_message.message_id) + 1
+        if self._last_incoming_message_id is not None:
+            next_message_id = abs(self._last_incoming_message_id) + 1
 
         if self.is_self_initiated:
             next_message_id = 0 - next_message_id
@@ -981,11 +1144,8 @@ class Dialogue(metaclass=_DialogueMeta):
         """
         representation = f"Dialogue Label:\n{self.dialogue_label}\nMessages:\n"
 
-        for msg_id in self._ordered_message_ids:
-            msg = self.get_message_by_id(msg_id)
-            if msg is None:  # pragma: nocover
-                raise ValueError("Dialogue inconsistent! Missing message.")
-            representation += f"message_id={msg.message_id}, target={msg.target}, performative={msg.performative}\n"
+        for header in self._message_headers.values():
+            representation += f"message_id={header.message_id}, target={header.target}, performative={header.performative}\n"
         return representation
 
 
@@ -1049,62 +1209,182 @@ def find_caller_object(object_type: Type) -> Any:
 class BasicDialoguesStorage:
     """Dialogues state storage."""
 
+    TERMINAL_STATE_DIALOGUES_SWEEP_INTERVAL = 10.0
+
     def __init__(self, dialogues: "Dialogues") -> None:
         """Init dialogues storage."""
         self._dialogues_by_dialogue_label = {}  # type: Dict[DialogueLabel, Dialogue]
         self._dialogue_by_address = defaultdict(
-            list
-        )  # type: Dict[Address, List[Dialogue]]
+            dict
+        )  # type: Dict[Address, Dict[DialogueLabel, Dialogue]]
         self._incomplete_to_complete_dialogue_labels = (
             {}
         )  # type: Dict[DialogueLabel, DialogueLabel]
+        # (dialogue reference, opponent address) -> starter address -> dialogue label
+        # for the complete and the incomplete references of the stored dialogues
+        self._dialogue_labels_by_reference = defaultdict(
+            dict
+        )  # type: Dict[Tuple[Tuple[str, str], Address], Dict[Address, DialogueLabel]]
         self._dialogues = dialogues
-        self._terminal_state_dialogues_labels: Set[DialogueLabel] = set()
+        self._active_dialogues_labels: Set[DialogueLabel] = set()
+        # label -> time of the last message, least recent first
+        self._terminal_state_dialogues_labels: "OrderedDict[DialogueLabel, float]" = OrderedDict()
+        self._max_terminal_state_dialogues: Optional[int] = None
+        self._terminal_state_dialogues_max_age: Optional[float] = None
+        self._lock = threading.RLock()
+        self._sweeper: Optional[threading.Thread] = None
+        self._sweeper_stopped = threading.Event()
 
     @property
     def dialogues_in_terminal_state(self) -> List["Dialogue"]:
         """Get all dialogues in terminal state."""
-        return list(
-            filter(
-                None,
-                [
-                    self._dialogues_by_dialogue_label.get(i)
-                    for i in self._terminal_state_dialogues_labels
-                ],
-            )
-        )
+        with self._lock:
+            return [
+                self._dialogues_by_dialogue_label[label]
+                for label in self._terminal_state_dialogues_labels
+            ]
 
     @property
     def dialogues_in_active_state(self) -> List["Dialogue"]:
         """Get all dialogues in active state."""
-        active_dialogues = (
-            set(self._dialogues_by_dialogue_label.keys())
-            - self._terminal_state_dialogues_labels
+        with self._lock:
+            return [
+                self._dialogues_by_dialogue_label[label]
+                for label in self._active_dialogues_labels
+            ]
+
+    def set_terminal_state_eviction_policy(
+        self, max_dialogues: Optional[int] = None, max_age: Optional[float] = None,
+    ) -> None:
+        """
+        Set the policy to evict dialogues in terminal state from memory.
+
+        The dialogues with the least recent last message are evicted first.
+        Evicted dialogues are offloaded to the storage, if any.
+
+        :param max_dialogues: the maximum number of dialogues in terminal state kept in memory.
+        :param max_age: the maximum time in seconds dialogues are kept in memory after their last message.
+        """
+        enforce(
+            max_dialogues is None or max_dialogues >= 0,
+            "Max terminal state dialogues must be non negative.",
         )
-        return list(
-            filter(
-                None,
-                [self._dialogues_by_dialogue_label.get(i) for i in active_dialogues],
-            )
+        enforce(
+            max_age is None or max_age > 0,
+            "Terminal state dialogues max age must be positive.",
         )
+        self._max_terminal_state_dialogues = max_dialogues
+        self._terminal_state_dialogues_max_age = max_age
 
     @property
     def is_terminal_dialogues_kept(self) -> bool:
         """Return True if dialogues should stay after terminal state."""
         return self._dialogues.is_keep_dialogues_in_terminal_state
 
+    def dialogue_update_callback(self, dialogue: "Dialogue") -> None:
+        """Method to be called on a new message added to the dialogue."""
+        dialogue_label = dialogue.dialogue_label
+        if dialogue_label not in self._terminal_state_dialogues_labels:
+            return
+        with self._lock:
+            if dialogue_label in self._terminal_state_dialogues_labels:
+                self._terminal_state_dialogues_labels[dialogue_label] = time.monotonic()
+                self._terminal_state_dialogues_labels.move_to_end(dialogue_label)
+
     def dialogue_terminal_state_callback(self, dialogue: "Dialogue") -> None:
         """Method to be called on dialogue terminal state reached."""
         if self.is_terminal_dialogues_kept:
-            self._terminal_state_dialogues_labels.add(dialogue.dialogue_label)
+            self._set_terminal_state(dialogue.dialogue_label)
         else:
             self.remove(dialogue.dialogue_label)
 
     def setup(self) -> None:
         """Set up dialogue storage."""
+        if self._terminal_state_dialogues_max_age is None or self._sweeper is not None:
+            return
+        self._sweeper_stopped.clear()
+        self._sweeper = threading.Thread(
+            target=self._sweep_periodically,
+            name=f"{self._dialogues.__class__.__name__}Sweeper",
+            daemon=True,
+        )
+        self._sweeper.start()
 
     def teardown(self) -> None:
         """Tear down dialogue storage."""
+        if self._sweeper is None:
+            return
+        self._sweeper_stopped.set()
+        self._sweeper.join()
+        self._sweeper = None
+
+    def _sweep_periodically(self) -> None:
+        """Evict the expired dialogues in terminal state until stopped."""
+        interval = min(
+            cast(float, self._terminal_state_dialogues_max_age),
+            self.TERMINAL_STATE_DIALOGUES_SWEEP_INTERVAL,
+        )
+        while not self._sweeper_stopped.wait(interval):
+            try:
+                self.sweep()
+            except Exception as e:  # pylint: disable=broad-except  # pragma: nocover
+                _default_logger.exception(
+                    f"Failed to evict dialogues in terminal state: {e}"
+                )
+
+    def sweep(self) -> None:
+        """Evict the dialogues in terminal state exceeding the eviction policy."""
+        with self._lock:
+            labels = self._get_labels_to_evict()
+            dialogues = [self._dialogues_by_dialogue_label[label] for label in labels]
+        if not dialogues:
+            return
+
+        self._offload(dialogues)
+
+        with self._lock:
+            for dialogue in dialogues:
+                label = dialogue.dialogue_label
+                if (
+                    label in self._terminal_state_dialogues_labels
+                    and self._dialogues_by_dialogue_label.get(label) is dialogue
+                ):
+                    self._remove_from_memory(label)
+
+    def _get_labels_to_evict(self) -> List[DialogueLabel]:
+        """
+        Get the labels of the dialogues in terminal state exceeding the eviction policy.
+
+        :return: the labels, least recent last message first.
+        """
+        terminal_labels = self._terminal_state_dialogues_labels
+        nb_to_evict = 0
+        if self._max_terminal_state_dialogues is not None:
+            nb_to_evict = max(
+                0, len(terminal_labels) - self._max_terminal_state_dialogues
+            )
+        labels: List[DialogueLabel] = []
+        expiry_time = (
+            time.monotonic() - self._terminal_state_dialogues_max_age
+            if self._terminal_state_dialogues_max_age is not None
+            else None
+        )
+        for label, terminal_time in terminal_labels.items():
+            if len(labels) >= nb_to_evict and (
+                expiry_time is None or terminal_time > expiry_time
+            ):
+                break
+            labels.append(label)
+        return labels
+
+    def _offload(self, dialogues: List[Dialogue]) -> None:
+        """
+        Offload dialogues evicted from memory.
+
+        Dialogues are just forgotten, as there is no storage.
+
+        :param dialogues: the dialogues to offload.
+        """
 
     def add(self, dialogue: Dialogue) -> None:
         """
@@ -1113,10 +1393,15 @@ class BasicDialoguesStorage:
         :param dialogue: dialogue to add.
         """
         dialogue.add_terminal_state_callback(self.dialogue_terminal_state_callback)
-        self._dialogues_by_dialogue_label[dialogue.dialogue_label] = dialogue
-        self._dialogue_by_address[
-            dialogue.dialogue_label.dialogue_opponent_addr
-        ].append(dialogue)
+        dialogue.add_update_callback(self.dialogue_update_callback)
+        dialogue_label = dialogue.dialogue_label
+        with self._lock:
+            self._dialogues_by_dialogue_label[dialogue_label] = dialogue
+            self._dialogue_by_address[dialogue_label.dialogue_opponent_addr][
+                dialogue_label
+            ] = dialogue
+            self._active_dialogues_labels.add(dialogue_label)
+            self._add_reference(dialogue_label, dialogue_label)
 
     def _add_terminal_state_dialogue(self, dialogue: Dialogue) -> None:
         """
@@ -1125,25 +1410,97 @@ class BasicDialoguesStorage:
         :param dialogue: dialogue to add.
         """
         self.add(dialogue)
-        self._terminal_state_dialogues_labels.add(dialogue.dialogue_label)
+        self._set_terminal_state(dialogue.dialogue_label)
+
+    def _set_terminal_state(self, dialogue_label: DialogueLabel) -> None:
+        """
+        Move a stored dialogue to the terminal state index.
+
+        :param dialogue_label: label of the dialogue.
+        """
+        with self._lock:
+            if dialogue_label not in self._dialogues_by_dialogue_label:
+                return
+            self._active_dialogues_labels.discard(dialogue_label)
+            self._terminal_state_dialogues_labels[dialogue_label] = time.monotonic()
+            self._terminal_state_dialogues_labels.move_to_end(dialogue_label)
+            exceeds_max_dialogues = (
+                self._max_terminal_state_dialogues is not None
+                and len(self._terminal_state_dialogues_labels)
+                > self._max_terminal_state_dialogues
+            )
+        if exceeds_max_dialogues:
+            self.sweep()
+
+    def _add_reference(
+        self, addressed_label: DialogueLabel, dialogue_label: DialogueLabel
+    ) -> None:
+        """
+        Index the dialogue label messages with the reference of another label are addressed to.
+
+        :param addressed_label: the label built from the messages.
+        :param dialogue_label: the label of the dialogue.
+        """
+        self._dialogue_labels_by_reference[
+            (addressed_label.dialogue_reference, addressed_label.dialogue_opponent_addr)
+        ][addressed_label.dialogue_starter_addr] = dialogue_label
+
+    def _remove_reference(
+        self, addressed_label: DialogueLabel, dialogue_label: DialogueLabel
+    ) -> None:
+        """
+        Remove a dialogue label indexed by the reference of another label.
+
+        :param addressed_label: the label built from the messages.
+        :param dialogue_label: the label of the dialogue.
+        """
+        key = (
+            addressed_label.dialogue_reference,
+            addressed_label.dialogue_opponent_addr,
+        )
+        labels_by_starter = self._dialogue_labels_by_reference.get(key)
+        if labels_by_starter is None:
+            return
+        starter = addressed_label.dialogue_starter_addr
+        if labels_by_starter.get(starter) == dialogue_label:
+            del labels_by_starter[starter]
+            if not labels_by_starter:
+                del self._dialogue_labels_by_reference[key]
 
     def remove(self, dialogue_label: DialogueLabel) -> None:
         """
         Remove dialogue from storage by it's label.
 
+        :param dialogue_label: label of the dialogue to remove
+        """
+        with self._lock:
+            self._remove_from_memory(dialogue_label)
+
+    def _remove_from_memory(self, dialogue_label: DialogueLabel) -> None:
+        """
+        Remove dialogue from memory by it's label.
+
         :param dialogue_label: label of the dialogue to remove
         """
         dialogue = self._dialogues_by_dialogue_label.pop(dialogue_label, None)
 
         self._incomplete_to_complete_dialogue_labels.pop(dialogue_label, None)
 
-        if dialogue_label in self._terminal_state_dialogues_labels:
-            self._terminal_state_dialogues_labels.remove(dialogue_label)
+        self._active_dialogues_labels.discard(dialogue_label)
+        self._terminal_state_dialogues_labels.pop(dialogue_label, None)
 
         if dialogue:
-            self._dialogue_by_address[dialogue_label.dialogue_opponent_addr].remove(
-                dialogue
-            )
+            dialogues_with_counterparty = self._dialogue_by_address[
+                dialogue_label.dialogue_opponent_addr
+            ]
+            dialogues_with_counterparty.pop(dialogue_label, None)
+            if not dialogues_with_counterparty:
+                del self._dialogue_by_address[dialogue_label.dialogue_opponent_addr]
+
+        self._remove_reference(dialogue_label, dialogue_label)
+        incomplete_dialogue_label = dialogue_label.get_incomplete_version()
+        if incomplete_dialogue_label != dialogue_label:
+            self._remove_reference(incomplete_dialogue_label, dialogue_label)
 
     def get(self, dialogue_label: DialogueLabel) -> Optional[Dialogue]:
         """
@@ -1161,7 +1518,33 @@ class BasicDialoguesStorage:
         :param counterparty: the counterparty
         :return: The dialogues with the counterparty.
         """
-        return self._dialogue_by_address.get(counterparty, [])
+        with self._lock:
+            return list(self._dialogue_by_address.get(counterparty, {}).values())
+
+    def get_dialogue_label_by_reference(
+        self,
+        dialogue_reference: Tuple[str, str],
+        counterparty: Address,
+        self_address: Address,
+    ) -> Optional[DialogueLabel]:
+        """
+        Get the label of the stored dialogue messages with a dialogue reference are addressed to.
+
+        Self initiated dialogues take precedence over the ones initiated by the counterparty.
+
+        :param dialogue_reference: the dialogue reference of the message.
+        :param counterparty: the counterparty of the dialogue.
+        :param self_address: the address of the agent.
+        :return: the dialogue label, or None if no stored dialogue matches.
+        """
+        labels_by_starter = self._dialogue_labels_by_reference.get(
+            (dialogue_reference, counterparty)
+        )
+        if labels_by_starter is None:
+            return None
+        return labels_by_starter.get(self_address) or labels_by_starter.get(
+            counterparty
+        )
 
     def is_in_incomplete(self, dialogue_label: DialogueLabel) -> bool:
         """Check dialogue label presents in list of incomplete."""
@@ -1173,9 +1556,11 @@ class BasicDialoguesStorage:
         complete_dialogue_label: DialogueLabel,
     ) -> None:
         """Set incomplete dialogue label."""
-        self._incomplete_to_complete_dialogue_labels[
-            incomplete_dialogue_label
-        ] = complete_dialogue_label
+        with self._lock:
+            self._incomplete_to_complete_dialogue_labels[
+                incomplete_dialogue_label
+            ] = complete_dialogue_label
+            self._add_reference(incomplete_dialogue_label, complete_dialogue_label)
 
     def is_dialogue_present(self, dialogue_label: DialogueLabel) -> bool:
         """Check dialogue with label specified presents in storage."""
@@ -1193,16 +1578,29 @@ class PersistDialoguesStorage(BasicDialoguesStorage):
     Persist dialogues storage.
 
     Uses generic storage to load/save dialogues data on setup/teardown.
+
+    Changed dialogues are written behind: they are buffered and the changes are
+    flushed to the generic storage in one transaction once the flush interval has
+    elapsed or the buffer is full, and on teardown. A dialogue is serialized when
+    its write is scheduled, by the thread changing it, so a flush never reads
+    live dialogues. The agent loop flushes the changes of idle agents when due.
     """
 
     INCOMPLETE_DIALOGUES_OBJECT_NAME = "incomplete_dialogues"
     TERMINAL_STATE_DIALOGUES_COLLECTTION_SUFFIX = "_terminal"
+    WRITE_BEHIND_FLUSH_INTERVAL = 1.0
+    WRITE_BEHIND_MAX_PENDING_WRITES = 100
 
     def __init__(self, dialogues: "Dialogues") -> None:
         """Init dialogues storage."""
         super().__init__(dialogues)
 
         self._skill_component: Optional[SkillComponent] = self.get_skill_component()
+        # (is terminal state collection, label) -> dialogue json to put, None to remove
+        self._pending_writes: "OrderedDict[Tuple[bool, DialogueLabel], Optional[Dict]]" = OrderedDict()
+        self._persisted_active_dialogues_labels: Set[DialogueLabel] = set()
+        self._last_flush_time = time.monotonic()
+        self._flush_lock = threading.Lock()
 
     @staticmethod
     def get_skill_component() -> Optional[SkillComponent]:
@@ -1258,12 +1656,102 @@ class PersistDialoguesStorage(BasicDialoguesStorage):
             return  # pragma: nocover
 
         self._dump_incomplete_dialogues_labels(self._active_dialogues_collection)
-        self._dump_dialogues(
-            self.dialogues_in_active_state, self._active_dialogues_collection
-        )
-        self._dump_dialogues(
-            self.dialogues_in_terminal_state, self._terminal_dialogues_collection
-        )
+        self.flush()
+
+    def flush(self) -> None:
+        """Write the dialogues changed since the last flush to the generic storage."""
+        with self._flush_lock:
+            with self._lock:
+                pending_writes = self._pending_writes
+                self._pending_writes = OrderedDict()
+                self._last_flush_time = time.monotonic()
+
+            if (
+                not pending_writes
+                or not self._active_dialogues_collection
+                or not self._terminal_dialogues_collection
+            ):
+                return
+
+            puts: Dict[bool, List[OBJECT_ID_AND_BODY]] = {False: [], True: []}
+            removals: Dict[bool, List[str]] = {False: [], True: []}
+            for (is_terminal, dialogue_label), body in pending_writes.items():
+                if body is None:
+                    removals[is_terminal].append(str(dialogue_label))
+                else:
+                    puts[is_terminal].append((str(dialogue_label), body))
+
+            # both collections share the storage backend, so one transaction covers them
+            with self._active_dialogues_collection.transaction():
+                for is_terminal, collection in (
+                    (False, self._active_dialogues_collection),
+                    (True, self._terminal_dialogues_collection),
+                ):
+                    if removals[is_terminal]:
+                        collection.remove_many(removals[is_terminal])
+                    if puts[is_terminal]:
+                        collection.put_many(puts[is_terminal])
+
+            with self._lock:
+                for (is_terminal, dialogue_label), body in pending_writes.items():
+                    if is_terminal:
+                        continue
+                    if body is None:
+                        self._persisted_active_dialogues_labels.discard(dialogue_label)
+                    else:
+                        self._persisted_active_dialogues_labels.add(dialogue_label)
+
+    def flush_if_due(self) -> None:
+        """Flush the pending writes if the flush interval has elapsed or there are too many of them."""
+        if (
+            len(self._pending_writes) >= self.WRITE_BEHIND_MAX_PENDING_WRITES
+            or time.monotonic() - self._last_flush_time
+            >= self.WRITE_BEHIND_FLUSH_INTERVAL
+        ):
+            self.flush()
+
+    def _schedule_active_write(self, dialogue: Dialogue) -> None:
+        """
+        Schedule the write of a dialogue to the active dialogues collection.
+
+        :param dialogue: the dialogue.
+        """
+        if not self._active_dialogues_collection:
+            return
+        dialogue_label = dialogue.dialogue_label
+        body = dialogue.json()
+        with self._lock:
+            self._pending_writes[(False, dialogue_label)] = body
+
+    def _schedule_terminal_write(self, dialogue: Dialogue) -> None:
+        """
+        Schedule the move of a dialogue to the terminal state dialogues collection.
+
+        :param dialogue: the dialogue.
+        """
+        if not self._terminal_dialogues_collection:
+            return
+        dialogue_label = dialogue.dialogue_label
+        body = dialogue.json()
+        with self._lock:
+            self._pending_writes.pop((False, dialogue_label), None)
+            if dialogue_label in self._persisted_active_dialogues_labels:
+                self._pending_writes[(False, dialogue_label)] = None
+            self._pending_writes[(True, dialogue_label)] = body
+
+    def dialogue_update_callback(self, dialogue: "Dialogue") -> None:
+        """Call on a new message added to the dialogue."""
+        super().dialogue_update_callback(dialogue)
+        if dialogue.dialogue_label not in self._terminal_state_dialogues_labels:
+            self._schedule_active_write(dialogue)
+        self.flush_if_due()
+
+    def dialogue_terminal_state_callback(self, dialogue: "Dialogue") -> None:
+        """Call on dialogue reaches terminal state."""
+        super().dialogue_terminal_state_callback(dialogue)
+        if dialogue.dialogue_label in self._terminal_state_dialogues_labels:
+            self._schedule_terminal_write(dialogue)
+        self.flush_if_due()
 
     def _dump_incomplete_dialogues_labels(self, collection: SyncCollection) -> None:
         """Dump incomplete labels."""
@@ -1285,6 +1773,7 @@ class PersistDialoguesStorage(BasicDialoguesStorage):
         """Load dialogues from collection."""
         if not collection:  # pragma: nocover
             return
+        self.flush()
         for label, dialogue_data in collection.list():
             if label == self.INCOMPLETE_DIALOGUES_OBJECT_NAME:
                 continue
@@ -1320,6 +1809,7 @@ class PersistDialoguesStorage(BasicDialoguesStorage):
         """Load active dialogues from storage."""
         for dialogue in self._load_dialogues(self._active_dialogues_collection):
             self.add(dialogue)
+            self._persisted_active_dialogues_labels.add(dialogue.dialogue_label)
 
     def _load_terminated_dialogues(self) -> None:
         """Load terminated dialogues from storage."""
@@ -1335,33 +1825,52 @@ class PersistDialoguesStorage(BasicDialoguesStorage):
 
     def _set_incomplete_dialogues_labels_from_json(self, data: List) -> None:
         """Set incomplete_to_complete_dialogue_labels from json friendly dict."""
-        self._incomplete_to_complete_dialogue_labels = {
-            DialogueLabel.from_json(k): DialogueLabel.from_json(v) for k, v in data
-        }
+        self._incomplete_to_complete_dialogue_labels = {}
+        for incomplete_label_data, complete_label_data in data:
+            self.set_incomplete_dialogue(
+                DialogueLabel.from_json(incomplete_label_data),
+                DialogueLabel.from_json(complete_label_data),
+            )
 
     def setup(self) -> None:
         """Set up dialogue storage."""
-        if not self._skill_component:  # pragma: nocover
-            return
-        self._load()
+        if self._skill_component:
+            self._load()
+        super().setup()
 
     def teardown(self) -> None:
         """Tear down dialogue storage."""
-        if not self._skill_component:  # pragma: nocover
-            return
-        self._dump()
+        super().teardown()
+        if self._skill_component:
+            self._dump()
 
-    def remove(self, dialogue_label: DialogueLabel) -> None:
-        """Remove dialogue from memory and persistent storage."""
-        if dialogue_label in self._terminal_state_dialogues_labels:
-            collection = self._terminal_dialogues_collection
-        else:
-            collection = self._active_dialogues_collection
+    def _offload(self, dialogues: List[Dialogue]) -> None:
+        """
+        Offload dialogues evicted from memory to the terminal state dialogues collection.
 
-        super().remove(dialogue_label)
+        :param dialogues: the dialogues to offload.
+        """
+        for dialogue in dialogues:
+            self._schedule_terminal_write(dialogue)
 
-        if collection:
-            collection.remove(str(dialogue_label))
+    def remove(self, dialogue_label: DialogueLabel) -> None:
+        """Remove dialogue from memory and persistent storage."""
+        with self._flush_lock:
+            with self._lock:
+                is_terminal = dialogue_label in self._terminal_state_dialogues_labels
+                super().remove(dialogue_label)
+                self._pending_writes.pop((False, dialogue_label), None)
+                self._pending_writes.pop((True, dialogue_label), None)
+                if is_terminal:
+                    collection = self._terminal_dialogues_collection
+                elif dialogue_label in self._persisted_active_dialogues_labels:
+                    self._persisted_active_dialogues_labels.discard(dialogue_label)
+                    collection = self._active_dialogues_collection
+                else:
+                    return
+
+            if collection:
+                collection.remove(str(dialogue_label))
 
 
 class PersistDialoguesStorageWithOffloading(PersistDialoguesStorage):
@@ -1378,11 +1887,11 @@ class PersistDialoguesStorageWithOffloading(PersistDialoguesStorage):
 
         # do offloading
         # push to storage
-        self._terminal_dialogues_collection.put(
-            str(dialogue.dialogue_label), dialogue.json()
-        )
+        self._schedule_terminal_write(dialogue)
         # remove from memory
-        self.remove(dialogue.dialogue_label)
+        with self._lock:
+            self._remove_from_memory(dialogue.dialogue_label)
+        self.flush_if_due()
 
     def get(self, dialogue_label: DialogueLabel) -> Optional[Dialogue]:
         """Try to get dialogue by label from memory or persists storage."""
@@ -1390,9 +1899,14 @@ class PersistDialoguesStorageWithOffloading(PersistDialoguesStorage):
         if dialogue:
             return dialogue
 
-        dialogue = self._get_dialogue_from_collection(
-            dialogue_label, self._terminal_dialogues_collection
-        )
+        with self._lock:
+            body = self._pending_writes.get((True, dialogue_label))
+        if body:
+            dialogue = self._dialogue_from_json(body)
+        else:
+            dialogue = self._get_dialogue_from_collection(
+                dialogue_label, self._terminal_dialogues_collection
+            )
         if dialogue:
             # get dialogue from terminal state collection and cache it
             self._add_terminal_state_dialogue(dialogue)
@@ -1434,6 +1948,7 @@ class PersistDialoguesStorageWithOffloading(PersistDialoguesStorage):
         if not collection:
             return []
 
+        self.flush()
         return [
             self._dialogue_from_json(cast(Dict, i[1]))
             for i in collection.find("dialogue_label.dialogue_opponent_addr", address)
@@ -1477,6 +1992,9 @@ class Dialogues:
     """The dialogues class keeps track of all dialogues for an agent."""
 
     _keep_terminal_state_dialogues = False
+    _max_terminal_state_dialogues: Optional[int] = None
+    _terminal_state_dialogues_max_age: Optional[float] = None
+    _max_message_bodies_per_dialogue: Optional[int] = None
 
     def __init__(
         self,
@@ -1486,6 +2004,9 @@ class Dialogues:
         dialogue_class: Type[Dialogue],
         role_from_first_message: Callable[[Message, Address], Dialogue.Role],
         keep_terminal_state_dialogues: Optional[bool] = None,
+        max_terminal_state_dialogues: Optional[int] = None,
+        terminal_state_dialogues_max_age: Optional[float] = None,
+        max_message_bodies_per_dialogue: Optional[int] = None,
     ) -> None:
         """
         Initialize dialogues.
@@ -1496,6 +2017,9 @@ class Dialogues:
         :param dialogue_class: the dialogue class used
         :param role_from_first_message: the callable determining role from first message
         :param keep_terminal_state_dialogues: specify do dialogues in terminal state should stay or not
+        :param max_terminal_state_dialogues: the maximum number of dialogues in terminal state kept in memory, the least recently terminated are evicted first
+        :param terminal_state_dialogues_max_age: the maximum time in seconds dialogues in terminal state are kept in memory
+        :param max_message_bodies_per_dialogue: the number of the most recent message bodies kept by each dialogue, the dialogue class default if None
         """
 
         self._dialogues_storage = PersistDialoguesStorageWithOffloading(self)
@@ -1504,6 +2028,15 @@ class Dialogues:
 
         if keep_terminal_state_dialogues is not None:
             self._keep_terminal_state_dialogues = keep_terminal_state_dialogues
+        if max_terminal_state_dialogues is not None:
+            self._max_terminal_state_dialogues = max_terminal_state_dialogues
+        if terminal_state_dialogues_max_age is not None:
+            self._terminal_state_dialogues_max_age = terminal_state_dialogues_max_age
+        self._dialogues_storage.set_terminal_state_eviction_policy(
+            self._max_terminal_state_dialogues, self._terminal_state_dialogues_max_age
+        )
+        if max_message_bodies_per_dialogue is not None:
+            self._max_message_bodies_per_dialogue = max_message_bodies_per_dialogue
 
         enforce(
             issubclass(message_class, Message),
@@ -1837,6 +2370,17 @@ class Dialogues:
         :param message: a message
         :return: the dialogue, or None in case such a dialogue does not exist
         """
+        dialogue_label = self._dialogues_storage.get_dialogue_label_by_reference(
+            message.dialogue_reference,
+            self._counterparty_from_message(message),
+            self.self_address,
+        )
+        if dialogue_label is not None:
+            dialogue = self.get_dialogue_from_label(dialogue_label)
+            if dialogue is not None:
+                return dialogue
+
+        # not indexed: the dialogue may be offloaded to the storage
         self_initiated_dialogue_label = DialogueLabel(
             message.dialogue_reference,
             self._counterparty_from_message(message),
@@ -1982,6 +2526,8 @@ class Dialogues:
             self_address=self.self_address,
             role=role,
         )
+        if self._max_message_bodies_per_dialogue is not None:
+            dialogue.max_message_bodies = self._max_message_bodies_per_dialogue
         self._dialogues_storage.add(dialogue)
         return dialogue
 
@@ -2007,3 +2553,7 @@ class Dialogues:
         super_obj = super()
         if hasattr(super_obj, "teardown"):  # pragma: nocover
             super_obj.teardown()  # type: ignore  # pylint: disable=no-member
+
+    def flush_if_due(self) -> None:
+        """Write the dialogues changed since the last flush to the generic storage, if the flush is due."""
+        self._dialogues_storage.flush_if_due()
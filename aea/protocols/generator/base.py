@@ -105,6 +105,30 @@ def _type_check(variable_name: str, variable_type: str) -> str:
         return f"type({variable_name}) is {variable_type}"
 
 
+def _parenthesize_compound_condition(condition: str) -> str:
+    """
+    Wrap a condition in parentheses if it has operators outside of brackets.
+
+    :param condition: the condition, in string form.
+    :return: the condition, safe to be negated with 'not'.
+    """
+    depth = 0
+    top_level_condition = ""
+    for char in condition:
+        if char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+        elif depth == 0:
+            top_level_condition += char
+    if any(
+        operator in top_level_condition
+        for operator in (" or ", " and ", " is ", " == ")
+    ):
+        return "({})".format(condition)
+    return condition
+
+
 def _copyright_header_str(author: str) -> str:
     """
     Produce the copyright header text for a protocol.
@@ -320,6 +344,25 @@ class ProtocolGenerator:
                 )
         return new_content_type
 
+    def _enforce_str(self, condition: str, exception_text: str) -> str:
+        """
+        Produce a check raising an AEAEnforceError if a condition does not hold.
+
+        Unlike a call to 'enforce', the exception text is only built when the check fails.
+
+        :param condition: the condition to be checked, in string form.
+        :param exception_text: the expression of the exception text, in string form.
+
+        :return: the string containing the check.
+        """
+        check_str = self.indent + "if not {}:\n".format(
+            _parenthesize_compound_condition(condition)
+        )
+        self._change_indent(1)
+        check_str += self.indent + "raise AEAEnforceError({})\n".format(exception_text)
+        self._change_indent(-1)
+        return check_str
+
     def _check_content_type_str(self, content_name: str, content_type: str) -> str:
         """
         Produce the checks of elements of compositional types.
@@ -356,28 +399,25 @@ class ProtocolGenerator:
                 else:
                     unique_standard_types_set.add(typing_content_type)
             unique_standard_types_list = sorted(unique_standard_types_set)
-            check_str += self.indent
-            check_str += "enforce("
-            for unique_type in unique_standard_types_list:
-                check_str += "{} or ".format(
+            check_str += self._enforce_str(
+                " or ".join(
                     _type_check(content_variable, self._to_custom_custom(unique_type))
-                )
-            check_str = check_str[:-4]
-            check_str += ", \"Invalid type for content '{}'. Expected either of '{}'. Found '{{}}'.\".format(type({})))\n".format(
-                content_name,
-                [
-                    unique_standard_type
-                    for unique_standard_type in unique_standard_types_list
-                ],
-                content_variable,
+                    for unique_type in unique_standard_types_list
+                ),
+                "\"Invalid type for content '{}'. Expected either of '{}'. Found '{{}}'.\".format(type({}))".format(
+                    content_name,
+                    [
+                        unique_standard_type
+                        for unique_standard_type in unique_standard_types_list
+                    ],
+                    content_variable,
+                ),
             )
             if "frozenset" in unique_standard_types_list:
                 check_str += self.indent + "if isinstance({}, frozenset):\n".format(
                     content_variable
                 )
                 self._change_indent(1)
-                check_str += self.indent + "enforce(\n"
-                self._change_indent(1)
                 frozen_set_element_types_set = set()
                 for element_type in element_types:
                     if element_type.startswith("FrozenSet"):
@@ -385,49 +425,38 @@ class ProtocolGenerator:
                             _get_sub_types_of_compositional_types(element_type)[0]
                         )
                 frozen_set_element_types = sorted(frozen_set_element_types_set)
-                for frozen_set_element_type in frozen_set_element_types:
-                    check_str += self.indent + "all({} for element in {}) or\n".format(
-                        _type_check(
-                            "element", self._to_custom_custom(frozen_set_element_type)
-                        ),
-                        content_variable,
-                    )
-                check_str = check_str[:-4]
-                check_str += "\n"
-                self._change_indent(-1)
                 if len(frozen_set_element_types) == 1:
-                    check_str += (
-                        self.indent
-                        + ", \"Invalid type for elements of content '{}'. Expected ".format(
-                            content_name
-                        )
+                    exception_text = "\"Invalid type for elements of content '{}'. Expected '{}'.\"".format(
+                        content_name,
+                        self._to_custom_custom(frozen_set_element_types[0]),
                     )
-                    for frozen_set_element_type in frozen_set_element_types:
-                        check_str += "'{}'".format(
-                            self._to_custom_custom(frozen_set_element_type)
-                        )
-                    check_str += '.")\n'
                 else:
-                    check_str += (
-                        self.indent
-                        + ", \"Invalid type for frozenset elements in content '{}'. Expected either ".format(
-                            content_name
-                        )
+                    exception_text = "\"Invalid type for frozenset elements in content '{}'. Expected either {}.\"".format(
+                        content_name,
+                        " or ".join(
+                            "'{}'".format(self._to_custom_custom(element_type))
+                            for element_type in frozen_set_element_types
+                        ),
                     )
-                    for frozen_set_element_type in frozen_set_element_types:
-                        check_str += "'{}' or ".format(
-                            self._to_custom_custom(frozen_set_element_type)
+                check_str += self._enforce_str(
+                    " or ".join(
+                        "all({} for element in {})".format(
+                            _type_check(
+                                "element",
+                                self._to_custom_custom(frozen_set_element_type),
+                            ),
+                            content_variable,
                         )
-                    check_str = check_str[:-4]
-                    check_str += '.")\n'
+                        for frozen_set_element_type in frozen_set_element_types
+                    ),
+                    exception_text,
+                )
                 self._change_indent(-1)
             if "tuple" in unique_standard_types_list:
                 check_str += self.indent + "if isinstance({}, tuple):\n".format(
                     content_variable
                 )
                 self._change_indent(1)
-                check_str += self.indent + "enforce(\n"
-                self._change_indent(1)
                 tuple_element_types_set = set()
                 for element_type in element_types:
                     if element_type.startswith("Tuple"):
@@ -435,41 +464,30 @@ class ProtocolGenerator:
                             _get_sub_types_of_compositional_types(element_type)[0]
                         )
                 tuple_element_types = sorted(tuple_element_types_set)
-                for tuple_element_type in tuple_element_types:
-                    check_str += self.indent + "all({} for element in {}) or \n".format(
-                        _type_check(
-                            "element", self._to_custom_custom(tuple_element_type)
-                        ),
-                        content_variable,
-                    )
-                check_str = check_str[:-4]
-                check_str += "\n"
-                self._change_indent(-1)
                 if len(tuple_element_types) == 1:
-                    check_str += (
-                        self.indent
-                        + ", \"Invalid type for tuple elements in content '{}'. Expected ".format(
-                            content_name
-                        )
+                    exception_text = "\"Invalid type for tuple elements in content '{}'. Expected '{}'.\"".format(
+                        content_name, self._to_custom_custom(tuple_element_types[0]),
                     )
-                    for tuple_element_type in tuple_element_types:
-                        check_str += "'{}'".format(
-                            self._to_custom_custom(tuple_element_type)
-                        )
-                    check_str += '.")\n'
                 else:
-                    check_str += (
-                        self.indent
-                        + ", \"Invalid type for tuple elements in content '{}'. Expected either ".format(
-                            content_name
-                        )
+                    exception_text = "\"Invalid type for tuple elements in content '{}'. Expected either {}.\"".format(
+                        content_name,
+                        " or ".join(
+                            "'{}'".format(self._to_custom_custom(element_type))
+                            for element_type in tuple_element_types
+                        ),
                     )
-                    for tuple_element_type in tuple_element_types:
-                        check_str += "'{}' or ".format(
-                            self._to_custom_custom(tuple_element_type)
+                check_str += self._enforce_str(
+                    " or ".join(
+                        "all({} for element in {})".format(
+                            _type_check(
+                                "element", self._to_custom_custom(tuple_element_type)
+                            ),
+                            content_variable,
                         )
-                    check_str = check_str[:-4]
-                    check_str += '.")\n'
+                        for tuple_element_type in tuple_element_types
+                    ),
+                    exception_text,
+                )
                 self._change_indent(-1)
             if "dict" in unique_standard_types_list:
                 check_str += self.indent + "if isinstance({}, dict):\n".format(
@@ -483,104 +501,86 @@ class ProtocolGenerator:
                     )
                 )
                 self._change_indent(1)
-                check_str += self.indent + "enforce(\n"
-                self._change_indent(1)
                 dict_key_value_types = dict()
                 for element_type in element_types:
                     if element_type.startswith("Dict"):
                         dict_key_value_types[
                             _get_sub_types_of_compositional_types(element_type)[0]
                         ] = _get_sub_types_of_compositional_types(element_type)[1]
-                for element1_type in sorted(dict_key_value_types.keys()):
-                    check_str += self.indent + "({} and {}) or\n".format(
-                        _type_check(
-                            "key_of_" + content_name,
-                            self._to_custom_custom(element1_type),
-                        ),
-                        _type_check(
-                            "value_of_" + content_name,
-                            self._to_custom_custom(dict_key_value_types[element1_type]),
-                        ),
-                    )
-                check_str = check_str[:-4]
-                check_str += "\n"
-                self._change_indent(-1)
-
                 if len(dict_key_value_types) == 1:
-                    check_str += (
-                        self.indent
-                        + ", \"Invalid type for dictionary key, value in content '{}'. Expected ".format(
-                            content_name
-                        )
+                    expected_types = "".join(
+                        "'{}', '{}'".format(key, dict_key_value_types[key])
+                        for key in sorted(dict_key_value_types.keys())
                     )
-                    for key in sorted(dict_key_value_types.keys()):
-                        check_str += "'{}', '{}'".format(key, dict_key_value_types[key])
-                    check_str += '.")\n'
                 else:
-                    check_str += (
-                        self.indent
-                        + ", \"Invalid type for dictionary key, value in content '{}'. Expected ".format(
-                            content_name
-                        )
+                    expected_types = " or ".join(
+                        "'{}','{}'".format(key, dict_key_value_types[key])
+                        for key in sorted(dict_key_value_types.keys())
                     )
-                    for key in sorted(dict_key_value_types.keys()):
-                        check_str += "'{}','{}' or ".format(
-                            key, dict_key_value_types[key]
+                check_str += self._enforce_str(
+                    " or ".join(
+                        "({} and {})".format(
+                            _type_check(
+                                "key_of_" + content_name,
+                                self._to_custom_custom(element1_type),
+                            ),
+                            _type_check(
+                                "value_of_" + content_name,
+                                self._to_custom_custom(
+                                    dict_key_value_types[element1_type]
+                                ),
+                            ),
                         )
-                    check_str = check_str[:-4]
-                    check_str += '.")\n'
+                        for element1_type in sorted(dict_key_value_types.keys())
+                    ),
+                    "\"Invalid type for dictionary key, value in content '{}'. Expected {}.\"".format(
+                        content_name, expected_types
+                    ),
+                )
                 self._change_indent(-2)
         elif content_type.startswith("FrozenSet["):
             # check the type
-            check_str += (
-                self.indent
-                + "enforce(isinstance({}, frozenset), \"Invalid type for content '{}'. Expected 'frozenset'. Found '{{}}'.\".format(type({})))\n".format(
-                    content_variable, content_name, content_variable
-                )
+            check_str += self._enforce_str(
+                "isinstance({}, frozenset)".format(content_variable),
+                "\"Invalid type for content '{}'. Expected 'frozenset'. Found '{{}}'.\".format(type({}))".format(
+                    content_name, content_variable
+                ),
             )
             element_type = _get_sub_types_of_compositional_types(content_type)[0]
-            check_str += self.indent + "enforce(all(\n"
-            self._change_indent(1)
-            check_str += self.indent + "{} for element in {}\n".format(
-                _type_check("element", self._to_custom_custom(element_type)),
-                content_variable,
-            )
-            self._change_indent(-1)
-            check_str += (
-                self.indent
-                + "), \"Invalid type for frozenset elements in content '{}'. Expected '{}'.\")\n".format(
+            check_str += self._enforce_str(
+                "all({} for element in {})".format(
+                    _type_check("element", self._to_custom_custom(element_type)),
+                    content_variable,
+                ),
+                "\"Invalid type for frozenset elements in content '{}'. Expected '{}'.\"".format(
                     content_name, element_type
-                )
+                ),
             )
         elif content_type.startswith("Tuple["):
             # check the type
-            check_str += (
-                self.indent
-                + "enforce(isinstance({}, tuple), \"Invalid type for content '{}'. Expected 'tuple'. Found '{{}}'.\".format(type({})))\n".format(
-                    content_variable, content_name, content_variable
-                )
+            check_str += self._enforce_str(
+                "isinstance({}, tuple)".format(content_variable),
+                "\"Invalid type for content '{}'. Expected 'tuple'. Found '{{}}'.\".format(type({}))".format(
+                    content_name, content_variable
+                ),
             )
             element_type = _get_sub_types_of_compositional_types(content_type)[0]
-            check_str += self.indent + "enforce(all(\n"
-            self._change_indent(1)
-            check_str += self.indent + "{} for element in {}\n".format(
-                _type_check("element", self._to_custom_custom(element_type)),
-                content_variable,
-            )
-            self._change_indent(-1)
-            check_str += (
-                self.indent
-                + "), \"Invalid type for tuple elements in content '{}'. Expected '{}'.\")\n".format(
+            check_str += self._enforce_str(
+                "all({} for element in {})".format(
+                    _type_check("element", self._to_custom_custom(element_type)),
+                    content_variable,
+                ),
+                "\"Invalid type for tuple elements in content '{}'. Expected '{}'.\"".format(
                     content_name, element_type
-                )
+                ),
             )
         elif content_type.startswith("Dict["):
             # check the type
-            check_str += (
-                self.indent
-                + "enforce(isinstance({}, dict), \"Invalid type for content '{}'. Expected 'dict'. Found '{{}}'.\".format(type({})))\n".format(
-                    content_variable, content_name, content_variable
-                )
+            check_str += self._enforce_str(
+                "isinstance({}, dict)".format(content_variable),
+                "\"Invalid type for content '{}'. Expected 'dict'. Found '{{}}'.\".format(type({}))".format(
+                    content_name, content_variable
+                ),
             )
             element_type_1 = _get_sub_types_of_compositional_types(content_type)[0]
             element_type_2 = _get_sub_types_of_compositional_types(content_type)[1]
@@ -592,45 +592,29 @@ class ProtocolGenerator:
                 )
             )
             self._change_indent(1)
-            check_str += self.indent + "enforce(\n"
-            self._change_indent(1)
-            check_str += self.indent + "{}\n".format(
+            check_str += self._enforce_str(
                 _type_check(
                     "key_of_" + content_name, self._to_custom_custom(element_type_1)
-                )
-            )
-            self._change_indent(-1)
-            check_str += (
-                self.indent
-                + ", \"Invalid type for dictionary keys in content '{}'. Expected '{}'. Found '{{}}'.\".format(type(key_of_{})))\n".format(
+                ),
+                "\"Invalid type for dictionary keys in content '{}'. Expected '{}'. Found '{{}}'.\".format(type(key_of_{}))".format(
                     content_name, element_type_1, content_name
-                )
+                ),
             )
-
-            check_str += self.indent + "enforce(\n"
-            self._change_indent(1)
-            check_str += self.indent + "{}\n".format(
+            check_str += self._enforce_str(
                 _type_check(
                     "value_of_" + content_name, self._to_custom_custom(element_type_2)
-                )
-            )
-            self._change_indent(-1)
-            check_str += (
-                self.indent
-                + ", \"Invalid type for dictionary values in content '{}'. Expected '{}'. Found '{{}}'.\".format(type(value_of_{})))\n".format(
+                ),
+                "\"Invalid type for dictionary values in content '{}'. Expected '{}'. Found '{{}}'.\".format(type(value_of_{}))".format(
                     content_name, element_type_2, content_name
-                )
+                ),
             )
             self._change_indent(-1)
         else:
-            check_str += (
-                self.indent
-                + "enforce({}, \"Invalid type for content '{}'. Expected '{}'. Found '{{}}'.\".format(type({})))\n".format(
-                    _type_check(content_variable, self._to_custom_custom(content_type)),
-                    content_name,
-                    content_type,
-                    content_variable,
-                )
+            check_str += self._enforce_str(
+                _type_check(content_variable, self._to_custom_custom(content_type)),
+                "\"Invalid type for content '{}'. Expected '{}'. Found '{{}}'.\".format(type({}))".format(
+                    content_name, content_type, content_variable
+                ),
             )
         if optional:
             self._change_indent(-1)
@@ -859,49 +843,38 @@ class ProtocolGenerator:
         )
         cls_str += self.indent + "try:\n"
         self._change_indent(1)
-        cls_str += (
-            self.indent
-            + "enforce(isinstance(self.dialogue_reference, tuple), \"Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.\""
-            ".format(type(self.dialogue_reference)))\n"
+        cls_str += self._enforce_str(
+            "isinstance(self.dialogue_reference, tuple)",
+            "\"Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.\".format(type(self.dialogue_reference))",
         )
-        cls_str += (
-            self.indent
-            + "enforce(isinstance(self.dialogue_reference[0], str), \"Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.\""
-            ".format(type(self.dialogue_reference[0])))\n"
+        cls_str += self._enforce_str(
+            "isinstance(self.dialogue_reference[0], str)",
+            "\"Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.\".format(type(self.dialogue_reference[0]))",
         )
-        cls_str += (
-            self.indent
-            + "enforce(isinstance(self.dialogue_reference[1], str), \"Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.\""
-            ".format(type(self.dialogue_reference[1])))\n"
+        cls_str += self._enforce_str(
+            "isinstance(self.dialogue_reference[1], str)",
+            "\"Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.\".format(type(self.dialogue_reference[1]))",
         )
-        cls_str += (
-            self.indent
-            + "enforce("
-            + _type_check("self.message_id", "int")
-            + ", \"Invalid type for 'message_id'. Expected 'int'. Found '{}'.\""
-            ".format(type(self.message_id)))\n"
+        cls_str += self._enforce_str(
+            _type_check("self.message_id", "int"),
+            "\"Invalid type for 'message_id'. Expected 'int'. Found '{}'.\".format(type(self.message_id))",
         )
-        cls_str += (
-            self.indent
-            + "enforce("
-            + _type_check("self.target", "int")
-            + ", \"Invalid type for 'target'. Expected 'int'. Found '{}'.\""
-            ".format(type(self.target)))\n\n"
+        cls_str += self._enforce_str(
+            _type_check("self.target", "int"),
+            "\"Invalid type for 'target'. Expected 'int'. Found '{}'.\".format(type(self.target))",
         )
+        cls_str += "\n"
 
         cls_str += self.indent + "# Light Protocol Rule 2\n"
         cls_str += self.indent + "# Check correct performative\n"
-        cls_str += (
-            self.indent
-            + "enforce(isinstance(self.performative, {}Message.Performative)".format(
+        cls_str += self._enforce_str(
+            "isinstance(self.performative, {}Message.Performative)".format(
                 self.protocol_specification_in_camel_case
-            )
-        )
-        cls_str += (
-            ", \"Invalid 'performative'. Expected either of '{}'. Found '{}'.\".format("
+            ),
+            "\"Invalid 'performative'. Expected either of '{}'. Found '{}'.\".format("
+            "self.valid_performatives, self.performative)",
         )
-        cls_str += "self.valid_performatives, self.performative"
-        cls_str += "))\n\n"
+        cls_str += "\n"
 
         cls_str += self.indent + "# Check correct contents\n"
         cls_str += (
@@ -934,18 +907,19 @@ class ProtocolGenerator:
 
         cls_str += "\n"
         cls_str += self.indent + "# Check correct content count\n"
-        cls_str += (
-            self.indent + "enforce(expected_nb_of_contents == actual_nb_of_contents, "
+        cls_str += self._enforce_str(
+            "expected_nb_of_contents == actual_nb_of_contents",
             '"Incorrect number of contents. Expected {}. Found {}"'
-            ".format(expected_nb_of_contents, actual_nb_of_contents))\n\n"
+            ".format(expected_nb_of_contents, actual_nb_of_contents)",
         )
+        cls_str += "\n"
 
         cls_str += self.indent + "# Light Protocol Rule 3\n"
         cls_str += self.indent + "if self.message_id == 1:\n"
         self._change_indent(1)
-        cls_str += (
-            self.indent
-            + "enforce(self.target == 0, \"Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.\".format(self.target))\n"
+        cls_str += self._enforce_str(
+            "self.target == 0",
+            "\"Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.\".format(self.target)",
         )
         self._change_indent(-2)
         cls_str += (
@@ -1574,8 +1548,7 @@ class ProtocolGenerator:
         # Imports
         cls_str += self.indent + "from typing import Any, Dict, cast\n\n"
         cls_str += (
-            self.indent
-            + "from aea.mail.base_pb2 import DialogueMessage, Message as ProtobufMessage\n"
+            self.indent + "from aea.mail.base_pb2 import Message as ProtobufMessage\n"
         )
         cls_str += MESSAGE_IMPORT + "\n"
         cls_str += SERIALIZER_IMPORT + "\n\n"
@@ -1621,7 +1594,7 @@ class ProtocolGenerator:
             self.protocol_specification_in_camel_case
         )
         cls_str += self.indent + "message_pb = ProtobufMessage()\n"
-        cls_str += self.indent + "dialogue_message_pb = DialogueMessage()\n"
+        cls_str += self.indent + "dialogue_message_pb = message_pb.dialogue_message\n"
         cls_str += self.indent + "{}_msg = {}_pb2.{}Message()\n\n".format(
             self.protocol_specification.name,
             self.protocol_specification.name,
@@ -1649,21 +1622,14 @@ class ProtocolGenerator:
                 self.protocol_specification_in_camel_case, performative.upper()
             )
             self._change_indent(1)
-            cls_str += (
-                self.indent
-                + "performative = {}_pb2.{}Message.{}_Performative()  # type: ignore\n".format(
-                    self.protocol_specification.name,
-                    self.protocol_specification_in_camel_case,
-                    performative.title(),
-                )
+            cls_str += self.indent + "performative = {}_msg.{}\n".format(
+                self.protocol_specification.name, performative
             )
+            cls_str += self.indent + "performative.SetInParent()\n"
             for content_name, content_type in contents.items():
                 cls_str += self._encoding_message_content_from_python_to_protobuf(
                     content_name, content_type
                 )
-            cls_str += self.indent + "{}_msg.{}.CopyFrom(performative)\n".format(
-                self.protocol_specification.name, performative
-            )
 
             counter += 1
             self._change_indent(-1)
@@ -1681,9 +1647,6 @@ class ProtocolGenerator:
                 self.protocol_specification.name,
             )
         )
-        cls_str += (
-            self.indent + "message_pb.dialogue_message.CopyFrom(dialogue_message_pb)\n"
-        )
         cls_str += self.indent + "message_bytes = message_pb.SerializeToString()\n"
         cls_str += self.indent + "return message_bytes\n"
         self._change_indent(-1)
@@ -1770,6 +1733,12 @@ class ProtocolGenerator:
         cls_str += self.indent + "dialogue_reference=dialogue_reference,\n"
         cls_str += self.indent + "target=target,\n"
         cls_str += self.indent + "performative=performative,\n"
+        cls_str += (
+            self.indent
+            + "_check_consistency={}Message.check_consistency_on_decode,\n".format(
+                self.protocol_specification_in_camel_case
+            )
+        )
         cls_str += self.indent + "**performative_content\n"
         self._change_indent(-1)
         cls_str += self.indent + ")\n"
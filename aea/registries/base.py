@@ -22,7 +22,18 @@
 import copy
 from abc import ABC, abstractmethod
 from operator import itemgetter
-from typing import Any, Dict, Generic, List, Optional, Set, Tuple, TypeVar, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
 from aea.components.base import Component
 from aea.configurations.base import ComponentId, ComponentType, PublicId
@@ -320,7 +331,7 @@ class ComponentRegistry(
 ):
     """This class implements a generic registry for skill components."""
 
-    __slots__ = ("_items", "_dynamically_added")
+    __slots__ = ("_items", "_dynamically_added", "_callbacks")
 
     def __init__(self, **kwargs: Any) -> None:
         """
@@ -333,6 +344,35 @@ class ComponentRegistry(
             Dict[str, SkillComponentType]
         ] = PublicIdRegistry()
         self._dynamically_added: Dict[PublicId, Set[str]] = {}
+        self._callbacks: List[Callable[[SkillComponentType, bool], None]] = []
+
+    def add_callback(
+        self, callback_fn: Callable[[SkillComponentType, bool], None]
+    ) -> None:
+        """
+        Add a callback to be notified of registrations and unregistrations.
+
+        The callback is called with the item and True on registration,
+        or with the item and False on unregistration.
+
+        :param callback_fn: the callback.
+        """
+        self._callbacks.append(callback_fn)
+
+    def remove_callback(
+        self, callback_fn: Callable[[SkillComponentType, bool], None]
+    ) -> None:
+        """
+        Remove a callback previously added.
+
+        :param callback_fn: the callback.
+        """
+        self._callbacks.remove(callback_fn)
+
+    def _notify(self, item: SkillComponentType, is_registered: bool) -> None:
+        """Notify the callbacks of a registration or an unregistration."""
+        for callback_fn in self._callbacks:
+            callback_fn(item, is_registered)
 
     def register(
         self,
@@ -365,6 +405,7 @@ class ComponentRegistry(
 
         if is_dynamically_added:
             self._dynamically_added.setdefault(skill_id, set()).add(item_name)
+        self._notify(item, True)
 
     def unregister(self, item_id: Tuple[PublicId, str]) -> Optional[SkillComponentType]:
         """
@@ -406,6 +447,7 @@ class ComponentRegistry(
             items.remove(item_name)
             if len(items) == 0:
                 self._dynamically_added.pop(skill_id, None)
+        self._notify(item, False)
         return item
 
     def fetch(self, item_id: Tuple[PublicId, str]) -> Optional[SkillComponentType]:
@@ -438,8 +480,10 @@ class ComponentRegistry(
             raise ValueError(
                 "No component of skill {} present in the registry.".format(skill_id)
             )
-        self._items.unregister(skill_id)
+        items = cast(Dict[str, SkillComponentType], self._items.unregister(skill_id))
         self._dynamically_added.pop(skill_id, None)
+        for item in items.values():
+            self._notify(item, False)
 
     def ids(self) -> Set[Tuple[PublicId, str]]:
         """Get the item ids."""
@@ -600,6 +644,7 @@ class HandlerRegistry(ComponentRegistry[Handler]):
                     self._items_by_protocol_and_skill.fetch(protocol_id),
                 )
                 skill_id_to_handler.unregister(skill_id)
+            self._notify(handler, False)
 
     def fetch_by_protocol(self, protocol_id: PublicId) -> List[Handler]:
         """
@@ -18,14 +18,14 @@
 # ------------------------------------------------------------------------------
 """This module contains registries."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 from aea.configurations.base import PublicId
 from aea.helpers.async_friendly_queue import AsyncFriendlyQueue
 from aea.helpers.logging import WithLogger, get_logger
 from aea.protocols.base import Message
 from aea.registries.resources import Resources
-from aea.skills.base import Behaviour, Handler
+from aea.skills.base import Behaviour, Handler, SkillContext
 
 
 class Filter(WithLogger):
@@ -45,6 +45,18 @@ class Filter(WithLogger):
         self._resources = resources
         self._decision_maker_out_queue = decision_maker_out_queue
 
+        self._active_handlers: Dict[
+            Tuple[PublicId, Optional[PublicId]], Tuple[Handler, ...]
+        ] = {}
+        self._active_handlers_version = 0
+        self._active_handlers_hits = 0
+        self._active_handlers_misses = 0
+        self._active_handlers_invalidations = 0
+        self._skill_contexts: Set[SkillContext] = set()
+        resources.handler_registry.add_callback(self._on_handler_registry_update)
+        for handler in resources.handler_registry.fetch_all():
+            self._subscribe_to_skill_status(handler.context)
+
     @property
     def resources(self) -> Resources:
         """Get resources."""
@@ -57,26 +69,94 @@ class Filter(WithLogger):
 
     def get_active_handlers(
         self, protocol_id: PublicId, skill_id: Optional[PublicId] = None
-    ) -> List[Handler]:
+    ) -> Sequence[Handler]:
         """
         Get active handlers based on protocol id and optional skill id.
 
+        The handlers are cached till a handler is registered or unregistered,
+        or a skill is activated or deactivated.
+
         :param protocol_id: the protocol id
         :param skill_id: the skill id
-        :return: the list of handlers currently active
+        :return: the handlers currently active
         """
+        key = (protocol_id, skill_id)
+        active_handlers = self._active_handlers.get(key, None)
+        if active_handlers is not None:
+            self._active_handlers_hits += 1
+            return active_handlers
+        self._active_handlers_misses += 1
+
+        version = self._active_handlers_version
         if skill_id is not None:
             handler = self.resources.get_handler(protocol_id, skill_id)
             active_handlers = (
-                [] if handler is None or not handler.context.is_active else [handler]
+                () if handler is None or not handler.context.is_active else (handler,)
             )
         else:
             handlers = self.resources.get_handlers(protocol_id)
-            active_handlers = list(
-                filter(lambda handler: handler.context.is_active, handlers)
+            active_handlers = tuple(
+                handler for handler in handlers if handler.context.is_active
             )
+        if version == self._active_handlers_version:
+            # not invalidated meanwhile
+            self._active_handlers[key] = active_handlers
         return active_handlers
 
+    def get_active_handlers_cache_stats(self) -> Dict[str, int]:
+        """
+        Get the statistics of the cache of the active handlers.
+
+        :return: the number of entries, hits, misses and invalidations.
+        """
+        return {
+            "size": len(self._active_handlers),
+            "hits": self._active_handlers_hits,
+            "misses": self._active_handlers_misses,
+            "invalidations": self._active_handlers_invalidations,
+        }
+
+    def _invalidate_active_handlers(self) -> None:
+        """Invalidate the cache of the active handlers."""
+        self._active_handlers_version += 1
+        self._active_handlers_invalidations += 1
+        self._active_handlers = {}
+
+    def _on_handler_registry_update(  # pylint: disable=unused-argument
+        self, handler: Handler, is_registered: bool
+    ) -> None:
+        """
+        Invalidate the cache of the active handlers on a handler registered or unregistered.
+
+        :param handler: the handler.
+        :param is_registered: True if the handler was registered, False otherwise.
+        """
+        if is_registered:
+            self._subscribe_to_skill_status(handler.context)
+        self._invalidate_active_handlers()
+
+    def _subscribe_to_skill_status(self, skill_context: SkillContext) -> None:
+        """
+        Invalidate the cache of the active handlers on the activations and deactivations of a skill.
+
+        :param skill_context: the context of the skill of a handler.
+        """
+        if skill_context in self._skill_contexts:
+            return
+        self._skill_contexts.add(skill_context)
+        skill_context.add_status_callback(self._on_skill_status_update)
+
+    def _on_skill_status_update(  # pylint: disable=unused-argument
+        self, skill_context: SkillContext, is_active: bool
+    ) -> None:
+        """
+        Invalidate the cache of the active handlers on a skill activated or deactivated.
+
+        :param skill_context: the context of the skill.
+        :param is_active: the new status of the skill.
+        """
+        self._invalidate_active_handlers()
+
     def get_active_behaviours(self) -> List[Behaviour]:
         """
         Get the active behaviours.
@@ -150,9 +230,7 @@ class Filter(WithLogger):
             message.protocol_id, skill_id,
         )
         if handler is not None:
-            self.logger.debug(
-                "Calling handler {} of skill {}".format(type(handler), skill_id)
-            )
+            self.logger.debug("Calling handler %s of skill %s", type(handler), skill_id)
             handler.handle(message)
         else:
             self.logger.warning(
@@ -31,6 +31,7 @@ from aea.agent_loop import (
     AsyncState,
     BaseAgentLoop,
     SyncAgentLoop,
+    TimerWheelAgentLoop,
 )
 from aea.connections.base import ConnectionStates
 from aea.decision_maker.base import DecisionMaker, DecisionMakerHandler
@@ -39,7 +40,7 @@ from aea.helpers.async_utils import Runnable
 from aea.helpers.exception_policy import ExceptionPolicyEnum
 from aea.helpers.logging import WithLogger, get_logger
 from aea.helpers.storage.generic_storage import Storage
-from aea.multiplexer import AsyncMultiplexer
+from aea.multiplexer import AsyncMultiplexer, BackpressurePolicyEnum
 from aea.skills.tasks import TaskManager
 
 
@@ -59,6 +60,7 @@ class BaseRuntime(Runnable, WithLogger):
     RUN_LOOPS: Dict[str, Type[BaseAgentLoop]] = {
         "async": AsyncAgentLoop,
         "sync": SyncAgentLoop,
+        "timer_wheel": TimerWheelAgentLoop,
     }
     DEFAULT_RUN_LOOP: str = "async"
 
@@ -104,7 +106,7 @@ class BaseRuntime(Runnable, WithLogger):
 
     def _log_runtime_state(self, state: RuntimeStates) -> None:
         """Log a runtime state changed."""
-        self.logger.debug(f"[{self._agent.name}]: Runtime state changed to {state}.")
+        self.logger.debug("[%s]: Runtime state changed to %s.", self._agent.name, state)
 
     def _get_taskmanager_instance(self) -> TaskManager:
         """Get taskmanager instance."""
@@ -133,6 +135,16 @@ class BaseRuntime(Runnable, WithLogger):
             default_routing=multiplexer_options.get("default_routing"),
             default_connection=multiplexer_options.get("default_connection"),
             protocols=multiplexer_options.get("protocols", []),
+            batch_size=multiplexer_options.get("batch_size", 1),
+            send_queue_high_watermark=multiplexer_options.get(
+                "send_queue_high_watermark"
+            ),
+            send_queue_low_watermark=multiplexer_options.get(
+                "send_queue_low_watermark"
+            ),
+            backpressure_policy=multiplexer_options.get(
+                "backpressure_policy", BackpressurePolicyEnum.block
+            ),
         )
 
     @staticmethod
@@ -239,13 +251,13 @@ class BaseRuntime(Runnable, WithLogger):
 
     def _teardown(self) -> None:
         """Tear down runtime."""
-        self.logger.debug("[{}]: Runtime teardown...".format(self._agent.name))
+        self.logger.debug("[%s]: Runtime teardown...", self._agent.name)
         if self._decision_maker is not None:  # pragma: nocover
             self.decision_maker.stop()
         self.task_manager.stop()
-        self.logger.debug("[{}]: Calling teardown method...".format(self._agent.name))
+        self.logger.debug("[%s]: Calling teardown method...", self._agent.name)
         self._agent.teardown()
-        self.logger.debug("[{}]: Runtime teardown completed".format(self._agent.name))
+        self.logger.debug("[%s]: Runtime teardown completed", self._agent.name)
 
     def set_loop(self, loop: AbstractEventLoop) -> None:
         """
@@ -362,20 +374,20 @@ class AsyncRuntime(BaseRuntime):
 
     async def _start_agent_loop(self) -> None:
         """Start agent main loop asynchronous way."""
-        self.logger.debug("[{}] Runtime started".format(self._agent.name))
+        self.logger.debug("[%s] Runtime started", self._agent.name)
 
         await self.multiplexer.connection_status.wait(ConnectionStates.connected)
-        self.logger.debug("[{}] Multiplexer connected.".format(self._agent.name))
+        self.logger.debug("[%s] Multiplexer connected.", self._agent.name)
         if self.storage:
             await self.storage.wait_connected()
-            self.logger.debug("[{}] Storage connected.".format(self._agent.name))
+            self.logger.debug("[%s] Storage connected.", self._agent.name)
 
         self.task_manager.start()
         if self._decision_maker is not None:  # pragma: nocover
             self.decision_maker.start()
-        self.logger.debug("[{}] Calling setup method...".format(self._agent.name))
+        self.logger.debug("[%s] Calling setup method...", self._agent.name)
         self._agent.setup()
-        self.logger.debug("[{}] Run main loop...".format(self._agent.name))
+        self.logger.debug("[%s] Run main loop...", self._agent.name)
 
         self.agent_loop.start()
 
@@ -29,7 +29,7 @@ from logging import Logger
 from pathlib import Path
 from queue import Queue
 from types import SimpleNamespace
-from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union, cast
 
 from aea.common import Address
 from aea.components.base import Component, load_aea_package
@@ -84,6 +84,7 @@ class SkillContext:
         self._new_behaviours_queue = queue.Queue()  # type: Queue
         self._new_handlers_queue = queue.Queue()  # type: Queue
         self._logger: Optional[Logger] = None
+        self._status_callbacks: List[Callable[["SkillContext", bool], None]] = []
 
     @property
     def logger(self) -> Logger:
@@ -132,12 +133,38 @@ class SkillContext:
     @is_active.setter
     def is_active(self, value: bool) -> None:
         """Set the status of the skill (active/not active)."""
+        is_changed = value != self._is_active
         self._is_active = value
         self.logger.debug(
             "New status of skill {}: is_active={}".format(
                 self.skill_id, self._is_active
             )
         )
+        if is_changed:
+            for callback_fn in self._status_callbacks:
+                callback_fn(self, value)
+
+    def add_status_callback(
+        self, callback_fn: Callable[["SkillContext", bool], None]
+    ) -> None:
+        """
+        Add a callback to be notified of the activations and deactivations of the skill.
+
+        The callback is called with the skill context and the new status.
+
+        :param callback_fn: the callback.
+        """
+        self._status_callbacks.append(callback_fn)
+
+    def remove_status_callback(
+        self, callback_fn: Callable[["SkillContext", bool], None]
+    ) -> None:
+        """
+        Remove a callback previously added.
+
+        :param callback_fn: the callback.
+        """
+        self._status_callbacks.remove(callback_fn)
 
     @property
     def new_behaviours(self) -> "Queue[Behaviour]":
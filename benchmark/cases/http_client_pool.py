@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Performance test of the http client connection requests, with and without keep-alive connections.
+
+The requests are sent to a local aiohttp server, so the reported time is
+dominated by the connection setup when the connections are not kept alive.
+"""
+import asyncio
+import socket
+from unittest.mock import MagicMock
+
+import aiohttp.web
+
+from aea.common import Address
+from aea.configurations.base import ConnectionConfig
+from aea.identity.base import Identity
+from aea.mail.base import Envelope, Message
+from aea.protocols.dialogue.base import Dialogue
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+from packages.fetchai.connections.http_client.connection import HTTPClientConnection
+from packages.fetchai.protocols.http.dialogues import HttpDialogue, HttpDialogues
+from packages.fetchai.protocols.http.message import HttpMessage
+
+
+HOST = "127.0.0.1"
+
+
+def _role_from_first_message(  # pylint: disable=unused-argument
+    message: Message, receiver_address: Address
+) -> Dialogue.Role:
+    """Infer the role of the agent from an incoming/outgoing first message."""
+    return HttpDialogue.Role.CLIENT
+
+
+async def _handler(_request: aiohttp.web.Request) -> aiohttp.web.Response:
+    """Respond to a request."""
+    return aiohttp.web.Response(text="ok")
+
+
+async def _run(
+    benchmark: BenchmarkControl,
+    requests_amount: int,
+    concurrency: int,
+    keep_alive: bool,
+) -> None:
+    """Send the requests through the connection to a local server."""
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        port = sock.getsockname()[1]
+    app = aiohttp.web.Application()
+    app.router.add_get("/", _handler)
+    runner = aiohttp.web.AppRunner(app)
+    await runner.setup()
+    await aiohttp.web.TCPSite(runner, HOST, port).start()
+
+    connection = HTTPClientConnection(
+        configuration=ConnectionConfig(
+            host=HOST,
+            port=port,
+            keepalive_timeout=15.0 if keep_alive else None,
+            max_concurrent_requests=concurrency,
+            connection_id=HTTPClientConnection.connection_id,
+        ),
+        data_dir=MagicMock(),
+        identity=Identity("name", address="address"),
+    )
+    dialogues = HttpDialogues(
+        "some/skill:0.1.0", role_from_first_message=_role_from_first_message
+    )
+    envelopes = []
+    for _ in range(requests_amount):
+        message, _ = dialogues.create(
+            counterparty=str(HTTPClientConnection.connection_id),
+            performative=HttpMessage.Performative.REQUEST,
+            method="get",
+            url=f"http://{HOST}:{port}/",
+            headers="Accept: text/plain\n",
+            version="",
+            body=b"",
+        )
+        envelopes.append(
+            Envelope(to=message.to, sender=message.sender, message=message)
+        )
+    await connection.connect()
+
+    benchmark.start()
+
+    try:
+        for envelope in envelopes:
+            await connection.send(envelope)
+        for _ in range(requests_amount):
+            await connection.receive()
+    finally:
+        await connection.disconnect()
+        await runner.cleanup()
+
+
+def http_client_pool(
+    benchmark: BenchmarkControl,
+    requests_amount: int = 2000,
+    concurrency: int = 10,
+    keep_alive: bool = True,
+) -> None:
+    """
+    Send requests to a local server, keeping the connections alive or not.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param requests_amount: number of requests to send
+    :param concurrency: number of requests in flight
+    :param keep_alive: keep the connections alive between requests, or open a connection per request
+
+    :return: None
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(
+            _run(benchmark, requests_amount, concurrency, keep_alive)
+        )
+    finally:
+        loop.close()
+
+
+if __name__ == "__main__":
+    TestCli(http_client_pool).run()
@@ -0,0 +1,133 @@
+#!/usr/bin/ev python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Performance test of the searches of the local node service directory.
+
+The directory holds many service descriptions, and answers equality, range,
+distance and combined queries. The same searches can be run as a scan of all
+the descriptions, to compare.
+"""
+import random
+from typing import List
+
+from aea.helpers.search.directory import ServiceDirectory
+from aea.helpers.search.models import (
+    Attribute,
+    Constraint,
+    ConstraintType,
+    DataModel,
+    Description,
+    Location,
+    Query,
+)
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+
+DATA_MODEL = DataModel(
+    "service",
+    [
+        Attribute("service_id", str, True),
+        Attribute("price", int, True),
+        Attribute("location", Location, True),
+    ],
+)
+
+
+def _make_queries(rng: random.Random, services_amount: int) -> List[Query]:
+    """Make selective queries of the different kinds."""
+    center = Location(rng.uniform(-60, 60), rng.uniform(-180, 180))
+    price = rng.randint(0, 100000)
+    return [
+        Query(
+            [
+                Constraint(
+                    "service_id",
+                    ConstraintType("==", f"service_{rng.randrange(services_amount)}"),
+                )
+            ],
+            DATA_MODEL,
+        ),
+        Query(
+            [Constraint("price", ConstraintType("within", (price, price + 10)))],
+            DATA_MODEL,
+        ),
+        Query(
+            [Constraint("location", ConstraintType("distance", (center, 50.0)))],
+            DATA_MODEL,
+        ),
+        Query(
+            [
+                Constraint("location", ConstraintType("distance", (center, 500.0))),
+                Constraint("price", ConstraintType("<", 1000)),
+            ],
+            DATA_MODEL,
+        ),
+    ]
+
+
+def local_node_search(
+    benchmark: BenchmarkControl,
+    services_amount: int = 100000,
+    searches_amount: int = 1000,
+    indexed: bool = True,
+) -> None:
+    """
+    Search the services of a directory of the local node.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param services_amount: number of registered service descriptions
+    :param searches_amount: number of searches
+    :param indexed: search with the indexes of the directory, or scan all the descriptions
+
+    :return: None
+    """
+    rng = random.Random(0)
+    directory = ServiceDirectory()
+    services = []
+    for i in range(services_amount):
+        description = Description(
+            {
+                "service_id": f"service_{i}",
+                "price": rng.randint(0, 100000),
+                "location": Location(rng.uniform(-60, 60), rng.uniform(-180, 180)),
+            },
+            data_model=DATA_MODEL,
+        )
+        services.append((f"agent_{i}", description))
+        directory.add(f"agent_{i}", description)
+    queries: List[Query] = []
+    while len(queries) < searches_amount:
+        queries.extend(_make_queries(rng, services_amount))
+
+    benchmark.start()
+
+    for query in queries[:searches_amount]:
+        if indexed:
+            directory.search(query)
+        else:
+            {
+                address
+                for address, description in services
+                if description.data_model == query.model and query.check(description)
+            }
+
+
+if __name__ == "__main__":
+    TestCli(local_node_search).run()
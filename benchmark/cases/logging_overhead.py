@@ -0,0 +1,84 @@
+#!/usr/bin/ev python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Performance test of the logging overhead on envelope processing.
+
+Envelopes are put in the agent inbox and handled by the agent with the
+`aea` loggers at DEBUG level or not, so the envelopes per second of both
+runs (envelopes amount over the reported time) can be compared.
+"""
+import logging
+import os
+import time
+
+from benchmark.cases.helpers.dummy_handler import DummyHandler
+from benchmark.framework.aea_test_wrapper import AEATestWrapper
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+
+def logging_overhead(
+    benchmark: BenchmarkControl,
+    envelopes_amount: int = 5000,
+    debug: bool = False,
+    agent_loop_timeout: float = 0.0,
+) -> None:
+    """
+    Process inbox envelopes, logging at DEBUG level or not.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param envelopes_amount: number of envelopes in the agent inbox
+    :param debug: set the `aea` loggers to DEBUG level, otherwise to INFO level
+    :param agent_loop_timeout: idle sleep time for agent's loop
+
+    :return: None
+    """
+    aea_logger = logging.getLogger("aea")
+    aea_logger.setLevel(logging.DEBUG if debug else logging.INFO)
+    aea_logger.propagate = False
+    # records are formatted and written, but not to the benchmark output
+    handler = logging.StreamHandler(open(os.devnull, "w"))
+    handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s]: %(message)s"))
+    aea_logger.addHandler(handler)
+
+    aea_test_wrapper = AEATestWrapper(
+        name="dummy_agent",
+        components=[
+            AEATestWrapper.make_skill(handlers={"dummy_handler": DummyHandler})
+        ],
+    )
+    for _ in range(envelopes_amount):
+        aea_test_wrapper.put_inbox(aea_test_wrapper.dummy_envelope())
+    aea_test_wrapper.set_loop_timeout(agent_loop_timeout)
+
+    benchmark.start()
+
+    aea_test_wrapper.start_loop()
+    try:
+        # wait all messages are consumed from the inbox
+        while not aea_test_wrapper.is_inbox_empty():
+            time.sleep(0.01)
+    finally:
+        aea_test_wrapper.stop_loop()
+        aea_logger.removeHandler(handler)
+        handler.close()
+
+
+if __name__ == "__main__":
+    TestCli(logging_overhead).run()
@@ -0,0 +1,121 @@
+#!/usr/bin/ev python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Performance test of the multiplexer envelope routing, with and without the routing table."""
+from typing import List
+from unittest.mock import MagicMock
+
+from aea.configurations.base import ConnectionConfig, PublicId
+from aea.connections.base import Connection
+from aea.identity.base import Identity
+from aea.mail.base import Envelope, EnvelopeContext
+from aea.multiplexer import AsyncMultiplexer
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+from benchmark.framework.fake_connection import FakeConnection
+
+from packages.fetchai.protocols.default.message import DefaultMessage
+from packages.fetchai.protocols.fipa.message import FipaMessage
+
+
+def _make_connections(connections_amount: int) -> List[Connection]:
+    """Make fake connections with different ids."""
+    connections: List[Connection] = []
+    for i in range(connections_amount):
+        connection_id = PublicId("fetchai", f"stub_{i}", "0.1.0")
+        connection_class = type(
+            f"FakeConnection{i}", (FakeConnection,), {"connection_id": connection_id}
+        )
+        connections.append(
+            connection_class(
+                envelope=None,
+                num=0,
+                configuration=ConnectionConfig(connection_id=connection_id),
+                data_dir=MagicMock(),
+                identity=Identity("name", "address"),
+            )
+        )
+    return connections
+
+
+def multiplexer_routing(
+    benchmark: BenchmarkControl,
+    envelopes_amount: int = 100000,
+    connections_amount: int = 5,
+    use_routing_table: bool = True,
+) -> None:
+    """
+    Route envelopes over default routing, default connection and envelope context.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param envelopes_amount: number of envelopes to route
+    :param connections_amount: number of connections of the multiplexer
+    :param use_routing_table: route with the routing table, or resolve every rule for every envelope
+
+    :return: None
+    """
+    connections = _make_connections(connections_amount)
+    multiplexer = AsyncMultiplexer(
+        connections,
+        default_routing={FipaMessage.protocol_id: connections[-1].connection_id},
+        protocols=[DefaultMessage, FipaMessage],  # type: ignore
+    )
+    envelopes = [
+        Envelope(
+            to="to",
+            sender="sender",
+            protocol_specification_id=DefaultMessage.protocol_specification_id,
+            message=b"",
+        ),
+        Envelope(
+            to="to",
+            sender="sender",
+            protocol_specification_id=FipaMessage.protocol_specification_id,
+            message=b"",
+        ),
+        Envelope(
+            to="to",
+            sender="sender",
+            protocol_specification_id=DefaultMessage.protocol_specification_id,
+            message=b"",
+            context=EnvelopeContext(connection_id=connections[1].connection_id),
+        ),
+    ]
+    if use_routing_table:
+        route = (
+            multiplexer._get_connection_for_envelope
+        )  # pylint: disable=protected-access
+    else:
+
+        def route(envelope: Envelope) -> None:
+            multiplexer._resolve_connection_for_envelope(  # pylint: disable=protected-access
+                envelope,
+                multiplexer._get_explicit_connection_id(  # pylint: disable=protected-access
+                    envelope
+                ),
+            )
+
+    benchmark.start()
+
+    for i in range(envelopes_amount):
+        route(envelopes[i % len(envelopes)])
+
+
+if __name__ == "__main__":
+    TestCli(multiplexer_routing).run()
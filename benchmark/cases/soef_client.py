@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Performance test of the soef connection, against a local stand-in SOEF.
+
+The connection sends service registration commands and searches to a local
+aiohttp server answering as the SOEF does, so it runs offline.
+"""
+import asyncio
+import shutil
+import tempfile
+
+import aiohttp.web
+
+from aea.common import Address
+from aea.configurations.base import ConnectionConfig
+from aea.helpers.search.models import (
+    Attribute,
+    Constraint,
+    ConstraintType,
+    DataModel,
+    Description,
+    Location,
+    Query,
+)
+from aea.identity.base import Identity
+from aea.mail.base import Envelope, Message
+from aea.protocols.dialogue.base import Dialogue
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+from packages.fetchai.connections.soef.connection import SOEFConnection
+from packages.fetchai.protocols.oef_search.dialogues import (
+    OefSearchDialogue,
+    OefSearchDialogues,
+)
+from packages.fetchai.protocols.oef_search.message import OefSearchMessage
+
+
+HOST = "127.0.0.1"
+PAGE_ADDRESS = "oef_C95B21A4D5759C8FE7A6304B62B726AB8077BEE4BA191A7B92B388F9B1"
+
+SET_SERVICE_KEY_MODEL = DataModel(
+    "set_service_key",
+    [Attribute("key", str, True), Attribute("value", str, True)],
+    "A data model to set service key.",
+)
+
+SEARCH_RESPONSE = '<?xml version="1.0" encoding="UTF-8"?><response><success>1</success><total>1</total><capped>0</capped><results><agent name="8c25cc02fd0c45f8895a3d4b3895376a" genus="" classification=""><identities><identity chain_identifier="fetchai">2ayYmgrCg76R1mzr2zWCmivzJG31hXtFVwQvR4XrXrD88Rc3sT</identity></identities><range_in_km>0</range_in_km></agent></results></response>'
+SUCCESS_RESPONSE = (
+    '<?xml version="1.0" encoding="UTF-8"?><response><success>1</success></response>'
+)
+
+
+def _role_from_first_message(  # pylint: disable=unused-argument
+    message: Message, receiver_address: Address
+) -> Dialogue.Role:
+    """Infer the role of the agent from an incoming/outgoing first message."""
+    return OefSearchDialogue.Role.AGENT
+
+
+def _make_stand_in_soef(latency: float) -> aiohttp.web.Application:
+    """Make a server answering the commands of the connection as the SOEF does."""
+
+    async def handler(request: aiohttp.web.Request) -> aiohttp.web.Response:
+        await asyncio.sleep(latency)
+        page = request.match_info["page"]
+        if page == "":
+            return aiohttp.web.Response(text="<response></response>")
+        if page == "register":
+            return aiohttp.web.Response(
+                text=f"<response><token>672DB3B67780F98984ABF1123BD11</token><page_address>{PAGE_ADDRESS}</page_address></response>"
+            )
+        command = request.query["command"]
+        if command == "unregister":
+            return aiohttp.web.Response(
+                text="<response><message>Goodbye!</message></response>"
+            )
+        if command == "find_around_me":
+            return aiohttp.web.Response(text=SEARCH_RESPONSE)
+        return aiohttp.web.Response(text=SUCCESS_RESPONSE)
+
+    app = aiohttp.web.Application()
+    app.router.add_get("/{page:.*}", handler)
+    return app
+
+
+async def _run(
+    benchmark: BenchmarkControl,
+    commands_amount: int,
+    searches_amount: int,
+    distinct_searches: int,
+    latency: float,
+) -> None:
+    """Send the commands and the searches through the connection to a stand-in SOEF."""
+    runner = aiohttp.web.AppRunner(_make_stand_in_soef(latency))
+    await runner.setup()
+    await aiohttp.web.TCPSite(runner, HOST, 0).start()
+    port = runner.addresses[0][1]
+    data_dir = tempfile.mkdtemp()
+
+    connection = SOEFConnection(
+        configuration=ConnectionConfig(
+            api_key="TwiCIriSl0mLahw17pyqoA",
+            soef_addr=HOST,
+            soef_port=port,
+            is_https=False,
+            connection_id=SOEFConnection.connection_id,
+        ),
+        data_dir=data_dir,
+        identity=Identity("name", address="address"),
+    )
+    connection.channel.FIND_AROUND_ME_REQUEST_DELAY = 0
+    dialogues = OefSearchDialogues(
+        "some/skill:0.1.0", role_from_first_message=_role_from_first_message
+    )
+    envelopes = []
+    for i in range(commands_amount):
+        message, _ = dialogues.create(
+            counterparty=str(SOEFConnection.connection_id.to_any()),
+            performative=OefSearchMessage.Performative.REGISTER_SERVICE,
+            service_description=Description(
+                {"key": f"key_{i}", "value": "value"}, data_model=SET_SERVICE_KEY_MODEL
+            ),
+        )
+        envelopes.append(
+            Envelope(to=message.to, sender=message.sender, message=message)
+        )
+    location = Location(52.2057092, 2.1183431)
+    for i in range(searches_amount):
+        radius = float(i % distinct_searches + 1)
+        message, _ = dialogues.create(
+            counterparty=str(SOEFConnection.connection_id.to_any()),
+            performative=OefSearchMessage.Performative.SEARCH_SERVICES,
+            query=Query(
+                [Constraint("location", ConstraintType("distance", (location, radius)))]
+            ),
+        )
+        envelopes.append(
+            Envelope(to=message.to, sender=message.sender, message=message)
+        )
+    await connection.connect()
+
+    benchmark.start()
+
+    try:
+        for envelope in envelopes:
+            await connection.send(envelope)
+        for _ in envelopes:
+            await connection.receive()
+    finally:
+        await connection.disconnect()
+        await runner.cleanup()
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+
+def soef_client(
+    benchmark: BenchmarkControl,
+    commands_amount: int = 200,
+    searches_amount: int = 200,
+    distinct_searches: int = 10,
+    latency: float = 0.005,
+) -> None:
+    """
+    Send registration commands and searches to a local stand-in SOEF.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param commands_amount: number of set service key commands to send
+    :param searches_amount: number of searches to send
+    :param distinct_searches: number of distinct searches among them
+    :param latency: the time the stand-in SOEF takes to answer a request, in seconds
+
+    :return: None
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(
+            _run(
+                benchmark, commands_amount, searches_amount, distinct_searches, latency
+            )
+        )
+    finally:
+        loop.close()
+
+
+if __name__ == "__main__":
+    TestCli(soef_client).run()
@@ -0,0 +1,134 @@
+#!/usr/bin/ev python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Performance test of the throughput of the tcp connection.
+
+A client connection sends envelopes to a server connection on the local host,
+one by one or in batches, as the multiplexer does with a batch size.
+"""
+import asyncio
+import socket
+from unittest.mock import MagicMock
+
+from aea.configurations.base import ConnectionConfig
+from aea.identity.base import Identity
+from aea.mail.base import Envelope
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+from packages.fetchai.connections.tcp.tcp_client import TCPClientConnection
+from packages.fetchai.connections.tcp.tcp_server import TCPServerConnection
+from packages.fetchai.protocols.default.message import DefaultMessage
+
+
+HOST = "127.0.0.1"
+SERVER_ADDRESS = "server"
+CLIENT_ADDRESS = "client"
+CONNECT_TIMEOUT = 5.0
+
+
+async def _receive(connection: TCPServerConnection, envelopes_amount: int) -> None:
+    """Receive the envelopes on the server."""
+    for _ in range(envelopes_amount):
+        if await connection.receive() is None:
+            raise ValueError("Connection closed.")
+
+
+async def _run(
+    benchmark: BenchmarkControl,
+    envelopes_amount: int,
+    envelope_size: int,
+    batch_size: int,
+) -> None:
+    """Send the envelopes from the client to the server."""
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        port = sock.getsockname()[1]
+    server = TCPServerConnection(
+        configuration=ConnectionConfig(
+            address=HOST, port=port, connection_id=TCPServerConnection.connection_id
+        ),
+        data_dir=MagicMock(),
+        identity=Identity("name", address=SERVER_ADDRESS),
+    )
+    client = TCPClientConnection(
+        configuration=ConnectionConfig(
+            address=HOST, port=port, connection_id=TCPClientConnection.connection_id
+        ),
+        data_dir=MagicMock(),
+        identity=Identity("name", address=CLIENT_ADDRESS),
+    )
+    envelopes = [
+        Envelope(
+            to=SERVER_ADDRESS,
+            sender=CLIENT_ADDRESS,
+            protocol_specification_id=DefaultMessage.protocol_specification_id,
+            message=b"x" * envelope_size,
+        )
+        for _ in range(envelopes_amount)
+    ]
+    await server.connect()
+    await client.connect()
+    loop = asyncio.get_event_loop()
+    deadline = loop.time() + CONNECT_TIMEOUT
+    while CLIENT_ADDRESS not in server.connections and loop.time() < deadline:
+        await asyncio.sleep(0.01)
+
+    benchmark.start()
+
+    try:
+        receiving = asyncio.ensure_future(_receive(server, envelopes_amount))
+        for i in range(0, envelopes_amount, batch_size):
+            if batch_size == 1:
+                await client.send(envelopes[i])
+            else:
+                await client.send_batch(envelopes[i : i + batch_size])
+        await receiving
+    finally:
+        await client.disconnect()
+        await server.disconnect()
+
+
+def tcp_throughput(
+    benchmark: BenchmarkControl,
+    envelopes_amount: int = 10000,
+    envelope_size: int = 1024,
+    batch_size: int = 1,
+) -> None:
+    """
+    Send envelopes from a tcp client connection to a tcp server connection.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param envelopes_amount: number of envelopes to send
+    :param envelope_size: size of the envelope messages, in bytes
+    :param batch_size: number of envelopes sent at once
+
+    :return: None
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(
+            _run(benchmark, envelopes_amount, envelope_size, batch_size)
+        )
+    finally:
+        loop.close()
+
+
+if __name__ == "__main__":
+    TestCli(tcp_throughput).run()
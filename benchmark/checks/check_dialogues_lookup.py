@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Per message cost of dialogues depending on the number of dialogues kept."""
+import os
+import sys
+import time
+import uuid
+from typing import List, Tuple, Union, cast
+
+import click
+
+from aea.common import Address
+from aea.protocols.base import Message
+from aea.protocols.dialogue.base import Dialogue
+from benchmark.checks.utils import multi_run, print_results  # noqa: I100
+
+from packages.fetchai.protocols.http.dialogues import HttpDialogue, HttpDialogues
+from packages.fetchai.protocols.http.message import HttpMessage
+
+
+ROOT_PATH = os.path.join(os.path.abspath(__file__), "..", "..")
+sys.path.append(ROOT_PATH)
+
+
+class DialoguesLookup:
+    """Serve requests of a few counterparties, while keeping many dialogues open."""
+
+    def __init__(self, counterparties_amount: int) -> None:
+        """
+        Set dialogues.
+
+        :param counterparties_amount: the number of counterparties sending requests.
+        """
+        # pylint: disable=unused-argument
+
+        def role(m: Message, addr: Address) -> Dialogue.Role:
+            return HttpDialogue.Role.SERVER
+
+        self.addr = uuid.uuid4().hex
+        self.counterparties = [uuid.uuid4().hex for _ in range(counterparties_amount)]
+        self.dialogues = HttpDialogues(self.addr, role_from_first_message=role)
+
+    def open_dialogue(self, counterparty: Address) -> Tuple[HttpDialogue, HttpMessage]:
+        """
+        Receive a request, opening a dialogue.
+
+        :param counterparty: the counterparty sending the request.
+        :return: the dialogue and the request.
+        """
+        message = HttpMessage(
+            dialogue_reference=HttpDialogues.new_self_initiated_dialogue_reference(),
+            performative=HttpMessage.Performative.REQUEST,
+            method="get",
+            url="some url",
+            headers="",
+            version="",
+            body=b"",
+        )
+        message.sender = counterparty
+        message.to = self.addr
+        dialogue = cast(HttpDialogue, self.dialogues.update(message))
+        return dialogue, message
+
+    def process_message(self, counterparty: Address) -> None:
+        """
+        Receive a request and respond to it, closing the dialogue.
+
+        :param counterparty: the counterparty sending the request.
+        """
+        dialogue, message = self.open_dialogue(counterparty)
+        response = dialogue.reply(
+            target_message=message,
+            performative=HttpMessage.Performative.RESPONSE,
+            version=message.version,
+            headers="",
+            status_code=200,
+            status_text="Success",
+            body=message.body,
+        )
+        # the counterparty gets its dialogue back from the response
+        if self.dialogues.get_dialogue(response) is not None:
+            raise ValueError("Dialogue not closed!")  # pragma: nocover
+
+
+def run(
+    dialogues_amount: int, messages_amount: int, counterparties_amount: int
+) -> List[Tuple[str, Union[float, int]]]:
+    """Test the per message cost of dialogues with many open dialogues."""
+    lookup = DialoguesLookup(counterparties_amount)
+    counterparties = lookup.counterparties
+    for i in range(dialogues_amount):
+        lookup.open_dialogue(counterparties[i % counterparties_amount])
+
+    start_time = time.time()
+    for i in range(messages_amount):
+        lookup.process_message(counterparties[i % counterparties_amount])
+    elapsed = time.time() - start_time
+
+    return [
+        (
+            "Open dialogues",
+            len(lookup.dialogues._dialogues_storage.dialogues_in_active_state),
+        ),  # pylint: disable=protected-access
+        ("Time per message (microseconds)", elapsed / messages_amount * 1e6),
+    ]
+
+
+@click.command()
+@click.option("--dialogues", default=10000, help="Open dialogues kept.")
+@click.option("--messages", default=1000, help="Messages to process.")
+@click.option("--counterparties", default=10, help="Counterparties sending messages.")
+@click.option("--number_of_runs", default=10, help="How many times run test.")
+def main(
+    dialogues: int, messages: int, counterparties: int, number_of_runs: int
+) -> None:
+    """Run test."""
+    click.echo("Start test with options:")
+    click.echo(f"* Dialogues: {dialogues}")
+    click.echo(f"* Messages: {messages}")
+    click.echo(f"* Counterparties: {counterparties}")
+    click.echo(f"* Number of runs: {number_of_runs}")
+
+    print_results(
+        multi_run(
+            int(number_of_runs),
+            run,
+            (int(dialogues), int(messages), int(counterparties)),
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2021 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Per envelope cost of decoding an envelope and fetching the handlers of its protocol."""
+import os
+import sys
+import time
+import uuid
+from typing import List, Tuple, Union
+from unittest.mock import Mock
+
+import click
+
+from aea.configurations.base import PublicId
+from aea.mail.base import Envelope
+from aea.registries.base import HandlerRegistry
+from benchmark.checks.utils import multi_run, print_results  # noqa: I100
+
+from packages.fetchai.protocols.default.message import DefaultMessage
+
+
+ROOT_PATH = os.path.join(os.path.abspath(__file__), "..", "..")
+sys.path.append(ROOT_PATH)
+
+
+def make_handler_registry(protocols_amount: int, skills_amount: int) -> HandlerRegistry:
+    """
+    Make a handler registry with handlers of every skill for every protocol.
+
+    :param protocols_amount: the number of protocols handled.
+    :param skills_amount: the number of skills handling every protocol.
+    :return: the registry.
+    """
+    registry = HandlerRegistry()
+    protocol_ids = [DefaultMessage.protocol_specification_id] + [
+        PublicId("fetchai", f"protocol_{i}", "0.1.0")
+        for i in range(protocols_amount - 1)
+    ]
+    for protocol_id in protocol_ids:
+        for i in range(skills_amount):
+            handler = Mock(SUPPORTED_PROTOCOL=protocol_id)
+            registry.register(
+                (PublicId("fetchai", f"skill_{i}", "0.1.0"), str(protocol_id)), handler,
+            )
+    return registry
+
+
+def make_envelope_bytes() -> bytes:
+    """Make the wire bytes of an envelope carrying a default message."""
+    message = DefaultMessage(
+        dialogue_reference=(uuid.uuid4().hex, ""),
+        performative=DefaultMessage.Performative.BYTES,
+        content=b"some content",
+    )
+    message.to = uuid.uuid4().hex
+    message.sender = uuid.uuid4().hex
+    envelope = Envelope(to=message.to, sender=message.sender, message=message)
+    return envelope.encode()
+
+
+def run(
+    envelopes_amount: int, protocols_amount: int, skills_amount: int
+) -> List[Tuple[str, Union[float, int]]]:
+    """Test the per envelope cost of decoding and handler dispatch."""
+    registry = make_handler_registry(protocols_amount, skills_amount)
+    envelopes_bytes = [make_envelope_bytes() for _ in range(envelopes_amount)]
+
+    start_time = time.time()
+    for envelope_bytes in envelopes_bytes:
+        envelope = Envelope.decode(envelope_bytes)
+        handlers = registry.fetch_by_protocol(envelope.protocol_specification_id)
+        if len(handlers) != skills_amount:
+            raise ValueError("Handlers not found!")  # pragma: nocover
+    elapsed = time.time() - start_time
+
+    return [
+        ("Time per envelope (microseconds)", elapsed / envelopes_amount * 1e6),
+    ]
+
+
+@click.command()
+@click.option("--envelopes", default=10000, help="Envelopes to dispatch.")
+@click.option("--protocols", default=10, help="Protocols handled.")
+@click.option("--skills", default=3, help="Skills handling every protocol.")
+@click.option("--number_of_runs", default=10, help="How many times run test.")
+def main(envelopes: int, protocols: int, skills: int, number_of_runs: int) -> None:
+    """Run test."""
+    click.echo("Start test with options:")
+    click.echo(f"* Envelopes: {envelopes}")
+    click.echo(f"* Protocols: {protocols}")
+    click.echo(f"* Skills: {skills}")
+    click.echo(f"* Number of runs: {number_of_runs}")
+
+    print_results(
+        multi_run(
+            int(number_of_runs), run, (int(envelopes), int(protocols), int(skills)),
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
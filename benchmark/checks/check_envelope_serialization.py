@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2021 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Round trip throughput of encoding and decoding envelopes with fipa or default messages."""
+import os
+import sys
+import time
+import uuid
+from typing import Callable, Dict, List, Tuple, Union
+
+import click
+
+from aea.helpers.search.models import Attribute, DataModel, Description
+from aea.mail.base import Envelope
+from aea.protocols.base import Message
+from benchmark.checks.utils import multi_run, print_results  # noqa: I100
+
+from packages.fetchai.protocols.default.message import DefaultMessage
+from packages.fetchai.protocols.fipa.message import FipaMessage
+
+
+ROOT_PATH = os.path.join(os.path.abspath(__file__), "..", "..")
+sys.path.append(ROOT_PATH)
+
+
+def make_default_message() -> Message:
+    """Make a default message."""
+    return DefaultMessage(
+        dialogue_reference=(uuid.uuid4().hex, ""),
+        performative=DefaultMessage.Performative.BYTES,
+        content=b"some content" * 10,
+    )
+
+
+def make_fipa_message() -> Message:
+    """Make a fipa message."""
+    data_model = DataModel(
+        "some_data_model",
+        [Attribute("price", int, True), Attribute("service", str, True)],
+    )
+    return FipaMessage(
+        dialogue_reference=(uuid.uuid4().hex, uuid.uuid4().hex),
+        message_id=2,
+        target=1,
+        performative=FipaMessage.Performative.PROPOSE,
+        proposal=Description({"price": 10, "service": "weather"}, data_model),
+    )
+
+
+MESSAGE_FACTORIES: Dict[str, Callable[[], Message]] = {
+    "default": make_default_message,
+    "fipa": make_fipa_message,
+}
+
+
+def run(envelopes_amount: int, protocol: str) -> List[Tuple[str, Union[float, int]]]:
+    """Test the round trip throughput of envelope encoding and decoding."""
+    envelopes = []
+    for _ in range(envelopes_amount):
+        message = MESSAGE_FACTORIES[protocol]()
+        message.to = uuid.uuid4().hex
+        message.sender = uuid.uuid4().hex
+        envelopes.append(
+            Envelope(to=message.to, sender=message.sender, message=message)
+        )
+
+    message_class = type(envelopes[0].message)
+    start_time = time.time()
+    for envelope in envelopes:
+        decoded = Envelope.decode(envelope.encode())
+        message_class.decode(decoded.message_bytes)
+    elapsed = time.time() - start_time
+
+    return [
+        ("Round trips per second", envelopes_amount / elapsed),
+    ]
+
+
+@click.command()
+@click.option("--envelopes", default=10000, help="Envelopes to encode and decode.")
+@click.option(
+    "--protocol",
+    default="fipa",
+    type=click.Choice(list(MESSAGE_FACTORIES)),
+    help="Protocol of the messages.",
+)
+@click.option("--number_of_runs", default=10, help="How many times run test.")
+def main(envelopes: int, protocol: str, number_of_runs: int) -> None:
+    """Run test."""
+    click.echo("Start test with options:")
+    click.echo(f"* Envelopes: {envelopes}")
+    click.echo(f"* Protocol: {protocol}")
+    click.echo(f"* Number of runs: {number_of_runs}")
+
+    print_results(multi_run(int(number_of_runs), run, (int(envelopes), protocol)))
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -60,3 +60,39 @@ do
 	done
 done
 # ~ 10 * 2 * 4 * 100 sec = 133.3 min
+
+chmod +x benchmark/checks/check_dialogues_lookup.py
+echo -e "\nDialogues lookup: number of runs: $NUM_RUNS, messages: $MESSAGES"
+echo "------------------------------------------------"
+echo "dialogues       value          mean        stdev"
+echo "------------------------------------------------"
+for dialogues in 100 1000 10000 50000;
+do
+	data=`./benchmark/checks/check_dialogues_lookup.py --dialogues=$dialogues --messages=$MESSAGES --number_of_runs=$NUM_RUNS`
+	time_per_message=`echo "$data"|grep 'Time per message'|awk '{print $7 "    " $9}'`
+	echo -e "$dialogues    time per message     ${time_per_message}"
+done
+
+chmod +x benchmark/checks/check_envelope_dispatch.py
+echo -e "\nEnvelope decode and dispatch: number of runs: $NUM_RUNS"
+echo "------------------------------------------------"
+echo "protocols       value          mean        stdev"
+echo "------------------------------------------------"
+for protocols in 1 10 100;
+do
+	data=`./benchmark/checks/check_envelope_dispatch.py --protocols=$protocols --number_of_runs=$NUM_RUNS`
+	time_per_envelope=`echo "$data"|grep 'Time per envelope'|awk '{print $7 "    " $9}'`
+	echo -e "$protocols    time per envelope     ${time_per_envelope}"
+done
+
+chmod +x benchmark/checks/check_envelope_serialization.py
+echo -e "\nEnvelope serialization round trip: number of runs: $NUM_RUNS"
+echo "------------------------------------------------"
+echo "protocol       value          mean        stdev"
+echo "------------------------------------------------"
+for protocol in default fipa;
+do
+	data=`./benchmark/checks/check_envelope_serialization.py --protocol=$protocol --number_of_runs=$NUM_RUNS`
+	round_trips=`echo "$data"|grep 'Round trips per second'|awk '{print $7 "    " $9}'`
+	echo -e "$protocol    round trips per second     ${round_trips}"
+done
@@ -132,7 +132,7 @@ class GymChannel:
         :return: None
         """
         sender = envelope.sender
-        self.logger.debug("Processing message from {}: {}".format(sender, envelope))
+        self.logger.debug("Processing message from %s: %s", sender, envelope)
         if envelope.protocol_specification_id != GymMessage.protocol_specification_id:
             raise ValueError("This protocol is not valid for gym.")
         await self.handle_gym_message(envelope)
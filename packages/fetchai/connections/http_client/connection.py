@@ -21,11 +21,14 @@ import asyncio
 import email
 import logging
 import ssl
+import time
 from asyncio import CancelledError
 from asyncio.events import AbstractEventLoop
 from asyncio.tasks import Task
+from functools import lru_cache
 from traceback import format_exc
-from typing import Any, Optional, Set, Tuple, Union, cast
+from types import SimpleNamespace
+from typing import Any, Dict, Optional, Set, Tuple, Union, cast
 
 import aiohttp
 import certifi  # pylint: disable=wrong-import-order
@@ -56,6 +59,8 @@ RequestId = str
 
 ssl_context = ssl.create_default_context(cafile=certifi.where())
 
+HEADERS_CACHE_SIZE = 128
+
 
 def headers_to_string(headers: CIMultiDictProxy) -> str:
     """
@@ -71,6 +76,18 @@ def headers_to_string(headers: CIMultiDictProxy) -> str:
     return msg.as_string()
 
 
+@lru_cache(maxsize=HEADERS_CACHE_SIZE)
+def headers_from_string(headers: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    Parse headers from string, the parsed headers are cached as agents tend to reuse the same ones.
+
+    :param headers: str
+
+    :return: tuple of header name and value pairs
+    """
+    return tuple(email.message_from_string(headers).items())
+
+
 HttpDialogue = BaseHttpDialogue
 
 
@@ -111,24 +128,55 @@ class HTTPClientAsyncChannel:
     DEFAULT_EXCEPTION_CODE = (
         600  # custom code to indicate there was exception during request
     )
+    DEFAULT_MAX_CONNECTIONS = 100
+    DEFAULT_MAX_CONNECTIONS_PER_HOST = 10
+    DEFAULT_KEEPALIVE_TIMEOUT = 15.0  # seconds an idle connection is kept open
+    DEFAULT_DNS_CACHE_TTL = 10  # seconds a resolved host is cached
+    DEFAULT_MAX_CONCURRENT_REQUESTS = 100
 
     def __init__(
-        self, agent_address: Address, address: str, port: int, connection_id: PublicId,
+        self,
+        agent_address: Address,
+        address: str,
+        port: int,
+        connection_id: PublicId,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        keepalive_timeout: Optional[float] = DEFAULT_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: Optional[int] = DEFAULT_DNS_CACHE_TTL,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
     ):
         """
         Initialize an http client channel.
 
+        The requests share a pool of connections, kept alive between requests.
+
         :param agent_address: the address of the agent.
         :param address: server hostname / IP address
         :param port: server port number
-        :param excluded_protocols: this connection cannot handle messages adhering to any of the protocols in this set
-        :param restricted_to_protocols: this connection can only handle messages adhering to protocols in this set
+        :param connection_id: the connection id
+        :param max_connections: the maximum number of connections in the pool, 0 for no limit
+        :param max_connections_per_host: the maximum number of connections to the same host, 0 for no limit
+        :param keepalive_timeout: the time an idle connection is kept open, None to close the connections after each request
+        :param dns_cache_ttl: the time the resolved hosts are cached, None to cache them forever
+        :param max_concurrent_requests: the maximum number of requests in flight, the others wait
         """
+        enforce(
+            max_concurrent_requests > 0, "max_concurrent_requests must be positive."
+        )
         self.agent_address = agent_address
         self.address = address
         self.port = port
         self.connection_id = connection_id
         self._dialogues = HttpDialogues()
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.max_concurrent_requests = max_concurrent_requests
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._requests_semaphore: Optional[asyncio.Semaphore] = None
+        self._pool_stats: Dict[str, float] = {}
 
         self._in_queue = None  # type: Optional[asyncio.Queue]  # pragma: no cover
         self._loop = (
@@ -150,8 +198,86 @@ class HTTPClientAsyncChannel:
         """
         self._loop = loop
         self._in_queue = asyncio.Queue()
+        self._requests_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        self._session = self._make_session()
+        self._pool_stats = dict.fromkeys(
+            [
+                "requests",
+                "connections_created",
+                "connections_reused",
+                "connections_queued",
+                "connection_wait_time",
+                "request_wait_time",
+            ],
+            0,
+        )
         self.is_stopped = False
 
+    def _make_session(self) -> aiohttp.ClientSession:
+        """Make a client session on top of a pool of keep-alive connections."""
+        keepalive_options: Dict[str, Any] = (
+            {"force_close": True}
+            if self.keepalive_timeout is None
+            else {"keepalive_timeout": self.keepalive_timeout}
+        )
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.max_connections_per_host,
+            use_dns_cache=True,
+            ttl_dns_cache=self.dns_cache_ttl,
+            ssl=ssl_context,
+            **keepalive_options,
+        )
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(self._on_connection_created)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reused)
+        trace_config.on_connection_queued_start.append(self._on_connection_queued)
+        trace_config.on_connection_queued_end.append(self._on_connection_dequeued)
+        return aiohttp.ClientSession(connector=connector, trace_configs=[trace_config])
+
+    async def _on_connection_created(
+        self, _session: aiohttp.ClientSession, _context: SimpleNamespace, _params: Any
+    ) -> None:
+        """Count a new connection of the pool."""
+        self._pool_stats["connections_created"] += 1
+
+    async def _on_connection_reused(
+        self, _session: aiohttp.ClientSession, _context: SimpleNamespace, _params: Any
+    ) -> None:
+        """Count a connection of the pool reused by a request."""
+        self._pool_stats["connections_reused"] += 1
+
+    async def _on_connection_queued(
+        self, _session: aiohttp.ClientSession, context: SimpleNamespace, _params: Any
+    ) -> None:
+        """Record when a request starts to wait for a connection, as the pool limits were reached."""
+        self._pool_stats["connections_queued"] += 1
+        context.queued_at = time.monotonic()
+
+    async def _on_connection_dequeued(
+        self, _session: aiohttp.ClientSession, context: SimpleNamespace, _params: Any
+    ) -> None:
+        """Account the time a request waited for a connection."""
+        self._pool_stats["connection_wait_time"] += time.monotonic() - context.queued_at
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Get the statistics of the connection pool.
+
+        :return: the requests performed, the connections created, reused and waited for,
+            the connection reuse rate, the time waited for a connection and the time
+            waited for the cap on the requests in flight, in seconds.
+        """
+        stats: Dict[str, Any] = dict(self._pool_stats)
+        connections = stats.get("connections_created", 0) + stats.get(
+            "connections_reused", 0
+        )
+        stats["reuse_rate"] = (
+            stats["connections_reused"] / connections if connections else 0.0
+        )
+        stats["requests_in_flight"] = len(self._tasks)
+        return stats
+
     def _get_message_and_dialogue(
         self, envelope: Envelope
     ) -> Tuple[HttpMessage, Optional[HttpDialogue]]:
@@ -188,10 +314,17 @@ class HTTPClientAsyncChannel:
             return
 
         try:
-            resp = await asyncio.wait_for(
-                self._perform_http_request(request_http_message),
-                timeout=self.DEFAULT_TIMEOUT,
-            )
+            if self._requests_semaphore is None:  # pragma: nocover
+                raise ValueError("Channel is not connected")
+            wait_started_at = time.monotonic()
+            async with self._requests_semaphore:
+                self._pool_stats["request_wait_time"] += (
+                    time.monotonic() - wait_started_at
+                )
+                resp = await asyncio.wait_for(
+                    self._perform_http_request(request_http_message),
+                    timeout=self.DEFAULT_TIMEOUT,
+                )
             envelope = self.to_envelope(
                 request_http_message,
                 status_code=resp.status,
@@ -226,22 +359,24 @@ class HTTPClientAsyncChannel:
         :return: aiohttp.ClientResponse
         """
         try:
+            if self._session is None:  # pragma: nocover
+                raise ValueError("Channel is not connected")
             if request_http_message.is_set("headers") and request_http_message.headers:
                 headers: Optional[dict] = dict(
-                    email.message_from_string(request_http_message.headers).items()
+                    headers_from_string(request_http_message.headers)
                 )
             else:
                 headers = None
-            async with aiohttp.ClientSession() as session:
-                async with session.request(
-                    method=request_http_message.method,
-                    url=request_http_message.url,
-                    headers=headers,
-                    data=request_http_message.body,
-                    ssl=ssl_context,
-                ) as resp:
-                    await resp.read()
-                return resp
+            self._pool_stats["requests"] += 1
+            async with self._session.request(
+                method=request_http_message.method,
+                url=request_http_message.url,
+                headers=headers,
+                data=request_http_message.body,
+            ) as resp:
+                # reading the body releases the connection to the pool
+                await resp.read()
+            return resp
         except Exception:  # pragma: nocover # pylint: disable=broad-except
             self.logger.exception(
                 f"Exception raised during http call: {request_http_message.method} {request_http_message.url}"
@@ -298,7 +433,7 @@ class HTTPClientAsyncChannel:
         :return: None
         """
         self._tasks.remove(task)
-        self.logger.debug(f"Task completed: {task}")
+        self.logger.debug("Task completed: %s", task)
 
     async def get_message(self) -> Union["Envelope", None]:
         """
@@ -370,6 +505,9 @@ class HTTPClientAsyncChannel:
             self.is_stopped = True
 
             await self._cancel_tasks()
+            if self._session is not None:
+                await self._session.close()
+                self._session = None
 
 
 class HTTPClientConnection(Connection):
@@ -384,8 +522,29 @@ class HTTPClientConnection(Connection):
         port = cast(int, self.configuration.config.get("port"))
         if host is None or port is None:  # pragma: nocover
             raise ValueError("host and port must be set!")
+        config = self.configuration.config
         self.channel = HTTPClientAsyncChannel(
-            self.address, host, port, connection_id=self.connection_id,
+            self.address,
+            host,
+            port,
+            connection_id=self.connection_id,
+            max_connections=config.get(
+                "max_connections", HTTPClientAsyncChannel.DEFAULT_MAX_CONNECTIONS
+            ),
+            max_connections_per_host=config.get(
+                "max_connections_per_host",
+                HTTPClientAsyncChannel.DEFAULT_MAX_CONNECTIONS_PER_HOST,
+            ),
+            keepalive_timeout=config.get(
+                "keepalive_timeout", HTTPClientAsyncChannel.DEFAULT_KEEPALIVE_TIMEOUT
+            ),
+            dns_cache_ttl=config.get(
+                "dns_cache_ttl", HTTPClientAsyncChannel.DEFAULT_DNS_CACHE_TTL
+            ),
+            max_concurrent_requests=config.get(
+                "max_concurrent_requests",
+                HTTPClientAsyncChannel.DEFAULT_MAX_CONCURRENT_REQUESTS,
+            ),
         )
 
     async def connect(self) -> None:
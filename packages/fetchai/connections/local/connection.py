@@ -21,7 +21,7 @@ import asyncio
 import logging
 import threading
 from asyncio import AbstractEventLoop, Queue
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from concurrent.futures import Future
 from threading import Thread
 from typing import Any, Dict, List, Optional, Tuple, cast
@@ -29,7 +29,9 @@ from typing import Any, Dict, List, Optional, Tuple, cast
 from aea.common import Address
 from aea.configurations.base import PublicId
 from aea.connections.base import Connection, ConnectionStates
-from aea.helpers.search.models import Description
+from aea.helpers.search.cache import SearchResultCache
+from aea.helpers.search.directory import ServiceDirectory
+from aea.helpers.search.models import Description, Query
 from aea.mail.base import Envelope
 from aea.protocols.base import Message
 from aea.protocols.dialogue.base import Dialogue as BaseDialogue
@@ -59,6 +61,10 @@ OefSearchDialogue = BaseOefSearchDialogue
 OEF_LOCAL_NODE_SEARCH_ADDRESS = "oef_local_node_search"
 OEF_LOCAL_NODE_ADDRESS = "oef_local_node"
 
+DEFAULT_SEARCH_CACHE_TTL = 0.0  # seconds, no caching
+DEFAULT_SEARCH_CACHE_SIZE = 128
+MAX_PENDING_SEARCHES = 1024  # searches waiting for a reply, the oldest are forgotten
+
 
 class OefSearchDialogues(BaseOefSearchDialogues):
     """The dialogues class keeps track of all dialogues."""
@@ -103,6 +109,7 @@ class LocalNode:
         """
         self._lock = threading.Lock()
         self.services = defaultdict(lambda: [])  # type: Dict[str, List[Description]]
+        self._directory = ServiceDirectory()
         self._loop = loop if loop is not None else asyncio.new_event_loop()
         self._thread = Thread(target=self._run_loop, daemon=True)
 
@@ -185,7 +192,7 @@ class LocalNode:
             if envelope is None:
                 self.logger.debug("Receiving loop terminated.")
                 return
-            self.logger.debug("Handling envelope: {}".format(envelope))
+            self.logger.debug("Handling envelope: %s", envelope)
             await self._handle_envelope(envelope)
 
     async def _handle_envelope(self, envelope: Envelope) -> None:
@@ -273,6 +280,7 @@ class LocalNode:
         """
         with self._lock:
             self.services[address].append(service_description)
+            self._directory.add(address, service_description)
 
     async def _unregister_service(
         self, oef_search_msg: OefSearchMessage, dialogue: OefSearchDialogue,
@@ -297,6 +305,7 @@ class LocalNode:
                 await self._send(envelope)
             else:
                 self.services[address].remove(service_description)
+                self._directory.remove(address, service_description)
                 if len(self.services[address]) == 0:
                     self.services.pop(address)
 
@@ -306,28 +315,20 @@ class LocalNode:
         """
         Search the agents in the local Service Directory, and send back the result.
 
-        This is actually a dummy search, it will return all the registered agents with the specified data model.
-        If the data model is not specified, it will return all the agents.
+        It returns the agents with a registered description of the query data model, if specified,
+        which satisfies the query constraints. The descriptions are indexed by the service directory.
 
         :param oef_search_msg: the message.
         :param dialogue: the dialogue.
         :return: None
         """
         with self._lock:
-            query = oef_search_msg.query
-            result = []  # type: List[str]
-            if query.model is None:
-                result = list(set(self.services.keys()))
-            else:
-                for agent_address, descriptions in self.services.items():
-                    for description in descriptions:
-                        if description.data_model == query.model:
-                            result.append(agent_address)
+            result = self._directory.search(oef_search_msg.query)
 
             msg = dialogue.reply(
                 performative=OefSearchMessage.Performative.SEARCH_RESULT,
                 target_message=oef_search_msg,
-                agents=tuple(sorted(set(result))),
+                agents=tuple(sorted(result)),
             )
 
             envelope = Envelope(to=msg.to, sender=msg.sender, message=msg,)
@@ -354,7 +355,7 @@ class LocalNode:
         destination = envelope.to
         destination_queue = self._out_queues[destination]
         destination_queue._loop.call_soon_threadsafe(destination_queue.put_nowait, envelope)  # type: ignore  # pylint: disable=protected-access
-        self.logger.debug("Send envelope {}".format(envelope))
+        self.logger.debug("Send envelope %s", envelope)
 
     async def disconnect(self, address: Address) -> None:
         """
@@ -366,6 +367,7 @@ class LocalNode:
         with self._lock:
             self._out_queues.pop(address, None)
             self.services.pop(address, None)
+            self._directory.remove_address(address)
 
 
 class OEFLocalConnection(Connection):
@@ -390,6 +392,26 @@ class OEFLocalConnection(Connection):
         self._local_node = local_node
         self._reader = None  # type: Optional[Queue]
         self._writer = None  # type: Optional[Queue]
+        search_cache_ttl = cast(
+            float,
+            self.configuration.config.get("search_cache_ttl", DEFAULT_SEARCH_CACHE_TTL),
+        )
+        search_cache_size = cast(
+            int,
+            self.configuration.config.get(
+                "search_cache_size", DEFAULT_SEARCH_CACHE_SIZE
+            ),
+        )
+        self._search_cache: Optional[SearchResultCache] = (
+            SearchResultCache(
+                search_cache_ttl, search_cache_size, self.address, str(PUBLIC_ID)
+            )
+            if search_cache_ttl > 0
+            else None
+        )
+        # the dialogues of the searches answered from the cache, on behalf of the node
+        self._search_cache_dialogues = OefSearchDialogues()
+        self._pending_searches: "OrderedDict[Tuple[str, int], Tuple[Query, int]]" = OrderedDict()
 
     async def connect(self) -> None:
         """Connect to the local OEF Node."""
@@ -415,13 +437,86 @@ class OEFLocalConnection(Connection):
         await self._local_node.disconnect(self.address)
         await self._reader.put(None)
         self._reader, self._writer = None, None
+        self._pending_searches.clear()
         self.state = ConnectionStates.disconnected
 
     async def send(self, envelope: Envelope) -> None:
         """Send a message."""
         self._ensure_connected()
+        if self._search_cache is not None and isinstance(
+            envelope.message, OefSearchMessage
+        ):
+            if self._answer_from_search_cache(envelope.message):
+                return
         self._writer._loop.call_soon_threadsafe(self._writer.put_nowait, envelope)  # type: ignore  # pylint: disable=protected-access
 
+    def _answer_from_search_cache(self, message: OefSearchMessage) -> bool:
+        """
+        Answer a search with a cached result, or track it to cache its result.
+
+        The cached results are invalidated when the agent registers or unregisters a service.
+
+        :param message: the oef search message sent.
+        :return: whether the search was answered from the cache.
+        """
+        search_cache = cast(SearchResultCache, self._search_cache)
+        if message.performative in {
+            OefSearchMessage.Performative.REGISTER_SERVICE,
+            OefSearchMessage.Performative.UNREGISTER_SERVICE,
+        }:
+            search_cache.invalidate()
+            return False
+        if message.performative != OefSearchMessage.Performative.SEARCH_SERVICES:
+            return False  # pragma: nocover
+
+        agents = search_cache.get(message.query)
+        if agents is None:
+            if len(self._pending_searches) >= MAX_PENDING_SEARCHES:
+                # the node did not reply to the oldest search
+                self._pending_searches.popitem(last=False)
+            self._pending_searches[
+                (message.dialogue_reference[0], message.message_id)
+            ] = (message.query, search_cache.generation)
+            return False
+
+        dialogue = self._search_cache_dialogues.update(message)
+        if dialogue is None:  # pragma: nocover
+            return False
+        reply = dialogue.reply(
+            performative=OefSearchMessage.Performative.SEARCH_RESULT,
+            target_message=message,
+            agents=agents,
+        )
+        if self._reader is None:
+            raise ValueError("No reader set!")  # pragma: nocover
+        self._reader.put_nowait(
+            Envelope(to=reply.to, sender=reply.sender, message=reply)
+        )
+        return True
+
+    def _cache_search_result(self, envelope: Envelope) -> None:
+        """
+        Cache the result of a search tracked when it was sent.
+
+        A search is no longer tracked once the node replies to it, with a result or an error.
+
+        :param envelope: the envelope received from the node.
+        """
+        message = envelope.message
+        if not isinstance(message, OefSearchMessage):
+            return
+        search = self._pending_searches.pop(
+            (message.dialogue_reference[0], message.target), None
+        )
+        if (
+            search is not None
+            and message.performative == OefSearchMessage.Performative.SEARCH_RESULT
+        ):
+            query, generation = search
+            cast(SearchResultCache, self._search_cache).put(
+                query, message.agents, generation
+            )
+
     async def receive(self, *args: Any, **kwargs: Any) -> Optional["Envelope"]:
         """
         Receive an envelope. Blocking.
@@ -436,7 +531,9 @@ class OEFLocalConnection(Connection):
             if envelope is None:  # pragma: no cover
                 self.logger.debug("Receiving task terminated.")
                 return None
-            self.logger.debug("Received envelope {}".format(envelope))
+            self.logger.debug("Received envelope %s", envelope)
+            if self._search_cache is not None:
+                self._cache_search_result(envelope)
             return envelope
         except Exception:  # pragma: nocover # pylint: disable=broad-except
             return None
@@ -567,7 +567,7 @@ class OEFConnection(Connection):
             if envelope is None:  # pragma: no cover
                 self.logger.debug("Received None.")
                 return None
-            self.logger.debug("Received envelope: {}".format(envelope))
+            self.logger.debug("Received envelope: %s", envelope)
             return envelope
         except CancelledError:
             self.logger.debug("Receive cancelled.")
@@ -382,7 +382,7 @@ class P2PLibp2pClientConnection(Connection):
             if envelope is None:  # pragma: no cover
                 self.logger.debug("Received None.")
                 return None
-            self.logger.debug("Received envelope: {}".format(envelope))
+            self.logger.debug("Received envelope: %s", envelope)
             return envelope
         except CancelledError:  # pragma: no cover
             self.logger.debug("Receive cancelled.")
@@ -29,6 +29,11 @@ from aea.common import Address
 from aea.configurations.base import PublicId
 from aea.connections.base import Connection, ConnectionStates
 from aea.exceptions import enforce
+from aea.helpers.search.cache import (
+    SEARCH_CACHE_HIT,
+    add_search_cache_observer,
+    remove_search_cache_observer,
+)
 from aea.mail.base import Envelope, Message
 from aea.protocols.dialogue.base import Dialogue as BaseDialogue
 
@@ -45,6 +50,8 @@ DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 9090
 VALID_UPDATE_FUNCS = {"inc", "dec", "add", "sub", "set", "observe"}
 VALID_METRIC_TYPES = {"Counter", "Gauge", "Histogram", "Summary"}
+SEARCH_CACHE_HITS_METRIC = "oef_search_cache_hits"
+SEARCH_CACHE_MISSES_METRIC = "oef_search_cache_misses"
 
 
 class PrometheusDialogues(BasePrometheusDialogues):
@@ -103,6 +110,32 @@ class PrometheusChannel:
         self._host = host
         self._port = port
         self._service = aioprometheus.Service()
+        self._add_search_cache_metrics()
+
+    def _add_search_cache_metrics(self) -> None:
+        """Add the counters of the lookups in the search caches of the agent connections."""
+        self.metrics[SEARCH_CACHE_HITS_METRIC] = aioprometheus.Counter(
+            SEARCH_CACHE_HITS_METRIC, "Number of searches answered from a cache."
+        )
+        self.metrics[SEARCH_CACHE_MISSES_METRIC] = aioprometheus.Counter(
+            SEARCH_CACHE_MISSES_METRIC, "Number of searches missing a cache."
+        )
+        self._service.register(self.metrics[SEARCH_CACHE_HITS_METRIC])
+        self._service.register(self.metrics[SEARCH_CACHE_MISSES_METRIC])
+
+    def _on_search_cache_event(self, cache_name: str, event: str) -> None:
+        """
+        Count a lookup in the search cache of a connection.
+
+        :param cache_name: the name of the cache, the connection id.
+        :param event: the lookup event, a hit or a miss.
+        """
+        metric = (
+            SEARCH_CACHE_HITS_METRIC
+            if event == SEARCH_CACHE_HIT
+            else SEARCH_CACHE_MISSES_METRIC
+        )
+        self.metrics[metric].inc({"cache": cache_name})
 
     def _get_message_and_dialogue(
         self, envelope: Envelope
@@ -136,6 +169,7 @@ class PrometheusChannel:
         self._loop = asyncio.get_event_loop()
         self._queue = asyncio.Queue()
         await self._service.start(addr=self._host, port=self._port)
+        add_search_cache_observer(self.address, self._on_search_cache_event)
 
     async def send(self, envelope: Envelope) -> None:
         """
@@ -144,7 +178,7 @@ class PrometheusChannel:
         :return: None
         """
         sender = envelope.sender
-        self.logger.debug("Processing message from {}: {}".format(sender, envelope))
+        self.logger.debug("Processing message from %s: %s", sender, envelope)
         if (
             envelope.protocol_specification_id
             != PrometheusMessage.protocol_specification_id
@@ -266,6 +300,7 @@ class PrometheusChannel:
 
         :return: None
         """
+        remove_search_cache_observer(self.address, self._on_search_cache_event)
         if self._queue is not None:
             await self._queue.put(None)
             self._queue = None
@@ -21,25 +21,29 @@ import asyncio
 import copy
 import logging
 import os
+import random
 import re
+import ssl
 import urllib
 from asyncio import CancelledError
 from concurrent.futures._base import CancelledError as ConcurrentCancelledError
-from concurrent.futures.thread import ThreadPoolExecutor
 from contextlib import suppress
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
 from urllib import parse
 from uuid import uuid4
 
+import aiohttp
+import certifi  # pylint: disable=wrong-import-order
 from defusedxml import ElementTree  # pylint: disable=wrong-import-order
 
 from aea.common import Address, JSONLike
 from aea.configurations.base import PublicId
 from aea.connections.base import Connection, ConnectionStates
 from aea.exceptions import enforce
-from aea.helpers import http_requests as requests
+from aea.helpers.constants import NETWORK_REQUEST_DEFAULT_TIMEOUT
+from aea.helpers.search.cache import SearchResultCache
 from aea.helpers.search.models import (
     Constraint,
     ConstraintTypes,
@@ -70,6 +74,10 @@ PUBLIC_ID = PublicId.from_str("fetchai/soef:0.25.0")
 
 NOT_SPECIFIED = object()
 
+ssl_context = ssl.create_default_context(cafile=certifi.where())
+
+SearchKey = Tuple[Any, ...]
+
 PERSONALITY_PIECES_KEYS = [
     "genus",
     "classification",
@@ -210,6 +218,17 @@ class SOEFChannel:
     PING_PERIOD = 30 * 60  # 30 minutes
     FIND_AROUND_ME_REQUEST_DELAY = 2  # seconds
 
+    DEFAULT_MAX_CONNECTIONS = 10
+    DEFAULT_KEEPALIVE_TIMEOUT = 15.0  # seconds an idle connection is kept open
+    DEFAULT_MAX_RETRIES = 3
+    DEFAULT_REQUEST_TIMEOUT = NETWORK_REQUEST_DEFAULT_TIMEOUT
+    DEFAULT_RETRY_BACKOFF = 0.5  # seconds, the base of the exponential backoff
+    RETRY_BACKOFF_CAP = 10.0  # seconds
+    RETRY_STATUS_CODES = frozenset({502, 503, 504})
+    DEFAULT_FIND_AROUND_ME_QUEUE_SIZE = 100
+    DEFAULT_SEARCH_CACHE_TTL = 0.0  # seconds, no caching
+    DEFAULT_SEARCH_CACHE_SIZE = 128
+
     def __init__(
         self,
         address: Address,
@@ -223,17 +242,39 @@ class SOEFChannel:
         logger: logging.Logger = _default_logger,
         connection_check_timeout: float = 15.0,
         connection_check_max_retries: int = 3,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        keepalive_timeout: Optional[float] = DEFAULT_KEEPALIVE_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+        find_around_me_queue_size: int = DEFAULT_FIND_AROUND_ME_QUEUE_SIZE,
+        search_cache_ttl: float = DEFAULT_SEARCH_CACHE_TTL,
+        search_cache_size: int = DEFAULT_SEARCH_CACHE_SIZE,
     ):
         """
         Initialize.
 
+        The requests share a pool of connections to the SOEF, kept alive between requests.
+
         :param address: the address of the agent.
         :param api_key: the SOEF API key.
         :param soef_addr: the SOEF IP address.
         :param soef_port: the SOEF port.
         :param chain_identifier: supported chain id
         :param connection_check_timeout: timeout to check network connection on connect
-        """
+        :param max_connections: the maximum number of connections in the pool, 0 for no limit
+        :param keepalive_timeout: the time an idle connection is kept open, None to close the connections after each request
+        :param max_retries: the number of times a request is retried on network errors and unavailable server responses
+        :param retry_backoff: the base delay of the jittered exponential backoff between retries, in seconds
+        :param request_timeout: the timeout of each attempt of a request, in seconds
+        :param find_around_me_queue_size: the maximum number of distinct searches waiting to be sent
+        :param search_cache_ttl: the time the search results are cached, 0 to not cache them
+        :param search_cache_size: the maximum number of search results cached
+        """
+        enforce(max_retries >= 0, "max_retries must be non negative.")
+        enforce(
+            find_around_me_queue_size > 0, "find_around_me_queue_size must be positive."
+        )
         if chain_identifier is not None and not any(
             regex.match(chain_identifier) for regex in self.SUPPORTED_CHAIN_IDENTIFIERS
         ):
@@ -266,12 +307,30 @@ class SOEFChannel:
         self._unique_page_address = None  # type: Optional[str]
         self.agent_location = None  # type: Optional[Location]
         self.in_queue = None  # type: Optional[asyncio.Queue]
-        self._executor_pool: Optional[ThreadPoolExecutor] = None
+        self.max_connections = max_connections
+        self.keepalive_timeout = keepalive_timeout
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.request_timeout = request_timeout
+        self.find_around_me_queue_size = find_around_me_queue_size
+        self._session: Optional[aiohttp.ClientSession] = None
         self.chain_identifier: str = chain_identifier or self.DEFAULT_CHAIN_IDENTIFIER
         self._loop = None  # type: Optional[asyncio.AbstractEventLoop]
         self._ping_periodic_task: Optional[asyncio.Task] = None
+        self._commands_queue: Optional[asyncio.Queue] = None
+        self._commands_processor_task: Optional[asyncio.Task] = None
         self._find_around_me_queue: Optional[asyncio.Queue] = None
+        self._find_around_me_requests: Dict[
+            SearchKey, List[Tuple[OefSearchMessage, OefSearchDialogue]]
+        ] = {}
         self._find_around_me_processor_task: Optional[asyncio.Task] = None
+        self._search_cache: Optional[SearchResultCache] = (
+            SearchResultCache(
+                search_cache_ttl, search_cache_size, address, str(PUBLIC_ID)
+            )
+            if search_cache_ttl > 0
+            else None
+        )
         self.logger = logger
         self._unregister_lock: Optional[asyncio.Lock] = None
 
@@ -312,11 +371,10 @@ class SOEFChannel:
             f.write(unique_page_address)
 
     async def _find_around_me_processor(self) -> None:
-        """Process find me around requests in background task."""
+        """Process find me around requests in background task, replying to all the coalesced searches."""
         while self._find_around_me_queue is not None:
             try:
-                task = await self._find_around_me_queue.get()
-                oef_message, oef_search_dialogue, radius, params = task
+                key, radius, params = await self._find_around_me_queue.get()
             except (
                 asyncio.CancelledError,
                 CancelledError,
@@ -329,11 +387,12 @@ class SOEFChannel:
                 )
                 raise
 
+            agents: Optional[Dict[str, Dict[str, Union[str, Dict[str, str]]]]] = None
+            generation = (
+                self._search_cache.generation if self._search_cache is not None else 0
+            )
             try:
-                await self._find_around_me_handle_request(
-                    oef_message, oef_search_dialogue, radius, params
-                )
-                await asyncio.sleep(self.FIND_AROUND_ME_REQUEST_DELAY)
+                agents = await self._find_around_me_agents(radius, params)
             except (
                 asyncio.CancelledError,
                 CancelledError,
@@ -341,22 +400,37 @@ class SOEFChannel:
             ):  # pylint: disable=try-except-raise
                 return
             except SOEFException:  # pragma: nocover
-                await self._send_error_response(
-                    oef_message,
-                    oef_search_dialogue,
-                    oef_error_operation=OefSearchMessage.OefErrorOperation.OTHER,
-                )
+                pass
             except Exception as e:  # pylint: disable=broad-except  # pragma: nocover
                 self.logger.exception(
                     f"Exception occurred in  _find_around_me_processor: {e}"
                 )
-                await self._send_error_response(
-                    oef_message,
-                    oef_search_dialogue,
-                    oef_error_operation=OefSearchMessage.OefErrorOperation.OTHER,
-                )
-            finally:
-                self.logger.debug("_find_around_me_processor exited")
+
+            # searches received while the request was in flight share its result
+            for oef_message, oef_search_dialogue in self._find_around_me_requests.pop(
+                key, []
+            ):
+                if agents is None:
+                    await self._send_error_response(
+                        oef_message,
+                        oef_search_dialogue,
+                        oef_error_operation=OefSearchMessage.OefErrorOperation.OTHER,
+                    )
+                else:
+                    if self._search_cache is not None:
+                        self._search_cache.put(oef_message.query, agents, generation)
+                    await self._send_search_result(
+                        oef_message, oef_search_dialogue, agents
+                    )
+            try:
+                await asyncio.sleep(self.FIND_AROUND_ME_REQUEST_DELAY)
+            except (
+                asyncio.CancelledError,
+                CancelledError,
+                GeneratorExit,
+            ):  # pylint: disable=try-except-raise
+                return
+        self.logger.debug("_find_around_me_processor exited")
 
     @property
     def loop(self) -> asyncio.AbstractEventLoop:
@@ -436,32 +510,139 @@ class SOEFChannel:
         """
         Send message handler.
 
+        The command of the envelope is queued and run in the background, in the order
+        the envelopes are sent, so the sender does not wait for the SOEF responses.
+
         :param envelope: the envelope.
         :return: None
         """
-        await self.process_envelope(envelope)
+        if self._commands_queue is None:
+            raise ValueError("SOEFChannel not started.")  # pragma: nocover
+        oef_message, oef_search_dialogue = self._get_message_and_dialogue(envelope)
+        await self._commands_queue.put((oef_message, oef_search_dialogue))
 
-    async def _request_text(self, *args: Any, **kwargs: Any) -> str:
-        """Perform and http request and return text of response."""
+    async def _commands_processor(self) -> None:
+        """Run the queued commands one by one, in the order they were sent."""
+        while self._commands_queue is not None:
+            oef_message, oef_search_dialogue = await self._commands_queue.get()
+            try:
+                await self._process_command(oef_message, oef_search_dialogue)
+            except (
+                asyncio.CancelledError,
+                ConcurrentCancelledError,
+            ):  # pragma: nocover
+                raise
+            except Exception as e:  # pylint: disable=broad-except # pragma: nocover
+                self.logger.exception(f"Exception during command processing: {e}")
+
+    def _make_session(self) -> aiohttp.ClientSession:
+        """Make a client session on top of a pool of keep-alive connections to the SOEF."""
+        keepalive_options: Dict[str, Any] = (
+            {"force_close": True}
+            if self.keepalive_timeout is None
+            else {"keepalive_timeout": self.keepalive_timeout}
+        )
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections, ssl=ssl_context, **keepalive_options
+        )
+        return aiohttp.ClientSession(connector=connector)
 
-        def _do_request() -> requests.Response:
-            return requests.request(*args, **kwargs)
+    def _get_retry_delay(self, attempt: int) -> float:
+        """
+        Get the delay before a retry, with full jitter so the agents do not retry in lockstep.
 
-        try:
-            response = await self.loop.run_in_executor(self._executor_pool, _do_request)
-        except requests.ConnectionError as e:
-            raise SOEFNetworkConnectionError(e) from e
+        :param attempt: the number of the retry, from 1.
+        :return: the delay in seconds.
+        """
+        max_delay = min(self.RETRY_BACKOFF_CAP, self.retry_backoff * 2 ** (attempt - 1))
+        return random.uniform(0, max_delay)  # nosec
+
+    async def _request_text(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Union[str, List[str]]]] = None,
+        timeout: Optional[float] = None,
+        idempotent: bool = True,
+    ) -> str:
+        """
+        Perform an http request and return text of response.
+
+        The request is retried with a jittered exponential backoff on network errors and unavailable server responses.
+        A request that is not idempotent is retried only when the connection to the server could not be established,
+        as otherwise the server may have processed it.
+
+        :param method: the http method.
+        :param url: the url.
+        :param params: the query parameters, the values of a list are sent as repeated parameters.
+        :param timeout: the timeout of each attempt, in seconds, the request timeout of the channel if None.
+        :param idempotent: whether the request can be repeated safely.
+        :return: the text of the response.
+        """
+        timeout = self.request_timeout if timeout is None else timeout
+        attempt = 0
+        while True:
+            try:
+                status, text = await self._send_request(method, url, params, timeout)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                # the request was not sent if the connection was not established
+                retriable = idempotent or isinstance(e, aiohttp.ClientConnectorError)
+                if not retriable or attempt >= self.max_retries:
+                    raise SOEFNetworkConnectionError(e) from e
+                reason = repr(e)
+            else:
+                if (
+                    not idempotent
+                    or status not in self.RETRY_STATUS_CODES
+                    or attempt >= self.max_retries
+                ):
+                    break
+                reason = f"code {status}"
+            attempt += 1
+            delay = self._get_retry_delay(attempt)
+            self.logger.debug(
+                f"SOEF request failed with {reason}, retry {attempt} of {self.max_retries} in {delay:.2f} seconds."
+            )
+            await asyncio.sleep(delay)
 
-        if response.status_code < 200 or response.status_code >= 300:
+        if status < 200 or status >= 300:
             raise SOEFServerBadResponseError(
-                f"Bad server response: code {response.status_code} when 2XX expected. Request data: ({args}, {kwargs}) Response content: `{response.text}`"
+                f"Bad server response: code {status} when 2XX expected. Request data: ({method}, {url}, {params}) Response content: `{text}`"
             )
-        if not response.text:
+        if not text:
             raise SOEFServerBadResponseError(
-                f"Bad server response: empty response. Request data: ({args}, {kwargs})"
+                f"Bad server response: empty response. Request data: ({method}, {url}, {params})"
             )
 
-        return response.text
+        return text
+
+    async def _send_request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Union[str, List[str]]]],
+        timeout: float,
+    ) -> Tuple[int, str]:
+        """
+        Send an http request on the pooled session.
+
+        :param method: the http method.
+        :param url: the url.
+        :param params: the query parameters.
+        :param timeout: the timeout of the request, in seconds.
+        :return: the status code and the text of the response.
+        """
+        if self._session is None:
+            raise ValueError("Session not set, use connect first!")  # pragma: nocover
+        query = [
+            (key, item)
+            for key, value in (params or {}).items()
+            for item in (value if isinstance(value, list) else [value])
+        ]
+        async with self._session.request(
+            method, url, params=query, timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            return response.status, await response.text()
 
     async def process_envelope(self, envelope: Envelope) -> None:
         """
@@ -470,6 +651,18 @@ class SOEFChannel:
         :param envelope: the envelope.
         :return: None
         """
+        oef_message, oef_search_dialogue = self._get_message_and_dialogue(envelope)
+        await self._process_command(oef_message, oef_search_dialogue)
+
+    def _get_message_and_dialogue(
+        self, envelope: Envelope
+    ) -> Tuple[OefSearchMessage, OefSearchDialogue]:
+        """
+        Get the message of an envelope and update its dialogue.
+
+        :param envelope: the envelope.
+        :return: the message and the dialogue.
+        """
         enforce(
             isinstance(envelope.message, OefSearchMessage),
             "Message not of type OefSearchMessage",
@@ -482,7 +675,18 @@ class SOEFChannel:
             raise ValueError(
                 "Could not create dialogue for message={}".format(oef_message)
             )
+        return oef_message, oef_search_dialogue
+
+    async def _process_command(
+        self, oef_message: OefSearchMessage, oef_search_dialogue: OefSearchDialogue
+    ) -> None:
+        """
+        Run the command of a message and send the response.
 
+        :param oef_message: the oef search message.
+        :param oef_search_dialogue: the oef search dialogue.
+        :return: None
+        """
         err_ops = OefSearchMessage.OefErrorOperation
         oef_error_operation = err_ops.OTHER
 
@@ -558,9 +762,16 @@ class SOEFChannel:
                 f'Data model name: {data_model_name} is not supported for `register`. Valid models for performative {oef_message.performative} are: {", ".join(data_model_handlers.keys())}'
             )
 
+        if data_model_name not in {"ping", "generic_command"}:
+            self._invalidate_search_cache()
         handler = data_model_handlers[data_model_name]
         await handler(service_description, oef_message, oef_search_dialogue)
 
+    def _invalidate_search_cache(self) -> None:
+        """Invalidate the cached search results, as the registration of the agent changes."""
+        if self._search_cache is not None:
+            self._search_cache.invalidate()
+
     async def _ping_handler(
         self,
         service_description: Description,
@@ -691,6 +902,7 @@ class SOEFChannel:
         params: Optional[Dict[str, Union[str, List[str]]]] = None,
         unique_page_address: Optional[str] = None,
         check_success: bool = True,
+        idempotent: bool = True,
     ) -> ElementTree:
         """
         Set service key from service description.
@@ -699,11 +911,12 @@ class SOEFChannel:
         :param params: the parameters of the command
         :param unique_page_address: the unique page address
         :param check_success: whether or not to check for success
+        :param idempotent: whether or not the command can be repeated safely
 
         :return: parsed xml ElementTree
         """
         params = params or {}
-        self.logger.debug(f"Perform `{command}` with {params}")
+        self.logger.debug("Perform `%s` with %s", command, params)
         url = parse.urljoin(
             self.base_url, unique_page_address or self.unique_page_address
         )
@@ -711,10 +924,13 @@ class SOEFChannel:
         response_text = ""
         try:
             response_text = await self._request_text(
-                "get", url=url, params={"command": command, **params}
+                "get",
+                url=url,
+                params={"command": command, **params},
+                idempotent=idempotent,
             )
             parsed_text = self._parse_soef_response(response_text, check_success)
-            self.logger.debug(f"`{command}` SUCCESS!")
+            self.logger.debug("`%s` SUCCESS!", command)
             return parsed_text
         except (
             asyncio.CancelledError,
@@ -927,7 +1143,9 @@ class SOEFChannel:
             "address": self.address,
             "declared_name": self.declared_name,
         }
-        response_text = await self._request_text("get", url=url, params=params)
+        response_text = await self._request_text(
+            "get", url=url, params=params, idempotent=False
+        )
         root = self._parse_soef_response(response_text, check_success=False)
 
         self.logger.debug("Root tag: {}".format(root.tag))
@@ -1012,6 +1230,7 @@ class SOEFChannel:
                 f'Data model name: {data_model_name} is not supported for `unregister`. Valid models for performative {oef_message.performative} are: {", ".join(data_model_handlers.keys())}'
             )
 
+        self._invalidate_search_cache()
         handler = data_model_handlers[data_model_name]
         if data_model_name == "location_agent":
             await handler(oef_message, oef_search_dialogue)
@@ -1043,7 +1262,9 @@ class SOEFChannel:
                 return
 
             task = asyncio.ensure_future(
-                self._generic_oef_command("unregister", check_success=False)
+                self._generic_oef_command(
+                    "unregister", check_success=False, idempotent=False
+                )
             )
 
             try:
@@ -1083,8 +1304,9 @@ class SOEFChannel:
             )
 
     async def connect(self) -> None:
-        """Connect channel set queues and executor pool."""
+        """Connect channel set queues and the session."""
         self._loop = asyncio.get_event_loop()
+        self._session = self._make_session()
 
         reachable_check_count = 0
         while reachable_check_count < self.connection_check_max_retries:
@@ -1094,13 +1316,20 @@ class SOEFChannel:
                 reachable_check_count = self.connection_check_max_retries
             except Exception as e:  # pylint: disable=broad-except # pragma: nocover
                 if reachable_check_count == self.connection_check_max_retries:
+                    await self._close_session()
                     raise e
                 self.logger.debug(f"Exception during SOEF reachability check: {e}.")
 
         self.in_queue = asyncio.Queue()
-        self._find_around_me_queue = asyncio.Queue()
+        self._commands_queue = asyncio.Queue()
+        self._find_around_me_queue = asyncio.Queue(
+            maxsize=self.find_around_me_queue_size
+        )
+        self._find_around_me_requests = {}
         self._unregister_lock = asyncio.Lock()
-        self._executor_pool = ThreadPoolExecutor(max_workers=10)
+        self._commands_processor_task = self._loop.create_task(
+            self._commands_processor()
+        )
         self._find_around_me_processor_task = self._loop.create_task(
             self._find_around_me_processor()
         )
@@ -1114,6 +1343,12 @@ class SOEFChannel:
             self.logger.debug("Unregister on SOEF failed. Agent not registered.")
             self.unique_page_address = None
 
+    async def _close_session(self) -> None:
+        """Close the session and its connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
     async def disconnect(self) -> None:
         """
         Disconnect unregisters any potential services still registered.
@@ -1125,18 +1360,27 @@ class SOEFChannel:
         if self.in_queue is None:
             raise ValueError("Queue is not set, use connect first!")  # pragma: nocover
 
-        if self._find_around_me_processor_task:
-            if not self._find_around_me_processor_task.done():
-                self._find_around_me_processor_task.cancel()
-            await self._find_around_me_processor_task
+        for task in [
+            self._commands_processor_task,
+            self._find_around_me_processor_task,
+        ]:
+            if task is None:
+                continue  # pragma: nocover
+            if not task.done():
+                task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
 
         try:
             await self._unregister_agent()
         except Exception as e:  # pylint: disable=broad-except # pragma: nocover
             self.logger.exception(str(e))
 
+        await self._close_session()
         await self.in_queue.put(None)
+        self._commands_queue = None
         self._find_around_me_queue = None
+        self._find_around_me_requests = {}
 
     async def search_services(
         self, oef_message: OefSearchMessage, oef_search_dialogue: OefSearchDialogue
@@ -1157,6 +1401,12 @@ class SOEFChannel:
                 )
             )
 
+        if self._search_cache is not None:
+            agents = self._search_cache.get(query)
+            if agents is not None:
+                await self._send_search_result(oef_message, oef_search_dialogue, agents)
+                return
+
         constraints = [cast(Constraint, c) for c in query.constraints]
         constraint_distance = [
             c for c in constraints if c.constraint_type.type == ConstraintTypes.DISTANCE
@@ -1197,8 +1447,36 @@ class SOEFChannel:
         """
         if not self._find_around_me_queue:
             raise ValueError("SOEFChannel not started.")  # pragma: nocover
-        await self._find_around_me_queue.put(
-            (oef_message, oef_search_dialogue, radius, params)
+        key = self._get_search_key(radius, params)
+        waiting_searches = self._find_around_me_requests.get(key)
+        if waiting_searches is not None:
+            # an identical search is pending, it is answered with the same result
+            waiting_searches.append((oef_message, oef_search_dialogue))
+            return
+        if self._find_around_me_queue.full():
+            raise SOEFException.warning(
+                f"Too many pending searches, maximum is {self.find_around_me_queue_size}."
+            )
+        self._find_around_me_requests[key] = [(oef_message, oef_search_dialogue)]
+        self._find_around_me_queue.put_nowait((key, radius, params))
+
+    def _get_search_key(self, radius: float, params: Dict[str, List[str]]) -> SearchKey:
+        """
+        Get the key identifying identical searches.
+
+        :param radius: the radius in which to search
+        :param params: the parameters for the query
+        :return: the key of the search from the agent location.
+        """
+        location = (
+            None
+            if self.agent_location is None
+            else (self.agent_location.latitude, self.agent_location.longitude)
+        )
+        return (
+            location,
+            radius,
+            tuple(sorted((name, tuple(values)) for name, values in params.items())),
         )
 
     async def _find_around_me_handle_request(
@@ -1209,7 +1487,7 @@ class SOEFChannel:
         params: Dict[str, List[str]],
     ) -> None:
         """
-        Find agents around me.
+        Find agents around me and send them in response to the search.
 
         :param oef_message: OefSearchMessage
         :param oef_search_dialogue: OefSearchDialogue
@@ -1217,8 +1495,19 @@ class SOEFChannel:
         :param params: the parameters for the query
         :return: None
         """
-        if self.in_queue is None:
-            raise ValueError("Inqueue not set!")  # pragma: nocover
+        agents = await self._find_around_me_agents(radius, params)
+        await self._send_search_result(oef_message, oef_search_dialogue, agents)
+
+    async def _find_around_me_agents(
+        self, radius: float, params: Dict[str, List[str]],
+    ) -> Dict[str, Dict[str, Union[str, Dict[str, str]]]]:
+        """
+        Find agents around me.
+
+        :param radius: the radius in which to search
+        :param params: the parameters for the query
+        :return: the agents found, by address
+        """
         self.logger.debug("Searching in radius={} of myself".format(radius))
 
         root = await self._generic_oef_command(
@@ -1251,7 +1540,24 @@ class SOEFChannel:
                                     "longitude": location.find("longitude").text,
                                     "latitude": location.find("latitude").text,
                                 }
+        return agents
+
+    async def _send_search_result(
+        self,
+        oef_message: OefSearchMessage,
+        oef_search_dialogue: OefSearchDialogue,
+        agents: Dict[str, Dict[str, Union[str, Dict[str, str]]]],
+    ) -> None:
+        """
+        Send the agents found in response to a search.
 
+        :param oef_message: OefSearchMessage
+        :param oef_search_dialogue: OefSearchDialogue
+        :param agents: the agents found, by address
+        :return: None
+        """
+        if self.in_queue is None:
+            raise ValueError("Inqueue not set!")  # pragma: nocover
         message = oef_search_dialogue.reply(
             performative=OefSearchMessage.Performative.SEARCH_RESULT,
             target_message=oef_message,
@@ -1299,6 +1605,55 @@ class SOEFConnection(Connection):
         token_storage_path = cast(
             Optional[str], self.configuration.config.get("token_storage_path")
         )
+        max_connections = cast(
+            int,
+            self.configuration.config.get(
+                "max_connections", SOEFChannel.DEFAULT_MAX_CONNECTIONS
+            ),
+        )
+        keepalive_timeout = cast(
+            Optional[float],
+            self.configuration.config.get(
+                "keepalive_timeout", SOEFChannel.DEFAULT_KEEPALIVE_TIMEOUT
+            ),
+        )
+        max_retries = cast(
+            int,
+            self.configuration.config.get(
+                "max_retries", SOEFChannel.DEFAULT_MAX_RETRIES
+            ),
+        )
+        retry_backoff = cast(
+            float,
+            self.configuration.config.get(
+                "retry_backoff", SOEFChannel.DEFAULT_RETRY_BACKOFF
+            ),
+        )
+        request_timeout = cast(
+            float,
+            self.configuration.config.get(
+                "request_timeout", SOEFChannel.DEFAULT_REQUEST_TIMEOUT
+            ),
+        )
+        find_around_me_queue_size = cast(
+            int,
+            self.configuration.config.get(
+                "find_around_me_queue_size",
+                SOEFChannel.DEFAULT_FIND_AROUND_ME_QUEUE_SIZE,
+            ),
+        )
+        search_cache_ttl = cast(
+            float,
+            self.configuration.config.get(
+                "search_cache_ttl", SOEFChannel.DEFAULT_SEARCH_CACHE_TTL
+            ),
+        )
+        search_cache_size = cast(
+            int,
+            self.configuration.config.get(
+                "search_cache_size", SOEFChannel.DEFAULT_SEARCH_CACHE_SIZE
+            ),
+        )
         not_none_params = {
             "api_key": api_key,
             "soef_addr": soef_addr,
@@ -1322,6 +1677,14 @@ class SOEFConnection(Connection):
             token_storage_path=token_storage_path,
             connection_check_timeout=connection_check_timeout,
             connection_check_max_retries=connection_check_max_retries,
+            max_connections=max_connections,
+            keepalive_timeout=keepalive_timeout,
+            max_retries=max_retries,
+            retry_backoff=retry_backoff,
+            request_timeout=request_timeout,
+            find_around_me_queue_size=find_around_me_queue_size,
+            search_cache_ttl=search_cache_ttl,
+            search_cache_size=search_cache_size,
         )
 
     async def connect(self) -> None:
@@ -1369,7 +1732,7 @@ class SOEFConnection(Connection):
             if envelope is None:  # pragma: nocover
                 self.logger.debug("Received None.")
                 return None
-            self.logger.debug("Received envelope: {}".format(envelope))
+            self.logger.debug("Received envelope: %s", envelope)
             return envelope
         except CancelledError:
             self.logger.debug("Receive cancelled.")
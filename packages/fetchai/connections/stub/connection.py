@@ -167,7 +167,7 @@ class StubConnection(Connection):
                 if envelope is None:
                     continue
 
-                self.logger.debug(f"Add envelope {envelope}")
+                self.logger.debug("Add envelope %s", envelope)
                 await self.in_queue.put(envelope)
 
     @classmethod
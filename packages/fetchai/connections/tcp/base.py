@@ -21,11 +21,12 @@
 import logging
 import struct
 from abc import ABC, abstractmethod
-from asyncio import CancelledError, StreamReader, StreamWriter
-from typing import Any, Optional
+from asyncio import CancelledError, IncompleteReadError, StreamReader, StreamWriter
+from typing import Any, Dict, List, Optional, Sequence, cast
 
 from aea.configurations.base import PublicId
 from aea.connections.base import Connection, ConnectionStates
+from aea.exceptions import enforce
 from aea.mail.base import Envelope
 
 
@@ -33,6 +34,13 @@ _default_logger = logging.getLogger("aea.packages.fetchai.connections.tcp")
 
 PUBLIC_ID = PublicId.from_str("fetchai/tcp:0.16.0")
 
+# a frame is the length of the payload, then the payload
+FRAME_HEADER = struct.Struct("I")
+
+
+class FrameSizeError(ValueError):
+    """Error raised when a received frame exceeds the maximum frame size."""
+
 
 class TCPConnection(Connection, ABC):
     """Abstract TCP connection."""
@@ -51,6 +59,13 @@ class TCPConnection(Connection, ABC):
         # for the client, the server address/port
         self.host = host
         self.port = port
+        self.max_frame_size = cast(
+            Optional[int], self.configuration.config.get("max_frame_size")
+        )
+        enforce(
+            self.max_frame_size is None or self.max_frame_size > 0,
+            "Max frame size must be positive.",
+        )
 
     @abstractmethod
     async def setup(self) -> None:
@@ -104,28 +119,52 @@ class TCPConnection(Connection, ABC):
         self.state = ConnectionStates.disconnected
 
     async def _recv(self, reader: StreamReader) -> Optional[bytes]:
-        """Receive bytes."""
-        data = await reader.read(len(struct.pack("I", 0)))
-        if not self.is_connected:
+        """
+        Receive the payload of a frame.
+
+        :param reader: the stream reader.
+        :return: the payload, or None if the stream is closed.
+        :raises FrameSizeError: if the frame exceeds the maximum frame size.
+        """
+        try:
+            header = await reader.readexactly(FRAME_HEADER.size)
+            if not self.is_connected:
+                return None
+            nbytes = FRAME_HEADER.unpack(header)[0]
+            if self.max_frame_size is not None and nbytes > self.max_frame_size:
+                raise FrameSizeError(
+                    f"[{self.address}] Frame of {nbytes} bytes exceeds the maximum frame size of {self.max_frame_size} bytes."
+                )
+            return await reader.readexactly(nbytes)
+        except IncompleteReadError:
             return None
-        nbytes = struct.unpack("I", data)[0]
-        nbytes_read = 0
-        data = b""
-        while nbytes_read < nbytes:
-            data += await reader.read(nbytes - nbytes_read)
-            nbytes_read = len(data)
-        return data
 
     async def _send(self, writer: StreamWriter, data: bytes) -> None:
-        self.logger.debug("[{}] Send a message".format(self.address))
-        nbytes = struct.pack("I", len(data))
-        self.logger.debug("#bytes: {!r}".format(nbytes))
+        """
+        Send a payload in a frame.
+
+        :param writer: the stream writer.
+        :param data: the payload.
+        """
+        await self._send_frames(writer, [data])
+
+    async def _send_frames(self, writer: StreamWriter, payloads: List[bytes]) -> None:
+        """
+        Send payloads in frames, written at once and drained once.
+
+        :param writer: the stream writer.
+        :param payloads: the payloads.
+        """
+        self.logger.debug("[%s] Send %d frame(s)", self.address, len(payloads))
+        chunks = []
+        for data in payloads:
+            chunks.append(FRAME_HEADER.pack(len(data)))
+            chunks.append(data)
         try:
-            writer.write(nbytes)
-            writer.write(data)
+            writer.writelines(chunks)
             await writer.drain()
         except CancelledError:
-            return None
+            pass
 
     async def send(self, envelope: Envelope) -> None:
         """
@@ -143,3 +182,23 @@ class TCPConnection(Connection, ABC):
             self.logger.error(
                 "[{}]: Cannot send envelope {}".format(self.address, envelope)
             )
+
+    async def send_batch(self, envelopes: Sequence[Envelope]) -> None:
+        """
+        Send a batch of envelopes, with a write and a drain per recipient stream.
+
+        :param envelopes: the envelopes to send.
+        :return: None.
+        """
+        payloads_by_writer: Dict[StreamWriter, List[bytes]] = {}
+        for envelope in envelopes:
+            self._ensure_valid_envelope_for_external_comms(envelope)
+            writer = self.select_writer_from_envelope(envelope)
+            if writer is None:
+                self.logger.error(
+                    "[{}]: Cannot send envelope {}".format(self.address, envelope)
+                )
+                continue
+            payloads_by_writer.setdefault(writer, []).append(envelope.encode())
+        for writer, payloads in payloads_by_writer.items():
+            await self._send_frames(writer, payloads)
@@ -32,7 +32,7 @@ from typing import Any, Optional, cast
 from aea.configurations.base import ConnectionConfig
 from aea.mail.base import Envelope
 
-from packages.fetchai.connections.tcp.base import TCPConnection
+from packages.fetchai.connections.tcp.base import FrameSizeError, TCPConnection
 
 
 _default_logger = logging.getLogger("aea.packages.fetchai.connections.tcp.tcp_client")
@@ -91,17 +91,20 @@ class TCPClientConnection(TCPConnection):
                 raise ValueError("Reader not set.")  # pragma: nocover
             data = await self._recv(self._reader)
             if data is None:  # pragma: nocover
-                self.logger.debug("[{}] No data received.".format(self.address))
+                self.logger.debug("[%s] No data received.", self.address)
                 return None
-            self.logger.debug("[{}] Message received: {!r}".format(self.address, data))
+            self.logger.debug("[%s] Message received: %r", self.address, data)
             envelope = Envelope.decode(data)
-            self.logger.debug(
-                "[{}] Decoded envelope: {}".format(self.address, envelope)
-            )
+            self.logger.debug("[%s] Decoded envelope: %s", self.address, envelope)
             return envelope
         except CancelledError:
             self.logger.debug("[{}] Read cancelled.".format(self.address))
             return None
+        except FrameSizeError as e:
+            # the rest of the stream cannot be read
+            self.logger.error(str(e))
+            await self.disconnect()
+            return None
         except struct.error as e:
             self.logger.debug("Struct error: {}".format(str(e)))
             return None
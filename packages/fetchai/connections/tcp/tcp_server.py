@@ -28,7 +28,7 @@ from aea.common import Address
 from aea.configurations.base import ConnectionConfig
 from aea.mail.base import Envelope
 
-from packages.fetchai.connections.tcp.base import TCPConnection
+from packages.fetchai.connections.tcp.base import FrameSizeError, TCPConnection
 
 
 _default_logger = logging.getLogger("aea.packages.fetchai.connections.tcp.tcp_server")
@@ -91,16 +91,22 @@ class TCPServerConnection(TCPConnection):
 
             # take the first
             task = next(iter(done))
-            envelope_bytes = task.result()
-            if envelope_bytes is None:  # pragma: no cover
-                self.logger.debug("[{}]: No data received.")
-                return None
-            envelope = Envelope.decode(envelope_bytes)
             address = self._read_tasks_to_address.pop(task)
+            try:
+                envelope_bytes = task.result()
+            except FrameSizeError as e:
+                self.logger.error(str(e))
+                envelope_bytes = None
+            if envelope_bytes is None:
+                self.logger.debug(
+                    "[{}]: Connection of {} closed.".format(self.address, address)
+                )
+                self._close_connection(address)
+                return None
             reader = self.connections[address][0]
             new_task = asyncio.ensure_future(self._recv(reader), loop=self.loop)
             self._read_tasks_to_address[new_task] = address
-            return envelope
+            return Envelope.decode(envelope_bytes)
         except asyncio.CancelledError:
             self.logger.debug("Receiving loop cancelled.")
             return None
@@ -129,6 +135,16 @@ class TCPServerConnection(TCPConnection):
         self._server.close()
         await self._server.wait_closed()
 
+    def _close_connection(self, address: Address) -> None:
+        """
+        Close the connection of a client, e.g. once its stream is closed.
+
+        :param address: the address of the client.
+        """
+        connection = self.connections.pop(address, None)
+        if connection is not None:
+            connection[1].close()
+
     def select_writer_from_envelope(self, envelope: Envelope) -> Optional[StreamWriter]:
         """Select the destination, given the envelope."""
         to = envelope.to
@@ -153,122 +153,122 @@ class AggregationMessage(Message):
     def _is_consistent(self) -> bool:
         """Check that the message follows the aggregation protocol."""
         try:
-            enforce(
-                isinstance(self.dialogue_reference, tuple),
-                "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
-                    type(self.dialogue_reference)
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[0], str),
-                "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[0])
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[1], str),
-                "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[1])
-                ),
-            )
-            enforce(
-                type(self.message_id) is int,
-                "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
-                    type(self.message_id)
-                ),
-            )
-            enforce(
-                type(self.target) is int,
-                "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
-                    type(self.target)
-                ),
-            )
+            if not isinstance(self.dialogue_reference, tuple):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.dialogue_reference)
+                    )
+                )
+            if not isinstance(self.dialogue_reference[0], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[0])
+                    )
+                )
+            if not isinstance(self.dialogue_reference[1], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[1])
+                    )
+                )
+            if not (type(self.message_id) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
+                        type(self.message_id)
+                    )
+                )
+            if not (type(self.target) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
+                        type(self.target)
+                    )
+                )
 
             # Light Protocol Rule 2
             # Check correct performative
-            enforce(
-                isinstance(self.performative, AggregationMessage.Performative),
-                "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
-                    self.valid_performatives, self.performative
-                ),
-            )
+            if not isinstance(self.performative, AggregationMessage.Performative):
+                raise AEAEnforceError(
+                    "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
+                        self.valid_performatives, self.performative
+                    )
+                )
 
             # Check correct contents
             actual_nb_of_contents = len(self._body) - DEFAULT_BODY_SIZE
             expected_nb_of_contents = 0
             if self.performative == AggregationMessage.Performative.OBSERVATION:
                 expected_nb_of_contents = 4
-                enforce(
-                    type(self.value) is int,
-                    "Invalid type for content 'value'. Expected 'int'. Found '{}'.".format(
-                        type(self.value)
-                    ),
-                )
-                enforce(
-                    isinstance(self.time, str),
-                    "Invalid type for content 'time'. Expected 'str'. Found '{}'.".format(
-                        type(self.time)
-                    ),
-                )
-                enforce(
-                    isinstance(self.source, str),
-                    "Invalid type for content 'source'. Expected 'str'. Found '{}'.".format(
-                        type(self.source)
-                    ),
-                )
-                enforce(
-                    isinstance(self.signature, str),
-                    "Invalid type for content 'signature'. Expected 'str'. Found '{}'.".format(
-                        type(self.signature)
-                    ),
-                )
+                if not (type(self.value) is int):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'value'. Expected 'int'. Found '{}'.".format(
+                            type(self.value)
+                        )
+                    )
+                if not isinstance(self.time, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'time'. Expected 'str'. Found '{}'.".format(
+                            type(self.time)
+                        )
+                    )
+                if not isinstance(self.source, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'source'. Expected 'str'. Found '{}'.".format(
+                            type(self.source)
+                        )
+                    )
+                if not isinstance(self.signature, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'signature'. Expected 'str'. Found '{}'.".format(
+                            type(self.signature)
+                        )
+                    )
             elif self.performative == AggregationMessage.Performative.AGGREGATION:
                 expected_nb_of_contents = 4
-                enforce(
-                    type(self.value) is int,
-                    "Invalid type for content 'value'. Expected 'int'. Found '{}'.".format(
-                        type(self.value)
-                    ),
-                )
-                enforce(
-                    isinstance(self.time, str),
-                    "Invalid type for content 'time'. Expected 'str'. Found '{}'.".format(
-                        type(self.time)
-                    ),
-                )
-                enforce(
-                    isinstance(self.contributors, tuple),
-                    "Invalid type for content 'contributors'. Expected 'tuple'. Found '{}'.".format(
-                        type(self.contributors)
-                    ),
-                )
-                enforce(
-                    all(isinstance(element, str) for element in self.contributors),
-                    "Invalid type for tuple elements in content 'contributors'. Expected 'str'.",
-                )
-                enforce(
-                    isinstance(self.signature, str),
-                    "Invalid type for content 'signature'. Expected 'str'. Found '{}'.".format(
-                        type(self.signature)
-                    ),
-                )
+                if not (type(self.value) is int):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'value'. Expected 'int'. Found '{}'.".format(
+                            type(self.value)
+                        )
+                    )
+                if not isinstance(self.time, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'time'. Expected 'str'. Found '{}'.".format(
+                            type(self.time)
+                        )
+                    )
+                if not isinstance(self.contributors, tuple):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'contributors'. Expected 'tuple'. Found '{}'.".format(
+                            type(self.contributors)
+                        )
+                    )
+                if not all(isinstance(element, str) for element in self.contributors):
+                    raise AEAEnforceError(
+                        "Invalid type for tuple elements in content 'contributors'. Expected 'str'."
+                    )
+                if not isinstance(self.signature, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'signature'. Expected 'str'. Found '{}'.".format(
+                            type(self.signature)
+                        )
+                    )
 
             # Check correct content count
-            enforce(
-                expected_nb_of_contents == actual_nb_of_contents,
-                "Incorrect number of contents. Expected {}. Found {}".format(
-                    expected_nb_of_contents, actual_nb_of_contents
-                ),
-            )
+            if not (expected_nb_of_contents == actual_nb_of_contents):
+                raise AEAEnforceError(
+                    "Incorrect number of contents. Expected {}. Found {}".format(
+                        expected_nb_of_contents, actual_nb_of_contents
+                    )
+                )
 
             # Light Protocol Rule 3
             if self.message_id == 1:
-                enforce(
-                    self.target == 0,
-                    "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
-                        self.target
-                    ),
-                )
+                if not (self.target == 0):
+                    raise AEAEnforceError(
+                        "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
+                            self.target
+                        )
+                    )
         except (AEAEnforceError, ValueError, KeyError) as e:
             _default_logger.error(str(e))
             return False
@@ -22,7 +22,6 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
 from aea.mail.base_pb2 import Message as ProtobufMessage
 from aea.protocols.base import Message, Serializer
 
@@ -43,7 +42,7 @@ class AggregationSerializer(Serializer):
         """
         msg = cast(AggregationMessage, msg)
         message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
+        dialogue_message_pb = message_pb.dialogue_message
         aggregation_msg = aggregation_pb2.AggregationMessage()
 
         dialogue_message_pb.message_id = msg.message_id
@@ -54,7 +53,8 @@ class AggregationSerializer(Serializer):
 
         performative_id = msg.performative
         if performative_id == AggregationMessage.Performative.OBSERVATION:
-            performative = aggregation_pb2.AggregationMessage.Observation_Performative()  # type: ignore
+            performative = aggregation_msg.observation
+            performative.SetInParent()
             value = msg.value
             performative.value = value
             time = msg.time
@@ -63,9 +63,9 @@ class AggregationSerializer(Serializer):
             performative.source = source
             signature = msg.signature
             performative.signature = signature
-            aggregation_msg.observation.CopyFrom(performative)
         elif performative_id == AggregationMessage.Performative.AGGREGATION:
-            performative = aggregation_pb2.AggregationMessage.Aggregation_Performative()  # type: ignore
+            performative = aggregation_msg.aggregation
+            performative.SetInParent()
             value = msg.value
             performative.value = value
             time = msg.time
@@ -74,13 +74,11 @@ class AggregationSerializer(Serializer):
             performative.contributors.extend(contributors)
             signature = msg.signature
             performative.signature = signature
-            aggregation_msg.aggregation.CopyFrom(performative)
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
         dialogue_message_pb.content = aggregation_msg.SerializeToString()
 
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
         message_bytes = message_pb.SerializeToString()
         return message_bytes
 
@@ -133,5 +131,6 @@ class AggregationSerializer(Serializer):
             dialogue_reference=dialogue_reference,
             target=target,
             performative=performative,
+            _check_consistency=AggregationMessage.check_consistency_on_decode,
             **performative_content
         )
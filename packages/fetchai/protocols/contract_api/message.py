@@ -227,45 +227,45 @@ class ContractApiMessage(Message):
     def _is_consistent(self) -> bool:
         """Check that the message follows the contract_api protocol."""
         try:
-            enforce(
-                isinstance(self.dialogue_reference, tuple),
-                "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
-                    type(self.dialogue_reference)
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[0], str),
-                "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[0])
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[1], str),
-                "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[1])
-                ),
-            )
-            enforce(
-                type(self.message_id) is int,
-                "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
-                    type(self.message_id)
-                ),
-            )
-            enforce(
-                type(self.target) is int,
-                "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
-                    type(self.target)
-                ),
-            )
+            if not isinstance(self.dialogue_reference, tuple):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.dialogue_reference)
+                    )
+                )
+            if not isinstance(self.dialogue_reference[0], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[0])
+                    )
+                )
+            if not isinstance(self.dialogue_reference[1], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[1])
+                    )
+                )
+            if not (type(self.message_id) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
+                        type(self.message_id)
+                    )
+                )
+            if not (type(self.target) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
+                        type(self.target)
+                    )
+                )
 
             # Light Protocol Rule 2
             # Check correct performative
-            enforce(
-                isinstance(self.performative, ContractApiMessage.Performative),
-                "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
-                    self.valid_performatives, self.performative
-                ),
-            )
+            if not isinstance(self.performative, ContractApiMessage.Performative):
+                raise AEAEnforceError(
+                    "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
+                        self.valid_performatives, self.performative
+                    )
+                )
 
             # Check correct contents
             actual_nb_of_contents = len(self._body) - DEFAULT_BODY_SIZE
@@ -275,195 +275,195 @@ class ContractApiMessage(Message):
                 == ContractApiMessage.Performative.GET_DEPLOY_TRANSACTION
             ):
                 expected_nb_of_contents = 4
-                enforce(
-                    isinstance(self.ledger_id, str),
-                    "Invalid type for content 'ledger_id'. Expected 'str'. Found '{}'.".format(
-                        type(self.ledger_id)
-                    ),
-                )
-                enforce(
-                    isinstance(self.contract_id, str),
-                    "Invalid type for content 'contract_id'. Expected 'str'. Found '{}'.".format(
-                        type(self.contract_id)
-                    ),
-                )
-                enforce(
-                    isinstance(self.callable, str),
-                    "Invalid type for content 'callable'. Expected 'str'. Found '{}'.".format(
-                        type(self.callable)
-                    ),
-                )
-                enforce(
-                    isinstance(self.kwargs, CustomKwargs),
-                    "Invalid type for content 'kwargs'. Expected 'Kwargs'. Found '{}'.".format(
-                        type(self.kwargs)
-                    ),
-                )
+                if not isinstance(self.ledger_id, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'ledger_id'. Expected 'str'. Found '{}'.".format(
+                            type(self.ledger_id)
+                        )
+                    )
+                if not isinstance(self.contract_id, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'contract_id'. Expected 'str'. Found '{}'.".format(
+                            type(self.contract_id)
+                        )
+                    )
+                if not isinstance(self.callable, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'callable'. Expected 'str'. Found '{}'.".format(
+                            type(self.callable)
+                        )
+                    )
+                if not isinstance(self.kwargs, CustomKwargs):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'kwargs'. Expected 'Kwargs'. Found '{}'.".format(
+                            type(self.kwargs)
+                        )
+                    )
             elif (
                 self.performative == ContractApiMessage.Performative.GET_RAW_TRANSACTION
             ):
                 expected_nb_of_contents = 5
-                enforce(
-                    isinstance(self.ledger_id, str),
-                    "Invalid type for content 'ledger_id'. Expected 'str'. Found '{}'.".format(
-                        type(self.ledger_id)
-                    ),
-                )
-                enforce(
-                    isinstance(self.contract_id, str),
-                    "Invalid type for content 'contract_id'. Expected 'str'. Found '{}'.".format(
-                        type(self.contract_id)
-                    ),
-                )
-                enforce(
-                    isinstance(self.contract_address, str),
-                    "Invalid type for content 'contract_address'. Expected 'str'. Found '{}'.".format(
-                        type(self.contract_address)
-                    ),
-                )
-                enforce(
-                    isinstance(self.callable, str),
-                    "Invalid type for content 'callable'. Expected 'str'. Found '{}'.".format(
-                        type(self.callable)
-                    ),
-                )
-                enforce(
-                    isinstance(self.kwargs, CustomKwargs),
-                    "Invalid type for content 'kwargs'. Expected 'Kwargs'. Found '{}'.".format(
-                        type(self.kwargs)
-                    ),
-                )
+                if not isinstance(self.ledger_id, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'ledger_id'. Expected 'str'. Found '{}'.".format(
+                            type(self.ledger_id)
+                        )
+                    )
+                if not isinstance(self.contract_id, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'contract_id'. Expected 'str'. Found '{}'.".format(
+                            type(self.contract_id)
+                        )
+                    )
+                if not isinstance(self.contract_address, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'contract_address'. Expected 'str'. Found '{}'.".format(
+                            type(self.contract_address)
+                        )
+                    )
+                if not isinstance(self.callable, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'callable'. Expected 'str'. Found '{}'.".format(
+                            type(self.callable)
+                        )
+                    )
+                if not isinstance(self.kwargs, CustomKwargs):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'kwargs'. Expected 'Kwargs'. Found '{}'.".format(
+                            type(self.kwargs)
+                        )
+                    )
             elif self.performative == ContractApiMessage.Performative.GET_RAW_MESSAGE:
                 expected_nb_of_contents = 5
-                enforce(
-                    isinstance(self.ledger_id, str),
-                    "Invalid type for content 'ledger_id'. Expected 'str'. Found '{}'.".format(
-                        type(self.ledger_id)
-                    ),
-                )
-                enforce(
-                    isinstance(self.contract_id, str),
-                    "Invalid type for content 'contract_id'. Expected 'str'. Found '{}'.".format(
-                        type(self.contract_id)
-                    ),
-                )
-                enforce(
-                    isinstance(self.contract_address, str),
-                    "Invalid type for content 'contract_address'. Expected 'str'. Found '{}'.".format(
-                        type(self.contract_address)
-                    ),
-                )
-                enforce(
-                    isinstance(self.callable, str),
-                    "Invalid type for content 'callable'. Expected 'str'. Found '{}'.".format(
-                        type(self.callable)
-                    ),
-                )
-                enforce(
-                    isinstance(self.kwargs, CustomKwargs),
-                    "Invalid type for content 'kwargs'. Expected 'Kwargs'. Found '{}'.".format(
-                        type(self.kwargs)
-                    ),
-                )
+                if not isinstance(self.ledger_id, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'ledger_id'. Expected 'str'. Found '{}'.".format(
+                            type(self.ledger_id)
+                        )
+                    )
+                if not isinstance(self.contract_id, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'contract_id'. Expected 'str'. Found '{}'.".format(
+                            type(self.contract_id)
+                        )
+                    )
+                if not isinstance(self.contract_address, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'contract_address'. Expected 'str'. Found '{}'.".format(
+                            type(self.contract_address)
+                        )
+                    )
+                if not isinstance(self.callable, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'callable'. Expected 'str'. Found '{}'.".format(
+                            type(self.callable)
+                        )
+                    )
+                if not isinstance(self.kwargs, CustomKwargs):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'kwargs'. Expected 'Kwargs'. Found '{}'.".format(
+                            type(self.kwargs)
+                        )
+                    )
             elif self.performative == ContractApiMessage.Performative.GET_STATE:
                 expected_nb_of_contents = 5
-                enforce(
-                    isinstance(self.ledger_id, str),
-                    "Invalid type for content 'ledger_id'. Expected 'str'. Found '{}'.".format(
-                        type(self.ledger_id)
-                    ),
-                )
-                enforce(
-                    isinstance(self.contract_id, str),
-                    "Invalid type for content 'contract_id'. Expected 'str'. Found '{}'.".format(
-                        type(self.contract_id)
-                    ),
-                )
-                enforce(
-                    isinstance(self.contract_address, str),
-                    "Invalid type for content 'contract_address'. Expected 'str'. Found '{}'.".format(
-                        type(self.contract_address)
-                    ),
-                )
-                enforce(
-                    isinstance(self.callable, str),
-                    "Invalid type for content 'callable'. Expected 'str'. Found '{}'.".format(
-                        type(self.callable)
-                    ),
-                )
-                enforce(
-                    isinstance(self.kwargs, CustomKwargs),
-                    "Invalid type for content 'kwargs'. Expected 'Kwargs'. Found '{}'.".format(
-                        type(self.kwargs)
-                    ),
-                )
+                if not isinstance(self.ledger_id, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'ledger_id'. Expected 'str'. Found '{}'.".format(
+                            type(self.ledger_id)
+                        )
+                    )
+                if not isinstance(self.contract_id, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'contract_id'. Expected 'str'. Found '{}'.".format(
+                            type(self.contract_id)
+                        )
+                    )
+                if not isinstance(self.contract_address, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'contract_address'. Expected 'str'. Found '{}'.".format(
+                            type(self.contract_address)
+                        )
+                    )
+                if not isinstance(self.callable, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'callable'. Expected 'str'. Found '{}'.".format(
+                            type(self.callable)
+                        )
+                    )
+                if not isinstance(self.kwargs, CustomKwargs):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'kwargs'. Expected 'Kwargs'. Found '{}'.".format(
+                            type(self.kwargs)
+                        )
+                    )
             elif self.performative == ContractApiMessage.Performative.STATE:
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.state, CustomState),
-                    "Invalid type for content 'state'. Expected 'State'. Found '{}'.".format(
-                        type(self.state)
-                    ),
-                )
+                if not isinstance(self.state, CustomState):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'state'. Expected 'State'. Found '{}'.".format(
+                            type(self.state)
+                        )
+                    )
             elif self.performative == ContractApiMessage.Performative.RAW_TRANSACTION:
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.raw_transaction, CustomRawTransaction),
-                    "Invalid type for content 'raw_transaction'. Expected 'RawTransaction'. Found '{}'.".format(
-                        type(self.raw_transaction)
-                    ),
-                )
+                if not isinstance(self.raw_transaction, CustomRawTransaction):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'raw_transaction'. Expected 'RawTransaction'. Found '{}'.".format(
+                            type(self.raw_transaction)
+                        )
+                    )
             elif self.performative == ContractApiMessage.Performative.RAW_MESSAGE:
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.raw_message, CustomRawMessage),
-                    "Invalid type for content 'raw_message'. Expected 'RawMessage'. Found '{}'.".format(
-                        type(self.raw_message)
-                    ),
-                )
+                if not isinstance(self.raw_message, CustomRawMessage):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'raw_message'. Expected 'RawMessage'. Found '{}'.".format(
+                            type(self.raw_message)
+                        )
+                    )
             elif self.performative == ContractApiMessage.Performative.ERROR:
                 expected_nb_of_contents = 1
                 if self.is_set("code"):
                     expected_nb_of_contents += 1
                     code = cast(int, self.code)
-                    enforce(
-                        type(code) is int,
-                        "Invalid type for content 'code'. Expected 'int'. Found '{}'.".format(
-                            type(code)
-                        ),
-                    )
+                    if not (type(code) is int):
+                        raise AEAEnforceError(
+                            "Invalid type for content 'code'. Expected 'int'. Found '{}'.".format(
+                                type(code)
+                            )
+                        )
                 if self.is_set("message"):
                     expected_nb_of_contents += 1
                     message = cast(str, self.message)
-                    enforce(
-                        isinstance(message, str),
-                        "Invalid type for content 'message'. Expected 'str'. Found '{}'.".format(
-                            type(message)
-                        ),
+                    if not isinstance(message, str):
+                        raise AEAEnforceError(
+                            "Invalid type for content 'message'. Expected 'str'. Found '{}'.".format(
+                                type(message)
+                            )
+                        )
+                if not isinstance(self.data, bytes):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'data'. Expected 'bytes'. Found '{}'.".format(
+                            type(self.data)
+                        )
                     )
-                enforce(
-                    isinstance(self.data, bytes),
-                    "Invalid type for content 'data'. Expected 'bytes'. Found '{}'.".format(
-                        type(self.data)
-                    ),
-                )
 
             # Check correct content count
-            enforce(
-                expected_nb_of_contents == actual_nb_of_contents,
-                "Incorrect number of contents. Expected {}. Found {}".format(
-                    expected_nb_of_contents, actual_nb_of_contents
-                ),
-            )
+            if not (expected_nb_of_contents == actual_nb_of_contents):
+                raise AEAEnforceError(
+                    "Incorrect number of contents. Expected {}. Found {}".format(
+                        expected_nb_of_contents, actual_nb_of_contents
+                    )
+                )
 
             # Light Protocol Rule 3
             if self.message_id == 1:
-                enforce(
-                    self.target == 0,
-                    "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
-                        self.target
-                    ),
-                )
+                if not (self.target == 0):
+                    raise AEAEnforceError(
+                        "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
+                            self.target
+                        )
+                    )
         except (AEAEnforceError, ValueError, KeyError) as e:
             _default_logger.error(str(e))
             return False
@@ -22,7 +22,6 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
 from aea.mail.base_pb2 import Message as ProtobufMessage
 from aea.protocols.base import Message, Serializer
 
@@ -49,7 +48,7 @@ class ContractApiSerializer(Serializer):
         """
         msg = cast(ContractApiMessage, msg)
         message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
+        dialogue_message_pb = message_pb.dialogue_message
         contract_api_msg = contract_api_pb2.ContractApiMessage()
 
         dialogue_message_pb.message_id = msg.message_id
@@ -60,7 +59,8 @@ class ContractApiSerializer(Serializer):
 
         performative_id = msg.performative
         if performative_id == ContractApiMessage.Performative.GET_DEPLOY_TRANSACTION:
-            performative = contract_api_pb2.ContractApiMessage.Get_Deploy_Transaction_Performative()  # type: ignore
+            performative = contract_api_msg.get_deploy_transaction
+            performative.SetInParent()
             ledger_id = msg.ledger_id
             performative.ledger_id = ledger_id
             contract_id = msg.contract_id
@@ -69,9 +69,9 @@ class ContractApiSerializer(Serializer):
             performative.callable = callable
             kwargs = msg.kwargs
             Kwargs.encode(performative.kwargs, kwargs)
-            contract_api_msg.get_deploy_transaction.CopyFrom(performative)
         elif performative_id == ContractApiMessage.Performative.GET_RAW_TRANSACTION:
-            performative = contract_api_pb2.ContractApiMessage.Get_Raw_Transaction_Performative()  # type: ignore
+            performative = contract_api_msg.get_raw_transaction
+            performative.SetInParent()
             ledger_id = msg.ledger_id
             performative.ledger_id = ledger_id
             contract_id = msg.contract_id
@@ -82,9 +82,9 @@ class ContractApiSerializer(Serializer):
             performative.callable = callable
             kwargs = msg.kwargs
             Kwargs.encode(performative.kwargs, kwargs)
-            contract_api_msg.get_raw_transaction.CopyFrom(performative)
         elif performative_id == ContractApiMessage.Performative.GET_RAW_MESSAGE:
-            performative = contract_api_pb2.ContractApiMessage.Get_Raw_Message_Performative()  # type: ignore
+            performative = contract_api_msg.get_raw_message
+            performative.SetInParent()
             ledger_id = msg.ledger_id
             performative.ledger_id = ledger_id
             contract_id = msg.contract_id
@@ -95,9 +95,9 @@ class ContractApiSerializer(Serializer):
             performative.callable = callable
             kwargs = msg.kwargs
             Kwargs.encode(performative.kwargs, kwargs)
-            contract_api_msg.get_raw_message.CopyFrom(performative)
         elif performative_id == ContractApiMessage.Performative.GET_STATE:
-            performative = contract_api_pb2.ContractApiMessage.Get_State_Performative()  # type: ignore
+            performative = contract_api_msg.get_state
+            performative.SetInParent()
             ledger_id = msg.ledger_id
             performative.ledger_id = ledger_id
             contract_id = msg.contract_id
@@ -108,24 +108,24 @@ class ContractApiSerializer(Serializer):
             performative.callable = callable
             kwargs = msg.kwargs
             Kwargs.encode(performative.kwargs, kwargs)
-            contract_api_msg.get_state.CopyFrom(performative)
         elif performative_id == ContractApiMessage.Performative.STATE:
-            performative = contract_api_pb2.ContractApiMessage.State_Performative()  # type: ignore
+            performative = contract_api_msg.state
+            performative.SetInParent()
             state = msg.state
             State.encode(performative.state, state)
-            contract_api_msg.state.CopyFrom(performative)
         elif performative_id == ContractApiMessage.Performative.RAW_TRANSACTION:
-            performative = contract_api_pb2.ContractApiMessage.Raw_Transaction_Performative()  # type: ignore
+            performative = contract_api_msg.raw_transaction
+            performative.SetInParent()
             raw_transaction = msg.raw_transaction
             RawTransaction.encode(performative.raw_transaction, raw_transaction)
-            contract_api_msg.raw_transaction.CopyFrom(performative)
         elif performative_id == ContractApiMessage.Performative.RAW_MESSAGE:
-            performative = contract_api_pb2.ContractApiMessage.Raw_Message_Performative()  # type: ignore
+            performative = contract_api_msg.raw_message
+            performative.SetInParent()
             raw_message = msg.raw_message
             RawMessage.encode(performative.raw_message, raw_message)
-            contract_api_msg.raw_message.CopyFrom(performative)
         elif performative_id == ContractApiMessage.Performative.ERROR:
-            performative = contract_api_pb2.ContractApiMessage.Error_Performative()  # type: ignore
+            performative = contract_api_msg.error
+            performative.SetInParent()
             if msg.is_set("code"):
                 performative.code_is_set = True
                 code = msg.code
@@ -136,13 +136,11 @@ class ContractApiSerializer(Serializer):
                 performative.message = message
             data = msg.data
             performative.data = data
-            contract_api_msg.error.CopyFrom(performative)
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
         dialogue_message_pb.content = contract_api_msg.SerializeToString()
 
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
         message_bytes = message_pb.SerializeToString()
         return message_bytes
 
@@ -243,5 +241,6 @@ class ContractApiSerializer(Serializer):
             dialogue_reference=dialogue_reference,
             target=target,
             performative=performative,
+            _check_consistency=ContractApiMessage.check_consistency_on_decode,
             **performative_content
         )
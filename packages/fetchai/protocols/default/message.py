@@ -149,109 +149,109 @@ class DefaultMessage(Message):
     def _is_consistent(self) -> bool:
         """Check that the message follows the default protocol."""
         try:
-            enforce(
-                isinstance(self.dialogue_reference, tuple),
-                "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
-                    type(self.dialogue_reference)
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[0], str),
-                "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[0])
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[1], str),
-                "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[1])
-                ),
-            )
-            enforce(
-                type(self.message_id) is int,
-                "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
-                    type(self.message_id)
-                ),
-            )
-            enforce(
-                type(self.target) is int,
-                "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
-                    type(self.target)
-                ),
-            )
+            if not isinstance(self.dialogue_reference, tuple):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.dialogue_reference)
+                    )
+                )
+            if not isinstance(self.dialogue_reference[0], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[0])
+                    )
+                )
+            if not isinstance(self.dialogue_reference[1], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[1])
+                    )
+                )
+            if not (type(self.message_id) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
+                        type(self.message_id)
+                    )
+                )
+            if not (type(self.target) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
+                        type(self.target)
+                    )
+                )
 
             # Light Protocol Rule 2
             # Check correct performative
-            enforce(
-                isinstance(self.performative, DefaultMessage.Performative),
-                "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
-                    self.valid_performatives, self.performative
-                ),
-            )
+            if not isinstance(self.performative, DefaultMessage.Performative):
+                raise AEAEnforceError(
+                    "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
+                        self.valid_performatives, self.performative
+                    )
+                )
 
             # Check correct contents
             actual_nb_of_contents = len(self._body) - DEFAULT_BODY_SIZE
             expected_nb_of_contents = 0
             if self.performative == DefaultMessage.Performative.BYTES:
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.content, bytes),
-                    "Invalid type for content 'content'. Expected 'bytes'. Found '{}'.".format(
-                        type(self.content)
-                    ),
-                )
+                if not isinstance(self.content, bytes):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content'. Expected 'bytes'. Found '{}'.".format(
+                            type(self.content)
+                        )
+                    )
             elif self.performative == DefaultMessage.Performative.ERROR:
                 expected_nb_of_contents = 3
-                enforce(
-                    isinstance(self.error_code, CustomErrorCode),
-                    "Invalid type for content 'error_code'. Expected 'ErrorCode'. Found '{}'.".format(
-                        type(self.error_code)
-                    ),
-                )
-                enforce(
-                    isinstance(self.error_msg, str),
-                    "Invalid type for content 'error_msg'. Expected 'str'. Found '{}'.".format(
-                        type(self.error_msg)
-                    ),
-                )
-                enforce(
-                    isinstance(self.error_data, dict),
-                    "Invalid type for content 'error_data'. Expected 'dict'. Found '{}'.".format(
-                        type(self.error_data)
-                    ),
-                )
-                for key_of_error_data, value_of_error_data in self.error_data.items():
-                    enforce(
-                        isinstance(key_of_error_data, str),
-                        "Invalid type for dictionary keys in content 'error_data'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_error_data)
-                        ),
+                if not isinstance(self.error_code, CustomErrorCode):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'error_code'. Expected 'ErrorCode'. Found '{}'.".format(
+                            type(self.error_code)
+                        )
                     )
-                    enforce(
-                        isinstance(value_of_error_data, bytes),
-                        "Invalid type for dictionary values in content 'error_data'. Expected 'bytes'. Found '{}'.".format(
-                            type(value_of_error_data)
-                        ),
+                if not isinstance(self.error_msg, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'error_msg'. Expected 'str'. Found '{}'.".format(
+                            type(self.error_msg)
+                        )
                     )
+                if not isinstance(self.error_data, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'error_data'. Expected 'dict'. Found '{}'.".format(
+                            type(self.error_data)
+                        )
+                    )
+                for key_of_error_data, value_of_error_data in self.error_data.items():
+                    if not isinstance(key_of_error_data, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'error_data'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_error_data)
+                            )
+                        )
+                    if not isinstance(value_of_error_data, bytes):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'error_data'. Expected 'bytes'. Found '{}'.".format(
+                                type(value_of_error_data)
+                            )
+                        )
             elif self.performative == DefaultMessage.Performative.END:
                 expected_nb_of_contents = 0
 
             # Check correct content count
-            enforce(
-                expected_nb_of_contents == actual_nb_of_contents,
-                "Incorrect number of contents. Expected {}. Found {}".format(
-                    expected_nb_of_contents, actual_nb_of_contents
-                ),
-            )
+            if not (expected_nb_of_contents == actual_nb_of_contents):
+                raise AEAEnforceError(
+                    "Incorrect number of contents. Expected {}. Found {}".format(
+                        expected_nb_of_contents, actual_nb_of_contents
+                    )
+                )
 
             # Light Protocol Rule 3
             if self.message_id == 1:
-                enforce(
-                    self.target == 0,
-                    "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
-                        self.target
-                    ),
-                )
+                if not (self.target == 0):
+                    raise AEAEnforceError(
+                        "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
+                            self.target
+                        )
+                    )
         except (AEAEnforceError, ValueError, KeyError) as e:
             _default_logger.error(str(e))
             return False
@@ -22,7 +22,6 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
 from aea.mail.base_pb2 import Message as ProtobufMessage
 from aea.protocols.base import Message, Serializer
 
@@ -44,7 +43,7 @@ class DefaultSerializer(Serializer):
         """
         msg = cast(DefaultMessage, msg)
         message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
+        dialogue_message_pb = message_pb.dialogue_message
         default_msg = default_pb2.DefaultMessage()
 
         dialogue_message_pb.message_id = msg.message_id
@@ -55,28 +54,27 @@ class DefaultSerializer(Serializer):
 
         performative_id = msg.performative
         if performative_id == DefaultMessage.Performative.BYTES:
-            performative = default_pb2.DefaultMessage.Bytes_Performative()  # type: ignore
+            performative = default_msg.bytes
+            performative.SetInParent()
             content = msg.content
             performative.content = content
-            default_msg.bytes.CopyFrom(performative)
         elif performative_id == DefaultMessage.Performative.ERROR:
-            performative = default_pb2.DefaultMessage.Error_Performative()  # type: ignore
+            performative = default_msg.error
+            performative.SetInParent()
             error_code = msg.error_code
             ErrorCode.encode(performative.error_code, error_code)
             error_msg = msg.error_msg
             performative.error_msg = error_msg
             error_data = msg.error_data
             performative.error_data.update(error_data)
-            default_msg.error.CopyFrom(performative)
         elif performative_id == DefaultMessage.Performative.END:
-            performative = default_pb2.DefaultMessage.End_Performative()  # type: ignore
-            default_msg.end.CopyFrom(performative)
+            performative = default_msg.end
+            performative.SetInParent()
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
         dialogue_message_pb.content = default_msg.SerializeToString()
 
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
         message_bytes = message_pb.SerializeToString()
         return message_bytes
 
@@ -124,5 +122,6 @@ class DefaultSerializer(Serializer):
             dialogue_reference=dialogue_reference,
             target=target,
             performative=performative,
+            _check_consistency=DefaultMessage.check_consistency_on_decode,
             **performative_content
         )
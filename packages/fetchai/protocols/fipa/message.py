@@ -163,128 +163,128 @@ class FipaMessage(Message):
     def _is_consistent(self) -> bool:
         """Check that the message follows the fipa protocol."""
         try:
-            enforce(
-                isinstance(self.dialogue_reference, tuple),
-                "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
-                    type(self.dialogue_reference)
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[0], str),
-                "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[0])
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[1], str),
-                "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[1])
-                ),
-            )
-            enforce(
-                type(self.message_id) is int,
-                "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
-                    type(self.message_id)
-                ),
-            )
-            enforce(
-                type(self.target) is int,
-                "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
-                    type(self.target)
-                ),
-            )
+            if not isinstance(self.dialogue_reference, tuple):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.dialogue_reference)
+                    )
+                )
+            if not isinstance(self.dialogue_reference[0], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[0])
+                    )
+                )
+            if not isinstance(self.dialogue_reference[1], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[1])
+                    )
+                )
+            if not (type(self.message_id) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
+                        type(self.message_id)
+                    )
+                )
+            if not (type(self.target) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
+                        type(self.target)
+                    )
+                )
 
             # Light Protocol Rule 2
             # Check correct performative
-            enforce(
-                isinstance(self.performative, FipaMessage.Performative),
-                "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
-                    self.valid_performatives, self.performative
-                ),
-            )
+            if not isinstance(self.performative, FipaMessage.Performative):
+                raise AEAEnforceError(
+                    "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
+                        self.valid_performatives, self.performative
+                    )
+                )
 
             # Check correct contents
             actual_nb_of_contents = len(self._body) - DEFAULT_BODY_SIZE
             expected_nb_of_contents = 0
             if self.performative == FipaMessage.Performative.CFP:
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.query, CustomQuery),
-                    "Invalid type for content 'query'. Expected 'Query'. Found '{}'.".format(
-                        type(self.query)
-                    ),
-                )
+                if not isinstance(self.query, CustomQuery):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'query'. Expected 'Query'. Found '{}'.".format(
+                            type(self.query)
+                        )
+                    )
             elif self.performative == FipaMessage.Performative.PROPOSE:
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.proposal, CustomDescription),
-                    "Invalid type for content 'proposal'. Expected 'Description'. Found '{}'.".format(
-                        type(self.proposal)
-                    ),
-                )
+                if not isinstance(self.proposal, CustomDescription):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'proposal'. Expected 'Description'. Found '{}'.".format(
+                            type(self.proposal)
+                        )
+                    )
             elif self.performative == FipaMessage.Performative.ACCEPT_W_INFORM:
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.info, dict),
-                    "Invalid type for content 'info'. Expected 'dict'. Found '{}'.".format(
-                        type(self.info)
-                    ),
-                )
-                for key_of_info, value_of_info in self.info.items():
-                    enforce(
-                        isinstance(key_of_info, str),
-                        "Invalid type for dictionary keys in content 'info'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_info)
-                        ),
-                    )
-                    enforce(
-                        isinstance(value_of_info, str),
-                        "Invalid type for dictionary values in content 'info'. Expected 'str'. Found '{}'.".format(
-                            type(value_of_info)
-                        ),
+                if not isinstance(self.info, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'info'. Expected 'dict'. Found '{}'.".format(
+                            type(self.info)
+                        )
                     )
+                for key_of_info, value_of_info in self.info.items():
+                    if not isinstance(key_of_info, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'info'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_info)
+                            )
+                        )
+                    if not isinstance(value_of_info, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'info'. Expected 'str'. Found '{}'.".format(
+                                type(value_of_info)
+                            )
+                        )
             elif self.performative == FipaMessage.Performative.MATCH_ACCEPT_W_INFORM:
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.info, dict),
-                    "Invalid type for content 'info'. Expected 'dict'. Found '{}'.".format(
-                        type(self.info)
-                    ),
-                )
-                for key_of_info, value_of_info in self.info.items():
-                    enforce(
-                        isinstance(key_of_info, str),
-                        "Invalid type for dictionary keys in content 'info'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_info)
-                        ),
-                    )
-                    enforce(
-                        isinstance(value_of_info, str),
-                        "Invalid type for dictionary values in content 'info'. Expected 'str'. Found '{}'.".format(
-                            type(value_of_info)
-                        ),
+                if not isinstance(self.info, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'info'. Expected 'dict'. Found '{}'.".format(
+                            type(self.info)
+                        )
                     )
+                for key_of_info, value_of_info in self.info.items():
+                    if not isinstance(key_of_info, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'info'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_info)
+                            )
+                        )
+                    if not isinstance(value_of_info, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'info'. Expected 'str'. Found '{}'.".format(
+                                type(value_of_info)
+                            )
+                        )
             elif self.performative == FipaMessage.Performative.INFORM:
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.info, dict),
-                    "Invalid type for content 'info'. Expected 'dict'. Found '{}'.".format(
-                        type(self.info)
-                    ),
-                )
-                for key_of_info, value_of_info in self.info.items():
-                    enforce(
-                        isinstance(key_of_info, str),
-                        "Invalid type for dictionary keys in content 'info'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_info)
-                        ),
-                    )
-                    enforce(
-                        isinstance(value_of_info, str),
-                        "Invalid type for dictionary values in content 'info'. Expected 'str'. Found '{}'.".format(
-                            type(value_of_info)
-                        ),
+                if not isinstance(self.info, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'info'. Expected 'dict'. Found '{}'.".format(
+                            type(self.info)
+                        )
                     )
+                for key_of_info, value_of_info in self.info.items():
+                    if not isinstance(key_of_info, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'info'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_info)
+                            )
+                        )
+                    if not isinstance(value_of_info, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'info'. Expected 'str'. Found '{}'.".format(
+                                type(value_of_info)
+                            )
+                        )
             elif self.performative == FipaMessage.Performative.ACCEPT:
                 expected_nb_of_contents = 0
             elif self.performative == FipaMessage.Performative.DECLINE:
@@ -295,21 +295,21 @@ class FipaMessage(Message):
                 expected_nb_of_contents = 0
 
             # Check correct content count
-            enforce(
-                expected_nb_of_contents == actual_nb_of_contents,
-                "Incorrect number of contents. Expected {}. Found {}".format(
-                    expected_nb_of_contents, actual_nb_of_contents
-                ),
-            )
+            if not (expected_nb_of_contents == actual_nb_of_contents):
+                raise AEAEnforceError(
+                    "Incorrect number of contents. Expected {}. Found {}".format(
+                        expected_nb_of_contents, actual_nb_of_contents
+                    )
+                )
 
             # Light Protocol Rule 3
             if self.message_id == 1:
-                enforce(
-                    self.target == 0,
-                    "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
-                        self.target
-                    ),
-                )
+                if not (self.target == 0):
+                    raise AEAEnforceError(
+                        "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
+                            self.target
+                        )
+                    )
         except (AEAEnforceError, ValueError, KeyError) as e:
             _default_logger.error(str(e))
             return False
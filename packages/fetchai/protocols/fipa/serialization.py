@@ -22,7 +22,6 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
 from aea.mail.base_pb2 import Message as ProtobufMessage
 from aea.protocols.base import Message, Serializer
 
@@ -44,7 +43,7 @@ class FipaSerializer(Serializer):
         """
         msg = cast(FipaMessage, msg)
         message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
+        dialogue_message_pb = message_pb.dialogue_message
         fipa_msg = fipa_pb2.FipaMessage()
 
         dialogue_message_pb.message_id = msg.message_id
@@ -55,48 +54,47 @@ class FipaSerializer(Serializer):
 
         performative_id = msg.performative
         if performative_id == FipaMessage.Performative.CFP:
-            performative = fipa_pb2.FipaMessage.Cfp_Performative()  # type: ignore
+            performative = fipa_msg.cfp
+            performative.SetInParent()
             query = msg.query
             Query.encode(performative.query, query)
-            fipa_msg.cfp.CopyFrom(performative)
         elif performative_id == FipaMessage.Performative.PROPOSE:
-            performative = fipa_pb2.FipaMessage.Propose_Performative()  # type: ignore
+            performative = fipa_msg.propose
+            performative.SetInParent()
             proposal = msg.proposal
             Description.encode(performative.proposal, proposal)
-            fipa_msg.propose.CopyFrom(performative)
         elif performative_id == FipaMessage.Performative.ACCEPT_W_INFORM:
-            performative = fipa_pb2.FipaMessage.Accept_W_Inform_Performative()  # type: ignore
+            performative = fipa_msg.accept_w_inform
+            performative.SetInParent()
             info = msg.info
             performative.info.update(info)
-            fipa_msg.accept_w_inform.CopyFrom(performative)
         elif performative_id == FipaMessage.Performative.MATCH_ACCEPT_W_INFORM:
-            performative = fipa_pb2.FipaMessage.Match_Accept_W_Inform_Performative()  # type: ignore
+            performative = fipa_msg.match_accept_w_inform
+            performative.SetInParent()
             info = msg.info
             performative.info.update(info)
-            fipa_msg.match_accept_w_inform.CopyFrom(performative)
         elif performative_id == FipaMessage.Performative.INFORM:
-            performative = fipa_pb2.FipaMessage.Inform_Performative()  # type: ignore
+            performative = fipa_msg.inform
+            performative.SetInParent()
             info = msg.info
             performative.info.update(info)
-            fipa_msg.inform.CopyFrom(performative)
         elif performative_id == FipaMessage.Performative.ACCEPT:
-            performative = fipa_pb2.FipaMessage.Accept_Performative()  # type: ignore
-            fipa_msg.accept.CopyFrom(performative)
+            performative = fipa_msg.accept
+            performative.SetInParent()
         elif performative_id == FipaMessage.Performative.DECLINE:
-            performative = fipa_pb2.FipaMessage.Decline_Performative()  # type: ignore
-            fipa_msg.decline.CopyFrom(performative)
+            performative = fipa_msg.decline
+            performative.SetInParent()
         elif performative_id == FipaMessage.Performative.MATCH_ACCEPT:
-            performative = fipa_pb2.FipaMessage.Match_Accept_Performative()  # type: ignore
-            fipa_msg.match_accept.CopyFrom(performative)
+            performative = fipa_msg.match_accept
+            performative.SetInParent()
         elif performative_id == FipaMessage.Performative.END:
-            performative = fipa_pb2.FipaMessage.End_Performative()  # type: ignore
-            fipa_msg.end.CopyFrom(performative)
+            performative = fipa_msg.end
+            performative.SetInParent()
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
         dialogue_message_pb.content = fipa_msg.SerializeToString()
 
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
         message_bytes = message_pb.SerializeToString()
         return message_bytes
 
@@ -158,5 +156,6 @@ class FipaSerializer(Serializer):
             dialogue_reference=dialogue_reference,
             target=target,
             performative=performative,
+            _check_consistency=FipaMessage.check_consistency_on_decode,
             **performative_content
         )
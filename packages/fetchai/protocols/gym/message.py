@@ -172,137 +172,137 @@ class GymMessage(Message):
     def _is_consistent(self) -> bool:
         """Check that the message follows the gym protocol."""
         try:
-            enforce(
-                isinstance(self.dialogue_reference, tuple),
-                "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
-                    type(self.dialogue_reference)
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[0], str),
-                "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[0])
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[1], str),
-                "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[1])
-                ),
-            )
-            enforce(
-                type(self.message_id) is int,
-                "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
-                    type(self.message_id)
-                ),
-            )
-            enforce(
-                type(self.target) is int,
-                "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
-                    type(self.target)
-                ),
-            )
+            if not isinstance(self.dialogue_reference, tuple):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.dialogue_reference)
+                    )
+                )
+            if not isinstance(self.dialogue_reference[0], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[0])
+                    )
+                )
+            if not isinstance(self.dialogue_reference[1], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[1])
+                    )
+                )
+            if not (type(self.message_id) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
+                        type(self.message_id)
+                    )
+                )
+            if not (type(self.target) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
+                        type(self.target)
+                    )
+                )
 
             # Light Protocol Rule 2
             # Check correct performative
-            enforce(
-                isinstance(self.performative, GymMessage.Performative),
-                "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
-                    self.valid_performatives, self.performative
-                ),
-            )
+            if not isinstance(self.performative, GymMessage.Performative):
+                raise AEAEnforceError(
+                    "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
+                        self.valid_performatives, self.performative
+                    )
+                )
 
             # Check correct contents
             actual_nb_of_contents = len(self._body) - DEFAULT_BODY_SIZE
             expected_nb_of_contents = 0
             if self.performative == GymMessage.Performative.ACT:
                 expected_nb_of_contents = 2
-                enforce(
-                    isinstance(self.action, CustomAnyObject),
-                    "Invalid type for content 'action'. Expected 'AnyObject'. Found '{}'.".format(
-                        type(self.action)
-                    ),
-                )
-                enforce(
-                    type(self.step_id) is int,
-                    "Invalid type for content 'step_id'. Expected 'int'. Found '{}'.".format(
-                        type(self.step_id)
-                    ),
-                )
+                if not isinstance(self.action, CustomAnyObject):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'action'. Expected 'AnyObject'. Found '{}'.".format(
+                            type(self.action)
+                        )
+                    )
+                if not (type(self.step_id) is int):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'step_id'. Expected 'int'. Found '{}'.".format(
+                            type(self.step_id)
+                        )
+                    )
             elif self.performative == GymMessage.Performative.PERCEPT:
                 expected_nb_of_contents = 5
-                enforce(
-                    type(self.step_id) is int,
-                    "Invalid type for content 'step_id'. Expected 'int'. Found '{}'.".format(
-                        type(self.step_id)
-                    ),
-                )
-                enforce(
-                    isinstance(self.observation, CustomAnyObject),
-                    "Invalid type for content 'observation'. Expected 'AnyObject'. Found '{}'.".format(
-                        type(self.observation)
-                    ),
-                )
-                enforce(
-                    isinstance(self.reward, float),
-                    "Invalid type for content 'reward'. Expected 'float'. Found '{}'.".format(
-                        type(self.reward)
-                    ),
-                )
-                enforce(
-                    isinstance(self.done, bool),
-                    "Invalid type for content 'done'. Expected 'bool'. Found '{}'.".format(
-                        type(self.done)
-                    ),
-                )
-                enforce(
-                    isinstance(self.info, CustomAnyObject),
-                    "Invalid type for content 'info'. Expected 'AnyObject'. Found '{}'.".format(
-                        type(self.info)
-                    ),
-                )
+                if not (type(self.step_id) is int):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'step_id'. Expected 'int'. Found '{}'.".format(
+                            type(self.step_id)
+                        )
+                    )
+                if not isinstance(self.observation, CustomAnyObject):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'observation'. Expected 'AnyObject'. Found '{}'.".format(
+                            type(self.observation)
+                        )
+                    )
+                if not isinstance(self.reward, float):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'reward'. Expected 'float'. Found '{}'.".format(
+                            type(self.reward)
+                        )
+                    )
+                if not isinstance(self.done, bool):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'done'. Expected 'bool'. Found '{}'.".format(
+                            type(self.done)
+                        )
+                    )
+                if not isinstance(self.info, CustomAnyObject):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'info'. Expected 'AnyObject'. Found '{}'.".format(
+                            type(self.info)
+                        )
+                    )
             elif self.performative == GymMessage.Performative.STATUS:
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.content, dict),
-                    "Invalid type for content 'content'. Expected 'dict'. Found '{}'.".format(
-                        type(self.content)
-                    ),
-                )
-                for key_of_content, value_of_content in self.content.items():
-                    enforce(
-                        isinstance(key_of_content, str),
-                        "Invalid type for dictionary keys in content 'content'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_content)
-                        ),
-                    )
-                    enforce(
-                        isinstance(value_of_content, str),
-                        "Invalid type for dictionary values in content 'content'. Expected 'str'. Found '{}'.".format(
-                            type(value_of_content)
-                        ),
+                if not isinstance(self.content, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content'. Expected 'dict'. Found '{}'.".format(
+                            type(self.content)
+                        )
                     )
+                for key_of_content, value_of_content in self.content.items():
+                    if not isinstance(key_of_content, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'content'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_content)
+                            )
+                        )
+                    if not isinstance(value_of_content, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'content'. Expected 'str'. Found '{}'.".format(
+                                type(value_of_content)
+                            )
+                        )
             elif self.performative == GymMessage.Performative.RESET:
                 expected_nb_of_contents = 0
             elif self.performative == GymMessage.Performative.CLOSE:
                 expected_nb_of_contents = 0
 
             # Check correct content count
-            enforce(
-                expected_nb_of_contents == actual_nb_of_contents,
-                "Incorrect number of contents. Expected {}. Found {}".format(
-                    expected_nb_of_contents, actual_nb_of_contents
-                ),
-            )
+            if not (expected_nb_of_contents == actual_nb_of_contents):
+                raise AEAEnforceError(
+                    "Incorrect number of contents. Expected {}. Found {}".format(
+                        expected_nb_of_contents, actual_nb_of_contents
+                    )
+                )
 
             # Light Protocol Rule 3
             if self.message_id == 1:
-                enforce(
-                    self.target == 0,
-                    "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
-                        self.target
-                    ),
-                )
+                if not (self.target == 0):
+                    raise AEAEnforceError(
+                        "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
+                            self.target
+                        )
+                    )
         except (AEAEnforceError, ValueError, KeyError) as e:
             _default_logger.error(str(e))
             return False
@@ -22,7 +22,6 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
 from aea.mail.base_pb2 import Message as ProtobufMessage
 from aea.protocols.base import Message, Serializer
 
@@ -44,7 +43,7 @@ class GymSerializer(Serializer):
         """
         msg = cast(GymMessage, msg)
         message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
+        dialogue_message_pb = message_pb.dialogue_message
         gym_msg = gym_pb2.GymMessage()
 
         dialogue_message_pb.message_id = msg.message_id
@@ -55,14 +54,15 @@ class GymSerializer(Serializer):
 
         performative_id = msg.performative
         if performative_id == GymMessage.Performative.ACT:
-            performative = gym_pb2.GymMessage.Act_Performative()  # type: ignore
+            performative = gym_msg.act
+            performative.SetInParent()
             action = msg.action
             AnyObject.encode(performative.action, action)
             step_id = msg.step_id
             performative.step_id = step_id
-            gym_msg.act.CopyFrom(performative)
         elif performative_id == GymMessage.Performative.PERCEPT:
-            performative = gym_pb2.GymMessage.Percept_Performative()  # type: ignore
+            performative = gym_msg.percept
+            performative.SetInParent()
             step_id = msg.step_id
             performative.step_id = step_id
             observation = msg.observation
@@ -73,24 +73,22 @@ class GymSerializer(Serializer):
             performative.done = done
             info = msg.info
             AnyObject.encode(performative.info, info)
-            gym_msg.percept.CopyFrom(performative)
         elif performative_id == GymMessage.Performative.STATUS:
-            performative = gym_pb2.GymMessage.Status_Performative()  # type: ignore
+            performative = gym_msg.status
+            performative.SetInParent()
             content = msg.content
             performative.content.update(content)
-            gym_msg.status.CopyFrom(performative)
         elif performative_id == GymMessage.Performative.RESET:
-            performative = gym_pb2.GymMessage.Reset_Performative()  # type: ignore
-            gym_msg.reset.CopyFrom(performative)
+            performative = gym_msg.reset
+            performative.SetInParent()
         elif performative_id == GymMessage.Performative.CLOSE:
-            performative = gym_pb2.GymMessage.Close_Performative()  # type: ignore
-            gym_msg.close.CopyFrom(performative)
+            performative = gym_msg.close
+            performative.SetInParent()
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
         dialogue_message_pb.content = gym_msg.SerializeToString()
 
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
         message_bytes = message_pb.SerializeToString()
         return message_bytes
 
@@ -151,5 +149,6 @@ class GymSerializer(Serializer):
             dialogue_reference=dialogue_reference,
             target=target,
             performative=performative,
+            _check_consistency=GymMessage.check_consistency_on_decode,
             **performative_content
         )
@@ -165,130 +165,130 @@ class HttpMessage(Message):
     def _is_consistent(self) -> bool:
         """Check that the message follows the http protocol."""
         try:
-            enforce(
-                isinstance(self.dialogue_reference, tuple),
-                "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
-                    type(self.dialogue_reference)
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[0], str),
-                "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[0])
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[1], str),
-                "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[1])
-                ),
-            )
-            enforce(
-                type(self.message_id) is int,
-                "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
-                    type(self.message_id)
-                ),
-            )
-            enforce(
-                type(self.target) is int,
-                "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
-                    type(self.target)
-                ),
-            )
+            if not isinstance(self.dialogue_reference, tuple):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.dialogue_reference)
+                    )
+                )
+            if not isinstance(self.dialogue_reference[0], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[0])
+                    )
+                )
+            if not isinstance(self.dialogue_reference[1], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[1])
+                    )
+                )
+            if not (type(self.message_id) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
+                        type(self.message_id)
+                    )
+                )
+            if not (type(self.target) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
+                        type(self.target)
+                    )
+                )
 
             # Light Protocol Rule 2
             # Check correct performative
-            enforce(
-                isinstance(self.performative, HttpMessage.Performative),
-                "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
-                    self.valid_performatives, self.performative
-                ),
-            )
+            if not isinstance(self.performative, HttpMessage.Performative):
+                raise AEAEnforceError(
+                    "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
+                        self.valid_performatives, self.performative
+                    )
+                )
 
             # Check correct contents
             actual_nb_of_contents = len(self._body) - DEFAULT_BODY_SIZE
             expected_nb_of_contents = 0
             if self.performative == HttpMessage.Performative.REQUEST:
                 expected_nb_of_contents = 5
-                enforce(
-                    isinstance(self.method, str),
-                    "Invalid type for content 'method'. Expected 'str'. Found '{}'.".format(
-                        type(self.method)
-                    ),
-                )
-                enforce(
-                    isinstance(self.url, str),
-                    "Invalid type for content 'url'. Expected 'str'. Found '{}'.".format(
-                        type(self.url)
-                    ),
-                )
-                enforce(
-                    isinstance(self.version, str),
-                    "Invalid type for content 'version'. Expected 'str'. Found '{}'.".format(
-                        type(self.version)
-                    ),
-                )
-                enforce(
-                    isinstance(self.headers, str),
-                    "Invalid type for content 'headers'. Expected 'str'. Found '{}'.".format(
-                        type(self.headers)
-                    ),
-                )
-                enforce(
-                    isinstance(self.body, bytes),
-                    "Invalid type for content 'body'. Expected 'bytes'. Found '{}'.".format(
-                        type(self.body)
-                    ),
-                )
+                if not isinstance(self.method, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'method'. Expected 'str'. Found '{}'.".format(
+                            type(self.method)
+                        )
+                    )
+                if not isinstance(self.url, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'url'. Expected 'str'. Found '{}'.".format(
+                            type(self.url)
+                        )
+                    )
+                if not isinstance(self.version, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'version'. Expected 'str'. Found '{}'.".format(
+                            type(self.version)
+                        )
+                    )
+                if not isinstance(self.headers, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'headers'. Expected 'str'. Found '{}'.".format(
+                            type(self.headers)
+                        )
+                    )
+                if not isinstance(self.body, bytes):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'body'. Expected 'bytes'. Found '{}'.".format(
+                            type(self.body)
+                        )
+                    )
             elif self.performative == HttpMessage.Performative.RESPONSE:
                 expected_nb_of_contents = 5
-                enforce(
-                    isinstance(self.version, str),
-                    "Invalid type for content 'version'. Expected 'str'. Found '{}'.".format(
-                        type(self.version)
-                    ),
-                )
-                enforce(
-                    type(self.status_code) is int,
-                    "Invalid type for content 'status_code'. Expected 'int'. Found '{}'.".format(
-                        type(self.status_code)
-                    ),
-                )
-                enforce(
-                    isinstance(self.status_text, str),
-                    "Invalid type for content 'status_text'. Expected 'str'. Found '{}'.".format(
-                        type(self.status_text)
-                    ),
-                )
-                enforce(
-                    isinstance(self.headers, str),
-                    "Invalid type for content 'headers'. Expected 'str'. Found '{}'.".format(
-                        type(self.headers)
-                    ),
-                )
-                enforce(
-                    isinstance(self.body, bytes),
-                    "Invalid type for content 'body'. Expected 'bytes'. Found '{}'.".format(
-                        type(self.body)
-                    ),
-                )
+                if not isinstance(self.version, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'version'. Expected 'str'. Found '{}'.".format(
+                            type(self.version)
+                        )
+                    )
+                if not (type(self.status_code) is int):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'status_code'. Expected 'int'. Found '{}'.".format(
+                            type(self.status_code)
+                        )
+                    )
+                if not isinstance(self.status_text, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'status_text'. Expected 'str'. Found '{}'.".format(
+                            type(self.status_text)
+                        )
+                    )
+                if not isinstance(self.headers, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'headers'. Expected 'str'. Found '{}'.".format(
+                            type(self.headers)
+                        )
+                    )
+                if not isinstance(self.body, bytes):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'body'. Expected 'bytes'. Found '{}'.".format(
+                            type(self.body)
+                        )
+                    )
 
             # Check correct content count
-            enforce(
-                expected_nb_of_contents == actual_nb_of_contents,
-                "Incorrect number of contents. Expected {}. Found {}".format(
-                    expected_nb_of_contents, actual_nb_of_contents
-                ),
-            )
+            if not (expected_nb_of_contents == actual_nb_of_contents):
+                raise AEAEnforceError(
+                    "Incorrect number of contents. Expected {}. Found {}".format(
+                        expected_nb_of_contents, actual_nb_of_contents
+                    )
+                )
 
             # Light Protocol Rule 3
             if self.message_id == 1:
-                enforce(
-                    self.target == 0,
-                    "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
-                        self.target
-                    ),
-                )
+                if not (self.target == 0):
+                    raise AEAEnforceError(
+                        "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
+                            self.target
+                        )
+                    )
         except (AEAEnforceError, ValueError, KeyError) as e:
             _default_logger.error(str(e))
             return False
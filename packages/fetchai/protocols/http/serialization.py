@@ -22,7 +22,6 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
 from aea.mail.base_pb2 import Message as ProtobufMessage
 from aea.protocols.base import Message, Serializer
 
@@ -43,7 +42,7 @@ class HttpSerializer(Serializer):
         """
         msg = cast(HttpMessage, msg)
         message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
+        dialogue_message_pb = message_pb.dialogue_message
         http_msg = http_pb2.HttpMessage()
 
         dialogue_message_pb.message_id = msg.message_id
@@ -54,7 +53,8 @@ class HttpSerializer(Serializer):
 
         performative_id = msg.performative
         if performative_id == HttpMessage.Performative.REQUEST:
-            performative = http_pb2.HttpMessage.Request_Performative()  # type: ignore
+            performative = http_msg.request
+            performative.SetInParent()
             method = msg.method
             performative.method = method
             url = msg.url
@@ -65,9 +65,9 @@ class HttpSerializer(Serializer):
             performative.headers = headers
             body = msg.body
             performative.body = body
-            http_msg.request.CopyFrom(performative)
         elif performative_id == HttpMessage.Performative.RESPONSE:
-            performative = http_pb2.HttpMessage.Response_Performative()  # type: ignore
+            performative = http_msg.response
+            performative.SetInParent()
             version = msg.version
             performative.version = version
             status_code = msg.status_code
@@ -78,13 +78,11 @@ class HttpSerializer(Serializer):
             performative.headers = headers
             body = msg.body
             performative.body = body
-            http_msg.response.CopyFrom(performative)
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
         dialogue_message_pb.content = http_msg.SerializeToString()
 
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
         message_bytes = message_pb.SerializeToString()
         return message_bytes
 
@@ -140,5 +138,6 @@ class HttpSerializer(Serializer):
             dialogue_reference=dialogue_reference,
             target=target,
             performative=performative,
+            _check_consistency=HttpMessage.check_consistency_on_decode,
             **performative_content
         )
@@ -279,218 +279,218 @@ class LedgerApiMessage(Message):
     def _is_consistent(self) -> bool:
         """Check that the message follows the ledger_api protocol."""
         try:
-            enforce(
-                isinstance(self.dialogue_reference, tuple),
-                "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
-                    type(self.dialogue_reference)
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[0], str),
-                "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[0])
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[1], str),
-                "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[1])
-                ),
-            )
-            enforce(
-                type(self.message_id) is int,
-                "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
-                    type(self.message_id)
-                ),
-            )
-            enforce(
-                type(self.target) is int,
-                "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
-                    type(self.target)
-                ),
-            )
+            if not isinstance(self.dialogue_reference, tuple):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.dialogue_reference)
+                    )
+                )
+            if not isinstance(self.dialogue_reference[0], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[0])
+                    )
+                )
+            if not isinstance(self.dialogue_reference[1], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[1])
+                    )
+                )
+            if not (type(self.message_id) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
+                        type(self.message_id)
+                    )
+                )
+            if not (type(self.target) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
+                        type(self.target)
+                    )
+                )
 
             # Light Protocol Rule 2
             # Check correct performative
-            enforce(
-                isinstance(self.performative, LedgerApiMessage.Performative),
-                "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
-                    self.valid_performatives, self.performative
-                ),
-            )
+            if not isinstance(self.performative, LedgerApiMessage.Performative):
+                raise AEAEnforceError(
+                    "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
+                        self.valid_performatives, self.performative
+                    )
+                )
 
             # Check correct contents
             actual_nb_of_contents = len(self._body) - DEFAULT_BODY_SIZE
             expected_nb_of_contents = 0
             if self.performative == LedgerApiMessage.Performative.GET_BALANCE:
                 expected_nb_of_contents = 2
-                enforce(
-                    isinstance(self.ledger_id, str),
-                    "Invalid type for content 'ledger_id'. Expected 'str'. Found '{}'.".format(
-                        type(self.ledger_id)
-                    ),
-                )
-                enforce(
-                    isinstance(self.address, str),
-                    "Invalid type for content 'address'. Expected 'str'. Found '{}'.".format(
-                        type(self.address)
-                    ),
-                )
+                if not isinstance(self.ledger_id, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'ledger_id'. Expected 'str'. Found '{}'.".format(
+                            type(self.ledger_id)
+                        )
+                    )
+                if not isinstance(self.address, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'address'. Expected 'str'. Found '{}'.".format(
+                            type(self.address)
+                        )
+                    )
             elif self.performative == LedgerApiMessage.Performative.GET_RAW_TRANSACTION:
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.terms, CustomTerms),
-                    "Invalid type for content 'terms'. Expected 'Terms'. Found '{}'.".format(
-                        type(self.terms)
-                    ),
-                )
+                if not isinstance(self.terms, CustomTerms):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'terms'. Expected 'Terms'. Found '{}'.".format(
+                            type(self.terms)
+                        )
+                    )
             elif (
                 self.performative
                 == LedgerApiMessage.Performative.SEND_SIGNED_TRANSACTION
             ):
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.signed_transaction, CustomSignedTransaction),
-                    "Invalid type for content 'signed_transaction'. Expected 'SignedTransaction'. Found '{}'.".format(
-                        type(self.signed_transaction)
-                    ),
-                )
+                if not isinstance(self.signed_transaction, CustomSignedTransaction):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'signed_transaction'. Expected 'SignedTransaction'. Found '{}'.".format(
+                            type(self.signed_transaction)
+                        )
+                    )
             elif (
                 self.performative
                 == LedgerApiMessage.Performative.GET_TRANSACTION_RECEIPT
             ):
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.transaction_digest, CustomTransactionDigest),
-                    "Invalid type for content 'transaction_digest'. Expected 'TransactionDigest'. Found '{}'.".format(
-                        type(self.transaction_digest)
-                    ),
-                )
+                if not isinstance(self.transaction_digest, CustomTransactionDigest):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'transaction_digest'. Expected 'TransactionDigest'. Found '{}'.".format(
+                            type(self.transaction_digest)
+                        )
+                    )
             elif self.performative == LedgerApiMessage.Performative.BALANCE:
                 expected_nb_of_contents = 2
-                enforce(
-                    isinstance(self.ledger_id, str),
-                    "Invalid type for content 'ledger_id'. Expected 'str'. Found '{}'.".format(
-                        type(self.ledger_id)
-                    ),
-                )
-                enforce(
-                    type(self.balance) is int,
-                    "Invalid type for content 'balance'. Expected 'int'. Found '{}'.".format(
-                        type(self.balance)
-                    ),
-                )
+                if not isinstance(self.ledger_id, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'ledger_id'. Expected 'str'. Found '{}'.".format(
+                            type(self.ledger_id)
+                        )
+                    )
+                if not (type(self.balance) is int):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'balance'. Expected 'int'. Found '{}'.".format(
+                            type(self.balance)
+                        )
+                    )
             elif self.performative == LedgerApiMessage.Performative.RAW_TRANSACTION:
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.raw_transaction, CustomRawTransaction),
-                    "Invalid type for content 'raw_transaction'. Expected 'RawTransaction'. Found '{}'.".format(
-                        type(self.raw_transaction)
-                    ),
-                )
+                if not isinstance(self.raw_transaction, CustomRawTransaction):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'raw_transaction'. Expected 'RawTransaction'. Found '{}'.".format(
+                            type(self.raw_transaction)
+                        )
+                    )
             elif self.performative == LedgerApiMessage.Performative.TRANSACTION_DIGEST:
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.transaction_digest, CustomTransactionDigest),
-                    "Invalid type for content 'transaction_digest'. Expected 'TransactionDigest'. Found '{}'.".format(
-                        type(self.transaction_digest)
-                    ),
-                )
+                if not isinstance(self.transaction_digest, CustomTransactionDigest):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'transaction_digest'. Expected 'TransactionDigest'. Found '{}'.".format(
+                            type(self.transaction_digest)
+                        )
+                    )
             elif self.performative == LedgerApiMessage.Performative.TRANSACTION_RECEIPT:
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.transaction_receipt, CustomTransactionReceipt),
-                    "Invalid type for content 'transaction_receipt'. Expected 'TransactionReceipt'. Found '{}'.".format(
-                        type(self.transaction_receipt)
-                    ),
-                )
+                if not isinstance(self.transaction_receipt, CustomTransactionReceipt):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'transaction_receipt'. Expected 'TransactionReceipt'. Found '{}'.".format(
+                            type(self.transaction_receipt)
+                        )
+                    )
             elif self.performative == LedgerApiMessage.Performative.GET_STATE:
                 expected_nb_of_contents = 4
-                enforce(
-                    isinstance(self.ledger_id, str),
-                    "Invalid type for content 'ledger_id'. Expected 'str'. Found '{}'.".format(
-                        type(self.ledger_id)
-                    ),
-                )
-                enforce(
-                    isinstance(self.callable, str),
-                    "Invalid type for content 'callable'. Expected 'str'. Found '{}'.".format(
-                        type(self.callable)
-                    ),
-                )
-                enforce(
-                    isinstance(self.args, tuple),
-                    "Invalid type for content 'args'. Expected 'tuple'. Found '{}'.".format(
-                        type(self.args)
-                    ),
-                )
-                enforce(
-                    all(isinstance(element, str) for element in self.args),
-                    "Invalid type for tuple elements in content 'args'. Expected 'str'.",
-                )
-                enforce(
-                    isinstance(self.kwargs, CustomKwargs),
-                    "Invalid type for content 'kwargs'. Expected 'Kwargs'. Found '{}'.".format(
-                        type(self.kwargs)
-                    ),
-                )
+                if not isinstance(self.ledger_id, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'ledger_id'. Expected 'str'. Found '{}'.".format(
+                            type(self.ledger_id)
+                        )
+                    )
+                if not isinstance(self.callable, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'callable'. Expected 'str'. Found '{}'.".format(
+                            type(self.callable)
+                        )
+                    )
+                if not isinstance(self.args, tuple):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'args'. Expected 'tuple'. Found '{}'.".format(
+                            type(self.args)
+                        )
+                    )
+                if not all(isinstance(element, str) for element in self.args):
+                    raise AEAEnforceError(
+                        "Invalid type for tuple elements in content 'args'. Expected 'str'."
+                    )
+                if not isinstance(self.kwargs, CustomKwargs):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'kwargs'. Expected 'Kwargs'. Found '{}'.".format(
+                            type(self.kwargs)
+                        )
+                    )
             elif self.performative == LedgerApiMessage.Performative.STATE:
                 expected_nb_of_contents = 2
-                enforce(
-                    isinstance(self.ledger_id, str),
-                    "Invalid type for content 'ledger_id'. Expected 'str'. Found '{}'.".format(
-                        type(self.ledger_id)
-                    ),
-                )
-                enforce(
-                    isinstance(self.state, CustomState),
-                    "Invalid type for content 'state'. Expected 'State'. Found '{}'.".format(
-                        type(self.state)
-                    ),
-                )
+                if not isinstance(self.ledger_id, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'ledger_id'. Expected 'str'. Found '{}'.".format(
+                            type(self.ledger_id)
+                        )
+                    )
+                if not isinstance(self.state, CustomState):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'state'. Expected 'State'. Found '{}'.".format(
+                            type(self.state)
+                        )
+                    )
             elif self.performative == LedgerApiMessage.Performative.ERROR:
                 expected_nb_of_contents = 1
-                enforce(
-                    type(self.code) is int,
-                    "Invalid type for content 'code'. Expected 'int'. Found '{}'.".format(
-                        type(self.code)
-                    ),
-                )
+                if not (type(self.code) is int):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'code'. Expected 'int'. Found '{}'.".format(
+                            type(self.code)
+                        )
+                    )
                 if self.is_set("message"):
                     expected_nb_of_contents += 1
                     message = cast(str, self.message)
-                    enforce(
-                        isinstance(message, str),
-                        "Invalid type for content 'message'. Expected 'str'. Found '{}'.".format(
-                            type(message)
-                        ),
-                    )
+                    if not isinstance(message, str):
+                        raise AEAEnforceError(
+                            "Invalid type for content 'message'. Expected 'str'. Found '{}'.".format(
+                                type(message)
+                            )
+                        )
                 if self.is_set("data"):
                     expected_nb_of_contents += 1
                     data = cast(bytes, self.data)
-                    enforce(
-                        isinstance(data, bytes),
-                        "Invalid type for content 'data'. Expected 'bytes'. Found '{}'.".format(
-                            type(data)
-                        ),
-                    )
+                    if not isinstance(data, bytes):
+                        raise AEAEnforceError(
+                            "Invalid type for content 'data'. Expected 'bytes'. Found '{}'.".format(
+                                type(data)
+                            )
+                        )
 
             # Check correct content count
-            enforce(
-                expected_nb_of_contents == actual_nb_of_contents,
-                "Incorrect number of contents. Expected {}. Found {}".format(
-                    expected_nb_of_contents, actual_nb_of_contents
-                ),
-            )
+            if not (expected_nb_of_contents == actual_nb_of_contents):
+                raise AEAEnforceError(
+                    "Incorrect number of contents. Expected {}. Found {}".format(
+                        expected_nb_of_contents, actual_nb_of_contents
+                    )
+                )
 
             # Light Protocol Rule 3
             if self.message_id == 1:
-                enforce(
-                    self.target == 0,
-                    "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
-                        self.target
-                    ),
-                )
+                if not (self.target == 0):
+                    raise AEAEnforceError(
+                        "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
+                            self.target
+                        )
+                    )
         except (AEAEnforceError, ValueError, KeyError) as e:
             _default_logger.error(str(e))
             return False
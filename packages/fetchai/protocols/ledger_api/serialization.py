@@ -22,7 +22,6 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
 from aea.mail.base_pb2 import Message as ProtobufMessage
 from aea.protocols.base import Message, Serializer
 
@@ -52,7 +51,7 @@ class LedgerApiSerializer(Serializer):
         """
         msg = cast(LedgerApiMessage, msg)
         message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
+        dialogue_message_pb = message_pb.dialogue_message
         ledger_api_msg = ledger_api_pb2.LedgerApiMessage()
 
         dialogue_message_pb.message_id = msg.message_id
@@ -63,59 +62,60 @@ class LedgerApiSerializer(Serializer):
 
         performative_id = msg.performative
         if performative_id == LedgerApiMessage.Performative.GET_BALANCE:
-            performative = ledger_api_pb2.LedgerApiMessage.Get_Balance_Performative()  # type: ignore
+            performative = ledger_api_msg.get_balance
+            performative.SetInParent()
             ledger_id = msg.ledger_id
             performative.ledger_id = ledger_id
             address = msg.address
             performative.address = address
-            ledger_api_msg.get_balance.CopyFrom(performative)
         elif performative_id == LedgerApiMessage.Performative.GET_RAW_TRANSACTION:
-            performative = ledger_api_pb2.LedgerApiMessage.Get_Raw_Transaction_Performative()  # type: ignore
+            performative = ledger_api_msg.get_raw_transaction
+            performative.SetInParent()
             terms = msg.terms
             Terms.encode(performative.terms, terms)
-            ledger_api_msg.get_raw_transaction.CopyFrom(performative)
         elif performative_id == LedgerApiMessage.Performative.SEND_SIGNED_TRANSACTION:
-            performative = ledger_api_pb2.LedgerApiMessage.Send_Signed_Transaction_Performative()  # type: ignore
+            performative = ledger_api_msg.send_signed_transaction
+            performative.SetInParent()
             signed_transaction = msg.signed_transaction
             SignedTransaction.encode(
                 performative.signed_transaction, signed_transaction
             )
-            ledger_api_msg.send_signed_transaction.CopyFrom(performative)
         elif performative_id == LedgerApiMessage.Performative.GET_TRANSACTION_RECEIPT:
-            performative = ledger_api_pb2.LedgerApiMessage.Get_Transaction_Receipt_Performative()  # type: ignore
+            performative = ledger_api_msg.get_transaction_receipt
+            performative.SetInParent()
             transaction_digest = msg.transaction_digest
             TransactionDigest.encode(
                 performative.transaction_digest, transaction_digest
             )
-            ledger_api_msg.get_transaction_receipt.CopyFrom(performative)
         elif performative_id == LedgerApiMessage.Performative.BALANCE:
-            performative = ledger_api_pb2.LedgerApiMessage.Balance_Performative()  # type: ignore
+            performative = ledger_api_msg.balance
+            performative.SetInParent()
             ledger_id = msg.ledger_id
             performative.ledger_id = ledger_id
             balance = msg.balance
             performative.balance = balance
-            ledger_api_msg.balance.CopyFrom(performative)
         elif performative_id == LedgerApiMessage.Performative.RAW_TRANSACTION:
-            performative = ledger_api_pb2.LedgerApiMessage.Raw_Transaction_Performative()  # type: ignore
+            performative = ledger_api_msg.raw_transaction
+            performative.SetInParent()
             raw_transaction = msg.raw_transaction
             RawTransaction.encode(performative.raw_transaction, raw_transaction)
-            ledger_api_msg.raw_transaction.CopyFrom(performative)
         elif performative_id == LedgerApiMessage.Performative.TRANSACTION_DIGEST:
-            performative = ledger_api_pb2.LedgerApiMessage.Transaction_Digest_Performative()  # type: ignore
+            performative = ledger_api_msg.transaction_digest
+            performative.SetInParent()
             transaction_digest = msg.transaction_digest
             TransactionDigest.encode(
                 performative.transaction_digest, transaction_digest
             )
-            ledger_api_msg.transaction_digest.CopyFrom(performative)
         elif performative_id == LedgerApiMessage.Performative.TRANSACTION_RECEIPT:
-            performative = ledger_api_pb2.LedgerApiMessage.Transaction_Receipt_Performative()  # type: ignore
+            performative = ledger_api_msg.transaction_receipt
+            performative.SetInParent()
             transaction_receipt = msg.transaction_receipt
             TransactionReceipt.encode(
                 performative.transaction_receipt, transaction_receipt
             )
-            ledger_api_msg.transaction_receipt.CopyFrom(performative)
         elif performative_id == LedgerApiMessage.Performative.GET_STATE:
-            performative = ledger_api_pb2.LedgerApiMessage.Get_State_Performative()  # type: ignore
+            performative = ledger_api_msg.get_state
+            performative.SetInParent()
             ledger_id = msg.ledger_id
             performative.ledger_id = ledger_id
             callable = msg.callable
@@ -124,16 +124,16 @@ class LedgerApiSerializer(Serializer):
             performative.args.extend(args)
             kwargs = msg.kwargs
             Kwargs.encode(performative.kwargs, kwargs)
-            ledger_api_msg.get_state.CopyFrom(performative)
         elif performative_id == LedgerApiMessage.Performative.STATE:
-            performative = ledger_api_pb2.LedgerApiMessage.State_Performative()  # type: ignore
+            performative = ledger_api_msg.state
+            performative.SetInParent()
             ledger_id = msg.ledger_id
             performative.ledger_id = ledger_id
             state = msg.state
             State.encode(performative.state, state)
-            ledger_api_msg.state.CopyFrom(performative)
         elif performative_id == LedgerApiMessage.Performative.ERROR:
-            performative = ledger_api_pb2.LedgerApiMessage.Error_Performative()  # type: ignore
+            performative = ledger_api_msg.error
+            performative.SetInParent()
             code = msg.code
             performative.code = code
             if msg.is_set("message"):
@@ -144,13 +144,11 @@ class LedgerApiSerializer(Serializer):
                 performative.data_is_set = True
                 data = msg.data
                 performative.data = data
-            ledger_api_msg.error.CopyFrom(performative)
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
         dialogue_message_pb.content = ledger_api_msg.SerializeToString()
 
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
         message_bytes = message_pb.SerializeToString()
         return message_bytes
 
@@ -250,5 +248,6 @@ class LedgerApiSerializer(Serializer):
             dialogue_reference=dialogue_reference,
             target=target,
             performative=performative,
+            _check_consistency=LedgerApiMessage.check_consistency_on_decode,
             **performative_content
         )
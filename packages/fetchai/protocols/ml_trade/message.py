@@ -155,110 +155,110 @@ class MlTradeMessage(Message):
     def _is_consistent(self) -> bool:
         """Check that the message follows the ml_trade protocol."""
         try:
-            enforce(
-                isinstance(self.dialogue_reference, tuple),
-                "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
-                    type(self.dialogue_reference)
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[0], str),
-                "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[0])
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[1], str),
-                "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[1])
-                ),
-            )
-            enforce(
-                type(self.message_id) is int,
-                "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
-                    type(self.message_id)
-                ),
-            )
-            enforce(
-                type(self.target) is int,
-                "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
-                    type(self.target)
-                ),
-            )
+            if not isinstance(self.dialogue_reference, tuple):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.dialogue_reference)
+                    )
+                )
+            if not isinstance(self.dialogue_reference[0], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[0])
+                    )
+                )
+            if not isinstance(self.dialogue_reference[1], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[1])
+                    )
+                )
+            if not (type(self.message_id) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
+                        type(self.message_id)
+                    )
+                )
+            if not (type(self.target) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
+                        type(self.target)
+                    )
+                )
 
             # Light Protocol Rule 2
             # Check correct performative
-            enforce(
-                isinstance(self.performative, MlTradeMessage.Performative),
-                "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
-                    self.valid_performatives, self.performative
-                ),
-            )
+            if not isinstance(self.performative, MlTradeMessage.Performative):
+                raise AEAEnforceError(
+                    "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
+                        self.valid_performatives, self.performative
+                    )
+                )
 
             # Check correct contents
             actual_nb_of_contents = len(self._body) - DEFAULT_BODY_SIZE
             expected_nb_of_contents = 0
             if self.performative == MlTradeMessage.Performative.CFP:
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.query, CustomQuery),
-                    "Invalid type for content 'query'. Expected 'Query'. Found '{}'.".format(
-                        type(self.query)
-                    ),
-                )
+                if not isinstance(self.query, CustomQuery):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'query'. Expected 'Query'. Found '{}'.".format(
+                            type(self.query)
+                        )
+                    )
             elif self.performative == MlTradeMessage.Performative.TERMS:
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.terms, CustomDescription),
-                    "Invalid type for content 'terms'. Expected 'Description'. Found '{}'.".format(
-                        type(self.terms)
-                    ),
-                )
+                if not isinstance(self.terms, CustomDescription):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'terms'. Expected 'Description'. Found '{}'.".format(
+                            type(self.terms)
+                        )
+                    )
             elif self.performative == MlTradeMessage.Performative.ACCEPT:
                 expected_nb_of_contents = 2
-                enforce(
-                    isinstance(self.terms, CustomDescription),
-                    "Invalid type for content 'terms'. Expected 'Description'. Found '{}'.".format(
-                        type(self.terms)
-                    ),
-                )
-                enforce(
-                    isinstance(self.tx_digest, str),
-                    "Invalid type for content 'tx_digest'. Expected 'str'. Found '{}'.".format(
-                        type(self.tx_digest)
-                    ),
-                )
+                if not isinstance(self.terms, CustomDescription):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'terms'. Expected 'Description'. Found '{}'.".format(
+                            type(self.terms)
+                        )
+                    )
+                if not isinstance(self.tx_digest, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'tx_digest'. Expected 'str'. Found '{}'.".format(
+                            type(self.tx_digest)
+                        )
+                    )
             elif self.performative == MlTradeMessage.Performative.DATA:
                 expected_nb_of_contents = 2
-                enforce(
-                    isinstance(self.terms, CustomDescription),
-                    "Invalid type for content 'terms'. Expected 'Description'. Found '{}'.".format(
-                        type(self.terms)
-                    ),
-                )
-                enforce(
-                    isinstance(self.payload, bytes),
-                    "Invalid type for content 'payload'. Expected 'bytes'. Found '{}'.".format(
-                        type(self.payload)
-                    ),
-                )
+                if not isinstance(self.terms, CustomDescription):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'terms'. Expected 'Description'. Found '{}'.".format(
+                            type(self.terms)
+                        )
+                    )
+                if not isinstance(self.payload, bytes):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'payload'. Expected 'bytes'. Found '{}'.".format(
+                            type(self.payload)
+                        )
+                    )
 
             # Check correct content count
-            enforce(
-                expected_nb_of_contents == actual_nb_of_contents,
-                "Incorrect number of contents. Expected {}. Found {}".format(
-                    expected_nb_of_contents, actual_nb_of_contents
-                ),
-            )
+            if not (expected_nb_of_contents == actual_nb_of_contents):
+                raise AEAEnforceError(
+                    "Incorrect number of contents. Expected {}. Found {}".format(
+                        expected_nb_of_contents, actual_nb_of_contents
+                    )
+                )
 
             # Light Protocol Rule 3
             if self.message_id == 1:
-                enforce(
-                    self.target == 0,
-                    "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
-                        self.target
-                    ),
-                )
+                if not (self.target == 0):
+                    raise AEAEnforceError(
+                        "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
+                            self.target
+                        )
+                    )
         except (AEAEnforceError, ValueError, KeyError) as e:
             _default_logger.error(str(e))
             return False
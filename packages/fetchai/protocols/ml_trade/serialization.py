@@ -22,7 +22,6 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
 from aea.mail.base_pb2 import Message as ProtobufMessage
 from aea.protocols.base import Message, Serializer
 
@@ -44,7 +43,7 @@ class MlTradeSerializer(Serializer):
         """
         msg = cast(MlTradeMessage, msg)
         message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
+        dialogue_message_pb = message_pb.dialogue_message
         ml_trade_msg = ml_trade_pb2.MlTradeMessage()
 
         dialogue_message_pb.message_id = msg.message_id
@@ -55,35 +54,34 @@ class MlTradeSerializer(Serializer):
 
         performative_id = msg.performative
         if performative_id == MlTradeMessage.Performative.CFP:
-            performative = ml_trade_pb2.MlTradeMessage.Cfp_Performative()  # type: ignore
+            performative = ml_trade_msg.cfp
+            performative.SetInParent()
             query = msg.query
             Query.encode(performative.query, query)
-            ml_trade_msg.cfp.CopyFrom(performative)
         elif performative_id == MlTradeMessage.Performative.TERMS:
-            performative = ml_trade_pb2.MlTradeMessage.Terms_Performative()  # type: ignore
+            performative = ml_trade_msg.terms
+            performative.SetInParent()
             terms = msg.terms
             Description.encode(performative.terms, terms)
-            ml_trade_msg.terms.CopyFrom(performative)
         elif performative_id == MlTradeMessage.Performative.ACCEPT:
-            performative = ml_trade_pb2.MlTradeMessage.Accept_Performative()  # type: ignore
+            performative = ml_trade_msg.accept
+            performative.SetInParent()
             terms = msg.terms
             Description.encode(performative.terms, terms)
             tx_digest = msg.tx_digest
             performative.tx_digest = tx_digest
-            ml_trade_msg.accept.CopyFrom(performative)
         elif performative_id == MlTradeMessage.Performative.DATA:
-            performative = ml_trade_pb2.MlTradeMessage.Data_Performative()  # type: ignore
+            performative = ml_trade_msg.data
+            performative.SetInParent()
             terms = msg.terms
             Description.encode(performative.terms, terms)
             payload = msg.payload
             performative.payload = payload
-            ml_trade_msg.data.CopyFrom(performative)
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
         dialogue_message_pb.content = ml_trade_msg.SerializeToString()
 
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
         message_bytes = message_pb.SerializeToString()
         return message_bytes
 
@@ -137,5 +135,6 @@ class MlTradeSerializer(Serializer):
             dialogue_reference=dialogue_reference,
             target=target,
             performative=performative,
+            _check_consistency=MlTradeMessage.check_consistency_on_decode,
             **performative_content
         )
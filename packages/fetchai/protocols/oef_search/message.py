@@ -187,124 +187,124 @@ class OefSearchMessage(Message):
     def _is_consistent(self) -> bool:
         """Check that the message follows the oef_search protocol."""
         try:
-            enforce(
-                isinstance(self.dialogue_reference, tuple),
-                "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
-                    type(self.dialogue_reference)
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[0], str),
-                "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[0])
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[1], str),
-                "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[1])
-                ),
-            )
-            enforce(
-                type(self.message_id) is int,
-                "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
-                    type(self.message_id)
-                ),
-            )
-            enforce(
-                type(self.target) is int,
-                "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
-                    type(self.target)
-                ),
-            )
+            if not isinstance(self.dialogue_reference, tuple):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.dialogue_reference)
+                    )
+                )
+            if not isinstance(self.dialogue_reference[0], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[0])
+                    )
+                )
+            if not isinstance(self.dialogue_reference[1], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[1])
+                    )
+                )
+            if not (type(self.message_id) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
+                        type(self.message_id)
+                    )
+                )
+            if not (type(self.target) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
+                        type(self.target)
+                    )
+                )
 
             # Light Protocol Rule 2
             # Check correct performative
-            enforce(
-                isinstance(self.performative, OefSearchMessage.Performative),
-                "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
-                    self.valid_performatives, self.performative
-                ),
-            )
+            if not isinstance(self.performative, OefSearchMessage.Performative):
+                raise AEAEnforceError(
+                    "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
+                        self.valid_performatives, self.performative
+                    )
+                )
 
             # Check correct contents
             actual_nb_of_contents = len(self._body) - DEFAULT_BODY_SIZE
             expected_nb_of_contents = 0
             if self.performative == OefSearchMessage.Performative.REGISTER_SERVICE:
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.service_description, CustomDescription),
-                    "Invalid type for content 'service_description'. Expected 'Description'. Found '{}'.".format(
-                        type(self.service_description)
-                    ),
-                )
+                if not isinstance(self.service_description, CustomDescription):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'service_description'. Expected 'Description'. Found '{}'.".format(
+                            type(self.service_description)
+                        )
+                    )
             elif self.performative == OefSearchMessage.Performative.UNREGISTER_SERVICE:
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.service_description, CustomDescription),
-                    "Invalid type for content 'service_description'. Expected 'Description'. Found '{}'.".format(
-                        type(self.service_description)
-                    ),
-                )
+                if not isinstance(self.service_description, CustomDescription):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'service_description'. Expected 'Description'. Found '{}'.".format(
+                            type(self.service_description)
+                        )
+                    )
             elif self.performative == OefSearchMessage.Performative.SEARCH_SERVICES:
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.query, CustomQuery),
-                    "Invalid type for content 'query'. Expected 'Query'. Found '{}'.".format(
-                        type(self.query)
-                    ),
-                )
+                if not isinstance(self.query, CustomQuery):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'query'. Expected 'Query'. Found '{}'.".format(
+                            type(self.query)
+                        )
+                    )
             elif self.performative == OefSearchMessage.Performative.SEARCH_RESULT:
                 expected_nb_of_contents = 2
-                enforce(
-                    isinstance(self.agents, tuple),
-                    "Invalid type for content 'agents'. Expected 'tuple'. Found '{}'.".format(
-                        type(self.agents)
-                    ),
-                )
-                enforce(
-                    all(isinstance(element, str) for element in self.agents),
-                    "Invalid type for tuple elements in content 'agents'. Expected 'str'.",
-                )
-                enforce(
-                    isinstance(self.agents_info, CustomAgentsInfo),
-                    "Invalid type for content 'agents_info'. Expected 'AgentsInfo'. Found '{}'.".format(
-                        type(self.agents_info)
-                    ),
-                )
+                if not isinstance(self.agents, tuple):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'agents'. Expected 'tuple'. Found '{}'.".format(
+                            type(self.agents)
+                        )
+                    )
+                if not all(isinstance(element, str) for element in self.agents):
+                    raise AEAEnforceError(
+                        "Invalid type for tuple elements in content 'agents'. Expected 'str'."
+                    )
+                if not isinstance(self.agents_info, CustomAgentsInfo):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'agents_info'. Expected 'AgentsInfo'. Found '{}'.".format(
+                            type(self.agents_info)
+                        )
+                    )
             elif self.performative == OefSearchMessage.Performative.SUCCESS:
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.agents_info, CustomAgentsInfo),
-                    "Invalid type for content 'agents_info'. Expected 'AgentsInfo'. Found '{}'.".format(
-                        type(self.agents_info)
-                    ),
-                )
+                if not isinstance(self.agents_info, CustomAgentsInfo):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'agents_info'. Expected 'AgentsInfo'. Found '{}'.".format(
+                            type(self.agents_info)
+                        )
+                    )
             elif self.performative == OefSearchMessage.Performative.OEF_ERROR:
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.oef_error_operation, CustomOefErrorOperation),
-                    "Invalid type for content 'oef_error_operation'. Expected 'OefErrorOperation'. Found '{}'.".format(
-                        type(self.oef_error_operation)
-                    ),
-                )
+                if not isinstance(self.oef_error_operation, CustomOefErrorOperation):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'oef_error_operation'. Expected 'OefErrorOperation'. Found '{}'.".format(
+                            type(self.oef_error_operation)
+                        )
+                    )
 
             # Check correct content count
-            enforce(
-                expected_nb_of_contents == actual_nb_of_contents,
-                "Incorrect number of contents. Expected {}. Found {}".format(
-                    expected_nb_of_contents, actual_nb_of_contents
-                ),
-            )
+            if not (expected_nb_of_contents == actual_nb_of_contents):
+                raise AEAEnforceError(
+                    "Incorrect number of contents. Expected {}. Found {}".format(
+                        expected_nb_of_contents, actual_nb_of_contents
+                    )
+                )
 
             # Light Protocol Rule 3
             if self.message_id == 1:
-                enforce(
-                    self.target == 0,
-                    "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
-                        self.target
-                    ),
-                )
+                if not (self.target == 0):
+                    raise AEAEnforceError(
+                        "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
+                            self.target
+                        )
+                    )
         except (AEAEnforceError, ValueError, KeyError) as e:
             _default_logger.error(str(e))
             return False
@@ -22,7 +22,6 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
 from aea.mail.base_pb2 import Message as ProtobufMessage
 from aea.protocols.base import Message, Serializer
 
@@ -49,7 +48,7 @@ class OefSearchSerializer(Serializer):
         """
         msg = cast(OefSearchMessage, msg)
         message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
+        dialogue_message_pb = message_pb.dialogue_message
         oef_search_msg = oef_search_pb2.OefSearchMessage()
 
         dialogue_message_pb.message_id = msg.message_id
@@ -60,45 +59,44 @@ class OefSearchSerializer(Serializer):
 
         performative_id = msg.performative
         if performative_id == OefSearchMessage.Performative.REGISTER_SERVICE:
-            performative = oef_search_pb2.OefSearchMessage.Register_Service_Performative()  # type: ignore
+            performative = oef_search_msg.register_service
+            performative.SetInParent()
             service_description = msg.service_description
             Description.encode(performative.service_description, service_description)
-            oef_search_msg.register_service.CopyFrom(performative)
         elif performative_id == OefSearchMessage.Performative.UNREGISTER_SERVICE:
-            performative = oef_search_pb2.OefSearchMessage.Unregister_Service_Performative()  # type: ignore
+            performative = oef_search_msg.unregister_service
+            performative.SetInParent()
             service_description = msg.service_description
             Description.encode(performative.service_description, service_description)
-            oef_search_msg.unregister_service.CopyFrom(performative)
         elif performative_id == OefSearchMessage.Performative.SEARCH_SERVICES:
-            performative = oef_search_pb2.OefSearchMessage.Search_Services_Performative()  # type: ignore
+            performative = oef_search_msg.search_services
+            performative.SetInParent()
             query = msg.query
             Query.encode(performative.query, query)
-            oef_search_msg.search_services.CopyFrom(performative)
         elif performative_id == OefSearchMessage.Performative.SEARCH_RESULT:
-            performative = oef_search_pb2.OefSearchMessage.Search_Result_Performative()  # type: ignore
+            performative = oef_search_msg.search_result
+            performative.SetInParent()
             agents = msg.agents
             performative.agents.extend(agents)
             agents_info = msg.agents_info
             AgentsInfo.encode(performative.agents_info, agents_info)
-            oef_search_msg.search_result.CopyFrom(performative)
         elif performative_id == OefSearchMessage.Performative.SUCCESS:
-            performative = oef_search_pb2.OefSearchMessage.Success_Performative()  # type: ignore
+            performative = oef_search_msg.success
+            performative.SetInParent()
             agents_info = msg.agents_info
             AgentsInfo.encode(performative.agents_info, agents_info)
-            oef_search_msg.success.CopyFrom(performative)
         elif performative_id == OefSearchMessage.Performative.OEF_ERROR:
-            performative = oef_search_pb2.OefSearchMessage.Oef_Error_Performative()  # type: ignore
+            performative = oef_search_msg.oef_error
+            performative.SetInParent()
             oef_error_operation = msg.oef_error_operation
             OefErrorOperation.encode(
                 performative.oef_error_operation, oef_error_operation
             )
-            oef_search_msg.oef_error.CopyFrom(performative)
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
         dialogue_message_pb.content = oef_search_msg.SerializeToString()
 
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
         message_bytes = message_pb.SerializeToString()
         return message_bytes
 
@@ -161,5 +159,6 @@ class OefSearchSerializer(Serializer):
             dialogue_reference=dialogue_reference,
             target=target,
             performative=performative,
+            _check_consistency=OefSearchMessage.check_consistency_on_decode,
             **performative_content
         )
@@ -172,161 +172,161 @@ class PrometheusMessage(Message):
     def _is_consistent(self) -> bool:
         """Check that the message follows the prometheus protocol."""
         try:
-            enforce(
-                isinstance(self.dialogue_reference, tuple),
-                "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
-                    type(self.dialogue_reference)
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[0], str),
-                "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[0])
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[1], str),
-                "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[1])
-                ),
-            )
-            enforce(
-                type(self.message_id) is int,
-                "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
-                    type(self.message_id)
-                ),
-            )
-            enforce(
-                type(self.target) is int,
-                "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
-                    type(self.target)
-                ),
-            )
+            if not isinstance(self.dialogue_reference, tuple):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.dialogue_reference)
+                    )
+                )
+            if not isinstance(self.dialogue_reference[0], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[0])
+                    )
+                )
+            if not isinstance(self.dialogue_reference[1], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[1])
+                    )
+                )
+            if not (type(self.message_id) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
+                        type(self.message_id)
+                    )
+                )
+            if not (type(self.target) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
+                        type(self.target)
+                    )
+                )
 
             # Light Protocol Rule 2
             # Check correct performative
-            enforce(
-                isinstance(self.performative, PrometheusMessage.Performative),
-                "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
-                    self.valid_performatives, self.performative
-                ),
-            )
+            if not isinstance(self.performative, PrometheusMessage.Performative):
+                raise AEAEnforceError(
+                    "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
+                        self.valid_performatives, self.performative
+                    )
+                )
 
             # Check correct contents
             actual_nb_of_contents = len(self._body) - DEFAULT_BODY_SIZE
             expected_nb_of_contents = 0
             if self.performative == PrometheusMessage.Performative.ADD_METRIC:
                 expected_nb_of_contents = 4
-                enforce(
-                    isinstance(self.type, str),
-                    "Invalid type for content 'type'. Expected 'str'. Found '{}'.".format(
-                        type(self.type)
-                    ),
-                )
-                enforce(
-                    isinstance(self.title, str),
-                    "Invalid type for content 'title'. Expected 'str'. Found '{}'.".format(
-                        type(self.title)
-                    ),
-                )
-                enforce(
-                    isinstance(self.description, str),
-                    "Invalid type for content 'description'. Expected 'str'. Found '{}'.".format(
-                        type(self.description)
-                    ),
-                )
-                enforce(
-                    isinstance(self.labels, dict),
-                    "Invalid type for content 'labels'. Expected 'dict'. Found '{}'.".format(
-                        type(self.labels)
-                    ),
-                )
-                for key_of_labels, value_of_labels in self.labels.items():
-                    enforce(
-                        isinstance(key_of_labels, str),
-                        "Invalid type for dictionary keys in content 'labels'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_labels)
-                        ),
+                if not isinstance(self.type, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'type'. Expected 'str'. Found '{}'.".format(
+                            type(self.type)
+                        )
+                    )
+                if not isinstance(self.title, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'title'. Expected 'str'. Found '{}'.".format(
+                            type(self.title)
+                        )
                     )
-                    enforce(
-                        isinstance(value_of_labels, str),
-                        "Invalid type for dictionary values in content 'labels'. Expected 'str'. Found '{}'.".format(
-                            type(value_of_labels)
-                        ),
+                if not isinstance(self.description, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'description'. Expected 'str'. Found '{}'.".format(
+                            type(self.description)
+                        )
                     )
+                if not isinstance(self.labels, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'labels'. Expected 'dict'. Found '{}'.".format(
+                            type(self.labels)
+                        )
+                    )
+                for key_of_labels, value_of_labels in self.labels.items():
+                    if not isinstance(key_of_labels, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'labels'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_labels)
+                            )
+                        )
+                    if not isinstance(value_of_labels, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'labels'. Expected 'str'. Found '{}'.".format(
+                                type(value_of_labels)
+                            )
+                        )
             elif self.performative == PrometheusMessage.Performative.UPDATE_METRIC:
                 expected_nb_of_contents = 4
-                enforce(
-                    isinstance(self.title, str),
-                    "Invalid type for content 'title'. Expected 'str'. Found '{}'.".format(
-                        type(self.title)
-                    ),
-                )
-                enforce(
-                    isinstance(self.callable, str),
-                    "Invalid type for content 'callable'. Expected 'str'. Found '{}'.".format(
-                        type(self.callable)
-                    ),
-                )
-                enforce(
-                    isinstance(self.value, float),
-                    "Invalid type for content 'value'. Expected 'float'. Found '{}'.".format(
-                        type(self.value)
-                    ),
-                )
-                enforce(
-                    isinstance(self.labels, dict),
-                    "Invalid type for content 'labels'. Expected 'dict'. Found '{}'.".format(
-                        type(self.labels)
-                    ),
-                )
-                for key_of_labels, value_of_labels in self.labels.items():
-                    enforce(
-                        isinstance(key_of_labels, str),
-                        "Invalid type for dictionary keys in content 'labels'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_labels)
-                        ),
+                if not isinstance(self.title, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'title'. Expected 'str'. Found '{}'.".format(
+                            type(self.title)
+                        )
+                    )
+                if not isinstance(self.callable, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'callable'. Expected 'str'. Found '{}'.".format(
+                            type(self.callable)
+                        )
+                    )
+                if not isinstance(self.value, float):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'value'. Expected 'float'. Found '{}'.".format(
+                            type(self.value)
+                        )
                     )
-                    enforce(
-                        isinstance(value_of_labels, str),
-                        "Invalid type for dictionary values in content 'labels'. Expected 'str'. Found '{}'.".format(
-                            type(value_of_labels)
-                        ),
+                if not isinstance(self.labels, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'labels'. Expected 'dict'. Found '{}'.".format(
+                            type(self.labels)
+                        )
                     )
+                for key_of_labels, value_of_labels in self.labels.items():
+                    if not isinstance(key_of_labels, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'labels'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_labels)
+                            )
+                        )
+                    if not isinstance(value_of_labels, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'labels'. Expected 'str'. Found '{}'.".format(
+                                type(value_of_labels)
+                            )
+                        )
             elif self.performative == PrometheusMessage.Performative.RESPONSE:
                 expected_nb_of_contents = 1
-                enforce(
-                    type(self.code) is int,
-                    "Invalid type for content 'code'. Expected 'int'. Found '{}'.".format(
-                        type(self.code)
-                    ),
-                )
+                if not (type(self.code) is int):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'code'. Expected 'int'. Found '{}'.".format(
+                            type(self.code)
+                        )
+                    )
                 if self.is_set("message"):
                     expected_nb_of_contents += 1
                     message = cast(str, self.message)
-                    enforce(
-                        isinstance(message, str),
-                        "Invalid type for content 'message'. Expected 'str'. Found '{}'.".format(
-                            type(message)
-                        ),
-                    )
+                    if not isinstance(message, str):
+                        raise AEAEnforceError(
+                            "Invalid type for content 'message'. Expected 'str'. Found '{}'.".format(
+                                type(message)
+                            )
+                        )
 
             # Check correct content count
-            enforce(
-                expected_nb_of_contents == actual_nb_of_contents,
-                "Incorrect number of contents. Expected {}. Found {}".format(
-                    expected_nb_of_contents, actual_nb_of_contents
-                ),
-            )
+            if not (expected_nb_of_contents == actual_nb_of_contents):
+                raise AEAEnforceError(
+                    "Incorrect number of contents. Expected {}. Found {}".format(
+                        expected_nb_of_contents, actual_nb_of_contents
+                    )
+                )
 
             # Light Protocol Rule 3
             if self.message_id == 1:
-                enforce(
-                    self.target == 0,
-                    "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
-                        self.target
-                    ),
-                )
+                if not (self.target == 0):
+                    raise AEAEnforceError(
+                        "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
+                            self.target
+                        )
+                    )
         except (AEAEnforceError, ValueError, KeyError) as e:
             _default_logger.error(str(e))
             return False
@@ -22,7 +22,6 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
 from aea.mail.base_pb2 import Message as ProtobufMessage
 from aea.protocols.base import Message, Serializer
 
@@ -43,7 +42,7 @@ class PrometheusSerializer(Serializer):
         """
         msg = cast(PrometheusMessage, msg)
         message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
+        dialogue_message_pb = message_pb.dialogue_message
         prometheus_msg = prometheus_pb2.PrometheusMessage()
 
         dialogue_message_pb.message_id = msg.message_id
@@ -54,7 +53,8 @@ class PrometheusSerializer(Serializer):
 
         performative_id = msg.performative
         if performative_id == PrometheusMessage.Performative.ADD_METRIC:
-            performative = prometheus_pb2.PrometheusMessage.Add_Metric_Performative()  # type: ignore
+            performative = prometheus_msg.add_metric
+            performative.SetInParent()
             type = msg.type
             performative.type = type
             title = msg.title
@@ -63,9 +63,9 @@ class PrometheusSerializer(Serializer):
             performative.description = description
             labels = msg.labels
             performative.labels.update(labels)
-            prometheus_msg.add_metric.CopyFrom(performative)
         elif performative_id == PrometheusMessage.Performative.UPDATE_METRIC:
-            performative = prometheus_pb2.PrometheusMessage.Update_Metric_Performative()  # type: ignore
+            performative = prometheus_msg.update_metric
+            performative.SetInParent()
             title = msg.title
             performative.title = title
             callable = msg.callable
@@ -74,22 +74,20 @@ class PrometheusSerializer(Serializer):
             performative.value = value
             labels = msg.labels
             performative.labels.update(labels)
-            prometheus_msg.update_metric.CopyFrom(performative)
         elif performative_id == PrometheusMessage.Performative.RESPONSE:
-            performative = prometheus_pb2.PrometheusMessage.Response_Performative()  # type: ignore
+            performative = prometheus_msg.response
+            performative.SetInParent()
             code = msg.code
             performative.code = code
             if msg.is_set("message"):
                 performative.message_is_set = True
                 message = msg.message
                 performative.message = message
-            prometheus_msg.response.CopyFrom(performative)
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
         dialogue_message_pb.content = prometheus_msg.SerializeToString()
 
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
         message_bytes = message_pb.SerializeToString()
         return message_bytes
 
@@ -149,5 +147,6 @@ class PrometheusSerializer(Serializer):
             dialogue_reference=dialogue_reference,
             target=target,
             performative=performative,
+            _check_consistency=PrometheusMessage.check_consistency_on_decode,
             **performative_content
         )
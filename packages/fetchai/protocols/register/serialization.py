@@ -22,7 +22,6 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
 from aea.mail.base_pb2 import Message as ProtobufMessage
 from aea.protocols.base import Message, Serializer
 
@@ -43,7 +42,7 @@ class RegisterSerializer(Serializer):
         """
         msg = cast(RegisterMessage, msg)
         message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
+        dialogue_message_pb = message_pb.dialogue_message
         register_msg = register_pb2.RegisterMessage()
 
         dialogue_message_pb.message_id = msg.message_id
@@ -54,30 +53,29 @@ class RegisterSerializer(Serializer):
 
         performative_id = msg.performative
         if performative_id == RegisterMessage.Performative.REGISTER:
-            performative = register_pb2.RegisterMessage.Register_Performative()  # type: ignore
+            performative = register_msg.register
+            performative.SetInParent()
             info = msg.info
             performative.info.update(info)
-            register_msg.register.CopyFrom(performative)
         elif performative_id == RegisterMessage.Performative.SUCCESS:
-            performative = register_pb2.RegisterMessage.Success_Performative()  # type: ignore
+            performative = register_msg.success
+            performative.SetInParent()
             info = msg.info
             performative.info.update(info)
-            register_msg.success.CopyFrom(performative)
         elif performative_id == RegisterMessage.Performative.ERROR:
-            performative = register_pb2.RegisterMessage.Error_Performative()  # type: ignore
+            performative = register_msg.error
+            performative.SetInParent()
             error_code = msg.error_code
             performative.error_code = error_code
             error_msg = msg.error_msg
             performative.error_msg = error_msg
             info = msg.info
             performative.info.update(info)
-            register_msg.error.CopyFrom(performative)
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
         dialogue_message_pb.content = register_msg.SerializeToString()
 
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
         message_bytes = message_pb.SerializeToString()
         return message_bytes
 
@@ -127,5 +125,6 @@ class RegisterSerializer(Serializer):
             dialogue_reference=dialogue_reference,
             target=target,
             performative=performative,
+            _check_consistency=RegisterMessage.check_consistency_on_decode,
             **performative_content
         )
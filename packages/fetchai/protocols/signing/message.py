@@ -197,118 +197,118 @@ class SigningMessage(Message):
     def _is_consistent(self) -> bool:
         """Check that the message follows the signing protocol."""
         try:
-            enforce(
-                isinstance(self.dialogue_reference, tuple),
-                "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
-                    type(self.dialogue_reference)
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[0], str),
-                "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[0])
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[1], str),
-                "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[1])
-                ),
-            )
-            enforce(
-                type(self.message_id) is int,
-                "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
-                    type(self.message_id)
-                ),
-            )
-            enforce(
-                type(self.target) is int,
-                "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
-                    type(self.target)
-                ),
-            )
+            if not isinstance(self.dialogue_reference, tuple):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.dialogue_reference)
+                    )
+                )
+            if not isinstance(self.dialogue_reference[0], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[0])
+                    )
+                )
+            if not isinstance(self.dialogue_reference[1], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[1])
+                    )
+                )
+            if not (type(self.message_id) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
+                        type(self.message_id)
+                    )
+                )
+            if not (type(self.target) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
+                        type(self.target)
+                    )
+                )
 
             # Light Protocol Rule 2
             # Check correct performative
-            enforce(
-                isinstance(self.performative, SigningMessage.Performative),
-                "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
-                    self.valid_performatives, self.performative
-                ),
-            )
+            if not isinstance(self.performative, SigningMessage.Performative):
+                raise AEAEnforceError(
+                    "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
+                        self.valid_performatives, self.performative
+                    )
+                )
 
             # Check correct contents
             actual_nb_of_contents = len(self._body) - DEFAULT_BODY_SIZE
             expected_nb_of_contents = 0
             if self.performative == SigningMessage.Performative.SIGN_TRANSACTION:
                 expected_nb_of_contents = 2
-                enforce(
-                    isinstance(self.terms, CustomTerms),
-                    "Invalid type for content 'terms'. Expected 'Terms'. Found '{}'.".format(
-                        type(self.terms)
-                    ),
-                )
-                enforce(
-                    isinstance(self.raw_transaction, CustomRawTransaction),
-                    "Invalid type for content 'raw_transaction'. Expected 'RawTransaction'. Found '{}'.".format(
-                        type(self.raw_transaction)
-                    ),
-                )
+                if not isinstance(self.terms, CustomTerms):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'terms'. Expected 'Terms'. Found '{}'.".format(
+                            type(self.terms)
+                        )
+                    )
+                if not isinstance(self.raw_transaction, CustomRawTransaction):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'raw_transaction'. Expected 'RawTransaction'. Found '{}'.".format(
+                            type(self.raw_transaction)
+                        )
+                    )
             elif self.performative == SigningMessage.Performative.SIGN_MESSAGE:
                 expected_nb_of_contents = 2
-                enforce(
-                    isinstance(self.terms, CustomTerms),
-                    "Invalid type for content 'terms'. Expected 'Terms'. Found '{}'.".format(
-                        type(self.terms)
-                    ),
-                )
-                enforce(
-                    isinstance(self.raw_message, CustomRawMessage),
-                    "Invalid type for content 'raw_message'. Expected 'RawMessage'. Found '{}'.".format(
-                        type(self.raw_message)
-                    ),
-                )
+                if not isinstance(self.terms, CustomTerms):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'terms'. Expected 'Terms'. Found '{}'.".format(
+                            type(self.terms)
+                        )
+                    )
+                if not isinstance(self.raw_message, CustomRawMessage):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'raw_message'. Expected 'RawMessage'. Found '{}'.".format(
+                            type(self.raw_message)
+                        )
+                    )
             elif self.performative == SigningMessage.Performative.SIGNED_TRANSACTION:
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.signed_transaction, CustomSignedTransaction),
-                    "Invalid type for content 'signed_transaction'. Expected 'SignedTransaction'. Found '{}'.".format(
-                        type(self.signed_transaction)
-                    ),
-                )
+                if not isinstance(self.signed_transaction, CustomSignedTransaction):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'signed_transaction'. Expected 'SignedTransaction'. Found '{}'.".format(
+                            type(self.signed_transaction)
+                        )
+                    )
             elif self.performative == SigningMessage.Performative.SIGNED_MESSAGE:
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.signed_message, CustomSignedMessage),
-                    "Invalid type for content 'signed_message'. Expected 'SignedMessage'. Found '{}'.".format(
-                        type(self.signed_message)
-                    ),
-                )
+                if not isinstance(self.signed_message, CustomSignedMessage):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'signed_message'. Expected 'SignedMessage'. Found '{}'.".format(
+                            type(self.signed_message)
+                        )
+                    )
             elif self.performative == SigningMessage.Performative.ERROR:
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.error_code, CustomErrorCode),
-                    "Invalid type for content 'error_code'. Expected 'ErrorCode'. Found '{}'.".format(
-                        type(self.error_code)
-                    ),
-                )
+                if not isinstance(self.error_code, CustomErrorCode):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'error_code'. Expected 'ErrorCode'. Found '{}'.".format(
+                            type(self.error_code)
+                        )
+                    )
 
             # Check correct content count
-            enforce(
-                expected_nb_of_contents == actual_nb_of_contents,
-                "Incorrect number of contents. Expected {}. Found {}".format(
-                    expected_nb_of_contents, actual_nb_of_contents
-                ),
-            )
+            if not (expected_nb_of_contents == actual_nb_of_contents):
+                raise AEAEnforceError(
+                    "Incorrect number of contents. Expected {}. Found {}".format(
+                        expected_nb_of_contents, actual_nb_of_contents
+                    )
+                )
 
             # Light Protocol Rule 3
             if self.message_id == 1:
-                enforce(
-                    self.target == 0,
-                    "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
-                        self.target
-                    ),
-                )
+                if not (self.target == 0):
+                    raise AEAEnforceError(
+                        "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
+                            self.target
+                        )
+                    )
         except (AEAEnforceError, ValueError, KeyError) as e:
             _default_logger.error(str(e))
             return False
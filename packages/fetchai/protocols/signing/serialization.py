@@ -22,7 +22,6 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
 from aea.mail.base_pb2 import Message as ProtobufMessage
 from aea.protocols.base import Message, Serializer
 
@@ -51,7 +50,7 @@ class SigningSerializer(Serializer):
         """
         msg = cast(SigningMessage, msg)
         message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
+        dialogue_message_pb = message_pb.dialogue_message
         signing_msg = signing_pb2.SigningMessage()
 
         dialogue_message_pb.message_id = msg.message_id
@@ -62,42 +61,41 @@ class SigningSerializer(Serializer):
 
         performative_id = msg.performative
         if performative_id == SigningMessage.Performative.SIGN_TRANSACTION:
-            performative = signing_pb2.SigningMessage.Sign_Transaction_Performative()  # type: ignore
+            performative = signing_msg.sign_transaction
+            performative.SetInParent()
             terms = msg.terms
             Terms.encode(performative.terms, terms)
             raw_transaction = msg.raw_transaction
             RawTransaction.encode(performative.raw_transaction, raw_transaction)
-            signing_msg.sign_transaction.CopyFrom(performative)
         elif performative_id == SigningMessage.Performative.SIGN_MESSAGE:
-            performative = signing_pb2.SigningMessage.Sign_Message_Performative()  # type: ignore
+            performative = signing_msg.sign_message
+            performative.SetInParent()
             terms = msg.terms
             Terms.encode(performative.terms, terms)
             raw_message = msg.raw_message
             RawMessage.encode(performative.raw_message, raw_message)
-            signing_msg.sign_message.CopyFrom(performative)
         elif performative_id == SigningMessage.Performative.SIGNED_TRANSACTION:
-            performative = signing_pb2.SigningMessage.Signed_Transaction_Performative()  # type: ignore
+            performative = signing_msg.signed_transaction
+            performative.SetInParent()
             signed_transaction = msg.signed_transaction
             SignedTransaction.encode(
                 performative.signed_transaction, signed_transaction
             )
-            signing_msg.signed_transaction.CopyFrom(performative)
         elif performative_id == SigningMessage.Performative.SIGNED_MESSAGE:
-            performative = signing_pb2.SigningMessage.Signed_Message_Performative()  # type: ignore
+            performative = signing_msg.signed_message
+            performative.SetInParent()
             signed_message = msg.signed_message
             SignedMessage.encode(performative.signed_message, signed_message)
-            signing_msg.signed_message.CopyFrom(performative)
         elif performative_id == SigningMessage.Performative.ERROR:
-            performative = signing_pb2.SigningMessage.Error_Performative()  # type: ignore
+            performative = signing_msg.error
+            performative.SetInParent()
             error_code = msg.error_code
             ErrorCode.encode(performative.error_code, error_code)
-            signing_msg.error.CopyFrom(performative)
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
         dialogue_message_pb.content = signing_msg.SerializeToString()
 
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
         message_bytes = message_pb.SerializeToString()
         return message_bytes
 
@@ -157,5 +155,6 @@ class SigningSerializer(Serializer):
             dialogue_reference=dialogue_reference,
             target=target,
             performative=performative,
+            _check_consistency=SigningMessage.check_consistency_on_decode,
             **performative_content
         )
@@ -159,204 +159,204 @@ class StateUpdateMessage(Message):
     def _is_consistent(self) -> bool:
         """Check that the message follows the state_update protocol."""
         try:
-            enforce(
-                isinstance(self.dialogue_reference, tuple),
-                "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
-                    type(self.dialogue_reference)
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[0], str),
-                "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[0])
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[1], str),
-                "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[1])
-                ),
-            )
-            enforce(
-                type(self.message_id) is int,
-                "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
-                    type(self.message_id)
-                ),
-            )
-            enforce(
-                type(self.target) is int,
-                "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
-                    type(self.target)
-                ),
-            )
+            if not isinstance(self.dialogue_reference, tuple):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.dialogue_reference)
+                    )
+                )
+            if not isinstance(self.dialogue_reference[0], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[0])
+                    )
+                )
+            if not isinstance(self.dialogue_reference[1], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[1])
+                    )
+                )
+            if not (type(self.message_id) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
+                        type(self.message_id)
+                    )
+                )
+            if not (type(self.target) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
+                        type(self.target)
+                    )
+                )
 
             # Light Protocol Rule 2
             # Check correct performative
-            enforce(
-                isinstance(self.performative, StateUpdateMessage.Performative),
-                "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
-                    self.valid_performatives, self.performative
-                ),
-            )
+            if not isinstance(self.performative, StateUpdateMessage.Performative):
+                raise AEAEnforceError(
+                    "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
+                        self.valid_performatives, self.performative
+                    )
+                )
 
             # Check correct contents
             actual_nb_of_contents = len(self._body) - DEFAULT_BODY_SIZE
             expected_nb_of_contents = 0
             if self.performative == StateUpdateMessage.Performative.INITIALIZE:
                 expected_nb_of_contents = 4
-                enforce(
-                    isinstance(self.exchange_params_by_currency_id, dict),
-                    "Invalid type for content 'exchange_params_by_currency_id'. Expected 'dict'. Found '{}'.".format(
-                        type(self.exchange_params_by_currency_id)
-                    ),
-                )
+                if not isinstance(self.exchange_params_by_currency_id, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'exchange_params_by_currency_id'. Expected 'dict'. Found '{}'.".format(
+                            type(self.exchange_params_by_currency_id)
+                        )
+                    )
                 for (
                     key_of_exchange_params_by_currency_id,
                     value_of_exchange_params_by_currency_id,
                 ) in self.exchange_params_by_currency_id.items():
-                    enforce(
-                        isinstance(key_of_exchange_params_by_currency_id, str),
-                        "Invalid type for dictionary keys in content 'exchange_params_by_currency_id'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_exchange_params_by_currency_id)
-                        ),
+                    if not isinstance(key_of_exchange_params_by_currency_id, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'exchange_params_by_currency_id'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_exchange_params_by_currency_id)
+                            )
+                        )
+                    if not isinstance(value_of_exchange_params_by_currency_id, float):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'exchange_params_by_currency_id'. Expected 'float'. Found '{}'.".format(
+                                type(value_of_exchange_params_by_currency_id)
+                            )
+                        )
+                if not isinstance(self.utility_params_by_good_id, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'utility_params_by_good_id'. Expected 'dict'. Found '{}'.".format(
+                            type(self.utility_params_by_good_id)
+                        )
                     )
-                    enforce(
-                        isinstance(value_of_exchange_params_by_currency_id, float),
-                        "Invalid type for dictionary values in content 'exchange_params_by_currency_id'. Expected 'float'. Found '{}'.".format(
-                            type(value_of_exchange_params_by_currency_id)
-                        ),
-                    )
-                enforce(
-                    isinstance(self.utility_params_by_good_id, dict),
-                    "Invalid type for content 'utility_params_by_good_id'. Expected 'dict'. Found '{}'.".format(
-                        type(self.utility_params_by_good_id)
-                    ),
-                )
                 for (
                     key_of_utility_params_by_good_id,
                     value_of_utility_params_by_good_id,
                 ) in self.utility_params_by_good_id.items():
-                    enforce(
-                        isinstance(key_of_utility_params_by_good_id, str),
-                        "Invalid type for dictionary keys in content 'utility_params_by_good_id'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_utility_params_by_good_id)
-                        ),
+                    if not isinstance(key_of_utility_params_by_good_id, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'utility_params_by_good_id'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_utility_params_by_good_id)
+                            )
+                        )
+                    if not isinstance(value_of_utility_params_by_good_id, float):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'utility_params_by_good_id'. Expected 'float'. Found '{}'.".format(
+                                type(value_of_utility_params_by_good_id)
+                            )
+                        )
+                if not isinstance(self.amount_by_currency_id, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'amount_by_currency_id'. Expected 'dict'. Found '{}'.".format(
+                            type(self.amount_by_currency_id)
+                        )
                     )
-                    enforce(
-                        isinstance(value_of_utility_params_by_good_id, float),
-                        "Invalid type for dictionary values in content 'utility_params_by_good_id'. Expected 'float'. Found '{}'.".format(
-                            type(value_of_utility_params_by_good_id)
-                        ),
-                    )
-                enforce(
-                    isinstance(self.amount_by_currency_id, dict),
-                    "Invalid type for content 'amount_by_currency_id'. Expected 'dict'. Found '{}'.".format(
-                        type(self.amount_by_currency_id)
-                    ),
-                )
                 for (
                     key_of_amount_by_currency_id,
                     value_of_amount_by_currency_id,
                 ) in self.amount_by_currency_id.items():
-                    enforce(
-                        isinstance(key_of_amount_by_currency_id, str),
-                        "Invalid type for dictionary keys in content 'amount_by_currency_id'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_amount_by_currency_id)
-                        ),
+                    if not isinstance(key_of_amount_by_currency_id, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'amount_by_currency_id'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_amount_by_currency_id)
+                            )
+                        )
+                    if not (type(value_of_amount_by_currency_id) is int):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'amount_by_currency_id'. Expected 'int'. Found '{}'.".format(
+                                type(value_of_amount_by_currency_id)
+                            )
+                        )
+                if not isinstance(self.quantities_by_good_id, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'quantities_by_good_id'. Expected 'dict'. Found '{}'.".format(
+                            type(self.quantities_by_good_id)
+                        )
                     )
-                    enforce(
-                        type(value_of_amount_by_currency_id) is int,
-                        "Invalid type for dictionary values in content 'amount_by_currency_id'. Expected 'int'. Found '{}'.".format(
-                            type(value_of_amount_by_currency_id)
-                        ),
-                    )
-                enforce(
-                    isinstance(self.quantities_by_good_id, dict),
-                    "Invalid type for content 'quantities_by_good_id'. Expected 'dict'. Found '{}'.".format(
-                        type(self.quantities_by_good_id)
-                    ),
-                )
                 for (
                     key_of_quantities_by_good_id,
                     value_of_quantities_by_good_id,
                 ) in self.quantities_by_good_id.items():
-                    enforce(
-                        isinstance(key_of_quantities_by_good_id, str),
-                        "Invalid type for dictionary keys in content 'quantities_by_good_id'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_quantities_by_good_id)
-                        ),
-                    )
-                    enforce(
-                        type(value_of_quantities_by_good_id) is int,
-                        "Invalid type for dictionary values in content 'quantities_by_good_id'. Expected 'int'. Found '{}'.".format(
-                            type(value_of_quantities_by_good_id)
-                        ),
-                    )
+                    if not isinstance(key_of_quantities_by_good_id, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'quantities_by_good_id'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_quantities_by_good_id)
+                            )
+                        )
+                    if not (type(value_of_quantities_by_good_id) is int):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'quantities_by_good_id'. Expected 'int'. Found '{}'.".format(
+                                type(value_of_quantities_by_good_id)
+                            )
+                        )
             elif self.performative == StateUpdateMessage.Performative.APPLY:
                 expected_nb_of_contents = 2
-                enforce(
-                    isinstance(self.amount_by_currency_id, dict),
-                    "Invalid type for content 'amount_by_currency_id'. Expected 'dict'. Found '{}'.".format(
-                        type(self.amount_by_currency_id)
-                    ),
-                )
+                if not isinstance(self.amount_by_currency_id, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'amount_by_currency_id'. Expected 'dict'. Found '{}'.".format(
+                            type(self.amount_by_currency_id)
+                        )
+                    )
                 for (
                     key_of_amount_by_currency_id,
                     value_of_amount_by_currency_id,
                 ) in self.amount_by_currency_id.items():
-                    enforce(
-                        isinstance(key_of_amount_by_currency_id, str),
-                        "Invalid type for dictionary keys in content 'amount_by_currency_id'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_amount_by_currency_id)
-                        ),
+                    if not isinstance(key_of_amount_by_currency_id, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'amount_by_currency_id'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_amount_by_currency_id)
+                            )
+                        )
+                    if not (type(value_of_amount_by_currency_id) is int):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'amount_by_currency_id'. Expected 'int'. Found '{}'.".format(
+                                type(value_of_amount_by_currency_id)
+                            )
+                        )
+                if not isinstance(self.quantities_by_good_id, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'quantities_by_good_id'. Expected 'dict'. Found '{}'.".format(
+                            type(self.quantities_by_good_id)
+                        )
                     )
-                    enforce(
-                        type(value_of_amount_by_currency_id) is int,
-                        "Invalid type for dictionary values in content 'amount_by_currency_id'. Expected 'int'. Found '{}'.".format(
-                            type(value_of_amount_by_currency_id)
-                        ),
-                    )
-                enforce(
-                    isinstance(self.quantities_by_good_id, dict),
-                    "Invalid type for content 'quantities_by_good_id'. Expected 'dict'. Found '{}'.".format(
-                        type(self.quantities_by_good_id)
-                    ),
-                )
                 for (
                     key_of_quantities_by_good_id,
                     value_of_quantities_by_good_id,
                 ) in self.quantities_by_good_id.items():
-                    enforce(
-                        isinstance(key_of_quantities_by_good_id, str),
-                        "Invalid type for dictionary keys in content 'quantities_by_good_id'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_quantities_by_good_id)
-                        ),
-                    )
-                    enforce(
-                        type(value_of_quantities_by_good_id) is int,
-                        "Invalid type for dictionary values in content 'quantities_by_good_id'. Expected 'int'. Found '{}'.".format(
-                            type(value_of_quantities_by_good_id)
-                        ),
-                    )
+                    if not isinstance(key_of_quantities_by_good_id, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'quantities_by_good_id'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_quantities_by_good_id)
+                            )
+                        )
+                    if not (type(value_of_quantities_by_good_id) is int):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'quantities_by_good_id'. Expected 'int'. Found '{}'.".format(
+                                type(value_of_quantities_by_good_id)
+                            )
+                        )
             elif self.performative == StateUpdateMessage.Performative.END:
                 expected_nb_of_contents = 0
 
             # Check correct content count
-            enforce(
-                expected_nb_of_contents == actual_nb_of_contents,
-                "Incorrect number of contents. Expected {}. Found {}".format(
-                    expected_nb_of_contents, actual_nb_of_contents
-                ),
-            )
+            if not (expected_nb_of_contents == actual_nb_of_contents):
+                raise AEAEnforceError(
+                    "Incorrect number of contents. Expected {}. Found {}".format(
+                        expected_nb_of_contents, actual_nb_of_contents
+                    )
+                )
 
             # Light Protocol Rule 3
             if self.message_id == 1:
-                enforce(
-                    self.target == 0,
-                    "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
-                        self.target
-                    ),
-                )
+                if not (self.target == 0):
+                    raise AEAEnforceError(
+                        "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
+                            self.target
+                        )
+                    )
         except (AEAEnforceError, ValueError, KeyError) as e:
             _default_logger.error(str(e))
             return False
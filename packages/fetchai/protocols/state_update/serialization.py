@@ -22,7 +22,6 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
 from aea.mail.base_pb2 import Message as ProtobufMessage
 from aea.protocols.base import Message, Serializer
 
@@ -43,7 +42,7 @@ class StateUpdateSerializer(Serializer):
         """
         msg = cast(StateUpdateMessage, msg)
         message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
+        dialogue_message_pb = message_pb.dialogue_message
         state_update_msg = state_update_pb2.StateUpdateMessage()
 
         dialogue_message_pb.message_id = msg.message_id
@@ -54,7 +53,8 @@ class StateUpdateSerializer(Serializer):
 
         performative_id = msg.performative
         if performative_id == StateUpdateMessage.Performative.INITIALIZE:
-            performative = state_update_pb2.StateUpdateMessage.Initialize_Performative()  # type: ignore
+            performative = state_update_msg.initialize
+            performative.SetInParent()
             exchange_params_by_currency_id = msg.exchange_params_by_currency_id
             performative.exchange_params_by_currency_id.update(
                 exchange_params_by_currency_id
@@ -65,23 +65,21 @@ class StateUpdateSerializer(Serializer):
             performative.amount_by_currency_id.update(amount_by_currency_id)
             quantities_by_good_id = msg.quantities_by_good_id
             performative.quantities_by_good_id.update(quantities_by_good_id)
-            state_update_msg.initialize.CopyFrom(performative)
         elif performative_id == StateUpdateMessage.Performative.APPLY:
-            performative = state_update_pb2.StateUpdateMessage.Apply_Performative()  # type: ignore
+            performative = state_update_msg.apply
+            performative.SetInParent()
             amount_by_currency_id = msg.amount_by_currency_id
             performative.amount_by_currency_id.update(amount_by_currency_id)
             quantities_by_good_id = msg.quantities_by_good_id
             performative.quantities_by_good_id.update(quantities_by_good_id)
-            state_update_msg.apply.CopyFrom(performative)
         elif performative_id == StateUpdateMessage.Performative.END:
-            performative = state_update_pb2.StateUpdateMessage.End_Performative()  # type: ignore
-            state_update_msg.end.CopyFrom(performative)
+            performative = state_update_msg.end
+            performative.SetInParent()
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
         dialogue_message_pb.content = state_update_msg.SerializeToString()
 
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
         message_bytes = message_pb.SerializeToString()
         return message_bytes
 
@@ -145,5 +143,6 @@ class StateUpdateSerializer(Serializer):
             dialogue_reference=dialogue_reference,
             target=target,
             performative=performative,
+            _check_consistency=StateUpdateMessage.check_consistency_on_decode,
             **performative_content
         )
@@ -294,476 +294,476 @@ class TacMessage(Message):
     def _is_consistent(self) -> bool:
         """Check that the message follows the tac protocol."""
         try:
-            enforce(
-                isinstance(self.dialogue_reference, tuple),
-                "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
-                    type(self.dialogue_reference)
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[0], str),
-                "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[0])
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[1], str),
-                "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[1])
-                ),
-            )
-            enforce(
-                type(self.message_id) is int,
-                "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
-                    type(self.message_id)
-                ),
-            )
-            enforce(
-                type(self.target) is int,
-                "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
-                    type(self.target)
-                ),
-            )
+            if not isinstance(self.dialogue_reference, tuple):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.dialogue_reference)
+                    )
+                )
+            if not isinstance(self.dialogue_reference[0], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[0])
+                    )
+                )
+            if not isinstance(self.dialogue_reference[1], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[1])
+                    )
+                )
+            if not (type(self.message_id) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
+                        type(self.message_id)
+                    )
+                )
+            if not (type(self.target) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
+                        type(self.target)
+                    )
+                )
 
             # Light Protocol Rule 2
             # Check correct performative
-            enforce(
-                isinstance(self.performative, TacMessage.Performative),
-                "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
-                    self.valid_performatives, self.performative
-                ),
-            )
+            if not isinstance(self.performative, TacMessage.Performative):
+                raise AEAEnforceError(
+                    "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
+                        self.valid_performatives, self.performative
+                    )
+                )
 
             # Check correct contents
             actual_nb_of_contents = len(self._body) - DEFAULT_BODY_SIZE
             expected_nb_of_contents = 0
             if self.performative == TacMessage.Performative.REGISTER:
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.agent_name, str),
-                    "Invalid type for content 'agent_name'. Expected 'str'. Found '{}'.".format(
-                        type(self.agent_name)
-                    ),
-                )
+                if not isinstance(self.agent_name, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'agent_name'. Expected 'str'. Found '{}'.".format(
+                            type(self.agent_name)
+                        )
+                    )
             elif self.performative == TacMessage.Performative.UNREGISTER:
                 expected_nb_of_contents = 0
             elif self.performative == TacMessage.Performative.TRANSACTION:
                 expected_nb_of_contents = 10
-                enforce(
-                    isinstance(self.transaction_id, str),
-                    "Invalid type for content 'transaction_id'. Expected 'str'. Found '{}'.".format(
-                        type(self.transaction_id)
-                    ),
-                )
-                enforce(
-                    isinstance(self.ledger_id, str),
-                    "Invalid type for content 'ledger_id'. Expected 'str'. Found '{}'.".format(
-                        type(self.ledger_id)
-                    ),
-                )
-                enforce(
-                    isinstance(self.sender_address, str),
-                    "Invalid type for content 'sender_address'. Expected 'str'. Found '{}'.".format(
-                        type(self.sender_address)
-                    ),
-                )
-                enforce(
-                    isinstance(self.counterparty_address, str),
-                    "Invalid type for content 'counterparty_address'. Expected 'str'. Found '{}'.".format(
-                        type(self.counterparty_address)
-                    ),
-                )
-                enforce(
-                    isinstance(self.amount_by_currency_id, dict),
-                    "Invalid type for content 'amount_by_currency_id'. Expected 'dict'. Found '{}'.".format(
-                        type(self.amount_by_currency_id)
-                    ),
-                )
+                if not isinstance(self.transaction_id, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'transaction_id'. Expected 'str'. Found '{}'.".format(
+                            type(self.transaction_id)
+                        )
+                    )
+                if not isinstance(self.ledger_id, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'ledger_id'. Expected 'str'. Found '{}'.".format(
+                            type(self.ledger_id)
+                        )
+                    )
+                if not isinstance(self.sender_address, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'sender_address'. Expected 'str'. Found '{}'.".format(
+                            type(self.sender_address)
+                        )
+                    )
+                if not isinstance(self.counterparty_address, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'counterparty_address'. Expected 'str'. Found '{}'.".format(
+                            type(self.counterparty_address)
+                        )
+                    )
+                if not isinstance(self.amount_by_currency_id, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'amount_by_currency_id'. Expected 'dict'. Found '{}'.".format(
+                            type(self.amount_by_currency_id)
+                        )
+                    )
                 for (
                     key_of_amount_by_currency_id,
                     value_of_amount_by_currency_id,
                 ) in self.amount_by_currency_id.items():
-                    enforce(
-                        isinstance(key_of_amount_by_currency_id, str),
-                        "Invalid type for dictionary keys in content 'amount_by_currency_id'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_amount_by_currency_id)
-                        ),
-                    )
-                    enforce(
-                        type(value_of_amount_by_currency_id) is int,
-                        "Invalid type for dictionary values in content 'amount_by_currency_id'. Expected 'int'. Found '{}'.".format(
-                            type(value_of_amount_by_currency_id)
-                        ),
-                    )
-                enforce(
-                    isinstance(self.fee_by_currency_id, dict),
-                    "Invalid type for content 'fee_by_currency_id'. Expected 'dict'. Found '{}'.".format(
-                        type(self.fee_by_currency_id)
-                    ),
-                )
+                    if not isinstance(key_of_amount_by_currency_id, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'amount_by_currency_id'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_amount_by_currency_id)
+                            )
+                        )
+                    if not (type(value_of_amount_by_currency_id) is int):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'amount_by_currency_id'. Expected 'int'. Found '{}'.".format(
+                                type(value_of_amount_by_currency_id)
+                            )
+                        )
+                if not isinstance(self.fee_by_currency_id, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'fee_by_currency_id'. Expected 'dict'. Found '{}'.".format(
+                            type(self.fee_by_currency_id)
+                        )
+                    )
                 for (
                     key_of_fee_by_currency_id,
                     value_of_fee_by_currency_id,
                 ) in self.fee_by_currency_id.items():
-                    enforce(
-                        isinstance(key_of_fee_by_currency_id, str),
-                        "Invalid type for dictionary keys in content 'fee_by_currency_id'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_fee_by_currency_id)
-                        ),
-                    )
-                    enforce(
-                        type(value_of_fee_by_currency_id) is int,
-                        "Invalid type for dictionary values in content 'fee_by_currency_id'. Expected 'int'. Found '{}'.".format(
-                            type(value_of_fee_by_currency_id)
-                        ),
-                    )
-                enforce(
-                    isinstance(self.quantities_by_good_id, dict),
-                    "Invalid type for content 'quantities_by_good_id'. Expected 'dict'. Found '{}'.".format(
-                        type(self.quantities_by_good_id)
-                    ),
-                )
+                    if not isinstance(key_of_fee_by_currency_id, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'fee_by_currency_id'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_fee_by_currency_id)
+                            )
+                        )
+                    if not (type(value_of_fee_by_currency_id) is int):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'fee_by_currency_id'. Expected 'int'. Found '{}'.".format(
+                                type(value_of_fee_by_currency_id)
+                            )
+                        )
+                if not isinstance(self.quantities_by_good_id, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'quantities_by_good_id'. Expected 'dict'. Found '{}'.".format(
+                            type(self.quantities_by_good_id)
+                        )
+                    )
                 for (
                     key_of_quantities_by_good_id,
                     value_of_quantities_by_good_id,
                 ) in self.quantities_by_good_id.items():
-                    enforce(
-                        isinstance(key_of_quantities_by_good_id, str),
-                        "Invalid type for dictionary keys in content 'quantities_by_good_id'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_quantities_by_good_id)
-                        ),
-                    )
-                    enforce(
-                        type(value_of_quantities_by_good_id) is int,
-                        "Invalid type for dictionary values in content 'quantities_by_good_id'. Expected 'int'. Found '{}'.".format(
-                            type(value_of_quantities_by_good_id)
-                        ),
-                    )
-                enforce(
-                    isinstance(self.nonce, str),
-                    "Invalid type for content 'nonce'. Expected 'str'. Found '{}'.".format(
-                        type(self.nonce)
-                    ),
-                )
-                enforce(
-                    isinstance(self.sender_signature, str),
-                    "Invalid type for content 'sender_signature'. Expected 'str'. Found '{}'.".format(
-                        type(self.sender_signature)
-                    ),
-                )
-                enforce(
-                    isinstance(self.counterparty_signature, str),
-                    "Invalid type for content 'counterparty_signature'. Expected 'str'. Found '{}'.".format(
-                        type(self.counterparty_signature)
-                    ),
-                )
+                    if not isinstance(key_of_quantities_by_good_id, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'quantities_by_good_id'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_quantities_by_good_id)
+                            )
+                        )
+                    if not (type(value_of_quantities_by_good_id) is int):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'quantities_by_good_id'. Expected 'int'. Found '{}'.".format(
+                                type(value_of_quantities_by_good_id)
+                            )
+                        )
+                if not isinstance(self.nonce, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'nonce'. Expected 'str'. Found '{}'.".format(
+                            type(self.nonce)
+                        )
+                    )
+                if not isinstance(self.sender_signature, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'sender_signature'. Expected 'str'. Found '{}'.".format(
+                            type(self.sender_signature)
+                        )
+                    )
+                if not isinstance(self.counterparty_signature, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'counterparty_signature'. Expected 'str'. Found '{}'.".format(
+                            type(self.counterparty_signature)
+                        )
+                    )
             elif self.performative == TacMessage.Performative.CANCELLED:
                 expected_nb_of_contents = 0
             elif self.performative == TacMessage.Performative.GAME_DATA:
                 expected_nb_of_contents = 9
-                enforce(
-                    isinstance(self.amount_by_currency_id, dict),
-                    "Invalid type for content 'amount_by_currency_id'. Expected 'dict'. Found '{}'.".format(
-                        type(self.amount_by_currency_id)
-                    ),
-                )
+                if not isinstance(self.amount_by_currency_id, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'amount_by_currency_id'. Expected 'dict'. Found '{}'.".format(
+                            type(self.amount_by_currency_id)
+                        )
+                    )
                 for (
                     key_of_amount_by_currency_id,
                     value_of_amount_by_currency_id,
                 ) in self.amount_by_currency_id.items():
-                    enforce(
-                        isinstance(key_of_amount_by_currency_id, str),
-                        "Invalid type for dictionary keys in content 'amount_by_currency_id'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_amount_by_currency_id)
-                        ),
-                    )
-                    enforce(
-                        type(value_of_amount_by_currency_id) is int,
-                        "Invalid type for dictionary values in content 'amount_by_currency_id'. Expected 'int'. Found '{}'.".format(
-                            type(value_of_amount_by_currency_id)
-                        ),
-                    )
-                enforce(
-                    isinstance(self.exchange_params_by_currency_id, dict),
-                    "Invalid type for content 'exchange_params_by_currency_id'. Expected 'dict'. Found '{}'.".format(
-                        type(self.exchange_params_by_currency_id)
-                    ),
-                )
+                    if not isinstance(key_of_amount_by_currency_id, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'amount_by_currency_id'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_amount_by_currency_id)
+                            )
+                        )
+                    if not (type(value_of_amount_by_currency_id) is int):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'amount_by_currency_id'. Expected 'int'. Found '{}'.".format(
+                                type(value_of_amount_by_currency_id)
+                            )
+                        )
+                if not isinstance(self.exchange_params_by_currency_id, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'exchange_params_by_currency_id'. Expected 'dict'. Found '{}'.".format(
+                            type(self.exchange_params_by_currency_id)
+                        )
+                    )
                 for (
                     key_of_exchange_params_by_currency_id,
                     value_of_exchange_params_by_currency_id,
                 ) in self.exchange_params_by_currency_id.items():
-                    enforce(
-                        isinstance(key_of_exchange_params_by_currency_id, str),
-                        "Invalid type for dictionary keys in content 'exchange_params_by_currency_id'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_exchange_params_by_currency_id)
-                        ),
-                    )
-                    enforce(
-                        isinstance(value_of_exchange_params_by_currency_id, float),
-                        "Invalid type for dictionary values in content 'exchange_params_by_currency_id'. Expected 'float'. Found '{}'.".format(
-                            type(value_of_exchange_params_by_currency_id)
-                        ),
-                    )
-                enforce(
-                    isinstance(self.quantities_by_good_id, dict),
-                    "Invalid type for content 'quantities_by_good_id'. Expected 'dict'. Found '{}'.".format(
-                        type(self.quantities_by_good_id)
-                    ),
-                )
+                    if not isinstance(key_of_exchange_params_by_currency_id, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'exchange_params_by_currency_id'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_exchange_params_by_currency_id)
+                            )
+                        )
+                    if not isinstance(value_of_exchange_params_by_currency_id, float):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'exchange_params_by_currency_id'. Expected 'float'. Found '{}'.".format(
+                                type(value_of_exchange_params_by_currency_id)
+                            )
+                        )
+                if not isinstance(self.quantities_by_good_id, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'quantities_by_good_id'. Expected 'dict'. Found '{}'.".format(
+                            type(self.quantities_by_good_id)
+                        )
+                    )
                 for (
                     key_of_quantities_by_good_id,
                     value_of_quantities_by_good_id,
                 ) in self.quantities_by_good_id.items():
-                    enforce(
-                        isinstance(key_of_quantities_by_good_id, str),
-                        "Invalid type for dictionary keys in content 'quantities_by_good_id'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_quantities_by_good_id)
-                        ),
-                    )
-                    enforce(
-                        type(value_of_quantities_by_good_id) is int,
-                        "Invalid type for dictionary values in content 'quantities_by_good_id'. Expected 'int'. Found '{}'.".format(
-                            type(value_of_quantities_by_good_id)
-                        ),
-                    )
-                enforce(
-                    isinstance(self.utility_params_by_good_id, dict),
-                    "Invalid type for content 'utility_params_by_good_id'. Expected 'dict'. Found '{}'.".format(
-                        type(self.utility_params_by_good_id)
-                    ),
-                )
+                    if not isinstance(key_of_quantities_by_good_id, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'quantities_by_good_id'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_quantities_by_good_id)
+                            )
+                        )
+                    if not (type(value_of_quantities_by_good_id) is int):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'quantities_by_good_id'. Expected 'int'. Found '{}'.".format(
+                                type(value_of_quantities_by_good_id)
+                            )
+                        )
+                if not isinstance(self.utility_params_by_good_id, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'utility_params_by_good_id'. Expected 'dict'. Found '{}'.".format(
+                            type(self.utility_params_by_good_id)
+                        )
+                    )
                 for (
                     key_of_utility_params_by_good_id,
                     value_of_utility_params_by_good_id,
                 ) in self.utility_params_by_good_id.items():
-                    enforce(
-                        isinstance(key_of_utility_params_by_good_id, str),
-                        "Invalid type for dictionary keys in content 'utility_params_by_good_id'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_utility_params_by_good_id)
-                        ),
-                    )
-                    enforce(
-                        isinstance(value_of_utility_params_by_good_id, float),
-                        "Invalid type for dictionary values in content 'utility_params_by_good_id'. Expected 'float'. Found '{}'.".format(
-                            type(value_of_utility_params_by_good_id)
-                        ),
-                    )
-                enforce(
-                    isinstance(self.fee_by_currency_id, dict),
-                    "Invalid type for content 'fee_by_currency_id'. Expected 'dict'. Found '{}'.".format(
-                        type(self.fee_by_currency_id)
-                    ),
-                )
+                    if not isinstance(key_of_utility_params_by_good_id, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'utility_params_by_good_id'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_utility_params_by_good_id)
+                            )
+                        )
+                    if not isinstance(value_of_utility_params_by_good_id, float):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'utility_params_by_good_id'. Expected 'float'. Found '{}'.".format(
+                                type(value_of_utility_params_by_good_id)
+                            )
+                        )
+                if not isinstance(self.fee_by_currency_id, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'fee_by_currency_id'. Expected 'dict'. Found '{}'.".format(
+                            type(self.fee_by_currency_id)
+                        )
+                    )
                 for (
                     key_of_fee_by_currency_id,
                     value_of_fee_by_currency_id,
                 ) in self.fee_by_currency_id.items():
-                    enforce(
-                        isinstance(key_of_fee_by_currency_id, str),
-                        "Invalid type for dictionary keys in content 'fee_by_currency_id'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_fee_by_currency_id)
-                        ),
-                    )
-                    enforce(
-                        type(value_of_fee_by_currency_id) is int,
-                        "Invalid type for dictionary values in content 'fee_by_currency_id'. Expected 'int'. Found '{}'.".format(
-                            type(value_of_fee_by_currency_id)
-                        ),
-                    )
-                enforce(
-                    isinstance(self.agent_addr_to_name, dict),
-                    "Invalid type for content 'agent_addr_to_name'. Expected 'dict'. Found '{}'.".format(
-                        type(self.agent_addr_to_name)
-                    ),
-                )
+                    if not isinstance(key_of_fee_by_currency_id, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'fee_by_currency_id'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_fee_by_currency_id)
+                            )
+                        )
+                    if not (type(value_of_fee_by_currency_id) is int):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'fee_by_currency_id'. Expected 'int'. Found '{}'.".format(
+                                type(value_of_fee_by_currency_id)
+                            )
+                        )
+                if not isinstance(self.agent_addr_to_name, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'agent_addr_to_name'. Expected 'dict'. Found '{}'.".format(
+                            type(self.agent_addr_to_name)
+                        )
+                    )
                 for (
                     key_of_agent_addr_to_name,
                     value_of_agent_addr_to_name,
                 ) in self.agent_addr_to_name.items():
-                    enforce(
-                        isinstance(key_of_agent_addr_to_name, str),
-                        "Invalid type for dictionary keys in content 'agent_addr_to_name'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_agent_addr_to_name)
-                        ),
-                    )
-                    enforce(
-                        isinstance(value_of_agent_addr_to_name, str),
-                        "Invalid type for dictionary values in content 'agent_addr_to_name'. Expected 'str'. Found '{}'.".format(
-                            type(value_of_agent_addr_to_name)
-                        ),
-                    )
-                enforce(
-                    isinstance(self.currency_id_to_name, dict),
-                    "Invalid type for content 'currency_id_to_name'. Expected 'dict'. Found '{}'.".format(
-                        type(self.currency_id_to_name)
-                    ),
-                )
+                    if not isinstance(key_of_agent_addr_to_name, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'agent_addr_to_name'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_agent_addr_to_name)
+                            )
+                        )
+                    if not isinstance(value_of_agent_addr_to_name, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'agent_addr_to_name'. Expected 'str'. Found '{}'.".format(
+                                type(value_of_agent_addr_to_name)
+                            )
+                        )
+                if not isinstance(self.currency_id_to_name, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'currency_id_to_name'. Expected 'dict'. Found '{}'.".format(
+                            type(self.currency_id_to_name)
+                        )
+                    )
                 for (
                     key_of_currency_id_to_name,
                     value_of_currency_id_to_name,
                 ) in self.currency_id_to_name.items():
-                    enforce(
-                        isinstance(key_of_currency_id_to_name, str),
-                        "Invalid type for dictionary keys in content 'currency_id_to_name'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_currency_id_to_name)
-                        ),
-                    )
-                    enforce(
-                        isinstance(value_of_currency_id_to_name, str),
-                        "Invalid type for dictionary values in content 'currency_id_to_name'. Expected 'str'. Found '{}'.".format(
-                            type(value_of_currency_id_to_name)
-                        ),
-                    )
-                enforce(
-                    isinstance(self.good_id_to_name, dict),
-                    "Invalid type for content 'good_id_to_name'. Expected 'dict'. Found '{}'.".format(
-                        type(self.good_id_to_name)
-                    ),
-                )
+                    if not isinstance(key_of_currency_id_to_name, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'currency_id_to_name'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_currency_id_to_name)
+                            )
+                        )
+                    if not isinstance(value_of_currency_id_to_name, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'currency_id_to_name'. Expected 'str'. Found '{}'.".format(
+                                type(value_of_currency_id_to_name)
+                            )
+                        )
+                if not isinstance(self.good_id_to_name, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'good_id_to_name'. Expected 'dict'. Found '{}'.".format(
+                            type(self.good_id_to_name)
+                        )
+                    )
                 for (
                     key_of_good_id_to_name,
                     value_of_good_id_to_name,
                 ) in self.good_id_to_name.items():
-                    enforce(
-                        isinstance(key_of_good_id_to_name, str),
-                        "Invalid type for dictionary keys in content 'good_id_to_name'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_good_id_to_name)
-                        ),
-                    )
-                    enforce(
-                        isinstance(value_of_good_id_to_name, str),
-                        "Invalid type for dictionary values in content 'good_id_to_name'. Expected 'str'. Found '{}'.".format(
-                            type(value_of_good_id_to_name)
-                        ),
-                    )
-                enforce(
-                    isinstance(self.version_id, str),
-                    "Invalid type for content 'version_id'. Expected 'str'. Found '{}'.".format(
-                        type(self.version_id)
-                    ),
-                )
+                    if not isinstance(key_of_good_id_to_name, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'good_id_to_name'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_good_id_to_name)
+                            )
+                        )
+                    if not isinstance(value_of_good_id_to_name, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'good_id_to_name'. Expected 'str'. Found '{}'.".format(
+                                type(value_of_good_id_to_name)
+                            )
+                        )
+                if not isinstance(self.version_id, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'version_id'. Expected 'str'. Found '{}'.".format(
+                            type(self.version_id)
+                        )
+                    )
                 if self.is_set("info"):
                     expected_nb_of_contents += 1
                     info = cast(Dict[str, str], self.info)
-                    enforce(
-                        isinstance(info, dict),
-                        "Invalid type for content 'info'. Expected 'dict'. Found '{}'.".format(
-                            type(info)
-                        ),
-                    )
-                    for key_of_info, value_of_info in info.items():
-                        enforce(
-                            isinstance(key_of_info, str),
-                            "Invalid type for dictionary keys in content 'info'. Expected 'str'. Found '{}'.".format(
-                                type(key_of_info)
-                            ),
-                        )
-                        enforce(
-                            isinstance(value_of_info, str),
-                            "Invalid type for dictionary values in content 'info'. Expected 'str'. Found '{}'.".format(
-                                type(value_of_info)
-                            ),
+                    if not isinstance(info, dict):
+                        raise AEAEnforceError(
+                            "Invalid type for content 'info'. Expected 'dict'. Found '{}'.".format(
+                                type(info)
+                            )
                         )
+                    for key_of_info, value_of_info in info.items():
+                        if not isinstance(key_of_info, str):
+                            raise AEAEnforceError(
+                                "Invalid type for dictionary keys in content 'info'. Expected 'str'. Found '{}'.".format(
+                                    type(key_of_info)
+                                )
+                            )
+                        if not isinstance(value_of_info, str):
+                            raise AEAEnforceError(
+                                "Invalid type for dictionary values in content 'info'. Expected 'str'. Found '{}'.".format(
+                                    type(value_of_info)
+                                )
+                            )
             elif self.performative == TacMessage.Performative.TRANSACTION_CONFIRMATION:
                 expected_nb_of_contents = 3
-                enforce(
-                    isinstance(self.transaction_id, str),
-                    "Invalid type for content 'transaction_id'. Expected 'str'. Found '{}'.".format(
-                        type(self.transaction_id)
-                    ),
-                )
-                enforce(
-                    isinstance(self.amount_by_currency_id, dict),
-                    "Invalid type for content 'amount_by_currency_id'. Expected 'dict'. Found '{}'.".format(
-                        type(self.amount_by_currency_id)
-                    ),
-                )
+                if not isinstance(self.transaction_id, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'transaction_id'. Expected 'str'. Found '{}'.".format(
+                            type(self.transaction_id)
+                        )
+                    )
+                if not isinstance(self.amount_by_currency_id, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'amount_by_currency_id'. Expected 'dict'. Found '{}'.".format(
+                            type(self.amount_by_currency_id)
+                        )
+                    )
                 for (
                     key_of_amount_by_currency_id,
                     value_of_amount_by_currency_id,
                 ) in self.amount_by_currency_id.items():
-                    enforce(
-                        isinstance(key_of_amount_by_currency_id, str),
-                        "Invalid type for dictionary keys in content 'amount_by_currency_id'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_amount_by_currency_id)
-                        ),
-                    )
-                    enforce(
-                        type(value_of_amount_by_currency_id) is int,
-                        "Invalid type for dictionary values in content 'amount_by_currency_id'. Expected 'int'. Found '{}'.".format(
-                            type(value_of_amount_by_currency_id)
-                        ),
-                    )
-                enforce(
-                    isinstance(self.quantities_by_good_id, dict),
-                    "Invalid type for content 'quantities_by_good_id'. Expected 'dict'. Found '{}'.".format(
-                        type(self.quantities_by_good_id)
-                    ),
-                )
+                    if not isinstance(key_of_amount_by_currency_id, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'amount_by_currency_id'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_amount_by_currency_id)
+                            )
+                        )
+                    if not (type(value_of_amount_by_currency_id) is int):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'amount_by_currency_id'. Expected 'int'. Found '{}'.".format(
+                                type(value_of_amount_by_currency_id)
+                            )
+                        )
+                if not isinstance(self.quantities_by_good_id, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'quantities_by_good_id'. Expected 'dict'. Found '{}'.".format(
+                            type(self.quantities_by_good_id)
+                        )
+                    )
                 for (
                     key_of_quantities_by_good_id,
                     value_of_quantities_by_good_id,
                 ) in self.quantities_by_good_id.items():
-                    enforce(
-                        isinstance(key_of_quantities_by_good_id, str),
-                        "Invalid type for dictionary keys in content 'quantities_by_good_id'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_quantities_by_good_id)
-                        ),
-                    )
-                    enforce(
-                        type(value_of_quantities_by_good_id) is int,
-                        "Invalid type for dictionary values in content 'quantities_by_good_id'. Expected 'int'. Found '{}'.".format(
-                            type(value_of_quantities_by_good_id)
-                        ),
-                    )
+                    if not isinstance(key_of_quantities_by_good_id, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'quantities_by_good_id'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_quantities_by_good_id)
+                            )
+                        )
+                    if not (type(value_of_quantities_by_good_id) is int):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'quantities_by_good_id'. Expected 'int'. Found '{}'.".format(
+                                type(value_of_quantities_by_good_id)
+                            )
+                        )
             elif self.performative == TacMessage.Performative.TAC_ERROR:
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.error_code, CustomErrorCode),
-                    "Invalid type for content 'error_code'. Expected 'ErrorCode'. Found '{}'.".format(
-                        type(self.error_code)
-                    ),
-                )
+                if not isinstance(self.error_code, CustomErrorCode):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'error_code'. Expected 'ErrorCode'. Found '{}'.".format(
+                            type(self.error_code)
+                        )
+                    )
                 if self.is_set("info"):
                     expected_nb_of_contents += 1
                     info = cast(Dict[str, str], self.info)
-                    enforce(
-                        isinstance(info, dict),
-                        "Invalid type for content 'info'. Expected 'dict'. Found '{}'.".format(
-                            type(info)
-                        ),
-                    )
-                    for key_of_info, value_of_info in info.items():
-                        enforce(
-                            isinstance(key_of_info, str),
-                            "Invalid type for dictionary keys in content 'info'. Expected 'str'. Found '{}'.".format(
-                                type(key_of_info)
-                            ),
-                        )
-                        enforce(
-                            isinstance(value_of_info, str),
-                            "Invalid type for dictionary values in content 'info'. Expected 'str'. Found '{}'.".format(
-                                type(value_of_info)
-                            ),
+                    if not isinstance(info, dict):
+                        raise AEAEnforceError(
+                            "Invalid type for content 'info'. Expected 'dict'. Found '{}'.".format(
+                                type(info)
+                            )
                         )
+                    for key_of_info, value_of_info in info.items():
+                        if not isinstance(key_of_info, str):
+                            raise AEAEnforceError(
+                                "Invalid type for dictionary keys in content 'info'. Expected 'str'. Found '{}'.".format(
+                                    type(key_of_info)
+                                )
+                            )
+                        if not isinstance(value_of_info, str):
+                            raise AEAEnforceError(
+                                "Invalid type for dictionary values in content 'info'. Expected 'str'. Found '{}'.".format(
+                                    type(value_of_info)
+                                )
+                            )
 
             # Check correct content count
-            enforce(
-                expected_nb_of_contents == actual_nb_of_contents,
-                "Incorrect number of contents. Expected {}. Found {}".format(
-                    expected_nb_of_contents, actual_nb_of_contents
-                ),
-            )
+            if not (expected_nb_of_contents == actual_nb_of_contents):
+                raise AEAEnforceError(
+                    "Incorrect number of contents. Expected {}. Found {}".format(
+                        expected_nb_of_contents, actual_nb_of_contents
+                    )
+                )
 
             # Light Protocol Rule 3
             if self.message_id == 1:
-                enforce(
-                    self.target == 0,
-                    "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
-                        self.target
-                    ),
-                )
+                if not (self.target == 0):
+                    raise AEAEnforceError(
+                        "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
+                            self.target
+                        )
+                    )
         except (AEAEnforceError, ValueError, KeyError) as e:
             _default_logger.error(str(e))
             return False
@@ -22,7 +22,6 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
 from aea.mail.base_pb2 import Message as ProtobufMessage
 from aea.protocols.base import Message, Serializer
 
@@ -44,7 +43,7 @@ class TacSerializer(Serializer):
         """
         msg = cast(TacMessage, msg)
         message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
+        dialogue_message_pb = message_pb.dialogue_message
         tac_msg = tac_pb2.TacMessage()
 
         dialogue_message_pb.message_id = msg.message_id
@@ -55,15 +54,16 @@ class TacSerializer(Serializer):
 
         performative_id = msg.performative
         if performative_id == TacMessage.Performative.REGISTER:
-            performative = tac_pb2.TacMessage.Register_Performative()  # type: ignore
+            performative = tac_msg.register
+            performative.SetInParent()
             agent_name = msg.agent_name
             performative.agent_name = agent_name
-            tac_msg.register.CopyFrom(performative)
         elif performative_id == TacMessage.Performative.UNREGISTER:
-            performative = tac_pb2.TacMessage.Unregister_Performative()  # type: ignore
-            tac_msg.unregister.CopyFrom(performative)
+            performative = tac_msg.unregister
+            performative.SetInParent()
         elif performative_id == TacMessage.Performative.TRANSACTION:
-            performative = tac_pb2.TacMessage.Transaction_Performative()  # type: ignore
+            performative = tac_msg.transaction
+            performative.SetInParent()
             transaction_id = msg.transaction_id
             performative.transaction_id = transaction_id
             ledger_id = msg.ledger_id
@@ -84,12 +84,12 @@ class TacSerializer(Serializer):
             performative.sender_signature = sender_signature
             counterparty_signature = msg.counterparty_signature
             performative.counterparty_signature = counterparty_signature
-            tac_msg.transaction.CopyFrom(performative)
         elif performative_id == TacMessage.Performative.CANCELLED:
-            performative = tac_pb2.TacMessage.Cancelled_Performative()  # type: ignore
-            tac_msg.cancelled.CopyFrom(performative)
+            performative = tac_msg.cancelled
+            performative.SetInParent()
         elif performative_id == TacMessage.Performative.GAME_DATA:
-            performative = tac_pb2.TacMessage.Game_Data_Performative()  # type: ignore
+            performative = tac_msg.game_data
+            performative.SetInParent()
             amount_by_currency_id = msg.amount_by_currency_id
             performative.amount_by_currency_id.update(amount_by_currency_id)
             exchange_params_by_currency_id = msg.exchange_params_by_currency_id
@@ -114,31 +114,29 @@ class TacSerializer(Serializer):
                 performative.info_is_set = True
                 info = msg.info
                 performative.info.update(info)
-            tac_msg.game_data.CopyFrom(performative)
         elif performative_id == TacMessage.Performative.TRANSACTION_CONFIRMATION:
-            performative = tac_pb2.TacMessage.Transaction_Confirmation_Performative()  # type: ignore
+            performative = tac_msg.transaction_confirmation
+            performative.SetInParent()
             transaction_id = msg.transaction_id
             performative.transaction_id = transaction_id
             amount_by_currency_id = msg.amount_by_currency_id
             performative.amount_by_currency_id.update(amount_by_currency_id)
             quantities_by_good_id = msg.quantities_by_good_id
             performative.quantities_by_good_id.update(quantities_by_good_id)
-            tac_msg.transaction_confirmation.CopyFrom(performative)
         elif performative_id == TacMessage.Performative.TAC_ERROR:
-            performative = tac_pb2.TacMessage.Tac_Error_Performative()  # type: ignore
+            performative = tac_msg.tac_error
+            performative.SetInParent()
             error_code = msg.error_code
             ErrorCode.encode(performative.error_code, error_code)
             if msg.is_set("info"):
                 performative.info_is_set = True
                 info = msg.info
                 performative.info.update(info)
-            tac_msg.tac_error.CopyFrom(performative)
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
         dialogue_message_pb.content = tac_msg.SerializeToString()
 
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
         message_bytes = message_pb.SerializeToString()
         return message_bytes
 
@@ -261,5 +259,6 @@ class TacSerializer(Serializer):
             dialogue_reference=dialogue_reference,
             target=target,
             performative=performative,
+            _check_consistency=TacMessage.check_consistency_on_decode,
             **performative_content
         )
@@ -22,7 +22,6 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
 from aea.mail.base_pb2 import Message as ProtobufMessage
 from aea.protocols.base import Message, Serializer
 
@@ -43,7 +42,7 @@ class YotiSerializer(Serializer):
         """
         msg = cast(YotiMessage, msg)
         message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
+        dialogue_message_pb = message_pb.dialogue_message
         yoti_msg = yoti_pb2.YotiMessage()
 
         dialogue_message_pb.message_id = msg.message_id
@@ -54,32 +53,31 @@ class YotiSerializer(Serializer):
 
         performative_id = msg.performative
         if performative_id == YotiMessage.Performative.GET_PROFILE:
-            performative = yoti_pb2.YotiMessage.Get_Profile_Performative()  # type: ignore
+            performative = yoti_msg.get_profile
+            performative.SetInParent()
             token = msg.token
             performative.token = token
             dotted_path = msg.dotted_path
             performative.dotted_path = dotted_path
             args = msg.args
             performative.args.extend(args)
-            yoti_msg.get_profile.CopyFrom(performative)
         elif performative_id == YotiMessage.Performative.PROFILE:
-            performative = yoti_pb2.YotiMessage.Profile_Performative()  # type: ignore
+            performative = yoti_msg.profile
+            performative.SetInParent()
             info = msg.info
             performative.info.update(info)
-            yoti_msg.profile.CopyFrom(performative)
         elif performative_id == YotiMessage.Performative.ERROR:
-            performative = yoti_pb2.YotiMessage.Error_Performative()  # type: ignore
+            performative = yoti_msg.error
+            performative.SetInParent()
             error_code = msg.error_code
             performative.error_code = error_code
             error_msg = msg.error_msg
             performative.error_msg = error_msg
-            yoti_msg.error.CopyFrom(performative)
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
         dialogue_message_pb.content = yoti_msg.SerializeToString()
 
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
         message_bytes = message_pb.SerializeToString()
         return message_bytes
 
@@ -130,5 +128,6 @@ class YotiSerializer(Serializer):
             dialogue_reference=dialogue_reference,
             target=target,
             performative=performative,
+            _check_consistency=YotiMessage.check_consistency_on_decode,
             **performative_content
         )
@@ -509,538 +509,542 @@ class TProtocolMessage(Message):
     def _is_consistent(self) -> bool:
         """Check that the message follows the t_protocol protocol."""
         try:
-            enforce(
-                isinstance(self.dialogue_reference, tuple),
-                "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
-                    type(self.dialogue_reference)
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[0], str),
-                "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[0])
-                ),
-            )
-            enforce(
-                isinstance(self.dialogue_reference[1], str),
-                "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
-                    type(self.dialogue_reference[1])
-                ),
-            )
-            enforce(
-                type(self.message_id) is int,
-                "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
-                    type(self.message_id)
-                ),
-            )
-            enforce(
-                type(self.target) is int,
-                "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
-                    type(self.target)
-                ),
-            )
+            if not isinstance(self.dialogue_reference, tuple):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.dialogue_reference)
+                    )
+                )
+            if not isinstance(self.dialogue_reference[0], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[0])
+                    )
+                )
+            if not isinstance(self.dialogue_reference[1], str):
+                raise AEAEnforceError(
+                    "Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.".format(
+                        type(self.dialogue_reference[1])
+                    )
+                )
+            if not (type(self.message_id) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'message_id'. Expected 'int'. Found '{}'.".format(
+                        type(self.message_id)
+                    )
+                )
+            if not (type(self.target) is int):
+                raise AEAEnforceError(
+                    "Invalid type for 'target'. Expected 'int'. Found '{}'.".format(
+                        type(self.target)
+                    )
+                )
 
             # Light Protocol Rule 2
             # Check correct performative
-            enforce(
-                isinstance(self.performative, TProtocolMessage.Performative),
-                "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
-                    self.valid_performatives, self.performative
-                ),
-            )
+            if not isinstance(self.performative, TProtocolMessage.Performative):
+                raise AEAEnforceError(
+                    "Invalid 'performative'. Expected either of '{}'. Found '{}'.".format(
+                        self.valid_performatives, self.performative
+                    )
+                )
 
             # Check correct contents
             actual_nb_of_contents = len(self._body) - DEFAULT_BODY_SIZE
             expected_nb_of_contents = 0
             if self.performative == TProtocolMessage.Performative.PERFORMATIVE_CT:
                 expected_nb_of_contents = 1
-                enforce(
-                    isinstance(self.content_ct, CustomDataModel),
-                    "Invalid type for content 'content_ct'. Expected 'DataModel'. Found '{}'.".format(
-                        type(self.content_ct)
-                    ),
-                )
+                if not isinstance(self.content_ct, CustomDataModel):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_ct'. Expected 'DataModel'. Found '{}'.".format(
+                            type(self.content_ct)
+                        )
+                    )
             elif self.performative == TProtocolMessage.Performative.PERFORMATIVE_PT:
                 expected_nb_of_contents = 5
-                enforce(
-                    isinstance(self.content_bytes, bytes),
-                    "Invalid type for content 'content_bytes'. Expected 'bytes'. Found '{}'.".format(
-                        type(self.content_bytes)
-                    ),
-                )
-                enforce(
-                    type(self.content_int) is int,
-                    "Invalid type for content 'content_int'. Expected 'int'. Found '{}'.".format(
-                        type(self.content_int)
-                    ),
-                )
-                enforce(
-                    isinstance(self.content_float, float),
-                    "Invalid type for content 'content_float'. Expected 'float'. Found '{}'.".format(
-                        type(self.content_float)
-                    ),
-                )
-                enforce(
-                    isinstance(self.content_bool, bool),
-                    "Invalid type for content 'content_bool'. Expected 'bool'. Found '{}'.".format(
-                        type(self.content_bool)
-                    ),
-                )
-                enforce(
-                    isinstance(self.content_str, str),
-                    "Invalid type for content 'content_str'. Expected 'str'. Found '{}'.".format(
-                        type(self.content_str)
-                    ),
-                )
+                if not isinstance(self.content_bytes, bytes):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_bytes'. Expected 'bytes'. Found '{}'.".format(
+                            type(self.content_bytes)
+                        )
+                    )
+                if not (type(self.content_int) is int):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_int'. Expected 'int'. Found '{}'.".format(
+                            type(self.content_int)
+                        )
+                    )
+                if not isinstance(self.content_float, float):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_float'. Expected 'float'. Found '{}'.".format(
+                            type(self.content_float)
+                        )
+                    )
+                if not isinstance(self.content_bool, bool):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_bool'. Expected 'bool'. Found '{}'.".format(
+                            type(self.content_bool)
+                        )
+                    )
+                if not isinstance(self.content_str, str):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_str'. Expected 'str'. Found '{}'.".format(
+                            type(self.content_str)
+                        )
+                    )
             elif self.performative == TProtocolMessage.Performative.PERFORMATIVE_PCT:
                 expected_nb_of_contents = 10
-                enforce(
-                    isinstance(self.content_set_bytes, frozenset),
-                    "Invalid type for content 'content_set_bytes'. Expected 'frozenset'. Found '{}'.".format(
-                        type(self.content_set_bytes)
-                    ),
-                )
-                enforce(
-                    all(
-                        isinstance(element, bytes) for element in self.content_set_bytes
-                    ),
-                    "Invalid type for frozenset elements in content 'content_set_bytes'. Expected 'bytes'.",
-                )
-                enforce(
-                    isinstance(self.content_set_int, frozenset),
-                    "Invalid type for content 'content_set_int'. Expected 'frozenset'. Found '{}'.".format(
-                        type(self.content_set_int)
-                    ),
-                )
-                enforce(
-                    all(type(element) is int for element in self.content_set_int),
-                    "Invalid type for frozenset elements in content 'content_set_int'. Expected 'int'.",
-                )
-                enforce(
-                    isinstance(self.content_set_float, frozenset),
-                    "Invalid type for content 'content_set_float'. Expected 'frozenset'. Found '{}'.".format(
-                        type(self.content_set_float)
-                    ),
-                )
-                enforce(
-                    all(
-                        isinstance(element, float) for element in self.content_set_float
-                    ),
-                    "Invalid type for frozenset elements in content 'content_set_float'. Expected 'float'.",
-                )
-                enforce(
-                    isinstance(self.content_set_bool, frozenset),
-                    "Invalid type for content 'content_set_bool'. Expected 'frozenset'. Found '{}'.".format(
-                        type(self.content_set_bool)
-                    ),
-                )
-                enforce(
-                    all(isinstance(element, bool) for element in self.content_set_bool),
-                    "Invalid type for frozenset elements in content 'content_set_bool'. Expected 'bool'.",
-                )
-                enforce(
-                    isinstance(self.content_set_str, frozenset),
-                    "Invalid type for content 'content_set_str'. Expected 'frozenset'. Found '{}'.".format(
-                        type(self.content_set_str)
-                    ),
-                )
-                enforce(
-                    all(isinstance(element, str) for element in self.content_set_str),
-                    "Invalid type for frozenset elements in content 'content_set_str'. Expected 'str'.",
-                )
-                enforce(
-                    isinstance(self.content_list_bytes, tuple),
-                    "Invalid type for content 'content_list_bytes'. Expected 'tuple'. Found '{}'.".format(
-                        type(self.content_list_bytes)
-                    ),
-                )
-                enforce(
-                    all(
-                        isinstance(element, bytes)
-                        for element in self.content_list_bytes
-                    ),
-                    "Invalid type for tuple elements in content 'content_list_bytes'. Expected 'bytes'.",
-                )
-                enforce(
-                    isinstance(self.content_list_int, tuple),
-                    "Invalid type for content 'content_list_int'. Expected 'tuple'. Found '{}'.".format(
-                        type(self.content_list_int)
-                    ),
-                )
-                enforce(
-                    all(type(element) is int for element in self.content_list_int),
-                    "Invalid type for tuple elements in content 'content_list_int'. Expected 'int'.",
-                )
-                enforce(
-                    isinstance(self.content_list_float, tuple),
-                    "Invalid type for content 'content_list_float'. Expected 'tuple'. Found '{}'.".format(
-                        type(self.content_list_float)
-                    ),
-                )
-                enforce(
-                    all(
-                        isinstance(element, float)
-                        for element in self.content_list_float
-                    ),
-                    "Invalid type for tuple elements in content 'content_list_float'. Expected 'float'.",
-                )
-                enforce(
-                    isinstance(self.content_list_bool, tuple),
-                    "Invalid type for content 'content_list_bool'. Expected 'tuple'. Found '{}'.".format(
-                        type(self.content_list_bool)
-                    ),
-                )
-                enforce(
-                    all(
-                        isinstance(element, bool) for element in self.content_list_bool
-                    ),
-                    "Invalid type for tuple elements in content 'content_list_bool'. Expected 'bool'.",
-                )
-                enforce(
-                    isinstance(self.content_list_str, tuple),
-                    "Invalid type for content 'content_list_str'. Expected 'tuple'. Found '{}'.".format(
-                        type(self.content_list_str)
-                    ),
-                )
-                enforce(
-                    all(isinstance(element, str) for element in self.content_list_str),
-                    "Invalid type for tuple elements in content 'content_list_str'. Expected 'str'.",
-                )
+                if not isinstance(self.content_set_bytes, frozenset):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_set_bytes'. Expected 'frozenset'. Found '{}'.".format(
+                            type(self.content_set_bytes)
+                        )
+                    )
+                if not all(
+                    isinstance(element, bytes) for element in self.content_set_bytes
+                ):
+                    raise AEAEnforceError(
+                        "Invalid type for frozenset elements in content 'content_set_bytes'. Expected 'bytes'."
+                    )
+                if not isinstance(self.content_set_int, frozenset):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_set_int'. Expected 'frozenset'. Found '{}'.".format(
+                            type(self.content_set_int)
+                        )
+                    )
+                if not all(type(element) is int for element in self.content_set_int):
+                    raise AEAEnforceError(
+                        "Invalid type for frozenset elements in content 'content_set_int'. Expected 'int'."
+                    )
+                if not isinstance(self.content_set_float, frozenset):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_set_float'. Expected 'frozenset'. Found '{}'.".format(
+                            type(self.content_set_float)
+                        )
+                    )
+                if not all(
+                    isinstance(element, float) for element in self.content_set_float
+                ):
+                    raise AEAEnforceError(
+                        "Invalid type for frozenset elements in content 'content_set_float'. Expected 'float'."
+                    )
+                if not isinstance(self.content_set_bool, frozenset):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_set_bool'. Expected 'frozenset'. Found '{}'.".format(
+                            type(self.content_set_bool)
+                        )
+                    )
+                if not all(
+                    isinstance(element, bool) for element in self.content_set_bool
+                ):
+                    raise AEAEnforceError(
+                        "Invalid type for frozenset elements in content 'content_set_bool'. Expected 'bool'."
+                    )
+                if not isinstance(self.content_set_str, frozenset):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_set_str'. Expected 'frozenset'. Found '{}'.".format(
+                            type(self.content_set_str)
+                        )
+                    )
+                if not all(
+                    isinstance(element, str) for element in self.content_set_str
+                ):
+                    raise AEAEnforceError(
+                        "Invalid type for frozenset elements in content 'content_set_str'. Expected 'str'."
+                    )
+                if not isinstance(self.content_list_bytes, tuple):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_list_bytes'. Expected 'tuple'. Found '{}'.".format(
+                            type(self.content_list_bytes)
+                        )
+                    )
+                if not all(
+                    isinstance(element, bytes) for element in self.content_list_bytes
+                ):
+                    raise AEAEnforceError(
+                        "Invalid type for tuple elements in content 'content_list_bytes'. Expected 'bytes'."
+                    )
+                if not isinstance(self.content_list_int, tuple):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_list_int'. Expected 'tuple'. Found '{}'.".format(
+                            type(self.content_list_int)
+                        )
+                    )
+                if not all(type(element) is int for element in self.content_list_int):
+                    raise AEAEnforceError(
+                        "Invalid type for tuple elements in content 'content_list_int'. Expected 'int'."
+                    )
+                if not isinstance(self.content_list_float, tuple):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_list_float'. Expected 'tuple'. Found '{}'.".format(
+                            type(self.content_list_float)
+                        )
+                    )
+                if not all(
+                    isinstance(element, float) for element in self.content_list_float
+                ):
+                    raise AEAEnforceError(
+                        "Invalid type for tuple elements in content 'content_list_float'. Expected 'float'."
+                    )
+                if not isinstance(self.content_list_bool, tuple):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_list_bool'. Expected 'tuple'. Found '{}'.".format(
+                            type(self.content_list_bool)
+                        )
+                    )
+                if not all(
+                    isinstance(element, bool) for element in self.content_list_bool
+                ):
+                    raise AEAEnforceError(
+                        "Invalid type for tuple elements in content 'content_list_bool'. Expected 'bool'."
+                    )
+                if not isinstance(self.content_list_str, tuple):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_list_str'. Expected 'tuple'. Found '{}'.".format(
+                            type(self.content_list_str)
+                        )
+                    )
+                if not all(
+                    isinstance(element, str) for element in self.content_list_str
+                ):
+                    raise AEAEnforceError(
+                        "Invalid type for tuple elements in content 'content_list_str'. Expected 'str'."
+                    )
             elif self.performative == TProtocolMessage.Performative.PERFORMATIVE_PMT:
                 expected_nb_of_contents = 15
-                enforce(
-                    isinstance(self.content_dict_int_bytes, dict),
-                    "Invalid type for content 'content_dict_int_bytes'. Expected 'dict'. Found '{}'.".format(
-                        type(self.content_dict_int_bytes)
-                    ),
-                )
+                if not isinstance(self.content_dict_int_bytes, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_dict_int_bytes'. Expected 'dict'. Found '{}'.".format(
+                            type(self.content_dict_int_bytes)
+                        )
+                    )
                 for (
                     key_of_content_dict_int_bytes,
                     value_of_content_dict_int_bytes,
                 ) in self.content_dict_int_bytes.items():
-                    enforce(
-                        type(key_of_content_dict_int_bytes) is int,
-                        "Invalid type for dictionary keys in content 'content_dict_int_bytes'. Expected 'int'. Found '{}'.".format(
-                            type(key_of_content_dict_int_bytes)
-                        ),
-                    )
-                    enforce(
-                        isinstance(value_of_content_dict_int_bytes, bytes),
-                        "Invalid type for dictionary values in content 'content_dict_int_bytes'. Expected 'bytes'. Found '{}'.".format(
-                            type(value_of_content_dict_int_bytes)
-                        ),
+                    if not (type(key_of_content_dict_int_bytes) is int):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'content_dict_int_bytes'. Expected 'int'. Found '{}'.".format(
+                                type(key_of_content_dict_int_bytes)
+                            )
+                        )
+                    if not isinstance(value_of_content_dict_int_bytes, bytes):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'content_dict_int_bytes'. Expected 'bytes'. Found '{}'.".format(
+                                type(value_of_content_dict_int_bytes)
+                            )
+                        )
+                if not isinstance(self.content_dict_int_int, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_dict_int_int'. Expected 'dict'. Found '{}'.".format(
+                            type(self.content_dict_int_int)
+                        )
                     )
-                enforce(
-                    isinstance(self.content_dict_int_int, dict),
-                    "Invalid type for content 'content_dict_int_int'. Expected 'dict'. Found '{}'.".format(
-                        type(self.content_dict_int_int)
-                    ),
-                )
                 for (
                     key_of_content_dict_int_int,
                     value_of_content_dict_int_int,
                 ) in self.content_dict_int_int.items():
-                    enforce(
-                        type(key_of_content_dict_int_int) is int,
-                        "Invalid type for dictionary keys in content 'content_dict_int_int'. Expected 'int'. Found '{}'.".format(
-                            type(key_of_content_dict_int_int)
-                        ),
-                    )
-                    enforce(
-                        type(value_of_content_dict_int_int) is int,
-                        "Invalid type for dictionary values in content 'content_dict_int_int'. Expected 'int'. Found '{}'.".format(
-                            type(value_of_content_dict_int_int)
-                        ),
+                    if not (type(key_of_content_dict_int_int) is int):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'content_dict_int_int'. Expected 'int'. Found '{}'.".format(
+                                type(key_of_content_dict_int_int)
+                            )
+                        )
+                    if not (type(value_of_content_dict_int_int) is int):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'content_dict_int_int'. Expected 'int'. Found '{}'.".format(
+                                type(value_of_content_dict_int_int)
+                            )
+                        )
+                if not isinstance(self.content_dict_int_float, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_dict_int_float'. Expected 'dict'. Found '{}'.".format(
+                            type(self.content_dict_int_float)
+                        )
                     )
-                enforce(
-                    isinstance(self.content_dict_int_float, dict),
-                    "Invalid type for content 'content_dict_int_float'. Expected 'dict'. Found '{}'.".format(
-                        type(self.content_dict_int_float)
-                    ),
-                )
                 for (
                     key_of_content_dict_int_float,
                     value_of_content_dict_int_float,
                 ) in self.content_dict_int_float.items():
-                    enforce(
-                        type(key_of_content_dict_int_float) is int,
-                        "Invalid type for dictionary keys in content 'content_dict_int_float'. Expected 'int'. Found '{}'.".format(
-                            type(key_of_content_dict_int_float)
-                        ),
-                    )
-                    enforce(
-                        isinstance(value_of_content_dict_int_float, float),
-                        "Invalid type for dictionary values in content 'content_dict_int_float'. Expected 'float'. Found '{}'.".format(
-                            type(value_of_content_dict_int_float)
-                        ),
+                    if not (type(key_of_content_dict_int_float) is int):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'content_dict_int_float'. Expected 'int'. Found '{}'.".format(
+                                type(key_of_content_dict_int_float)
+                            )
+                        )
+                    if not isinstance(value_of_content_dict_int_float, float):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'content_dict_int_float'. Expected 'float'. Found '{}'.".format(
+                                type(value_of_content_dict_int_float)
+                            )
+                        )
+                if not isinstance(self.content_dict_int_bool, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_dict_int_bool'. Expected 'dict'. Found '{}'.".format(
+                            type(self.content_dict_int_bool)
+                        )
                     )
-                enforce(
-                    isinstance(self.content_dict_int_bool, dict),
-                    "Invalid type for content 'content_dict_int_bool'. Expected 'dict'. Found '{}'.".format(
-                        type(self.content_dict_int_bool)
-                    ),
-                )
                 for (
                     key_of_content_dict_int_bool,
                     value_of_content_dict_int_bool,
                 ) in self.content_dict_int_bool.items():
-                    enforce(
-                        type(key_of_content_dict_int_bool) is int,
-                        "Invalid type for dictionary keys in content 'content_dict_int_bool'. Expected 'int'. Found '{}'.".format(
-                            type(key_of_content_dict_int_bool)
-                        ),
-                    )
-                    enforce(
-                        isinstance(value_of_content_dict_int_bool, bool),
-                        "Invalid type for dictionary values in content 'content_dict_int_bool'. Expected 'bool'. Found '{}'.".format(
-                            type(value_of_content_dict_int_bool)
-                        ),
+                    if not (type(key_of_content_dict_int_bool) is int):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'content_dict_int_bool'. Expected 'int'. Found '{}'.".format(
+                                type(key_of_content_dict_int_bool)
+                            )
+                        )
+                    if not isinstance(value_of_content_dict_int_bool, bool):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'content_dict_int_bool'. Expected 'bool'. Found '{}'.".format(
+                                type(value_of_content_dict_int_bool)
+                            )
+                        )
+                if not isinstance(self.content_dict_int_str, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_dict_int_str'. Expected 'dict'. Found '{}'.".format(
+                            type(self.content_dict_int_str)
+                        )
                     )
-                enforce(
-                    isinstance(self.content_dict_int_str, dict),
-                    "Invalid type for content 'content_dict_int_str'. Expected 'dict'. Found '{}'.".format(
-                        type(self.content_dict_int_str)
-                    ),
-                )
                 for (
                     key_of_content_dict_int_str,
                     value_of_content_dict_int_str,
                 ) in self.content_dict_int_str.items():
-                    enforce(
-                        type(key_of_content_dict_int_str) is int,
-                        "Invalid type for dictionary keys in content 'content_dict_int_str'. Expected 'int'. Found '{}'.".format(
-                            type(key_of_content_dict_int_str)
-                        ),
-                    )
-                    enforce(
-                        isinstance(value_of_content_dict_int_str, str),
-                        "Invalid type for dictionary values in content 'content_dict_int_str'. Expected 'str'. Found '{}'.".format(
-                            type(value_of_content_dict_int_str)
-                        ),
+                    if not (type(key_of_content_dict_int_str) is int):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'content_dict_int_str'. Expected 'int'. Found '{}'.".format(
+                                type(key_of_content_dict_int_str)
+                            )
+                        )
+                    if not isinstance(value_of_content_dict_int_str, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'content_dict_int_str'. Expected 'str'. Found '{}'.".format(
+                                type(value_of_content_dict_int_str)
+                            )
+                        )
+                if not isinstance(self.content_dict_bool_bytes, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_dict_bool_bytes'. Expected 'dict'. Found '{}'.".format(
+                            type(self.content_dict_bool_bytes)
+                        )
                     )
-                enforce(
-                    isinstance(self.content_dict_bool_bytes, dict),
-                    "Invalid type for content 'content_dict_bool_bytes'. Expected 'dict'. Found '{}'.".format(
-                        type(self.content_dict_bool_bytes)
-                    ),
-                )
                 for (
                     key_of_content_dict_bool_bytes,
                     value_of_content_dict_bool_bytes,
                 ) in self.content_dict_bool_bytes.items():
-                    enforce(
-                        isinstance(key_of_content_dict_bool_bytes, bool),
-                        "Invalid type for dictionary keys in content 'content_dict_bool_bytes'. Expected 'bool'. Found '{}'.".format(
-                            type(key_of_content_dict_bool_bytes)
-                        ),
-                    )
-                    enforce(
-                        isinstance(value_of_content_dict_bool_bytes, bytes),
-                        "Invalid type for dictionary values in content 'content_dict_bool_bytes'. Expected 'bytes'. Found '{}'.".format(
-                            type(value_of_content_dict_bool_bytes)
-                        ),
+                    if not isinstance(key_of_content_dict_bool_bytes, bool):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'content_dict_bool_bytes'. Expected 'bool'. Found '{}'.".format(
+                                type(key_of_content_dict_bool_bytes)
+                            )
+                        )
+                    if not isinstance(value_of_content_dict_bool_bytes, bytes):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'content_dict_bool_bytes'. Expected 'bytes'. Found '{}'.".format(
+                                type(value_of_content_dict_bool_bytes)
+                            )
+                        )
+                if not isinstance(self.content_dict_bool_int, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_dict_bool_int'. Expected 'dict'. Found '{}'.".format(
+                            type(self.content_dict_bool_int)
+                        )
                     )
-                enforce(
-                    isinstance(self.content_dict_bool_int, dict),
-                    "Invalid type for content 'content_dict_bool_int'. Expected 'dict'. Found '{}'.".format(
-                        type(self.content_dict_bool_int)
-                    ),
-                )
                 for (
                     key_of_content_dict_bool_int,
                     value_of_content_dict_bool_int,
                 ) in self.content_dict_bool_int.items():
-                    enforce(
-                        isinstance(key_of_content_dict_bool_int, bool),
-                        "Invalid type for dictionary keys in content 'content_dict_bool_int'. Expected 'bool'. Found '{}'.".format(
-                            type(key_of_content_dict_bool_int)
-                        ),
-                    )
-                    enforce(
-                        type(value_of_content_dict_bool_int) is int,
-                        "Invalid type for dictionary values in content 'content_dict_bool_int'. Expected 'int'. Found '{}'.".format(
-                            type(value_of_content_dict_bool_int)
-                        ),
+                    if not isinstance(key_of_content_dict_bool_int, bool):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'content_dict_bool_int'. Expected 'bool'. Found '{}'.".format(
+                                type(key_of_content_dict_bool_int)
+                            )
+                        )
+                    if not (type(value_of_content_dict_bool_int) is int):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'content_dict_bool_int'. Expected 'int'. Found '{}'.".format(
+                                type(value_of_content_dict_bool_int)
+                            )
+                        )
+                if not isinstance(self.content_dict_bool_float, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_dict_bool_float'. Expected 'dict'. Found '{}'.".format(
+                            type(self.content_dict_bool_float)
+                        )
                     )
-                enforce(
-                    isinstance(self.content_dict_bool_float, dict),
-                    "Invalid type for content 'content_dict_bool_float'. Expected 'dict'. Found '{}'.".format(
-                        type(self.content_dict_bool_float)
-                    ),
-                )
                 for (
                     key_of_content_dict_bool_float,
                     value_of_content_dict_bool_float,
                 ) in self.content_dict_bool_float.items():
-                    enforce(
-                        isinstance(key_of_content_dict_bool_float, bool),
-                        "Invalid type for dictionary keys in content 'content_dict_bool_float'. Expected 'bool'. Found '{}'.".format(
-                            type(key_of_content_dict_bool_float)
-                        ),
-                    )
-                    enforce(
-                        isinstance(value_of_content_dict_bool_float, float),
-                        "Invalid type for dictionary values in content 'content_dict_bool_float'. Expected 'float'. Found '{}'.".format(
-                            type(value_of_content_dict_bool_float)
-                        ),
+                    if not isinstance(key_of_content_dict_bool_float, bool):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'content_dict_bool_float'. Expected 'bool'. Found '{}'.".format(
+                                type(key_of_content_dict_bool_float)
+                            )
+                        )
+                    if not isinstance(value_of_content_dict_bool_float, float):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'content_dict_bool_float'. Expected 'float'. Found '{}'.".format(
+                                type(value_of_content_dict_bool_float)
+                            )
+                        )
+                if not isinstance(self.content_dict_bool_bool, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_dict_bool_bool'. Expected 'dict'. Found '{}'.".format(
+                            type(self.content_dict_bool_bool)
+                        )
                     )
-                enforce(
-                    isinstance(self.content_dict_bool_bool, dict),
-                    "Invalid type for content 'content_dict_bool_bool'. Expected 'dict'. Found '{}'.".format(
-                        type(self.content_dict_bool_bool)
-                    ),
-                )
                 for (
                     key_of_content_dict_bool_bool,
                     value_of_content_dict_bool_bool,
                 ) in self.content_dict_bool_bool.items():
-                    enforce(
-                        isinstance(key_of_content_dict_bool_bool, bool),
-                        "Invalid type for dictionary keys in content 'content_dict_bool_bool'. Expected 'bool'. Found '{}'.".format(
-                            type(key_of_content_dict_bool_bool)
-                        ),
-                    )
-                    enforce(
-                        isinstance(value_of_content_dict_bool_bool, bool),
-                        "Invalid type for dictionary values in content 'content_dict_bool_bool'. Expected 'bool'. Found '{}'.".format(
-                            type(value_of_content_dict_bool_bool)
-                        ),
+                    if not isinstance(key_of_content_dict_bool_bool, bool):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'content_dict_bool_bool'. Expected 'bool'. Found '{}'.".format(
+                                type(key_of_content_dict_bool_bool)
+                            )
+                        )
+                    if not isinstance(value_of_content_dict_bool_bool, bool):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'content_dict_bool_bool'. Expected 'bool'. Found '{}'.".format(
+                                type(value_of_content_dict_bool_bool)
+                            )
+                        )
+                if not isinstance(self.content_dict_bool_str, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_dict_bool_str'. Expected 'dict'. Found '{}'.".format(
+                            type(self.content_dict_bool_str)
+                        )
                     )
-                enforce(
-                    isinstance(self.content_dict_bool_str, dict),
-                    "Invalid type for content 'content_dict_bool_str'. Expected 'dict'. Found '{}'.".format(
-                        type(self.content_dict_bool_str)
-                    ),
-                )
                 for (
                     key_of_content_dict_bool_str,
                     value_of_content_dict_bool_str,
                 ) in self.content_dict_bool_str.items():
-                    enforce(
-                        isinstance(key_of_content_dict_bool_str, bool),
-                        "Invalid type for dictionary keys in content 'content_dict_bool_str'. Expected 'bool'. Found '{}'.".format(
-                            type(key_of_content_dict_bool_str)
-                        ),
-                    )
-                    enforce(
-                        isinstance(value_of_content_dict_bool_str, str),
-                        "Invalid type for dictionary values in content 'content_dict_bool_str'. Expected 'str'. Found '{}'.".format(
-                            type(value_of_content_dict_bool_str)
-                        ),
+                    if not isinstance(key_of_content_dict_bool_str, bool):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'content_dict_bool_str'. Expected 'bool'. Found '{}'.".format(
+                                type(key_of_content_dict_bool_str)
+                            )
+                        )
+                    if not isinstance(value_of_content_dict_bool_str, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'content_dict_bool_str'. Expected 'str'. Found '{}'.".format(
+                                type(value_of_content_dict_bool_str)
+                            )
+                        )
+                if not isinstance(self.content_dict_str_bytes, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_dict_str_bytes'. Expected 'dict'. Found '{}'.".format(
+                            type(self.content_dict_str_bytes)
+                        )
                     )
-                enforce(
-                    isinstance(self.content_dict_str_bytes, dict),
-                    "Invalid type for content 'content_dict_str_bytes'. Expected 'dict'. Found '{}'.".format(
-                        type(self.content_dict_str_bytes)
-                    ),
-                )
                 for (
                     key_of_content_dict_str_bytes,
                     value_of_content_dict_str_bytes,
                 ) in self.content_dict_str_bytes.items():
-                    enforce(
-                        isinstance(key_of_content_dict_str_bytes, str),
-                        "Invalid type for dictionary keys in content 'content_dict_str_bytes'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_content_dict_str_bytes)
-                        ),
-                    )
-                    enforce(
-                        isinstance(value_of_content_dict_str_bytes, bytes),
-                        "Invalid type for dictionary values in content 'content_dict_str_bytes'. Expected 'bytes'. Found '{}'.".format(
-                            type(value_of_content_dict_str_bytes)
-                        ),
+                    if not isinstance(key_of_content_dict_str_bytes, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'content_dict_str_bytes'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_content_dict_str_bytes)
+                            )
+                        )
+                    if not isinstance(value_of_content_dict_str_bytes, bytes):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'content_dict_str_bytes'. Expected 'bytes'. Found '{}'.".format(
+                                type(value_of_content_dict_str_bytes)
+                            )
+                        )
+                if not isinstance(self.content_dict_str_int, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_dict_str_int'. Expected 'dict'. Found '{}'.".format(
+                            type(self.content_dict_str_int)
+                        )
                     )
-                enforce(
-                    isinstance(self.content_dict_str_int, dict),
-                    "Invalid type for content 'content_dict_str_int'. Expected 'dict'. Found '{}'.".format(
-                        type(self.content_dict_str_int)
-                    ),
-                )
                 for (
                     key_of_content_dict_str_int,
                     value_of_content_dict_str_int,
                 ) in self.content_dict_str_int.items():
-                    enforce(
-                        isinstance(key_of_content_dict_str_int, str),
-                        "Invalid type for dictionary keys in content 'content_dict_str_int'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_content_dict_str_int)
-                        ),
-                    )
-                    enforce(
-                        type(value_of_content_dict_str_int) is int,
-                        "Invalid type for dictionary values in content 'content_dict_str_int'. Expected 'int'. Found '{}'.".format(
-                            type(value_of_content_dict_str_int)
-                        ),
+                    if not isinstance(key_of_content_dict_str_int, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'content_dict_str_int'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_content_dict_str_int)
+                            )
+                        )
+                    if not (type(value_of_content_dict_str_int) is int):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'content_dict_str_int'. Expected 'int'. Found '{}'.".format(
+                                type(value_of_content_dict_str_int)
+                            )
+                        )
+                if not isinstance(self.content_dict_str_float, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_dict_str_float'. Expected 'dict'. Found '{}'.".format(
+                            type(self.content_dict_str_float)
+                        )
                     )
-                enforce(
-                    isinstance(self.content_dict_str_float, dict),
-                    "Invalid type for content 'content_dict_str_float'. Expected 'dict'. Found '{}'.".format(
-                        type(self.content_dict_str_float)
-                    ),
-                )
                 for (
                     key_of_content_dict_str_float,
                     value_of_content_dict_str_float,
                 ) in self.content_dict_str_float.items():
-                    enforce(
-                        isinstance(key_of_content_dict_str_float, str),
-                        "Invalid type for dictionary keys in content 'content_dict_str_float'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_content_dict_str_float)
-                        ),
-                    )
-                    enforce(
-                        isinstance(value_of_content_dict_str_float, float),
-                        "Invalid type for dictionary values in content 'content_dict_str_float'. Expected 'float'. Found '{}'.".format(
-                            type(value_of_content_dict_str_float)
-                        ),
+                    if not isinstance(key_of_content_dict_str_float, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'content_dict_str_float'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_content_dict_str_float)
+                            )
+                        )
+                    if not isinstance(value_of_content_dict_str_float, float):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'content_dict_str_float'. Expected 'float'. Found '{}'.".format(
+                                type(value_of_content_dict_str_float)
+                            )
+                        )
+                if not isinstance(self.content_dict_str_bool, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_dict_str_bool'. Expected 'dict'. Found '{}'.".format(
+                            type(self.content_dict_str_bool)
+                        )
                     )
-                enforce(
-                    isinstance(self.content_dict_str_bool, dict),
-                    "Invalid type for content 'content_dict_str_bool'. Expected 'dict'. Found '{}'.".format(
-                        type(self.content_dict_str_bool)
-                    ),
-                )
                 for (
                     key_of_content_dict_str_bool,
                     value_of_content_dict_str_bool,
                 ) in self.content_dict_str_bool.items():
-                    enforce(
-                        isinstance(key_of_content_dict_str_bool, str),
-                        "Invalid type for dictionary keys in content 'content_dict_str_bool'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_content_dict_str_bool)
-                        ),
-                    )
-                    enforce(
-                        isinstance(value_of_content_dict_str_bool, bool),
-                        "Invalid type for dictionary values in content 'content_dict_str_bool'. Expected 'bool'. Found '{}'.".format(
-                            type(value_of_content_dict_str_bool)
-                        ),
+                    if not isinstance(key_of_content_dict_str_bool, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'content_dict_str_bool'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_content_dict_str_bool)
+                            )
+                        )
+                    if not isinstance(value_of_content_dict_str_bool, bool):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'content_dict_str_bool'. Expected 'bool'. Found '{}'.".format(
+                                type(value_of_content_dict_str_bool)
+                            )
+                        )
+                if not isinstance(self.content_dict_str_str, dict):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_dict_str_str'. Expected 'dict'. Found '{}'.".format(
+                            type(self.content_dict_str_str)
+                        )
                     )
-                enforce(
-                    isinstance(self.content_dict_str_str, dict),
-                    "Invalid type for content 'content_dict_str_str'. Expected 'dict'. Found '{}'.".format(
-                        type(self.content_dict_str_str)
-                    ),
-                )
                 for (
                     key_of_content_dict_str_str,
                     value_of_content_dict_str_str,
                 ) in self.content_dict_str_str.items():
-                    enforce(
-                        isinstance(key_of_content_dict_str_str, str),
-                        "Invalid type for dictionary keys in content 'content_dict_str_str'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_content_dict_str_str)
-                        ),
-                    )
-                    enforce(
-                        isinstance(value_of_content_dict_str_str, str),
-                        "Invalid type for dictionary values in content 'content_dict_str_str'. Expected 'str'. Found '{}'.".format(
-                            type(value_of_content_dict_str_str)
-                        ),
-                    )
+                    if not isinstance(key_of_content_dict_str_str, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary keys in content 'content_dict_str_str'. Expected 'str'. Found '{}'.".format(
+                                type(key_of_content_dict_str_str)
+                            )
+                        )
+                    if not isinstance(value_of_content_dict_str_str, str):
+                        raise AEAEnforceError(
+                            "Invalid type for dictionary values in content 'content_dict_str_str'. Expected 'str'. Found '{}'.".format(
+                                type(value_of_content_dict_str_str)
+                            )
+                        )
             elif self.performative == TProtocolMessage.Performative.PERFORMATIVE_MT:
                 expected_nb_of_contents = 2
-                enforce(
+                if not (
                     isinstance(self.content_union_1, CustomDataModel)
                     or isinstance(self.content_union_1, bool)
                     or isinstance(self.content_union_1, bytes)
@@ -1049,46 +1053,51 @@ class TProtocolMessage(Message):
                     or isinstance(self.content_union_1, frozenset)
                     or type(self.content_union_1) is int
                     or isinstance(self.content_union_1, str)
-                    or isinstance(self.content_union_1, tuple),
-                    "Invalid type for content 'content_union_1'. Expected either of '['DataModel', 'bool', 'bytes', 'dict', 'float', 'frozenset', 'int', 'str', 'tuple']'. Found '{}'.".format(
-                        type(self.content_union_1)
-                    ),
-                )
-                if isinstance(self.content_union_1, frozenset):
-                    enforce(
-                        all(type(element) is int for element in self.content_union_1),
-                        "Invalid type for elements of content 'content_union_1'. Expected 'int'.",
+                    or isinstance(self.content_union_1, tuple)
+                ):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_union_1'. Expected either of '['DataModel', 'bool', 'bytes', 'dict', 'float', 'frozenset', 'int', 'str', 'tuple']'. Found '{}'.".format(
+                            type(self.content_union_1)
+                        )
                     )
+                if isinstance(self.content_union_1, frozenset):
+                    if not all(
+                        type(element) is int for element in self.content_union_1
+                    ):
+                        raise AEAEnforceError(
+                            "Invalid type for elements of content 'content_union_1'. Expected 'int'."
+                        )
                 if isinstance(self.content_union_1, tuple):
-                    enforce(
-                        all(
-                            isinstance(element, bool)
-                            for element in self.content_union_1
-                        ),
-                        "Invalid type for tuple elements in content 'content_union_1'. Expected 'bool'.",
-                    )
+                    if not all(
+                        isinstance(element, bool) for element in self.content_union_1
+                    ):
+                        raise AEAEnforceError(
+                            "Invalid type for tuple elements in content 'content_union_1'. Expected 'bool'."
+                        )
                 if isinstance(self.content_union_1, dict):
                     for (
                         key_of_content_union_1,
                         value_of_content_union_1,
                     ) in self.content_union_1.items():
-                        enforce(
-                            (
-                                isinstance(key_of_content_union_1, str)
-                                and type(value_of_content_union_1) is int
-                            ),
-                            "Invalid type for dictionary key, value in content 'content_union_1'. Expected 'str', 'int'.",
-                        )
-                enforce(
+                        if not (
+                            isinstance(key_of_content_union_1, str)
+                            and type(value_of_content_union_1) is int
+                        ):
+                            raise AEAEnforceError(
+                                "Invalid type for dictionary key, value in content 'content_union_1'. Expected 'str', 'int'."
+                            )
+                if not (
                     isinstance(self.content_union_2, dict)
                     or isinstance(self.content_union_2, frozenset)
-                    or isinstance(self.content_union_2, tuple),
-                    "Invalid type for content 'content_union_2'. Expected either of '['dict', 'frozenset', 'tuple']'. Found '{}'.".format(
-                        type(self.content_union_2)
-                    ),
-                )
+                    or isinstance(self.content_union_2, tuple)
+                ):
+                    raise AEAEnforceError(
+                        "Invalid type for content 'content_union_2'. Expected either of '['dict', 'frozenset', 'tuple']'. Found '{}'.".format(
+                            type(self.content_union_2)
+                        )
+                    )
                 if isinstance(self.content_union_2, frozenset):
-                    enforce(
+                    if not (
                         all(
                             isinstance(element, bytes)
                             for element in self.content_union_2
@@ -1096,11 +1105,13 @@ class TProtocolMessage(Message):
                         or all(type(element) is int for element in self.content_union_2)
                         or all(
                             isinstance(element, str) for element in self.content_union_2
-                        ),
-                        "Invalid type for frozenset elements in content 'content_union_2'. Expected either 'bytes' or 'int' or 'str'.",
-                    )
+                        )
+                    ):
+                        raise AEAEnforceError(
+                            "Invalid type for frozenset elements in content 'content_union_2'. Expected either 'bytes' or 'int' or 'str'."
+                        )
                 if isinstance(self.content_union_2, tuple):
-                    enforce(
+                    if not (
                         all(
                             isinstance(element, bool)
                             for element in self.content_union_2
@@ -1112,15 +1123,17 @@ class TProtocolMessage(Message):
                         or all(
                             isinstance(element, float)
                             for element in self.content_union_2
-                        ),
-                        "Invalid type for tuple elements in content 'content_union_2'. Expected either 'bool' or 'bytes' or 'float'.",
-                    )
+                        )
+                    ):
+                        raise AEAEnforceError(
+                            "Invalid type for tuple elements in content 'content_union_2'. Expected either 'bool' or 'bytes' or 'float'."
+                        )
                 if isinstance(self.content_union_2, dict):
                     for (
                         key_of_content_union_2,
                         value_of_content_union_2,
                     ) in self.content_union_2.items():
-                        enforce(
+                        if not (
                             (
                                 isinstance(key_of_content_union_2, bool)
                                 and isinstance(value_of_content_union_2, bytes)
@@ -1132,87 +1145,88 @@ class TProtocolMessage(Message):
                             or (
                                 isinstance(key_of_content_union_2, str)
                                 and type(value_of_content_union_2) is int
-                            ),
-                            "Invalid type for dictionary key, value in content 'content_union_2'. Expected 'bool','bytes' or 'int','float' or 'str','int'.",
-                        )
+                            )
+                        ):
+                            raise AEAEnforceError(
+                                "Invalid type for dictionary key, value in content 'content_union_2'. Expected 'bool','bytes' or 'int','float' or 'str','int'."
+                            )
             elif self.performative == TProtocolMessage.Performative.PERFORMATIVE_O:
                 expected_nb_of_contents = 0
                 if self.is_set("content_o_ct"):
                     expected_nb_of_contents += 1
                     content_o_ct = cast(CustomDataModel, self.content_o_ct)
-                    enforce(
-                        isinstance(content_o_ct, CustomDataModel),
-                        "Invalid type for content 'content_o_ct'. Expected 'DataModel'. Found '{}'.".format(
-                            type(content_o_ct)
-                        ),
-                    )
+                    if not isinstance(content_o_ct, CustomDataModel):
+                        raise AEAEnforceError(
+                            "Invalid type for content 'content_o_ct'. Expected 'DataModel'. Found '{}'.".format(
+                                type(content_o_ct)
+                            )
+                        )
                 if self.is_set("content_o_bool"):
                     expected_nb_of_contents += 1
                     content_o_bool = cast(bool, self.content_o_bool)
-                    enforce(
-                        isinstance(content_o_bool, bool),
-                        "Invalid type for content 'content_o_bool'. Expected 'bool'. Found '{}'.".format(
-                            type(content_o_bool)
-                        ),
-                    )
+                    if not isinstance(content_o_bool, bool):
+                        raise AEAEnforceError(
+                            "Invalid type for content 'content_o_bool'. Expected 'bool'. Found '{}'.".format(
+                                type(content_o_bool)
+                            )
+                        )
                 if self.is_set("content_o_set_int"):
                     expected_nb_of_contents += 1
                     content_o_set_int = cast(FrozenSet[int], self.content_o_set_int)
-                    enforce(
-                        isinstance(content_o_set_int, frozenset),
-                        "Invalid type for content 'content_o_set_int'. Expected 'frozenset'. Found '{}'.".format(
-                            type(content_o_set_int)
-                        ),
-                    )
-                    enforce(
-                        all(type(element) is int for element in content_o_set_int),
-                        "Invalid type for frozenset elements in content 'content_o_set_int'. Expected 'int'.",
-                    )
+                    if not isinstance(content_o_set_int, frozenset):
+                        raise AEAEnforceError(
+                            "Invalid type for content 'content_o_set_int'. Expected 'frozenset'. Found '{}'.".format(
+                                type(content_o_set_int)
+                            )
+                        )
+                    if not all(type(element) is int for element in content_o_set_int):
+                        raise AEAEnforceError(
+                            "Invalid type for frozenset elements in content 'content_o_set_int'. Expected 'int'."
+                        )
                 if self.is_set("content_o_list_bytes"):
                     expected_nb_of_contents += 1
                     content_o_list_bytes = cast(
                         Tuple[bytes, ...], self.content_o_list_bytes
                     )
-                    enforce(
-                        isinstance(content_o_list_bytes, tuple),
-                        "Invalid type for content 'content_o_list_bytes'. Expected 'tuple'. Found '{}'.".format(
-                            type(content_o_list_bytes)
-                        ),
-                    )
-                    enforce(
-                        all(
-                            isinstance(element, bytes)
-                            for element in content_o_list_bytes
-                        ),
-                        "Invalid type for tuple elements in content 'content_o_list_bytes'. Expected 'bytes'.",
-                    )
+                    if not isinstance(content_o_list_bytes, tuple):
+                        raise AEAEnforceError(
+                            "Invalid type for content 'content_o_list_bytes'. Expected 'tuple'. Found '{}'.".format(
+                                type(content_o_list_bytes)
+                            )
+                        )
+                    if not all(
+                        isinstance(element, bytes) for element in content_o_list_bytes
+                    ):
+                        raise AEAEnforceError(
+                            "Invalid type for tuple elements in content 'content_o_list_bytes'. Expected 'bytes'."
+                        )
                 if self.is_set("content_o_dict_str_int"):
                     expected_nb_of_contents += 1
                     content_o_dict_str_int = cast(
                         Dict[str, int], self.content_o_dict_str_int
                     )
-                    enforce(
-                        isinstance(content_o_dict_str_int, dict),
-                        "Invalid type for content 'content_o_dict_str_int'. Expected 'dict'. Found '{}'.".format(
-                            type(content_o_dict_str_int)
-                        ),
-                    )
+                    if not isinstance(content_o_dict_str_int, dict):
+                        raise AEAEnforceError(
+                            "Invalid type for content 'content_o_dict_str_int'. Expected 'dict'. Found '{}'.".format(
+                                type(content_o_dict_str_int)
+                            )
+                        )
                     for (
                         key_of_content_o_dict_str_int,
                         value_of_content_o_dict_str_int,
                     ) in content_o_dict_str_int.items():
-                        enforce(
-                            isinstance(key_of_content_o_dict_str_int, str),
-                            "Invalid type for dictionary keys in content 'content_o_dict_str_int'. Expected 'str'. Found '{}'.".format(
-                                type(key_of_content_o_dict_str_int)
-                            ),
-                        )
-                        enforce(
-                            type(value_of_content_o_dict_str_int) is int,
-                            "Invalid type for dictionary values in content 'content_o_dict_str_int'. Expected 'int'. Found '{}'.".format(
-                                type(value_of_content_o_dict_str_int)
-                            ),
-                        )
+                        if not isinstance(key_of_content_o_dict_str_int, str):
+                            raise AEAEnforceError(
+                                "Invalid type for dictionary keys in content 'content_o_dict_str_int'. Expected 'str'. Found '{}'.".format(
+                                    type(key_of_content_o_dict_str_int)
+                                )
+                            )
+                        if not (type(value_of_content_o_dict_str_int) is int):
+                            raise AEAEnforceError(
+                                "Invalid type for dictionary values in content 'content_o_dict_str_int'. Expected 'int'. Found '{}'.".format(
+                                    type(value_of_content_o_dict_str_int)
+                                )
+                            )
             elif (
                 self.performative
                 == TProtocolMessage.Performative.PERFORMATIVE_EMPTY_CONTENTS
@@ -1220,21 +1234,21 @@ class TProtocolMessage(Message):
                 expected_nb_of_contents = 0
 
             # Check correct content count
-            enforce(
-                expected_nb_of_contents == actual_nb_of_contents,
-                "Incorrect number of contents. Expected {}. Found {}".format(
-                    expected_nb_of_contents, actual_nb_of_contents
-                ),
-            )
+            if not (expected_nb_of_contents == actual_nb_of_contents):
+                raise AEAEnforceError(
+                    "Incorrect number of contents. Expected {}. Found {}".format(
+                        expected_nb_of_contents, actual_nb_of_contents
+                    )
+                )
 
             # Light Protocol Rule 3
             if self.message_id == 1:
-                enforce(
-                    self.target == 0,
-                    "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
-                        self.target
-                    ),
-                )
+                if not (self.target == 0):
+                    raise AEAEnforceError(
+                        "Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.".format(
+                            self.target
+                        )
+                    )
         except (AEAEnforceError, ValueError, KeyError) as e:
             _default_logger.error(str(e))
             return False
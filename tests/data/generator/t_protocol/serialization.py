@@ -22,7 +22,6 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
 from aea.mail.base_pb2 import Message as ProtobufMessage
 from aea.protocols.base import Message, Serializer
 
@@ -44,7 +43,7 @@ class TProtocolSerializer(Serializer):
         """
         msg = cast(TProtocolMessage, msg)
         message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
+        dialogue_message_pb = message_pb.dialogue_message
         t_protocol_msg = t_protocol_pb2.TProtocolMessage()
 
         dialogue_message_pb.message_id = msg.message_id
@@ -55,12 +54,13 @@ class TProtocolSerializer(Serializer):
 
         performative_id = msg.performative
         if performative_id == TProtocolMessage.Performative.PERFORMATIVE_CT:
-            performative = t_protocol_pb2.TProtocolMessage.Performative_Ct_Performative()  # type: ignore
+            performative = t_protocol_msg.performative_ct
+            performative.SetInParent()
             content_ct = msg.content_ct
             DataModel.encode(performative.content_ct, content_ct)
-            t_protocol_msg.performative_ct.CopyFrom(performative)
         elif performative_id == TProtocolMessage.Performative.PERFORMATIVE_PT:
-            performative = t_protocol_pb2.TProtocolMessage.Performative_Pt_Performative()  # type: ignore
+            performative = t_protocol_msg.performative_pt
+            performative.SetInParent()
             content_bytes = msg.content_bytes
             performative.content_bytes = content_bytes
             content_int = msg.content_int
@@ -71,9 +71,9 @@ class TProtocolSerializer(Serializer):
             performative.content_bool = content_bool
             content_str = msg.content_str
             performative.content_str = content_str
-            t_protocol_msg.performative_pt.CopyFrom(performative)
         elif performative_id == TProtocolMessage.Performative.PERFORMATIVE_PCT:
-            performative = t_protocol_pb2.TProtocolMessage.Performative_Pct_Performative()  # type: ignore
+            performative = t_protocol_msg.performative_pct
+            performative.SetInParent()
             content_set_bytes = msg.content_set_bytes
             performative.content_set_bytes.extend(content_set_bytes)
             content_set_int = msg.content_set_int
@@ -94,9 +94,9 @@ class TProtocolSerializer(Serializer):
             performative.content_list_bool.extend(content_list_bool)
             content_list_str = msg.content_list_str
             performative.content_list_str.extend(content_list_str)
-            t_protocol_msg.performative_pct.CopyFrom(performative)
         elif performative_id == TProtocolMessage.Performative.PERFORMATIVE_PMT:
-            performative = t_protocol_pb2.TProtocolMessage.Performative_Pmt_Performative()  # type: ignore
+            performative = t_protocol_msg.performative_pmt
+            performative.SetInParent()
             content_dict_int_bytes = msg.content_dict_int_bytes
             performative.content_dict_int_bytes.update(content_dict_int_bytes)
             content_dict_int_int = msg.content_dict_int_int
@@ -127,9 +127,9 @@ class TProtocolSerializer(Serializer):
             performative.content_dict_str_bool.update(content_dict_str_bool)
             content_dict_str_str = msg.content_dict_str_str
             performative.content_dict_str_str.update(content_dict_str_str)
-            t_protocol_msg.performative_pmt.CopyFrom(performative)
         elif performative_id == TProtocolMessage.Performative.PERFORMATIVE_MT:
-            performative = t_protocol_pb2.TProtocolMessage.Performative_Mt_Performative()  # type: ignore
+            performative = t_protocol_msg.performative_mt
+            performative.SetInParent()
             if msg.is_set("content_union_1_type_DataModel"):
                 performative.content_union_1_type_DataModel_is_set = True
                 content_union_1_type_DataModel = msg.content_union_1_type_DataModel
@@ -247,9 +247,9 @@ class TProtocolSerializer(Serializer):
                 performative.content_union_2_type_dict_of_bool_bytes.update(
                     content_union_2_type_dict_of_bool_bytes
                 )
-            t_protocol_msg.performative_mt.CopyFrom(performative)
         elif performative_id == TProtocolMessage.Performative.PERFORMATIVE_O:
-            performative = t_protocol_pb2.TProtocolMessage.Performative_O_Performative()  # type: ignore
+            performative = t_protocol_msg.performative_o
+            performative.SetInParent()
             if msg.is_set("content_o_ct"):
                 performative.content_o_ct_is_set = True
                 content_o_ct = msg.content_o_ct
@@ -270,18 +270,16 @@ class TProtocolSerializer(Serializer):
                 performative.content_o_dict_str_int_is_set = True
                 content_o_dict_str_int = msg.content_o_dict_str_int
                 performative.content_o_dict_str_int.update(content_o_dict_str_int)
-            t_protocol_msg.performative_o.CopyFrom(performative)
         elif (
             performative_id == TProtocolMessage.Performative.PERFORMATIVE_EMPTY_CONTENTS
         ):
-            performative = t_protocol_pb2.TProtocolMessage.Performative_Empty_Contents_Performative()  # type: ignore
-            t_protocol_msg.performative_empty_contents.CopyFrom(performative)
+            performative = t_protocol_msg.performative_empty_contents
+            performative.SetInParent()
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
         dialogue_message_pb.content = t_protocol_msg.SerializeToString()
 
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
         message_bytes = message_pb.SerializeToString()
         return message_bytes
 
@@ -539,5 +537,6 @@ class TProtocolSerializer(Serializer):
             dialogue_reference=dialogue_reference,
             target=target,
             performative=performative,
+            _check_consistency=TProtocolMessage.check_consistency_on_decode,
             **performative_content
         )
@@ -22,7 +22,6 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
 from aea.mail.base_pb2 import Message as ProtobufMessage
 from aea.protocols.base import Message, Serializer
 
@@ -43,7 +42,7 @@ class TProtocolNoCtSerializer(Serializer):
         """
         msg = cast(TProtocolNoCtMessage, msg)
         message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
+        dialogue_message_pb = message_pb.dialogue_message
         t_protocol_no_ct_msg = t_protocol_no_ct_pb2.TProtocolNoCtMessage()
 
         dialogue_message_pb.message_id = msg.message_id
@@ -54,7 +53,8 @@ class TProtocolNoCtSerializer(Serializer):
 
         performative_id = msg.performative
         if performative_id == TProtocolNoCtMessage.Performative.PERFORMATIVE_PT:
-            performative = t_protocol_no_ct_pb2.TProtocolNoCtMessage.Performative_Pt_Performative()  # type: ignore
+            performative = t_protocol_no_ct_msg.performative_pt
+            performative.SetInParent()
             content_bytes = msg.content_bytes
             performative.content_bytes = content_bytes
             content_int = msg.content_int
@@ -65,9 +65,9 @@ class TProtocolNoCtSerializer(Serializer):
             performative.content_bool = content_bool
             content_str = msg.content_str
             performative.content_str = content_str
-            t_protocol_no_ct_msg.performative_pt.CopyFrom(performative)
         elif performative_id == TProtocolNoCtMessage.Performative.PERFORMATIVE_PCT:
-            performative = t_protocol_no_ct_pb2.TProtocolNoCtMessage.Performative_Pct_Performative()  # type: ignore
+            performative = t_protocol_no_ct_msg.performative_pct
+            performative.SetInParent()
             content_set_bytes = msg.content_set_bytes
             performative.content_set_bytes.extend(content_set_bytes)
             content_set_int = msg.content_set_int
@@ -88,9 +88,9 @@ class TProtocolNoCtSerializer(Serializer):
             performative.content_list_bool.extend(content_list_bool)
             content_list_str = msg.content_list_str
             performative.content_list_str.extend(content_list_str)
-            t_protocol_no_ct_msg.performative_pct.CopyFrom(performative)
         elif performative_id == TProtocolNoCtMessage.Performative.PERFORMATIVE_PMT:
-            performative = t_protocol_no_ct_pb2.TProtocolNoCtMessage.Performative_Pmt_Performative()  # type: ignore
+            performative = t_protocol_no_ct_msg.performative_pmt
+            performative.SetInParent()
             content_dict_int_bytes = msg.content_dict_int_bytes
             performative.content_dict_int_bytes.update(content_dict_int_bytes)
             content_dict_int_int = msg.content_dict_int_int
@@ -121,9 +121,9 @@ class TProtocolNoCtSerializer(Serializer):
             performative.content_dict_str_bool.update(content_dict_str_bool)
             content_dict_str_str = msg.content_dict_str_str
             performative.content_dict_str_str.update(content_dict_str_str)
-            t_protocol_no_ct_msg.performative_pmt.CopyFrom(performative)
         elif performative_id == TProtocolNoCtMessage.Performative.PERFORMATIVE_MT:
-            performative = t_protocol_no_ct_pb2.TProtocolNoCtMessage.Performative_Mt_Performative()  # type: ignore
+            performative = t_protocol_no_ct_msg.performative_mt
+            performative.SetInParent()
             if msg.is_set("content_union_1_type_bytes"):
                 performative.content_union_1_type_bytes_is_set = True
                 content_union_1_type_bytes = msg.content_union_1_type_bytes
@@ -234,9 +234,9 @@ class TProtocolNoCtSerializer(Serializer):
                 performative.content_union_2_type_dict_of_bool_bytes.update(
                     content_union_2_type_dict_of_bool_bytes
                 )
-            t_protocol_no_ct_msg.performative_mt.CopyFrom(performative)
         elif performative_id == TProtocolNoCtMessage.Performative.PERFORMATIVE_O:
-            performative = t_protocol_no_ct_pb2.TProtocolNoCtMessage.Performative_O_Performative()  # type: ignore
+            performative = t_protocol_no_ct_msg.performative_o
+            performative.SetInParent()
             if msg.is_set("content_o_bool"):
                 performative.content_o_bool_is_set = True
                 content_o_bool = msg.content_o_bool
@@ -253,19 +253,17 @@ class TProtocolNoCtSerializer(Serializer):
                 performative.content_o_dict_str_int_is_set = True
                 content_o_dict_str_int = msg.content_o_dict_str_int
                 performative.content_o_dict_str_int.update(content_o_dict_str_int)
-            t_protocol_no_ct_msg.performative_o.CopyFrom(performative)
         elif (
             performative_id
             == TProtocolNoCtMessage.Performative.PERFORMATIVE_EMPTY_CONTENTS
         ):
-            performative = t_protocol_no_ct_pb2.TProtocolNoCtMessage.Performative_Empty_Contents_Performative()  # type: ignore
-            t_protocol_no_ct_msg.performative_empty_contents.CopyFrom(performative)
+            performative = t_protocol_no_ct_msg.performative_empty_contents
+            performative.SetInParent()
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
         dialogue_message_pb.content = t_protocol_no_ct_msg.SerializeToString()
 
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
         message_bytes = message_pb.SerializeToString()
         return message_bytes
 
@@ -548,5 +546,6 @@ class TProtocolNoCtSerializer(Serializer):
             dialogue_reference=dialogue_reference,
             target=target,
             performative=performative,
+            _check_consistency=TProtocolNoCtMessage.check_consistency_on_decode,
             **performative_content
         )
@@ -41,6 +41,7 @@ from aea.helpers.exception_policy import ExceptionPolicyEnum
 from aea.identity.base import Identity
 from aea.mail.base import Envelope
 from aea.protocols.base import Protocol
+from aea.protocols.dialogue.base import Dialogues, PersistDialoguesStorage
 from aea.registries.resources import Resources
 from aea.runtime import RuntimeStates
 from aea.skills.base import Skill, SkillContext
@@ -111,6 +112,27 @@ def test_act():
         agent.stop()
 
 
+def test_dialogues_flushed_periodically():
+    """Tests the AEA flushes the dialogues of its skills in a periodic task."""
+    private_key_path = os.path.join(CUR_PATH, "data", DEFAULT_PRIVATE_KEY_FILE)
+    builder = AEABuilder()
+    builder.set_name("my_name").add_private_key(DEFAULT_LEDGER, private_key_path)
+    agent = builder.build()
+    assert agent.get_periodic_tasks()[agent._flush_dialogues] == (
+        PersistDialoguesStorage.WRITE_BEHIND_FLUSH_INTERVAL,
+        None,
+    )
+
+    dialogues = MagicMock(spec=Dialogues)
+    with patch.object(
+        agent.resources.model_registry,
+        "fetch_all",
+        return_value=[MagicMock(), dialogues],
+    ):
+        agent._flush_dialogues()
+    dialogues.flush_if_due.assert_called_once_with()
+
+
 def test_start_stop():
     """Tests the act function of the AEA."""
     agent_name = "MyAgent"
@@ -298,6 +320,43 @@ def test_handle():
             an_aea.stop()
 
 
+def test_handle_decoding_with_decoded_message_cache():
+    """Test identical encoded messages are decoded once when the cache is enabled."""
+    private_key_path = os.path.join(CUR_PATH, "data", DEFAULT_PRIVATE_KEY_FILE)
+    builder = AEABuilder()
+    builder.set_name("my_agent")
+    builder.add_private_key(DEFAULT_LEDGER, private_key_path)
+    builder.add_skill(Path(CUR_PATH, "data", "dummy_skill"))
+    builder.set_decoded_message_cache_size(8)
+    an_aea = builder.build()
+    an_aea.setup()
+
+    msg = DefaultMessage(
+        dialogue_reference=("", ""),
+        message_id=1,
+        target=0,
+        performative=DefaultMessage.Performative.BYTES,
+        content=b"hello",
+    )
+    encoded_msg = DefaultSerializer.encode(msg)
+    decoded = []
+    for sender in ("sender_1", "sender_2"):
+        envelope = Envelope(
+            to=an_aea.identity.address,
+            sender=sender,
+            protocol_specification_id=DefaultMessage.protocol_specification_id,
+            message=encoded_msg,
+        )
+        message, handlers = an_aea._get_msg_and_handlers_for_envelope(envelope)
+        assert len(handlers) > 0
+        decoded.append(message)
+
+    assert [message.sender for message in decoded] == ["sender_1", "sender_2"]
+    assert decoded[0].content == decoded[1].content == b"hello"
+    cache = an_aea.decoded_message_cache
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
 def test_initialize_aea_programmatically():
     """Test that we can initialize an AEA programmatically."""
     with LocalNode() as node:
@@ -54,6 +54,7 @@ from aea.exceptions import AEAEnforceError, AEAException, AEAWalletNoAddressExce
 from aea.helpers.base import cd
 from aea.helpers.exception_policy import ExceptionPolicyEnum
 from aea.helpers.install_dependency import run_install_subprocess
+from aea.multiplexer import BackpressurePolicyEnum
 from aea.protocols.base import Protocol
 from aea.registries.resources import Resources
 from aea.skills.base import Skill
@@ -521,6 +522,7 @@ def test_set_from_config_default():
     agent_configuration.error_handler = {}
     agent_configuration.skill_exception_policy = ExceptionPolicyEnum.just_log
     agent_configuration.connection_exception_policy = ExceptionPolicyEnum.just_log
+    agent_configuration.backpressure_policy = BackpressurePolicyEnum.block
     agent_configuration._default_connection = None
     agent_configuration.connection_private_key_paths_dict = {"fetchai": None}
     agent_configuration.ledger_apis_dict = {"fetchai": None}
@@ -563,6 +565,7 @@ def test_set_from_config_custom():
     }
     agent_configuration.skill_exception_policy = ExceptionPolicyEnum.just_log
     agent_configuration.connection_exception_policy = ExceptionPolicyEnum.just_log
+    agent_configuration.backpressure_policy = BackpressurePolicyEnum.block
     agent_configuration._default_connection = None
     agent_configuration.connection_private_key_paths_dict = {"fetchai": None}
     agent_configuration.ledger_apis_dict = {"fetchai": None}
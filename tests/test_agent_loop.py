@@ -26,7 +26,13 @@ from unittest.mock import MagicMock, Mock, patch
 import pytest
 
 from aea.aea import AEA
-from aea.agent_loop import AgentLoopStates, AsyncAgentLoop, BaseAgentLoop, SyncAgentLoop
+from aea.agent_loop import (
+    AgentLoopStates,
+    AsyncAgentLoop,
+    BaseAgentLoop,
+    SyncAgentLoop,
+    TimerWheelAgentLoop,
+)
 from aea.exceptions import AEAActException
 from aea.helpers.async_friendly_queue import AsyncFriendlyQueue
 from aea.helpers.exception_policy import ExceptionPolicyEnum
@@ -35,7 +41,7 @@ from aea.protocols.base import Message
 from aea.registries.filter import Filter
 from aea.registries.resources import Resources
 from aea.skills.base import Behaviour, Handler, SkillContext
-from aea.skills.behaviours import TickerBehaviour
+from aea.skills.behaviours import SimpleBehaviour, TickerBehaviour
 
 from packages.fetchai.protocols.default.message import DefaultMessage
 
@@ -113,8 +119,9 @@ class AsyncFakeAgent(AEA):
         self.runtime.decision_maker.message_out_queue = AsyncFriendlyQueue()
         self._inbox = AsyncFriendlyQueue()
         self._runtime.agent_loop.skill2skill_queue = asyncio.Queue()
+        self._resources = Resources()
         self._filter = Filter(
-            Resources(), self.runtime.decision_maker.message_out_queue
+            self._resources, self.runtime.decision_maker.message_out_queue
         )
         self._logger = logging.getLogger("fake agent")
         self._period = 0.001
@@ -292,6 +299,113 @@ class TestAsyncAgentLoop:
         agent_loop.stop()
         agent_loop.wait_completed(sync=True)
 
+    def test_behaviours_updates(self):
+        """Test behaviours registered and unregistered at runtime are (un)scheduled."""
+        tick_interval = 0.1
+        behaviour = CountBehaviour.make(tick_interval=tick_interval)
+        behaviour.setup()
+        agent = self.FAKE_AGENT_CLASS()
+        agent_loop = self.AGENT_LOOP_CLASS(agent, threaded=True)
+        agent.runtime.agent_loop = agent_loop
+        agent_loop.start()
+        wait_for_condition(lambda: agent_loop.is_running, timeout=10)
+
+        agent_loop.update_behaviour(behaviour, True)
+        wait_for_condition(lambda: behaviour.counter >= 1, timeout=tick_interval * 5)
+
+        agent_loop.update_behaviour(behaviour, False)
+        wait_for_condition(
+            lambda: behaviour.act_wrapper not in agent_loop._periodic_tasks, timeout=2
+        )
+        agent_loop.stop()
+        agent_loop.wait_completed(sync=True)
+
+    def test_done_behaviour_unscheduled(self):
+        """Test a behaviour is unscheduled once done."""
+        tick_interval = 0.1
+        behaviour = CountBehaviour.make(tick_interval=tick_interval)
+        behaviour.setup()
+        behaviour.is_done = lambda: behaviour.counter >= 2
+        agent = self.FAKE_AGENT_CLASS(behaviours=[behaviour])
+        agent_loop = self.AGENT_LOOP_CLASS(agent, threaded=True)
+        agent.runtime.agent_loop = agent_loop
+        agent_loop.start()
+        wait_for_condition(lambda: agent_loop.is_running, timeout=10)
+
+        wait_for_condition(
+            lambda: behaviour.act_wrapper not in agent_loop._periodic_tasks,
+            timeout=tick_interval * 10,
+        )
+        assert behaviour.counter == 2
+        agent_loop.stop()
+        agent_loop.wait_completed(sync=True)
+
+    def test_inactive_skill_behaviour(self):
+        """Test a behaviour of an inactive skill is scheduled once the skill is active."""
+        tick_interval = 0.1
+        behaviour = CountBehaviour.make(tick_interval=tick_interval)
+        behaviour.setup()
+        behaviour.context._is_active = False
+        agent = self.FAKE_AGENT_CLASS()
+        agent_loop = self.AGENT_LOOP_CLASS(agent, threaded=True)
+        agent_loop.NEW_BEHAVIOURS_PROCESS_SLEEP = 0.1
+        agent.runtime.agent_loop = agent_loop
+        agent_loop.start()
+        wait_for_condition(lambda: agent_loop.is_running, timeout=10)
+
+        agent_loop.update_behaviour(behaviour, True)
+        wait_for_condition(
+            lambda: behaviour in agent_loop._inactive_behaviours, timeout=2
+        )
+        assert behaviour.counter == 0
+
+        behaviour.context._is_active = True
+        wait_for_condition(lambda: behaviour.counter >= 1, timeout=2)
+
+        behaviour.context._is_active = False
+        wait_for_condition(
+            lambda: behaviour in agent_loop._inactive_behaviours, timeout=2
+        )
+        assert behaviour.act_wrapper not in agent_loop._periodic_tasks
+        agent_loop.stop()
+        agent_loop.wait_completed(sync=True)
+
+    def test_deactivated_skill_behaviour_not_acted(self):
+        """Test a behaviour of a skill deactivated since its last act does not act again."""
+        acts = []
+        behaviour = SimpleBehaviour(
+            act=lambda: acts.append(True), name="test", skill_context=SkillContext()
+        )
+        agent_loop = self.AGENT_LOOP_CLASS(self.FAKE_AGENT_CLASS())
+        agent_loop._periodic_behaviours[behaviour.act_wrapper] = behaviour
+        agent_loop._run_periodic_task(behaviour.act_wrapper)
+        assert len(acts) == 1
+
+        behaviour.context._is_active = False
+        agent_loop._run_periodic_task(behaviour.act_wrapper)
+        assert len(acts) == 1
+        assert behaviour in agent_loop._inactive_behaviours
+        assert behaviour.act_wrapper not in agent_loop._periodic_behaviours
+
+    def test_behaviour_done_from_outside_not_acted(self):
+        """Test a behaviour made done since its last act, e.g. by a handler, does not act again."""
+        acts = []
+        behaviour = SimpleBehaviour(
+            act=lambda: acts.append(True), name="test", skill_context=SkillContext()
+        )
+        is_done = False
+        behaviour.is_done = lambda: is_done
+        agent_loop = self.AGENT_LOOP_CLASS(self.FAKE_AGENT_CLASS())
+        agent_loop._periodic_behaviours[behaviour.act_wrapper] = behaviour
+        agent_loop._run_periodic_task(behaviour.act_wrapper)
+        assert len(acts) == 1
+
+        is_done = True
+        agent_loop._run_periodic_task(behaviour.act_wrapper)
+        assert len(acts) == 1
+        assert behaviour.act_wrapper not in agent_loop._periodic_behaviours
+        assert behaviour not in agent_loop._inactive_behaviours
+
     @pytest.mark.asyncio
     async def test_behaviour_exception(self):
         """Test behaviour exception reraised properly."""
@@ -359,6 +473,28 @@ class TestAsyncAgentLoop:
             )
 
 
+class TestTimerWheelAgentLoop(TestAsyncAgentLoop):
+    """Tests for asynchronous loop with behaviours scheduled by a timer wheel."""
+
+    AGENT_LOOP_CLASS: Type[BaseAgentLoop] = TimerWheelAgentLoop
+
+    def test_timer_wheel_stats(self):
+        """Test behaviours are scheduled by the timer wheel."""
+        tick_interval = 0.1
+        behaviour = CountBehaviour.make(tick_interval=tick_interval)
+        behaviour.setup()
+        agent = self.FAKE_AGENT_CLASS(behaviours=[behaviour])
+        agent_loop = self.AGENT_LOOP_CLASS(agent, threaded=True)
+        agent.runtime.agent_loop = agent_loop
+        agent_loop.start()
+        wait_for_condition(lambda: agent_loop.is_running, timeout=10)
+
+        wait_for_condition(lambda: behaviour.counter >= 2, timeout=tick_interval * 5)
+        assert agent_loop.timer_wheel.stats.calls >= behaviour.counter
+        agent_loop.stop()
+        agent_loop.wait_completed(sync=True)
+
+
 class TestSyncAgentLoop:
     """Tests for synchronous loop."""
 
@@ -41,6 +41,7 @@ from aea.configurations.loader import ConfigLoader, ConfigLoaders
 from aea.exceptions import AEAValidationError
 from aea.helpers.exception_policy import ExceptionPolicyEnum
 from aea.helpers.yaml_utils import yaml_load_all
+from aea.multiplexer import BackpressurePolicyEnum
 
 from tests.conftest import CUR_PATH, ROOT_DIR
 
@@ -225,6 +226,93 @@ class TestMaxReactionsConfigVariable(BaseConfigTestVariable):
     AEA_DEFAULT_VALUE = AEABuilder.DEFAULT_MAX_REACTIONS
 
 
+class TestDecodedMessageCacheSizeConfigVariable(BaseConfigTestVariable):
+    """Test `decoded_message_cache_size` aea config option."""
+
+    OPTION_NAME = "decoded_message_cache_size"
+    CONFIG_ATTR_NAME = "decoded_message_cache_size"
+    GOOD_VALUES = [0, 10]
+    INCORRECT_VALUES = ["sTrING?", -1, 1.1]
+    REQUIRED = False
+    AEA_ATTR_NAME = "decoded_message_cache"
+    AEA_DEFAULT_VALUE = AEABuilder.DEFAULT_DECODED_MESSAGE_CACHE_SIZE
+
+    def _get_aea_value(self, aea: AEA) -> Any:
+        """Get AEA attribute value.
+
+        :param aea: AEA isntance to get atribute value from.
+
+        :return: value of attribute.
+        """
+        cache = aea.decoded_message_cache
+        return cache.max_size if cache is not None else 0
+
+
+class TestMultiplexerBatchSizeConfigVariable(BaseConfigTestVariable):
+    """Test `multiplexer_batch_size` aea config option."""
+
+    OPTION_NAME = "multiplexer_batch_size"
+    CONFIG_ATTR_NAME = "multiplexer_batch_size"
+    GOOD_VALUES = [1, 32]
+    INCORRECT_VALUES = ["sTrING?", -1, 0, 1.1]
+    REQUIRED = False
+    AEA_ATTR_NAME = "batch_size"
+    AEA_DEFAULT_VALUE = AEABuilder.DEFAULT_MULTIPLEXER_BATCH_SIZE
+
+    def _get_aea_value(self, aea: AEA) -> Any:
+        """Get AEA attribute value.
+
+        :param aea: AEA isntance to get atribute value from.
+
+        :return: value of attribute.
+        """
+        return aea.runtime.multiplexer.batch_size
+
+
+class TestSendQueueHighWatermarkConfigVariable(BaseConfigTestVariable):
+    """Test `send_queue_high_watermark` aea config option."""
+
+    OPTION_NAME = "send_queue_high_watermark"
+    CONFIG_ATTR_NAME = "send_queue_high_watermark"
+    GOOD_VALUES = [1, 100]
+    INCORRECT_VALUES = ["sTrING?", -1, 0, 1.1]
+    REQUIRED = False
+    AEA_ATTR_NAME = "_send_queue_high_watermark"
+    AEA_DEFAULT_VALUE = None
+
+    def _get_aea_value(self, aea: AEA) -> Any:
+        """Get AEA attribute value.
+
+        :param aea: AEA isntance to get atribute value from.
+
+        :return: value of attribute.
+        """
+        return getattr(aea.runtime.multiplexer, self.AEA_ATTR_NAME)
+
+
+class TestSendQueueLowWatermarkConfigVariable(TestSendQueueHighWatermarkConfigVariable):
+    """Test `send_queue_low_watermark` aea config option."""
+
+    OPTION_NAME = "send_queue_low_watermark"
+    CONFIG_ATTR_NAME = "send_queue_low_watermark"
+    GOOD_VALUES = [0, 50]
+    INCORRECT_VALUES = ["sTrING?", -1, 1.1]
+    BASE_CONFIG = base_config + "send_queue_high_watermark: 100\n"
+    AEA_ATTR_NAME = "_send_queue_low_watermark"
+    AEA_DEFAULT_VALUE = 50
+
+
+class TestBackpressurePolicyConfigVariable(TestSendQueueHighWatermarkConfigVariable):
+    """Test `backpressure_policy` aea config option."""
+
+    OPTION_NAME = "backpressure_policy"
+    CONFIG_ATTR_NAME = "backpressure_policy"
+    GOOD_VALUES = BackpressurePolicyEnum  # type: ignore
+    INCORRECT_VALUES = [None, "sTrING?", -1]
+    AEA_ATTR_NAME = "_backpressure_policy"
+    AEA_DEFAULT_VALUE = AEABuilder.DEFAULT_BACKPRESSURE_POLICY
+
+
 class TestLoopModeConfigVariable(BaseConfigTestVariable):
     """Test `loop_mode` aea config option."""
 
@@ -17,6 +17,7 @@
 #
 # ------------------------------------------------------------------------------
 """This module contains the tests for the aea.configurations.base module."""
+import pickle  # nosec
 import re
 from copy import copy
 from pathlib import Path
@@ -617,6 +618,27 @@ def test_public_id_from_string_with_version_string_latest():
     assert public_id.version == "latest"
 
 
+def test_public_id_from_string_interned():
+    """Test parsing the same string returns the same public id."""
+    public_id = PublicId.from_str("author/package:0.1.0")
+    assert PublicId.from_str("author/package:0.1.0") is public_id
+    assert PublicId.from_str("author/package:0.1.1") is not public_id
+
+    same_public_id = PublicId("author", "package", "0.1.0")
+    assert same_public_id is not public_id
+    assert same_public_id == public_id
+    assert hash(same_public_id) == hash(public_id)
+    assert PublicId("author", "package", "0.1.1") != public_id
+    assert PublicId("author", "package", "0.1.0+build") != public_id
+
+
+def test_public_id_pickle():
+    """Test public ids are pickled with their components only."""
+    public_id = PublicId.from_str("author/package:0.1.0")
+    assert public_id.__reduce__() == (PublicId, ("author", "package", "0.1.0"))
+    assert pickle.loads(pickle.dumps(public_id)) == public_id  # nosec
+
+
 def test_public_id_from_uri_path():
     """Test PublicId.from_uri_path"""
     result = PublicId.from_uri_path("author/package_name/0.1.0")
@@ -26,7 +26,7 @@ import pytest
 import yaml
 
 from aea.configurations.constants import CONNECTION
-from aea.configurations.data_types import ComponentId, PublicId
+from aea.configurations.data_types import ComponentId, ComponentType, PublicId
 from aea.configurations.manager import (
     AgentConfigManager,
     find_component_directory_from_component_id,
@@ -239,7 +239,12 @@ def test_agent_attribute_get_overridables():
     agent_config_manager = AgentConfigManager.load(DUMMY_AEA, substitude_env_vars=False)
     agent_overrides, component_overrides = agent_config_manager.get_overridables()
     assert "default_ledger" in agent_overrides
-    assert "is_abstract" in list(component_overrides.values())[0]
+    overrides_by_type = {
+        component_id.component_type: overrides
+        for component_id, overrides in component_overrides.items()
+    }
+    assert "is_abstract" in overrides_by_type[ComponentType.SKILL]
+    assert "check_consistency_on_decode" in overrides_by_type[ComponentType.PROTOCOL]
 
 
 def test_dump_config():
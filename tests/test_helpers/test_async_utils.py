@@ -22,6 +22,7 @@ import time
 from concurrent.futures._base import CancelledError
 from contextlib import suppress
 from threading import Thread
+from unittest.mock import Mock
 
 import pytest
 
@@ -30,6 +31,7 @@ from aea.helpers.async_utils import (
     PeriodicCaller,
     Runnable,
     ThreadedAsyncRunner,
+    TimerWheel,
     ensure_list,
 )
 
@@ -167,6 +169,91 @@ async def test_periodic_caller_exception():
     periodic_caller.stop()
 
 
+@pytest.mark.asyncio
+async def test_timer_wheel_start_stop():
+    """Test start stop calls of periodic callers scheduled by TimerWheel."""
+    wheel = TimerWheel(tick=0.01)
+    calls = {0.02: 0, 0.05: 0}
+
+    def make_callback(period):
+        def callback():
+            calls[period] += 1
+
+        return callback
+
+    callers = [wheel.call_periodic(make_callback(period), period) for period in calls]
+    for caller in callers:
+        caller.start()
+
+    await asyncio.sleep(0.5)
+    assert 15 <= calls[0.02] <= 26
+    assert 6 <= calls[0.05] <= 11
+    assert wheel.stats.calls == sum(calls.values())
+    # the calls due on the same tick run on the same wakeup
+    assert wheel.stats.wakeups < wheel.stats.calls
+    assert "TimerWheelStats(" in repr(wheel.stats)
+
+    for caller in callers:
+        caller.stop()
+    old_calls = dict(calls)
+    await asyncio.sleep(0.1)
+    assert calls == old_calls
+    assert wheel._timerhandle is None
+
+
+@pytest.mark.asyncio
+async def test_timer_wheel_cascade():
+    """Test TimerWheel schedules calls beyond the lower levels and the top level rotation."""
+    loop = asyncio.get_event_loop()
+    wheel = TimerWheel(tick=0.001, slots=2, levels=2)
+    called_at = []
+    caller = wheel.call_periodic(lambda: called_at.append(loop.time()), 0.011)
+    start_time = loop.time()
+    caller.start()
+
+    await asyncio.sleep(0.1)
+    caller.stop()
+    assert 5 <= len(called_at) <= 10
+    for previous, current in zip([start_time] + called_at, called_at[1:]):
+        assert current - previous >= 0.011 - 0.001
+
+
+@pytest.mark.asyncio
+async def test_timer_wheel_overrun():
+    """Test TimerWheel counts the calls skipped when a call lasts more than its period."""
+    wheel = TimerWheel(tick=0.01)
+    caller = wheel.call_periodic(lambda: time.sleep(0.05), 0.01)
+    caller.start()
+
+    await asyncio.sleep(0.2)
+    caller.stop()
+    assert wheel.stats.overruns > 0
+    assert wheel.stats.max_lag >= wheel.stats.lag >= 0
+
+
+@pytest.mark.asyncio
+async def test_timer_wheel_exception():
+    """Test exception raised in a periodic caller scheduled by TimerWheel."""
+    wheel = TimerWheel(tick=0.01)
+    exception_callback = Mock()
+
+    def callback():
+        raise Exception("expected")
+
+    caller = wheel.call_periodic(callback, 0.01, exception_callback=exception_callback)
+    caller.start()
+
+    await asyncio.sleep(0.1)
+    exception_callback.assert_called_once()
+    assert not caller.is_active
+
+
+def test_timer_wheel_bad_parameters():
+    """Test TimerWheel parameters are checked."""
+    with pytest.raises(ValueError, match="Tick must be positive"):
+        TimerWheel(tick=0)
+
+
 @pytest.mark.asyncio
 async def test_threaded_async_run():
     """Test threaded async runner."""
@@ -23,6 +23,7 @@ import unittest
 from functools import partial
 from threading import Thread
 from unittest.case import TestCase
+from unittest.mock import patch
 
 import pytest
 
@@ -30,6 +31,7 @@ from aea.helpers.exec_timeout import (
     BaseExecTimeout,
     ExecTimeoutSigAlarm,
     ExecTimeoutThreadGuard,
+    ExecTimeoutWatchdog,
     TimeoutException,
 )
 
@@ -170,6 +172,57 @@ class TestThreadGuard(BaseTestExecTimeout):
         assert t1_timeout <= time_t1.time_passed < t1_sleep
 
 
+class TestWatchdog(TestThreadGuard):
+    """Test code execution timeout using a shared watchdog thread."""
+
+    EXEC_TIMEOUT_CLASS = ExecTimeoutWatchdog
+
+    def setUp(self):
+        """Set up."""
+        super().setUp()
+        self.EXEC_TIMEOUT_CLASS.reset_stats()
+
+    def test_stats(self):
+        """Test the watchdog reports interrupted calls and the time left to deadlines."""
+        with ExecTimeoutWatchdog(1) as exec_timeout:
+            self.slow_function(0.1)
+        assert not exec_timeout.is_cancelled_by_timeout()
+        with pytest.raises(TimeoutException):
+            with ExecTimeoutWatchdog(0.1):
+                self.slow_function(0.4)
+
+        stats = ExecTimeoutWatchdog.get_stats()
+        assert stats.calls == 2
+        assert stats.interrupted == 1
+        assert 0 < stats.min_time_to_deadline <= 0.9
+        assert "calls=2" in repr(stats)
+
+        ExecTimeoutWatchdog.reset_stats()
+        assert ExecTimeoutWatchdog.get_stats().calls == 0
+
+    def test_deadline_later_than_wheel_turn(self):
+        """Test calls due after a full turn of the timer wheel are not interrupted early."""
+        with patch.object(ExecTimeoutWatchdog, "WHEEL_SIZE", 4):
+            ExecTimeoutWatchdog.stop(force=True)
+            ExecTimeoutWatchdog.start()
+            with ExecTimeoutWatchdog(0.2) as exec_timeout:
+                self.slow_function(0.1)
+            assert not exec_timeout.is_cancelled_by_timeout()
+            with pytest.raises(TimeoutException):
+                with ExecTimeoutWatchdog(0.1):
+                    self.slow_function(0.4)
+            ExecTimeoutWatchdog.stop(force=True)
+            ExecTimeoutWatchdog.start()
+
+
+def test_watchdog_not_started():
+    """Test that the watchdog applies no timeout if not started."""
+    with ExecTimeoutWatchdog(0.1) as exec_limit:
+        TestThreadGuard.slow_function(0.3)
+
+    assert not exec_limit.is_cancelled_by_timeout()
+
+
 def test_supervisor_not_started():
     """Test that TestThreadGuard supervisor thread not started."""
     timeout = 0.1
@@ -42,6 +42,36 @@ def test_agent_logger_adapter():
         mock_logger.assert_any_call(logging.DEBUG, "[some_agent] Some log message.")
 
 
+def test_agent_logger_adapter_lazy_formatting():
+    """Test the agent logger adapter follows level changes and formats arguments lazily."""
+    logger = AgentLoggerAdapter(
+        AgentLoggerAdapter(logging.getLogger("some.lazy.logger"), "inner_agent"),
+        agent_name="some_agent",
+    )
+    logger.setLevel(logging.INFO)
+    assert not logger.isEnabledFor(logging.DEBUG)
+    with patch.object(logging.Logger, "_log") as mock_log, patch.object(
+        logger, "process"
+    ) as mock_process:
+        logger.debug("Some log message: %s", "arg")
+        mock_log.assert_not_called()
+        mock_process.assert_not_called()
+
+    logger.setLevel(logging.DEBUG)
+    assert logger.isEnabledFor(logging.DEBUG)
+    with patch.object(logger.logger.logger, "_log") as mock_log:
+        logger.debug("Some log message: %s", "arg")
+        mock_log.assert_called_once_with(
+            logging.DEBUG, "[inner_agent] [some_agent] Some log message: %s", ("arg",)
+        )
+
+    logger.logger.logger.disabled = True
+    try:
+        assert not logger.isEnabledFor(logging.DEBUG)
+    finally:
+        logger.logger.logger.disabled = False
+
+
 def test_with_logger_default_logger_name():
     """Test the WithLogger interface, default logger name."""
 
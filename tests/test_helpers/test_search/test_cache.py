@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the tests for the search result cache."""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from aea.exceptions import AEAEnforceError
+from aea.helpers.search.cache import (
+    SEARCH_CACHE_HIT,
+    SEARCH_CACHE_MISS,
+    SearchResultCache,
+    add_search_cache_observer,
+    get_query_key,
+    remove_search_cache_observer,
+)
+from aea.helpers.search.models import (
+    Attribute,
+    Constraint,
+    ConstraintType,
+    DataModel,
+    Query,
+)
+
+
+def _make_query(value: int, model_name: str = "foo") -> Query:
+    """Make a query on an attribute value."""
+    model = DataModel(model_name, [Attribute("bar", int, True)])
+    return Query([Constraint("bar", ConstraintType("==", value))], model=model)
+
+
+def test_query_key():
+    """Test the key of a query encodes its constraints and its data model."""
+    assert get_query_key(_make_query(1)) == get_query_key(_make_query(1))
+    assert get_query_key(_make_query(1)) != get_query_key(_make_query(2))
+    assert get_query_key(_make_query(1)) != get_query_key(_make_query(1, "baz"))
+
+
+def test_bad_parameters():
+    """Test the cache parameters are checked."""
+    with pytest.raises(AEAEnforceError, match="Time to live must be positive."):
+        SearchResultCache(0.0, 1, "owner")
+    with pytest.raises(AEAEnforceError, match="Max size must be a positive integer."):
+        SearchResultCache(1.0, 0, "owner")
+
+
+def test_hit_and_miss():
+    """Test a cached result is returned till it expires."""
+    cache = SearchResultCache(10.0, 10, "owner")
+    assert cache.ttl == 10.0
+    assert cache.max_size == 10
+    assert cache.get(_make_query(1)) is None
+    cache.put(_make_query(1), ("agent",))
+    assert cache.get(_make_query(1)) == ("agent",)
+    assert len(cache) == 1
+
+    with patch("time.monotonic", return_value=float("inf")):
+        assert cache.get(_make_query(1)) is None
+    assert len(cache) == 0
+    assert cache.get_stats() == {
+        "hits": 1,
+        "misses": 2,
+        "evictions": 0,
+        "expirations": 1,
+        "invalidations": 0,
+        "size": 0,
+    }
+
+
+def test_eviction():
+    """Test the least recently used result is evicted first."""
+    cache = SearchResultCache(10.0, 2, "owner")
+    cache.put(_make_query(1), ("agent_1",))
+    cache.put(_make_query(2), ("agent_2",))
+    assert cache.get(_make_query(1)) == ("agent_1",)
+    cache.put(_make_query(3), ("agent_3",))
+
+    assert cache.get(_make_query(2)) is None
+    assert cache.get(_make_query(1)) == ("agent_1",)
+    assert cache.get(_make_query(3)) == ("agent_3",)
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_invalidation():
+    """Test the results of the searches started before an invalidation are not cached."""
+    cache = SearchResultCache(10.0, 10, "owner")
+    cache.put(_make_query(1), ("agent_1",))
+    generation = cache.generation
+    cache.invalidate()
+
+    assert cache.generation == generation + 1
+    assert cache.get(_make_query(1)) is None
+    cache.put(_make_query(2), ("agent_2",), generation)
+    assert cache.get(_make_query(2)) is None
+    cache.put(_make_query(2), ("agent_2",), cache.generation)
+    assert cache.get(_make_query(2)) == ("agent_2",)
+    assert cache.get_stats()["invalidations"] == 1
+
+
+def test_observers():
+    """Test the observers of the owner are notified of the lookups."""
+    observer, other_observer = MagicMock(), MagicMock()
+    cache = SearchResultCache(10.0, 10, "owner", "some/connection:0.1.0")
+    add_search_cache_observer("owner", observer)
+    add_search_cache_observer("other_owner", other_observer)
+    try:
+        cache.get(_make_query(1))
+        cache.put(_make_query(1), ("agent",))
+        cache.get(_make_query(1))
+    finally:
+        remove_search_cache_observer("owner", observer)
+        remove_search_cache_observer("other_owner", other_observer)
+
+    assert [c[0] for c in observer.call_args_list] == [
+        ("some/connection:0.1.0", SEARCH_CACHE_MISS),
+        ("some/connection:0.1.0", SEARCH_CACHE_HIT),
+    ]
+    other_observer.assert_not_called()
+    cache.get(_make_query(1))
+    assert observer.call_count == 2
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the tests for the directory of service descriptions."""
+import random
+
+import pytest
+
+from aea.exceptions import AEAEnforceError
+from aea.helpers.search.directory import ServiceDirectory
+from aea.helpers.search.models import (
+    And,
+    Attribute,
+    Constraint,
+    ConstraintType,
+    DataModel,
+    Description,
+    Location,
+    Not,
+    Or,
+    Query,
+)
+
+
+DATA_MODEL = DataModel(
+    "service",
+    [
+        Attribute("price", int, True),
+        Attribute("rating", float, True),
+        Attribute("city", str, True),
+        Attribute("open", bool, True),
+        Attribute("location", Location, True),
+    ],
+)
+OTHER_DATA_MODEL = DataModel("other", [Attribute("price", int, True)])
+CITIES = ["Berlin", "Cambridge", "London", "Paris", "Zurich"]
+
+
+def _make_description(rng: random.Random) -> Description:
+    """Make a random service description."""
+    return Description(
+        {
+            "price": rng.randint(0, 20),
+            "rating": round(rng.uniform(0, 5), 1),
+            "city": rng.choice(CITIES),
+            "open": rng.random() < 0.5,
+            "location": Location(rng.uniform(-90, 90), rng.uniform(-180, 180)),
+        },
+        data_model=DATA_MODEL,
+    )
+
+
+def _make_constraint(rng: random.Random) -> Constraint:
+    """Make a random constraint on the attributes of the service data model."""
+    kind = rng.randrange(11)
+    price = rng.randint(0, 20)
+    if kind == 0:
+        return Constraint("price", ConstraintType("==", price))
+    if kind == 1:
+        return Constraint("price", ConstraintType("!=", price))
+    if kind == 2:
+        return Constraint("price", ConstraintType(rng.choice(["<", "<="]), price))
+    if kind == 3:
+        return Constraint("price", ConstraintType(rng.choice([">", ">="]), price))
+    if kind == 4:
+        return Constraint("price", ConstraintType("within", (price, price + 5)))
+    if kind == 5:
+        return Constraint("rating", ConstraintType(">", rng.uniform(0, 5)))
+    if kind == 6:
+        return Constraint("city", ConstraintType("in", tuple(rng.sample(CITIES, 2))))
+    if kind == 7:
+        return Constraint("city", ConstraintType("<", rng.choice(CITIES)))
+    if kind == 8:
+        return Constraint("open", ConstraintType("==", True))
+    if kind == 9:
+        return Constraint("city", ConstraintType("not_in", ("Berlin",)))
+    center = Location(rng.uniform(-90, 90), rng.uniform(-180, 180))
+    return Constraint(
+        "location", ConstraintType("distance", (center, rng.uniform(0, 5000)))
+    )
+
+
+def _make_query(rng: random.Random) -> Query:
+    """Make a random query, with nested expressions."""
+    constraints = []
+    for _ in range(rng.randint(1, 3)):
+        kind = rng.randrange(5)
+        if kind == 0:
+            constraints.append(And([_make_constraint(rng), _make_constraint(rng)]))
+        elif kind == 1:
+            constraints.append(Or([_make_constraint(rng), _make_constraint(rng)]))
+        elif kind == 2:
+            constraints.append(Not(_make_constraint(rng)))
+        else:
+            constraints.append(_make_constraint(rng))
+    return Query(constraints, model=rng.choice([None, DATA_MODEL]))
+
+
+def test_search_as_query_check():
+    """Test the search results are those of checking the query on all the descriptions."""
+    rng = random.Random(0)
+    directory = ServiceDirectory(grid_cell_size=10.0)
+    services = []
+    for i in range(300):
+        services.append((f"agent_{i % 100}", _make_description(rng)))
+        directory.add(*services[-1])
+    for address, description in services[::3]:
+        assert directory.remove(address, description)
+    services = [service for i, service in enumerate(services) if i % 3 != 0]
+    assert len(directory) == len(services)
+
+    for _ in range(500):
+        query = _make_query(rng)
+        expected = {
+            address
+            for address, description in services
+            if (query.model is None or description.data_model == query.model)
+            and query.check(description)
+        }
+        assert directory.search(query) == expected
+
+
+def test_data_model():
+    """Test the search is restricted to the descriptions of the query data model."""
+    directory = ServiceDirectory()
+    directory.add("agent_1", Description({"price": 1}, data_model=OTHER_DATA_MODEL))
+    directory.add("agent_2", Description({"price": 1}, data_model_name="another"))
+    query = Query([Constraint("price", ConstraintType("==", 1))])
+
+    assert directory.search(query) == {"agent_1", "agent_2"}
+    assert directory.search(Query(query.constraints, OTHER_DATA_MODEL)) == {"agent_1"}
+    assert directory.search(Query([], DATA_MODEL)) == set()
+
+
+def test_value_types():
+    """Test the values are only matched by constraints of their type."""
+    directory = ServiceDirectory()
+    directory.add("int", Description({"value": 1}))
+    directory.add("float", Description({"value": 1.0}))
+    directory.add("bool", Description({"value": True}))
+    directory.add("str", Description({"value": "1"}))
+    directory.add("nan", Description({"value": float("nan")}))
+
+    def search(constraint_type: ConstraintType):
+        return directory.search(Query([Constraint("value", constraint_type)]))
+
+    assert search(ConstraintType("==", 1)) == {"int", "bool"}
+    assert search(ConstraintType("==", 1.0)) == {"float"}
+    assert search(ConstraintType("==", "1")) == {"str"}
+    assert search(ConstraintType(">=", 1)) == {"int", "bool"}
+    assert search(ConstraintType("<", 2.0)) == {"float"}
+    assert search(ConstraintType("<", float("nan"))) == set()
+    assert search(ConstraintType("within", ("0", "2"))) == {"str"}
+    assert search(ConstraintType("!=", 2.0)) == {"float", "nan"}
+    assert search(ConstraintType("==", 2)) == set()
+
+
+@pytest.mark.parametrize(
+    "center,location",
+    [
+        (Location(10.0, 179.9), Location(10.0, -179.9)),
+        (Location(89.9, 0.0), Location(89.9, 180.0)),
+        (Location(-89.9, 45.0), Location(-89.95, -135.0)),
+        (Location(0.0, 0.0), Location(0.0, 0.0)),
+    ],
+)
+def test_distance_across_grid_edges(center, location):
+    """Test the locations are found across the antimeridian and the poles."""
+    directory = ServiceDirectory()
+    directory.add("agent", Description({"location": location}))
+    query = Query([Constraint("location", ConstraintType("distance", (center, 50.0)))])
+
+    assert directory.search(query) == {"agent"}
+
+
+def test_remove():
+    """Test the descriptions are removed from the indexes."""
+    directory = ServiceDirectory()
+    description = Description({"price": 1, "location": Location(1.0, 1.0)})
+    directory.add("agent_1", description)
+    directory.add("agent_1", description)
+    directory.add("agent_2", description)
+
+    assert directory.remove("agent_1", description)
+    assert directory.search(Query([])) == {"agent_1", "agent_2"}
+    assert not directory.remove("agent_3", description)
+    directory.remove_address("agent_1")
+    assert directory.search(Query([])) == {"agent_2"}
+    assert directory.remove("agent_2", description)
+    assert len(directory) == 0
+    assert directory._attributes == {}
+    assert (
+        directory.search(Query([Constraint("price", ConstraintType("<=", 1))])) == set()
+    )
+
+
+def test_bad_grid_cell_size():
+    """Test the grid cell size is checked."""
+    with pytest.raises(AEAEnforceError, match="Grid cell size must be in"):
+        ServiceDirectory(grid_cell_size=0.0)
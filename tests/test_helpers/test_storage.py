@@ -22,6 +22,7 @@ import time
 
 import pytest
 
+from aea.helpers.storage.backends.sqlite import SqliteStorageBackend
 from aea.helpers.storage.generic_storage import Storage
 
 
@@ -55,6 +56,42 @@ class TestAsyncCollection:
         s.stop()
         await s.wait_completed()
 
+    @pytest.mark.asyncio
+    async def test_bulk_operations(self):
+        """Test collection bulk methods and transactions."""
+        s = Storage("sqlite://:memory:")
+        s.start()
+
+        await s.wait_connected()
+
+        col = await s.get_collection("test_col")
+        objects = [(str(i), {"a": i}) for i in range(1200)]
+        await col.put_many(objects)
+        assert await col.get_many(["3", "not exists", "1", "1100"]) == [
+            ("3", {"a": 3}),
+            ("1", {"a": 1}),
+            ("1100", {"a": 1100}),
+        ]
+        assert await col.get_many([obj_id for obj_id, _ in objects]) == objects
+
+        await col.remove_many(["3", "1100"])
+        assert await col.get_many(["3", "1", "1100"]) == [("1", {"a": 1})]
+
+        async with col.transaction():
+            await col.put("x", {"a": "x"})
+            await col.remove("1")
+        assert await col.get("x") == {"a": "x"}
+        assert await col.get("1") is None
+
+        with pytest.raises(ValueError, match="oops"):
+            async with col.transaction():
+                await col.put("y", {"a": "y"})
+                raise ValueError("oops")
+        assert await col.get("y") is None
+
+        s.stop()
+        await s.wait_completed()
+
 
 class TestSyncCollection:
     """Test sync storage collection."""
@@ -83,6 +120,21 @@ class TestSyncCollection:
         col.remove(obj_id)
         assert col.get(obj_id) is None
 
+        col.put_many([("1", {"a": 1}), ("2", {"a": 2})])
+        assert col.get_many(["1", "2"]) == [("1", {"a": 1}), ("2", {"a": 2})]
+        col.remove_many(["1"])
+        assert col.get_many(["1", "2"]) == [("2", {"a": 2})]
+
+        with col.transaction():
+            col.put("3", {"a": 3})
+        assert col.get("3") == {"a": 3}
+
+        with pytest.raises(ValueError, match="oops"):
+            with col.transaction():
+                col.put("4", {"a": 4})
+                raise ValueError("oops")
+        assert col.get("4") is None
+
         s.stop()
         s.wait_completed(sync=True, timeout=5)
 
@@ -101,6 +153,14 @@ class TestMisc:
             s.stop()
             s.wait_completed(sync=True, timeout=10)
 
+    def test_sqlite_wal_mode(self, tmp_path):
+        """Test sqlite databases use write-ahead logging."""
+        con = SqliteStorageBackend._do_connect(str(tmp_path / "test.db"))
+        try:
+            assert con.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        finally:
+            con.close()
+
     def test_unsupoported_backend(self):
         """Test unsupported backed raises exception."""
         with pytest.raises(
@@ -25,7 +25,13 @@ import aea
 from aea.configurations.base import PublicId
 from aea.exceptions import AEAEnforceError
 from aea.mail import base_pb2
-from aea.mail.base import Envelope, EnvelopeContext, ProtobufEnvelopeSerializer, URI
+from aea.mail.base import (
+    Envelope,
+    EnvelopeContext,
+    LazyEnvelope,
+    ProtobufEnvelopeSerializer,
+    URI,
+)
 from aea.multiplexer import InBox, Multiplexer, OutBox
 from aea.protocols.base import Message
 
@@ -252,6 +258,104 @@ def test_protobuf_envelope_serializer():
     assert actual_envelope == expected_envelope
 
 
+def test_protobuf_envelope_serializer_decodes_lazily():
+    """Test the Protobuf envelope serializer copies the message only on access."""
+    serializer = ProtobufEnvelopeSerializer()
+    message = DefaultMessage(DefaultMessage.Performative.BYTES, content=b"message")
+    expected_envelope = Envelope(
+        to="to",
+        sender="sender",
+        message=message,
+        context=EnvelopeContext(uri=URI("/uri")),
+    )
+    encoded_envelope = serializer.encode(expected_envelope)
+    actual_envelope = serializer.decode(encoded_envelope)
+
+    assert isinstance(actual_envelope, LazyEnvelope)
+    assert actual_envelope.to == "to"
+    assert actual_envelope.sender == "sender"
+    assert (
+        actual_envelope.protocol_specification_id
+        == DefaultMessage.protocol_specification_id
+    )
+    assert actual_envelope.message_object is None
+    assert not actual_envelope.is_message_loaded
+    # forwarding the envelope unchanged reuses the encoded envelope
+    assert serializer.encode(actual_envelope) is encoded_envelope
+
+    assert actual_envelope.context == expected_envelope.context
+    assert actual_envelope.message_bytes == message.encode()
+    assert actual_envelope.is_message_loaded
+
+    actual_envelope.to = "other"
+    assert actual_envelope.wire_bytes is None
+    assert serializer.decode(serializer.encode(actual_envelope)).to == "other"
+
+
+def test_protobuf_envelope_serializer_decode_matches_protobuf():
+    """Test the header parser handles what the protobuf parser handles."""
+    serializer = ProtobufEnvelopeSerializer()
+    envelope_pb = base_pb2.Envelope()
+    envelope_pb.to = "to"
+    envelope_pb.sender = "sender"
+    envelope_pb.protocol_id = "author/name:0.1.0"
+    envelope_pb.message = b"\x80" * 200
+    encoded_envelope = envelope_pb.SerializeToString()
+
+    # unknown fields are skipped, and the last occurrence of a field wins
+    unknown_fields = b"\x30\x96\x01" + b"\x39" + b"\x00" * 8 + b"\x45" + b"\x00" * 4
+    encoded_envelope = encoded_envelope + unknown_fields + b"\x0a\x03new"
+    actual_envelope = serializer.decode(bytearray(encoded_envelope))
+    expected_envelope = serializer._decode_eagerly(encoded_envelope)
+
+    assert isinstance(actual_envelope, LazyEnvelope)
+    assert actual_envelope.to == "new"
+    assert actual_envelope == expected_envelope
+    assert actual_envelope.encode() == encoded_envelope
+    assert actual_envelope.context is None
+
+    with pytest.raises(Exception):
+        serializer.decode(encoded_envelope[:-1])
+
+
+@pytest.mark.parametrize("message_size", [0, 1, 127, 128, 20000])
+@pytest.mark.parametrize("uri", [None, "/uri"])
+def test_protobuf_envelope_serializer_encode_matches_protobuf(message_size, uri):
+    """Test the envelope encoder writes the same bytes as the protobuf serializer."""
+    serializer = ProtobufEnvelopeSerializer()
+    envelope = Envelope(
+        to="tö",
+        sender="sender",
+        protocol_specification_id=PublicId("author", "name", "0.1.0"),
+        message=b"\x80" * message_size,
+        context=EnvelopeContext(uri=URI(uri)) if uri is not None else None,
+    )
+    envelope_pb = base_pb2.Envelope()
+    envelope_pb.to = envelope.to
+    envelope_pb.sender = envelope.sender
+    envelope_pb.protocol_id = str(envelope.protocol_specification_id)
+    envelope_pb.message = envelope.message_bytes
+    if uri is not None:
+        envelope_pb.uri = uri
+
+    assert serializer.encode(envelope) == envelope_pb.SerializeToString()
+
+
+def test_lazy_envelope_c2c_with_uri_fails():
+    """Test a component to component lazy envelope cannot have a context."""
+    with pytest.raises(
+        AEAEnforceError,
+        match="EnvelopeContext must be None for component to component messages.",
+    ):
+        LazyEnvelope(
+            to="some_author/some_name:0.1.0",
+            sender="some_author/some_name:0.1.0",
+            protocol_specification_id=PublicId("author", "name", "0.1.0"),
+            message=memoryview(b"message"),
+            uri_raw="/uri",
+        )
+
+
 def test_envelope_serialization():
     """Test Envelope.encode and Envelope.decode methods."""
     expected_envelope = Envelope(
@@ -470,8 +470,12 @@ class BaseTestMultiAgentManager(TestCase):
         assert "default_ledger" in agent_overridables
         assert "timeout" in agent_overridables
         assert "description" in agent_overridables
-        assert len(components_overridables) == 2
-        assert "is_abstract" in components_overridables[0]
+        overridables_by_type = {
+            overridables["type"]: overridables
+            for overridables in components_overridables
+        }
+        assert "is_abstract" in overridables_by_type["skill"]
+        assert "check_consistency_on_decode" in overridables_by_type["protocol"]
 
     def test_issue_certificates(self, *args):
         """Test agent alias issue certificates."""
@@ -581,6 +585,119 @@ class TestMultiAgentManagerThreadedModeWithPassword(BaseTestMultiAgentManager):
     PASSWORD = "password"  # nosec
 
 
+class TestMultiAgentManagerSharedMode(BaseTestMultiAgentManager):
+    """Tests for MultiAgentManager in shared mode."""
+
+    MODE = "shared"
+
+    def test_agent_metrics(self, *args):
+        """Test the agent metrics report the scheduling on the shared loop."""
+        self.test_add_agent()
+        with pytest.raises(ValueError, match=" is not running!"):
+            self.manager.get_agent_metrics(self.agent_name)
+
+        self.manager.start_all_agents()
+        agent = self.manager._agents_tasks[self.agent_name].agent
+        wait_for_condition(lambda: agent.runtime.is_running, timeout=10)
+        metrics = self.manager.get_agents_metrics()[self.agent_name]
+        assert metrics["shard"] == "agents_shard_0"
+        assert metrics["cpu_time"] > 0
+        assert metrics["callbacks"] > 0
+        assert metrics["cpu_share"] == 1.0
+        assert metrics["inbox_size"] == 0
+        assert metrics["outbox_size"] == 0
+        assert metrics["decision_maker_queue_size"] == 0
+
+        self.manager.stop_all_agents()
+        wait_for_condition(lambda: self.manager._shards[0].agents_num == 0, timeout=5)
+
+
+@patch("aea.aea_builder.AEABuilder.install_pypi_dependencies")
+class TestMultiAgentManagerMultiprocessMode(TestCase):
+    """Tests for MultiAgentManager in multiprocess mode."""
+
+    def setUp(self):
+        """Set test case."""
+        self.working_dir = "MultiAgentManager_dir"
+        self.project_public_id = MY_FIRST_AEA_PUBLIC_ID
+        assert not os.path.exists(self.working_dir)
+        self.manager = MultiAgentManager(
+            self.working_dir, mode="multiprocess", shards=2
+        )
+        self.manager.start_manager()
+        self.manager.add_project(self.project_public_id, local=True)
+
+    def tearDown(self):
+        """Tear down test case."""
+        self.manager.stop_manager()
+        if os.path.exists(self.working_dir):
+            rmtree(self.working_dir)
+
+    def _get_loads(self):
+        """Get the agents of each worker process."""
+        return [sorted(shard.agents) for shard in self.manager._worker_shards]
+
+    def test_agents_run_in_workers(self, *args):
+        """Test the agents run in the worker processes, balanced on start only."""
+        agent_names = ["agent_0", "agent_1", "agent_2"]
+        for agent_name in agent_names:
+            self.manager.add_agent(self.project_public_id, agent_name)
+        self.manager.start_all_agents()
+        assert self._get_loads() == [["agent_0", "agent_2"], ["agent_1"]]
+        assert sorted(self.manager.list_agents(running_only=True)) == agent_names
+        assert all(info["is_running"] for info in self.manager.list_agents_info())
+
+        metrics = self.manager.get_agents_metrics()
+        pids = {metrics[agent_name]["pid"] for agent_name in agent_names}
+        assert len(pids) == 2 and os.getpid() not in pids
+        assert metrics["agent_1"]["shard"] == "agents_worker_1"
+        assert metrics["agent_1"]["inbox_size"] == 0
+
+        self.manager.stop_agent("agent_1")
+        assert not self.manager.list_agents_info()[1]["is_running"]
+        wait_for_condition(
+            lambda: self._get_loads() == [["agent_0", "agent_2"], []], timeout=20,
+        )
+        # the running agents are not moved when an agent stops
+        assert sorted(self.manager.list_agents(running_only=True)) == [
+            "agent_0",
+            "agent_2",
+        ]
+        assert self.manager.get_agents_metrics()["agent_2"]["pid"] == (
+            metrics["agent_2"]["pid"]
+        )
+
+        self.manager.start_agent("agent_1")
+        assert self._get_loads() == [["agent_0", "agent_2"], ["agent_1"]]
+
+        self.manager.stop_all_agents()
+        assert self._get_loads() == [[], []]
+
+    def test_start_error_reported(self, *args):
+        """Test a failure to start an agent in a worker process is passed to the error callbacks."""
+        callback_mock = Mock()
+        self.manager.add_error_callback(callback_mock)
+        self.manager.add_agent(self.project_public_id, "agent_0")
+        rmtree(
+            os.path.join(
+                self.manager.projects[self.project_public_id].path,
+                "vendor",
+                "fetchai",
+                "skills",
+            )
+        )
+        self.manager.start_agent("agent_0")
+        wait_for_condition(lambda: callback_mock.call_count > 0, timeout=10)
+        assert callback_mock.call_args[0][0] == "agent_0"
+        assert not self.manager.list_agents(running_only=True)
+
+
+def test_invalid_shards_number():
+    """Test MultiAgentManager fails on invalid shards number."""
+    with pytest.raises(ValueError, match="Invalid shards number"):
+        MultiAgentManager("test_dir", mode="shared", shards=0)
+
+
 def test_project_auto_added_removed():
     """Check project auto added and auto removed on agent added/removed."""
     agent_name = "test_agent"
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains tests for aea.manager.scheduler."""
+import threading
+import time
+
+import pytest
+
+from aea.manager.scheduler import (
+    AgentsSharedLoop,
+    SharedLoopShard,
+    run_in_agent_context,
+)
+
+
+def test_callbacks_accounted_per_agent():
+    """Test callbacks are accounted to the agent whose context scheduled them."""
+    loop = AgentsSharedLoop()
+    try:
+        loop.add_agent("agent_1")
+        loop.add_agent("agent_2")
+
+        async def busy(seconds: float) -> None:
+            time.sleep(seconds)
+            loop.call_soon(time.sleep, seconds)
+
+        task_1 = run_in_agent_context("agent_1", loop.create_task, busy(0.01))
+        task_2 = run_in_agent_context("agent_2", loop.create_task, busy(0.03))
+        loop.call_soon(time.sleep, 0.01)
+        loop.run_until_complete(task_1)
+        loop.run_until_complete(task_2)
+        loop.run_until_complete(loop.shutdown_asyncgens())
+
+        stats_1 = loop.agents_stats["agent_1"]
+        stats_2 = loop.agents_stats["agent_2"]
+        assert 0.02 <= stats_1.cpu_time < 0.05
+        assert 0.06 <= stats_2.cpu_time < 0.1
+        assert stats_1.callbacks >= 2
+        assert stats_2.callbacks >= 2
+    finally:
+        loop.close()
+
+
+def test_agent_over_fair_share_deferred():
+    """Test the new callbacks of an agent over its fair share are deferred while others wait."""
+    loop = AgentsSharedLoop()
+    try:
+        loop.add_agent("agent_1")
+        loop.add_agent("agent_2")
+        calls = []
+
+        def greedy() -> None:
+            time.sleep(loop.SCHEDULING_PERIOD * 0.6)
+            calls.append("agent_1")
+            run_in_agent_context("agent_1", loop.call_soon, greedy)
+
+        def polite() -> None:
+            calls.append("agent_2")
+            run_in_agent_context("agent_2", loop.call_soon, polite)
+
+        run_in_agent_context("agent_1", loop.call_soon, greedy)
+        run_in_agent_context("agent_2", loop.call_soon, polite)
+        loop.call_later(loop.SCHEDULING_PERIOD * 4.5, loop.stop)
+        loop.run_forever()
+
+        # without deferral, the greedy agent would run at every loop iteration
+        assert calls[:2] == ["agent_1", "agent_2"]
+        assert 3 <= calls.count("agent_1") <= 6
+        assert calls.count("agent_2") > 10 * calls.count("agent_1")
+        assert loop.agents_stats["agent_1"].deferred > 0
+        assert loop.agents_stats["agent_2"].deferred == 0
+    finally:
+        loop.close()
+
+
+def test_agent_removed():
+    """Test the callbacks of removed agents are not accounted."""
+    loop = AgentsSharedLoop()
+    try:
+        loop.add_agent("agent")
+        loop.remove_agent("agent")
+        run_in_agent_context("agent", loop.call_soon, loop.stop)
+        loop.run_forever()
+        assert loop.agents_stats == {}
+    finally:
+        loop.close()
+
+
+def test_deferred_callbacks_keep_order():
+    """Test the callbacks of an agent run in the order they were scheduled, deferred or not."""
+    loop = AgentsSharedLoop()
+    try:
+        loop.add_agent("agent_1")
+        loop.add_agent("agent_2")
+        calls = []
+
+        def greedy() -> None:
+            time.sleep(loop.SCHEDULING_PERIOD * 0.6)
+            for i in range(3):
+                run_in_agent_context("agent_1", loop.call_soon, calls.append, i)
+            cancelled = run_in_agent_context(
+                "agent_1", loop.call_soon, calls.append, "cancelled"
+            )
+            cancelled.cancel()
+            run_in_agent_context("agent_1", loop.call_soon, calls.append, 3)
+
+        run_in_agent_context("agent_2", loop.call_soon, time.sleep, 0.0)
+        run_in_agent_context("agent_1", loop.call_soon, greedy)
+        run_in_agent_context("agent_2", loop.call_soon, time.sleep, 0.0)
+        loop.call_later(loop.SCHEDULING_PERIOD * 2, loop.stop)
+        loop.run_forever()
+
+        assert calls == [0, 1, 2, 3]
+        assert loop.agents_stats["agent_1"].deferred == 5
+        assert not loop.agents_stats["agent_1"].ready_handles
+        assert not loop.agents_stats["agent_1"].deferred_handles
+        assert not loop.agents_stats["agent_2"].ready_handles
+    finally:
+        loop.close()
+
+
+def test_closed_loop_rejects_agent_callbacks():
+    """Test the callbacks of agents can not be scheduled on a closed loop."""
+    loop = AgentsSharedLoop()
+    loop.add_agent("agent")
+    loop.close()
+    with pytest.raises(RuntimeError, match="Event loop is closed"):
+        run_in_agent_context("agent", loop.call_soon, time.sleep, 0.0)
+    with pytest.raises(RuntimeError, match="Event loop is closed"):
+        run_in_agent_context("agent", loop.call_later, 0.0, time.sleep, 0.0)
+
+
+def test_agents_added_while_shard_running():
+    """Test agents are added and removed from the loop thread while other agents run on the shard."""
+    shard = SharedLoopShard("test_shard")
+    shard.start()
+    errors = []
+    stop_event = threading.Event()
+
+    def busy(agent_name: str) -> None:
+        try:
+            time.sleep(0.001)
+        except Exception as e:  # pragma: nocover
+            errors.append(e)
+        if not stop_event.is_set():
+            run_in_agent_context(agent_name, shard.loop.call_soon, busy, agent_name)
+
+    def start_agent(agent_name: str) -> None:
+        shard.loop.add_agent(agent_name)
+        run_in_agent_context(agent_name, shard.loop.call_soon, busy, agent_name)
+
+    try:
+        for i in range(20):
+            agent_name = f"agent_{i}"
+            shard.agents.add(agent_name)
+            shard.loop.call_soon_threadsafe(start_agent, agent_name)
+            shard.get_agent_stats(agent_name, timeout=5)
+            time.sleep(0.005)
+        time.sleep(shard.loop.SCHEDULING_PERIOD * 2)
+        stats = shard.get_agent_stats("agent_0", timeout=5)
+        assert stats["shard"] == "test_shard"
+        assert stats["callbacks"] > 0
+        assert 0.0 < stats["cpu_share"] < 1.0
+        assert shard.agents_num == 20
+        stop_event.set()
+        shard.loop.call_soon_threadsafe(shard.loop.remove_agent, "agent_0")
+        assert shard.get_agent_stats("agent_0", timeout=5) == {}
+        assert errors == []
+    finally:
+        stop_event.set()
+        shard.stop(timeout=5)
@@ -35,12 +35,21 @@ from pexpect.exceptions import EOF  # type: ignore
 
 import aea
 from aea.cli.core import cli
+from aea.configurations.base import ConnectionConfig, PublicId
 from aea.configurations.constants import DEFAULT_LEDGER
 from aea.connections.base import ConnectionStates
+from aea.exceptions import AEAEnforceError
 from aea.helpers.exception_policy import ExceptionPolicyEnum
 from aea.identity.base import Identity
-from aea.mail.base import AEAConnectionError, Envelope, EnvelopeContext
-from aea.multiplexer import AsyncMultiplexer, InBox, Multiplexer, OutBox
+from aea.mail.base import AEAConnectionError, Envelope, EnvelopeContext, Full
+from aea.multiplexer import (
+    AsyncMultiplexer,
+    BackpressurePolicyEnum,
+    ConnectionSendWorker,
+    InBox,
+    Multiplexer,
+    OutBox,
+)
 from aea.test_tools.click_testing import CliRunner
 
 from packages.fetchai.connections.local.connection import LocalNode
@@ -64,6 +73,7 @@ from .conftest import (
 )
 from tests.common.pexpect_popen import PexpectWrapper
 from tests.common.utils import wait_for_condition
+from tests.data.dummy_connection.connection import DummyConnection
 
 
 UnknownProtocolMock = Mock()
@@ -307,12 +317,23 @@ async def test_sending_loop_does_not_start_if_multiplexer_not_connected():
 
 @pytest.mark.asyncio
 async def test_sending_loop_cancelled():
-    """Test the case when the sending loop is cancelled."""
-    multiplexer = Multiplexer([_make_dummy_connection()])
+    """Test the case when the sending loop is cancelled, as it does not stop in time on disconnect."""
+    connection = _make_dummy_connection()
+    multiplexer = Multiplexer([connection])
+    multiplexer.DISCONNECT_TIMEOUT = 0.1
+
+    async def send(envelope):
+        await asyncio.sleep(10)
 
     multiplexer.connect()
     await asyncio.sleep(0.1)
-    with unittest.mock.patch.object(multiplexer.logger, "debug") as mock_logger_debug:
+    with unittest.mock.patch.object(
+        connection, "send", side_effect=send
+    ), unittest.mock.patch.object(multiplexer.logger, "debug") as mock_logger_debug:
+        msg = DefaultMessage(performative=DefaultMessage.Performative.BYTES)
+        msg.to = "to"
+        msg.sender = "sender"
+        multiplexer.put(Envelope(to="to", sender="sender", message=msg))
         multiplexer.disconnect()
         mock_logger_debug.assert_any_call("Sending loop cancelled.")
 
@@ -1119,3 +1140,445 @@ async def test_stops_on_connectionerror_during_connect():
             await multiplexer.connect()
 
     assert multiplexer.connection_status.is_disconnected
+
+
+@pytest.mark.asyncio
+async def test_batched_send_and_receive():
+    """Test envelopes are drained from the out queue in batches and keep their order."""
+    connection = _make_dummy_connection()
+    multiplexer = AsyncMultiplexer(
+        [connection], loop=asyncio.get_event_loop(), batch_size=10
+    )
+    assert multiplexer.batch_size == 10
+    envelopes = []
+    for i in range(5):
+        msg = DefaultMessage(
+            performative=DefaultMessage.Performative.BYTES, content=str(i).encode()
+        )
+        msg.to = "to"
+        msg.sender = "sender"
+        envelopes.append(Envelope(to="to", sender="sender", message=msg))
+
+    try:
+        await multiplexer.connect()
+        with patch.object(
+            connection, "send_batch", wraps=connection.send_batch
+        ) as send_batch_mock:
+            for envelope in envelopes:
+                multiplexer.put(envelope)
+
+            received = [await multiplexer.async_get() for _ in envelopes]
+
+        send_batch_mock.assert_called_once_with(envelopes)
+        assert received == envelopes
+    finally:
+        await multiplexer.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_batched_send_loop_stopped_on_disconnect():
+    """Test the envelopes queued before the 'stop' token of a disconnection are sent in the last batch."""
+    connection = _make_dummy_connection()
+    multiplexer = AsyncMultiplexer(
+        [connection], loop=asyncio.get_event_loop(), batch_size=10
+    )
+    envelopes = []
+    for i in range(3):
+        msg = DefaultMessage(
+            performative=DefaultMessage.Performative.BYTES, content=str(i).encode()
+        )
+        msg.to = "to"
+        msg.sender = "sender"
+        envelopes.append(Envelope(to="to", sender="sender", message=msg))
+
+    batches = []
+    first_batch_sent = asyncio.Event()
+    release_first_batch = asyncio.Event()
+
+    async def send_batch(batch):
+        batches.append(list(batch))
+        if len(batches) == 1:
+            first_batch_sent.set()
+            await release_first_batch.wait()
+
+    async def send(envelope):
+        await send_batch([envelope])
+
+    await multiplexer.connect()
+    send_loop_task = multiplexer._send_loop_task
+    with patch.object(connection, "send", side_effect=send), patch.object(
+        connection, "send_batch", side_effect=send_batch
+    ):
+        multiplexer.put(envelopes[0])
+        await asyncio.wait_for(first_batch_sent.wait(), timeout=5)
+        multiplexer.put(envelopes[1])
+        multiplexer.put(envelopes[2])
+
+        disconnect_task = asyncio.ensure_future(multiplexer.disconnect())
+        while multiplexer.out_queue.qsize() < 3:  # the 'stop' token is queued
+            await asyncio.sleep(0.01)
+        release_first_batch.set()
+        await asyncio.wait_for(disconnect_task, timeout=10)
+
+    assert batches == [envelopes[:1], envelopes[1:]]
+    assert send_loop_task.done() and not send_loop_task.cancelled()
+    assert multiplexer.connection_status.is_disconnected
+
+
+@pytest.mark.asyncio
+async def test_send_batch_groups_envelopes_by_connection():
+    """Test a batch is split by destination connection preserving the order."""
+    multiplexer = AsyncMultiplexer(batch_size=10)
+    sent = {}
+
+    def _make_connection(name):
+        connection = Mock()
+        connection.connection_id = PublicId("author", name, "0.1.0")
+
+        async def send_batch(batch):
+            sent.setdefault(name, []).extend(batch)
+
+        connection.send_batch = send_batch
+        return connection
+
+    connection_1 = _make_connection("conn_1")
+    connection_2 = _make_connection("conn_2")
+    envelopes = [Mock(to=str(i)) for i in range(6)]
+    routing = {
+        envelope: connection_1 if i % 2 == 0 else connection_2
+        for i, envelope in enumerate(envelopes)
+    }
+
+    with patch.object(
+        multiplexer, "_get_connection_for_envelope", side_effect=routing.get
+    ):
+        await multiplexer._send_batch(envelopes)
+
+    assert sent["conn_1"] == envelopes[0::2]
+    assert sent["conn_2"] == envelopes[1::2]
+
+
+@pytest.mark.asyncio
+async def test_send_batch_timeout_per_envelope():
+    """Test the send timeout of a batch scales with the number of envelopes."""
+    multiplexer = AsyncMultiplexer(batch_size=10)
+    multiplexer.SEND_TIMEOUT = 0.05
+    connection = Mock()
+    connection.connection_id = PublicId("author", "conn", "0.1.0")
+
+    async def send(*args):
+        await asyncio.sleep(0.1)
+
+    connection.send = send
+    connection.send_batch = send
+    envelopes = [Mock(to=str(i)) for i in range(4)]
+
+    with patch.object(
+        multiplexer, "_get_connection_for_envelope", return_value=connection
+    ), patch.object(multiplexer, "_handle_exception") as handle_exception_mock:
+        await multiplexer._send_batch(envelopes)
+        handle_exception_mock.assert_not_called()
+
+        await multiplexer._send_batch(envelopes[:1])
+        handle_exception_mock.assert_called_once()
+        assert isinstance(handle_exception_mock.call_args[0][1], asyncio.TimeoutError)
+
+
+@pytest.mark.asyncio
+async def test_default_receive_batch():
+    """Test the default receive batch implementation of a connection."""
+    connection = _make_dummy_connection()
+    envelope = Mock()
+    with patch.object(connection, "receive", side_effect=[envelope, None]):
+        assert await connection.receive_batch(10) == [envelope]
+        assert await connection.receive_batch(10) == []
+
+
+def test_batch_size_validated():
+    """Test the batch size must be positive."""
+    with pytest.raises(AEAEnforceError, match="Batch size must be a positive integer."):
+        AsyncMultiplexer(batch_size=0)
+
+
+class OtherDummyConnection(DummyConnection):
+    """A dummy connection with a different id."""
+
+    connection_id = PublicId.from_str("fetchai/other_dummy:0.1.0")
+
+
+def _make_envelope(content: bytes, connection_id=None) -> Envelope:
+    msg = DefaultMessage(
+        performative=DefaultMessage.Performative.BYTES, content=content
+    )
+    msg.to = "to"
+    msg.sender = "sender"
+    context = EnvelopeContext(connection_id=connection_id) if connection_id else None
+    return Envelope(to="to", sender="sender", message=msg, context=context)
+
+
+@pytest.mark.asyncio
+async def test_send_workers_slow_connection_does_not_block_others():
+    """Test a slow connection does not hold up the envelopes of the other ones."""
+    slow_connection = _make_dummy_connection()
+    fast_connection = OtherDummyConnection(
+        configuration=ConnectionConfig(
+            connection_id=OtherDummyConnection.connection_id
+        ),
+        data_dir=MagicMock(),
+        identity=Identity("name", "address"),
+    )
+    multiplexer = AsyncMultiplexer(
+        [slow_connection, fast_connection],
+        loop=asyncio.get_event_loop(),
+        send_queue_high_watermark=10,
+    )
+    assert set(multiplexer.send_workers) == {
+        slow_connection.connection_id,
+        fast_connection.connection_id,
+    }
+    never_done = asyncio.Event()
+
+    async def slow_send(envelope):
+        await never_done.wait()
+
+    try:
+        await multiplexer.connect()
+        with patch.object(slow_connection, "send", side_effect=slow_send):
+            slow_envelope = _make_envelope(b"slow", slow_connection.connection_id)
+            fast_envelope = _make_envelope(b"fast", fast_connection.connection_id)
+            multiplexer.put(slow_envelope)
+            multiplexer.put(fast_envelope)
+
+            received = await asyncio.wait_for(multiplexer.async_get(), timeout=5)
+            assert received == fast_envelope
+            slow_worker = multiplexer.send_workers[slow_connection.connection_id]
+            assert slow_worker.size == 1
+    finally:
+        await multiplexer.disconnect()
+
+
+def test_send_workers_propagate_policy():
+    """Test an exception in a send worker stops the sending loop with propagate policy."""
+    connection = _make_dummy_connection()
+    multiplexer = Multiplexer(
+        [connection], protocols=[DefaultProtocolMock], send_queue_high_watermark=10
+    )
+    multiplexer.connect()
+    exception = ValueError("expected")
+    try:
+        with patch.object(connection, "send", side_effect=exception):
+            multiplexer.put(_make_envelope(b"", connection.connection_id))
+            wait_for_condition(lambda: multiplexer._send_loop_task.done(), timeout=5)
+            assert multiplexer._send_loop_task.exception() == exception
+    finally:
+        multiplexer.disconnect()
+
+
+def test_send_workers_put_in_loop_thread_does_not_block():
+    """Test a put from the event loop thread raises on a full send queue instead of blocking."""
+    connection = _make_dummy_connection()
+    multiplexer = Multiplexer(
+        [connection], protocols=[DefaultProtocolMock], send_queue_high_watermark=2
+    )
+    multiplexer.connect()
+    results = []
+
+    async def slow_send(envelope):
+        await asyncio.sleep(10)
+
+    def put_envelopes():
+        try:
+            for _ in range(3):
+                multiplexer.put(_make_envelope(b"", connection.connection_id))
+                results.append("put")
+        except Full:
+            results.append("full")
+
+    try:
+        with patch.object(connection, "send", side_effect=slow_send):
+            multiplexer._loop.call_soon_threadsafe(put_envelopes)
+            wait_for_condition(lambda: results == ["put", "put", "full"], timeout=5)
+    finally:
+        multiplexer.disconnect()
+
+
+class TestConnectionSendWorker:
+    """Test the backpressure policies of the connection send worker."""
+
+    def _make_worker(self, policy, threaded=False):
+        self.sent = []
+
+        async def send_fn(connection, envelopes):
+            self.sent.extend(envelopes)
+
+        worker = ConnectionSendWorker(
+            Mock(connection_id=PublicId("author", "conn", "0.1.0")),
+            send_fn,
+            high_watermark=2,
+            low_watermark=1,
+            policy=policy,
+            threaded=threaded,
+        )
+        worker.reset()
+        return worker
+
+    @pytest.mark.asyncio
+    async def test_error_policy(self):
+        """Test putting in a full queue raises."""
+        worker = self._make_worker(BackpressurePolicyEnum.error)
+        worker.put(Mock())
+        assert not worker.is_full
+        worker.put(Mock())
+        assert worker.is_full
+        with pytest.raises(Full):
+            worker.put(Mock())
+        with pytest.raises(Full):
+            await worker.async_put(Mock())
+        assert worker.size == 2
+
+    @pytest.mark.asyncio
+    async def test_drop_policy(self):
+        """Test putting in a full queue drops the envelope."""
+        worker = self._make_worker(BackpressurePolicyEnum.drop)
+        envelopes = [Mock() for _ in range(3)]
+        for envelope in envelopes:
+            worker.put(envelope)
+        assert worker.dropped == 1
+
+        task = asyncio.ensure_future(worker.run())
+        try:
+            await asyncio.sleep(0.1)
+            assert self.sent == envelopes[:2]
+            assert worker.size == 0
+            assert not worker.is_full
+        finally:
+            task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_block_policy_async(self):
+        """Test putting in a full queue awaits the queue to drain to the low watermark."""
+        worker = self._make_worker(BackpressurePolicyEnum.block)
+        envelopes = [Mock() for _ in range(3)]
+        worker.put(envelopes[0])
+        worker.put(envelopes[1])
+        put_task = asyncio.ensure_future(worker.async_put(envelopes[2]))
+        await asyncio.sleep(0.1)
+        assert not put_task.done()
+
+        task = asyncio.ensure_future(worker.run())
+        try:
+            await asyncio.wait_for(put_task, timeout=5)
+            await asyncio.sleep(0.1)
+            assert self.sent == envelopes
+        finally:
+            task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_block_policy_threaded(self):
+        """Test putting in a full queue from another thread blocks it until the queue drains."""
+        worker = self._make_worker(BackpressurePolicyEnum.block, threaded=True)
+        envelopes = [Mock() for _ in range(3)]
+        worker.put(envelopes[0])
+        worker.put(envelopes[1])
+        await asyncio.sleep(0.1)
+        put_future = asyncio.get_event_loop().run_in_executor(
+            None, worker.put, envelopes[2]
+        )
+        await asyncio.sleep(0.1)
+        assert not put_future.done()
+
+        task = asyncio.ensure_future(worker.run())
+        try:
+            await asyncio.wait_for(put_future, timeout=5)
+            await asyncio.sleep(0.1)
+            assert self.sent == envelopes
+        finally:
+            task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_reset_logs_dropped_envelopes(self):
+        """Test resetting the queue logs the number of envelopes not sent."""
+        worker = self._make_worker(BackpressurePolicyEnum.error)
+        worker.put(Mock())
+        with patch.object(worker.logger, "warning") as warning_mock:
+            worker.reset()
+        warning_mock.assert_called_once_with(
+            "Dropping 1 envelopes not sent by connection author/conn:0.1.0."
+        )
+        assert worker.size == 0
+
+        with patch.object(worker.logger, "warning") as warning_mock:
+            worker.reset()
+        warning_mock.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_block_policy_in_loop_thread(self):
+        """Test a blocking put from the event loop thread raises, as it can not wait."""
+        for threaded in (False, True):
+            worker = self._make_worker(BackpressurePolicyEnum.block, threaded)
+            worker.put(Mock())
+            worker.put(Mock())
+            with pytest.raises(Full):
+                worker.put(Mock())
+
+
+def test_routing_table():
+    """Test envelopes are routed with the routing table, rebuilt only on changes."""
+    connection = _make_dummy_connection()
+    multiplexer = AsyncMultiplexer([connection], protocols=[DefaultProtocolMock])
+    envelope = Envelope(
+        to="to",
+        sender="sender",
+        protocol_specification_id=DefaultMessage.protocol_specification_id,
+        message=b"",
+    )
+
+    assert multiplexer._get_connection_for_envelope(envelope) == connection
+    assert multiplexer._get_connection_for_envelope(envelope) == connection
+    assert multiplexer.routing_table_stats == {
+        "routes": 2,
+        "rebuilds": 1,
+        "hits": 2,
+        "misses": 0,
+    }
+
+    multiplexer.default_routing = {
+        DefaultMessage.protocol_id: UNKNOWN_CONNECTION_PUBLIC_ID
+    }
+    assert multiplexer._get_connection_for_envelope(envelope) is None
+    stats = multiplexer.routing_table_stats
+    assert stats["rebuilds"] == 2
+    assert stats["misses"] == 1
+
+    unknown_protocol_envelope = Envelope(
+        to="to",
+        sender="sender",
+        message=FipaMessage(performative=FipaMessage.Performative.ACCEPT),
+    )
+    multiplexer.default_routing = {}
+    assert (
+        multiplexer._get_connection_for_envelope(unknown_protocol_envelope)
+        == connection
+    )
+    assert multiplexer.routing_table_stats["misses"] == 2
+
+
+def test_routing_table_unsupported_protocol():
+    """Test the routing table drops envelopes of protocols not supported by the connection."""
+    connection = _make_dummy_connection()
+    connection._configuration.excluded_protocols = {DefaultMessage.protocol_id}
+    multiplexer = AsyncMultiplexer([connection], protocols=[DefaultProtocolMock])
+    envelope = Envelope(
+        to="to",
+        sender="sender",
+        protocol_specification_id=DefaultMessage.protocol_specification_id,
+        message=b"",
+        context=EnvelopeContext(connection_id=connection.connection_id),
+    )
+
+    with patch.object(multiplexer.logger, "warning") as mock_logger_warning:
+        assert multiplexer._get_connection_for_envelope(envelope) is None
+    mock_logger_warning.assert_called_with(
+        f"Connection {connection.connection_id} does not support protocol {DefaultMessage.protocol_id}. It is explicitly excluded."
+    )
+    assert multiplexer.routing_table_stats["hits"] == 1
@@ -24,6 +24,7 @@ from typing import cast
 from unittest.mock import MagicMock, Mock, patch
 
 import aiohttp
+import aiohttp.web
 import pytest
 
 from aea.common import Address
@@ -348,3 +349,73 @@ class TestHTTPClientConnect:
         message = cast(HttpMessage, envelope.message)
         assert message.performative == HttpMessage.Performative.RESPONSE
         assert b"expected exception" in message.body
+
+    def _make_request_envelope(self, url: str, headers: str = "") -> Envelope:
+        """Make a request envelope to the connection."""
+        request_http_message, _ = self.http_dialogs.create(
+            counterparty=self.connection_address,
+            performative=HttpMessage.Performative.REQUEST,
+            method="get",
+            url=url,
+            headers=headers,
+            version="",
+            body=b"",
+        )
+        return Envelope(
+            to=self.connection_address,
+            sender=self.client_skill_id,
+            message=request_http_message,
+        )
+
+    @pytest.mark.asyncio
+    async def test_http_connections_pooled(self):
+        """Test the connections to a server are kept alive and reused by the requests."""
+        requests_headers = []
+
+        async def handler(request: aiohttp.web.Request) -> aiohttp.web.Response:
+            requests_headers.append(request.headers.get("X-Test"))
+            await asyncio.sleep(0.05)
+            return aiohttp.web.Response(text="ok")
+
+        app = aiohttp.web.Application()
+        app.router.add_get("/", handler)
+        runner = aiohttp.web.AppRunner(app)
+        await runner.setup()
+        site = aiohttp.web.TCPSite(runner, self.address, self.port)
+        await site.start()
+        url = f"http://{self.address}:{self.port}/"
+        try:
+            await self.http_client_connection.connect()
+            channel = self.http_client_connection.channel
+            for _ in range(3):
+                await self.http_client_connection.send(
+                    self._make_request_envelope(url, headers="X-Test: value\n")
+                )
+                envelope = await asyncio.wait_for(
+                    self.http_client_connection.receive(), timeout=10
+                )
+                assert envelope.message.status_code == 200
+                assert envelope.message.body == b"ok"
+            assert requests_headers == ["value"] * 3
+
+            stats = channel.get_pool_stats()
+            assert stats["requests"] == 3
+            assert stats["connections_created"] == 1
+            assert stats["connections_reused"] == 2
+            assert stats["reuse_rate"] == 2 / 3
+
+            channel.max_concurrent_requests = 1
+            channel._requests_semaphore = asyncio.Semaphore(1)
+            for _ in range(2):
+                await self.http_client_connection.send(self._make_request_envelope(url))
+            for _ in range(2):
+                await asyncio.wait_for(
+                    self.http_client_connection.receive(), timeout=10
+                )
+            stats = channel.get_pool_stats()
+            assert stats["connections_created"] == 1
+            assert stats["request_wait_time"] > 0
+            assert stats["requests_in_flight"] == 0
+        finally:
+            await self.http_client_connection.disconnect()
+            await runner.cleanup()
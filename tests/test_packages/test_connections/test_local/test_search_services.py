@@ -23,6 +23,11 @@ from typing import cast
 import pytest
 
 from aea.common import Address
+from aea.configurations.base import ConnectionConfig
+from aea.helpers.search.cache import (
+    add_search_cache_observer,
+    remove_search_cache_observer,
+)
 from aea.helpers.search.models import (
     Attribute,
     Constraint,
@@ -31,6 +36,7 @@ from aea.helpers.search.models import (
     Description,
     Query,
 )
+from aea.identity.base import Identity
 from aea.mail.base import Envelope, EnvelopeContext, Message
 from aea.multiplexer import InBox, Multiplexer
 from aea.protocols.dialogue.base import Dialogue as BaseDialogue
@@ -263,6 +269,77 @@ class TestSimpleSearchResult:
         self.node.stop()
 
 
+class TestConstraintsSearchResult:
+    """Test that the search results satisfy the query constraints."""
+
+    def setup(self):
+        """Set up the test."""
+        self.node = LocalNode()
+        self.node.start()
+
+        self.address_1 = "address"
+        self.multiplexer = Multiplexer(
+            [_make_local_connection(self.address_1, self.node,)]
+        )
+        self.multiplexer.connect()
+
+        self.dialogues = OefSearchDialogues(self.address_1)
+        self.data_model = DataModel(
+            "foobar",
+            attributes=[Attribute("foo", int, True), Attribute("bar", str, True)],
+        )
+        register_service_request, _ = self.dialogues.create(
+            counterparty=OEF_LOCAL_NODE_SEARCH_ADDRESS,
+            performative=OefSearchMessage.Performative.REGISTER_SERVICE,
+            service_description=Description(
+                {"foo": 1, "bar": "baz"}, data_model=self.data_model
+            ),
+        )
+        self.multiplexer.put(
+            Envelope(
+                to=register_service_request.to,
+                sender=register_service_request.sender,
+                message=register_service_request,
+            )
+        )
+        wait_for_condition(lambda: self.address_1 in self.node.services, timeout=2.0)
+
+    def _search(self, constraints):
+        """Search the agents, and get the result."""
+        search_services_request, _ = self.dialogues.create(
+            counterparty=OEF_LOCAL_NODE_SEARCH_ADDRESS,
+            performative=OefSearchMessage.Performative.SEARCH_SERVICES,
+            query=Query(constraints=constraints, model=self.data_model),
+        )
+        self.multiplexer.put(
+            Envelope(
+                to=search_services_request.to,
+                sender=search_services_request.sender,
+                message=search_services_request,
+            )
+        )
+        response_envelope = self.multiplexer.get(block=True, timeout=2.0)
+        search_result = cast(OefSearchMessage, response_envelope.message)
+        assert search_result.performative == OefSearchMessage.Performative.SEARCH_RESULT
+        return search_result.agents
+
+    def test_search_result_constraints(self):
+        """Test that only the agents with a description satisfying the constraints are returned."""
+        assert self._search(
+            [
+                Constraint("foo", ConstraintType("<=", 1)),
+                Constraint("bar", ConstraintType("==", "baz")),
+            ]
+        ) == (self.address_1,)
+        assert self._search([Constraint("foo", ConstraintType(">", 1))]) == ()
+        assert self._search([Constraint("bar", ConstraintType("!=", "baz"))]) == ()
+
+    def teardown(self):
+        """Teardown the test."""
+        self.multiplexer.disconnect()
+        self.node.stop()
+
+
 class TestUnregister:
     """Test that the unregister service results to Error Message."""
 
@@ -585,3 +662,158 @@ class TestFilteredSearchResult:
         cls.multiplexer1.disconnect()
         cls.multiplexer2.disconnect()
         cls.node.stop()
+
+
+class TestSearchCache:
+    """Test the search results are cached by the connection, till the agent registrations change."""
+
+    def setup(self):
+        """Set up the test."""
+        self.node = LocalNode()
+        self.node.start()
+
+        self.address_1 = "address_1"
+        self.connection_1 = OEFLocalConnection(
+            configuration=ConnectionConfig(
+                search_cache_ttl=60.0,
+                search_cache_size=10,
+                connection_id=OEFLocalConnection.connection_id,
+            ),
+            data_dir=unittest.mock.MagicMock(),
+            identity=Identity("name", self.address_1),
+            local_node=self.node,
+        )
+        self.multiplexer1 = Multiplexer([self.connection_1])
+        self.address_2 = "address_2"
+        self.multiplexer2 = Multiplexer(
+            [_make_local_connection(self.address_2, self.node,)]
+        )
+        self.multiplexer1.connect()
+        self.multiplexer2.connect()
+        self.dialogues_1 = OefSearchDialogues(self.address_1)
+        self.dialogues_2 = OefSearchDialogues(self.address_2)
+        self.data_model = DataModel(
+            "foobar",
+            attributes=[Attribute("foo", int, True), Attribute("bar", str, True)],
+        )
+        self.service_description = Description(
+            {"foo": 1, "bar": "baz"}, data_model=self.data_model
+        )
+
+    def _send(self, multiplexer, dialogues, performative, **kwargs):
+        """Send an oef search message."""
+        message, _ = dialogues.create(
+            counterparty=OEF_LOCAL_NODE_SEARCH_ADDRESS,
+            performative=performative,
+            **kwargs,
+        )
+        multiplexer.put(Envelope(to=message.to, sender=message.sender, message=message))
+
+    def _search(self):
+        """Search the services of the agents, and get the result."""
+        self._send(
+            self.multiplexer1,
+            self.dialogues_1,
+            OefSearchMessage.Performative.SEARCH_SERVICES,
+            query=Query(constraints=[], model=self.data_model),
+        )
+        response_envelope = self.multiplexer1.get(block=True, timeout=2.0)
+        search_result = cast(OefSearchMessage, response_envelope.message)
+        assert self.dialogues_1.update(search_result) is not None
+        assert search_result.performative == OefSearchMessage.Performative.SEARCH_RESULT
+        return search_result.agents
+
+    def test_search_cached(self):
+        """Test a repeated search is answered from the cache, till the agent registers a service."""
+        observer = unittest.mock.MagicMock()
+        add_search_cache_observer(self.address_1, observer)
+        try:
+            self._send(
+                self.multiplexer2,
+                self.dialogues_2,
+                OefSearchMessage.Performative.REGISTER_SERVICE,
+                service_description=self.service_description,
+            )
+            wait_for_condition(
+                lambda: self.address_2 in self.node.services, timeout=2.0
+            )
+            assert self._search() == (self.address_2,)
+
+            # the cached result does not see the changes of the other agents
+            self._send(
+                self.multiplexer2,
+                self.dialogues_2,
+                OefSearchMessage.Performative.UNREGISTER_SERVICE,
+                service_description=self.service_description,
+            )
+            wait_for_condition(
+                lambda: self.address_2 not in self.node.services, timeout=2.0
+            )
+            assert self._search() == (self.address_2,)
+
+            # but is invalidated by the changes of the agent
+            self._send(
+                self.multiplexer1,
+                self.dialogues_1,
+                OefSearchMessage.Performative.REGISTER_SERVICE,
+                service_description=self.service_description,
+            )
+            wait_for_condition(
+                lambda: self.address_1 in self.node.services, timeout=2.0
+            )
+            assert self._search() == (self.address_1,)
+        finally:
+            remove_search_cache_observer(self.address_1, observer)
+
+        assert [c[0][1] for c in observer.call_args_list] == ["miss", "hit", "miss"]
+        assert self.connection_1._search_cache.get_stats()["invalidations"] == 1
+
+    def test_pending_searches_forgotten(self):
+        """Test the searches are no longer tracked once answered with an error, or when too many."""
+        query = Query(constraints=[], model=self.data_model)
+        message, dialogue = self.dialogues_1.create(
+            counterparty=OEF_LOCAL_NODE_SEARCH_ADDRESS,
+            performative=OefSearchMessage.Performative.SEARCH_SERVICES,
+            query=query,
+        )
+        assert not self.connection_1._answer_from_search_cache(message)
+        assert len(self.connection_1._pending_searches) == 1
+
+        error = OefSearchMessage(
+            performative=OefSearchMessage.Performative.OEF_ERROR,
+            dialogue_reference=(message.dialogue_reference[0], "node"),
+            message_id=message.message_id + 1,
+            target=message.message_id,
+            oef_error_operation=OefSearchMessage.OefErrorOperation.SEARCH_SERVICES,
+        )
+        error.to = self.address_1
+        error.sender = OEF_LOCAL_NODE_SEARCH_ADDRESS
+        self.connection_1._cache_search_result(
+            Envelope(to=error.to, sender=error.sender, message=error)
+        )
+        assert len(self.connection_1._pending_searches) == 0
+        assert self.connection_1._search_cache.get(query) is None
+
+        with unittest.mock.patch(
+            "packages.fetchai.connections.local.connection.MAX_PENDING_SEARCHES", 2
+        ):
+            messages = [
+                self.dialogues_1.create(
+                    counterparty=OEF_LOCAL_NODE_SEARCH_ADDRESS,
+                    performative=OefSearchMessage.Performative.SEARCH_SERVICES,
+                    query=query,
+                )[0]
+                for _ in range(3)
+            ]
+            for message in messages:
+                self.connection_1._answer_from_search_cache(message)
+        assert list(self.connection_1._pending_searches) == [
+            (message.dialogue_reference[0], message.message_id)
+            for message in messages[1:]
+        ]
+
+    def teardown(self):
+        """Teardown the test."""
+        self.multiplexer1.disconnect()
+        self.multiplexer2.disconnect()
+        self.node.stop()
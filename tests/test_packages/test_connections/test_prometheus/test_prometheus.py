@@ -26,6 +26,8 @@ import pytest
 from aea.common import Address
 from aea.configurations.base import ConnectionConfig, PublicId
 from aea.exceptions import AEAEnforceError
+from aea.helpers.search.cache import SearchResultCache
+from aea.helpers.search.models import Query
 from aea.identity.base import Identity
 from aea.mail.base import Envelope, Message
 from aea.protocols.dialogue.base import Dialogue as BaseDialogue
@@ -241,3 +243,23 @@ class TestPrometheusConnection:
         assert (
             self.prometheus_con.state == ConnectionStates.disconnected
         ), "should be disconnected"
+
+    @pytest.mark.asyncio
+    async def test_search_cache_metrics(self):
+        """Test the lookups in the search caches of the agent are counted."""
+        await self.prometheus_con.connect()
+        cache = SearchResultCache(10.0, 10, self.agent_address, "some/connection:0.1.0")
+        query = Query([])
+        cache.get(query)
+        cache.put(query, ())
+        cache.get(query)
+        cache.get(query)
+
+        labels = {"cache": "some/connection:0.1.0"}
+        metrics = self.prometheus_con.channel.metrics
+        assert metrics["oef_search_cache_hits"].get(labels) == 2
+        assert metrics["oef_search_cache_misses"].get(labels) == 1
+
+        await self.prometheus_con.disconnect()
+        cache.get(query)
+        assert metrics["oef_search_cache_hits"].get(labels) == 2
@@ -22,9 +22,11 @@ import os
 import shutil
 import tempfile
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, List, Optional
 from unittest.mock import MagicMock, patch
 
+import aiohttp
+import aiohttp.web
 import pytest
 
 from aea.common import Address
@@ -51,7 +53,6 @@ from packages.fetchai.connections.soef.connection import (
     SOEFException,
     SOEFNetworkConnectionError,
     SOEFServerBadResponseError,
-    requests,
 )
 from packages.fetchai.protocols.oef_search.dialogues import OefSearchDialogue
 from packages.fetchai.protocols.oef_search.dialogues import (
@@ -229,8 +230,8 @@ class TestSoef:
             make_async(self.generic_success_response),
         ):
             await self.connection.send(envelope)
+            response = await asyncio.wait_for(self.connection.receive(), timeout=1)
 
-        response = await asyncio.wait_for(self.connection.receive(), timeout=1)
         assert response.message.performative == OefSearchMessage.Performative.SUCCESS
         assert response.message.agents_info.body == {}
 
@@ -255,8 +256,8 @@ class TestSoef:
             make_async(self.generic_success_response),
         ):
             await self.connection.send(envelope)
+            response = await asyncio.wait_for(self.connection.receive(), timeout=1)
 
-        response = await asyncio.wait_for(self.connection.receive(), timeout=1)
         assert response.message.performative == OefSearchMessage.Performative.SUCCESS
         assert response.message.agents_info.body == {}
 
@@ -297,8 +298,8 @@ class TestSoef:
             make_async(self.generic_success_response),
         ):
             await self.connection.send(envelope)
+            response = await asyncio.wait_for(self.connection.receive(), timeout=1)
 
-        response = await asyncio.wait_for(self.connection.receive(), timeout=1)
         assert response.message.performative == OefSearchMessage.Performative.SUCCESS
         assert response.message.agents_info.body == {}
 
@@ -359,7 +360,9 @@ class TestSoef:
             make_async("<response><message>Goodbye!</message></response>"),
         ):
             await self.connection.send(envelope)
+            response = await asyncio.wait_for(self.connection.receive(), timeout=1)
 
+        assert response.message.performative == OefSearchMessage.Performative.SUCCESS
         assert self.connection.channel.unique_page_address is None
 
     @pytest.mark.asyncio
@@ -381,8 +384,8 @@ class TestSoef:
             make_async(self.generic_success_response),
         ):
             await self.connection.send(envelope)
+            response = await asyncio.wait_for(self.connection.receive(), timeout=1)
 
-        response = await asyncio.wait_for(self.connection.receive(), timeout=1)
         assert response.message.performative == OefSearchMessage.Performative.SUCCESS
         assert response.message.agents_info.body == {}
 
@@ -437,8 +440,10 @@ class TestSoef:
             make_async(self.search_empty_response),
         ):
             await self.connection.send(envelope)
+            expected_envelope = await asyncio.wait_for(
+                self.connection.receive(), timeout=1
+            )
 
-        expected_envelope = await asyncio.wait_for(self.connection.receive(), timeout=1)
         assert expected_envelope
         message = expected_envelope.message
         assert message.performative == OefSearchMessage.Performative.OEF_ERROR
@@ -627,52 +632,93 @@ class TestSoef:
     @pytest.mark.asyncio
     async def test_request_text_ok(self):
         """Test internal method request_text works ok."""
-        resp = MagicMock()
-        resp.status_code = 200
-        resp.text = "<a></a>"
-        with patch("aea.helpers.http_requests.request", return_value=resp):
+        with patch.object(
+            self.connection.channel, "_send_request", make_async((200, "<a></a>"))
+        ):
             await self.connection.channel._request_text("get", "http://not-exists.com")
 
     @pytest.mark.asyncio
     async def test_request_text_fail(self):
         """Test internal method request_text fails."""
-        resp = MagicMock()
-        resp.status_code = 400
-        resp.text = "<a></a>"
         with pytest.raises(
             SOEFServerBadResponseError,
             match="<SOEF Server Bad Response Error: Bad server response: code 400 when 2XX expected.",
         ):
-            with patch("aea.helpers.http_requests.request", return_value=resp):
+            with patch.object(
+                self.connection.channel, "_send_request", make_async((400, "<a></a>"))
+            ):
                 await self.connection.channel._request_text(
                     "get", "http://not-exists.com"
                 )
 
-        resp.status_code = 200
-        resp.text = ""
         with pytest.raises(
             SOEFServerBadResponseError,
             match="SOEF Server Bad Response Error: Bad server response: empty response. Request data:",
         ):
-            with patch("aea.helpers.http_requests.request", return_value=resp):
+            with patch.object(
+                self.connection.channel, "_send_request", make_async((200, ""))
+            ):
                 await self.connection.channel._request_text(
                     "get", "http://not-exists.com"
                 )
 
-        resp.status_code = 200
-        resp.text = ""
         with pytest.raises(
             SOEFNetworkConnectionError,
             match="SOEF Network Connection Error:.*expected!",
         ):
-            with patch(
-                "aea.helpers.http_requests.request",
-                side_effect=requests.ConnectionError("expected!"),
-            ):
+            with patch.object(
+                self.connection.channel,
+                "_send_request",
+                side_effect=aiohttp.ClientConnectionError("expected!"),
+            ), patch.object(self.connection.channel, "max_retries", 0):
                 await self.connection.channel._request_text(
                     "get", "http://not-exists.com"
                 )
 
+    @pytest.mark.asyncio
+    async def test_request_text_retry_policy(self):
+        """Test only the connection errors of not idempotent requests are retried."""
+        timeouts = []
+        results: List[Any] = []
+
+        async def send_request(method, url, params, timeout):
+            timeouts.append(timeout)
+            result = results.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        connector_error = aiohttp.ClientConnectorError(
+            MagicMock(), OSError("expected!")
+        )
+        channel = self.connection.channel
+        with patch.object(channel, "_send_request", send_request), patch.object(
+            channel, "retry_backoff", 0.0
+        ):
+            results[:] = [asyncio.TimeoutError(), (200, "<a></a>")]
+            assert await channel._request_text("get", "http://not-exists.com")
+            assert timeouts == [channel.DEFAULT_REQUEST_TIMEOUT] * 2
+
+            results[:] = [asyncio.TimeoutError(), (200, "<a></a>")]
+            with pytest.raises(SOEFNetworkConnectionError):
+                await channel._request_text(
+                    "get", "http://not-exists.com", idempotent=False
+                )
+            assert len(results) == 1
+
+            results[:] = [(503, "<a></a>"), (200, "<a></a>")]
+            with pytest.raises(SOEFServerBadResponseError, match="code 503"):
+                await channel._request_text(
+                    "get", "http://not-exists.com", idempotent=False
+                )
+            assert len(results) == 1
+
+            results[:] = [connector_error, (200, "<a></a>")]
+            assert await channel._request_text(
+                "get", "http://not-exists.com", idempotent=False
+            )
+            assert results == []
+
     @pytest.mark.asyncio
     async def test_set_location(self):
         """Test internal method set location."""
@@ -793,8 +839,8 @@ class TestSoef:
             make_async(self.generic_success_response),
         ):
             await self.connection.send(envelope)
+            response = await asyncio.wait_for(self.connection.receive(), timeout=1)
 
-        response = await asyncio.wait_for(self.connection.receive(), timeout=1)
         assert response.message.performative == OefSearchMessage.Performative.SUCCESS
         assert response.message.agents_info.body == {}
 
@@ -824,3 +870,256 @@ class TestSoef:
                 assert self.connection.channel._ping_periodic_task is not None
                 await asyncio.sleep(0.3)
                 assert mocked_ping.call_count > 1
+
+
+class StandInSOEF:
+    """A local stand-in of the SOEF, answering the commands of the connection."""
+
+    page_address = "oef_C95B21A4D5759C8FE7A6304B62B726AB8077BEE4BA191A7B92B388F9B1"
+
+    def __init__(self, unavailable_responses: int = 0, latency: float = 0.0) -> None:
+        """
+        Initialize the server.
+
+        :param unavailable_responses: the number of 503 responses to send first.
+        :param latency: the time to answer a request, in seconds.
+        """
+        self.unavailable_responses = unavailable_responses
+        self.latency = latency
+        self.requests_count = 0
+        self.commands: List[str] = []
+        self.port = 0
+        self._runner: Optional[aiohttp.web.AppRunner] = None
+
+    async def start(self) -> None:
+        """Start the server on a free port."""
+        app = aiohttp.web.Application()
+        app.router.add_get("/{page:.*}", self._handle)
+        self._runner = aiohttp.web.AppRunner(app)
+        await self._runner.setup()
+        site = aiohttp.web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def _handle(self, request: aiohttp.web.Request) -> aiohttp.web.Response:
+        """Answer a request."""
+        self.requests_count += 1
+        if self.unavailable_responses > 0:
+            self.unavailable_responses -= 1
+            return aiohttp.web.Response(status=503)
+        await asyncio.sleep(self.latency)
+        page = request.match_info["page"]
+        if page == "":
+            return aiohttp.web.Response(text="<response></response>")
+        if page == "register":
+            return aiohttp.web.Response(
+                text=f"<response><token>672DB3B67780F98984ABF1123BD11</token><page_address>{self.page_address}</page_address></response>"
+            )
+        command = request.query["command"]
+        self.commands.append(command)
+        if command == "unregister":
+            return aiohttp.web.Response(
+                text="<response><message>Goodbye!</message></response>"
+            )
+        if command == "find_around_me":
+            return aiohttp.web.Response(text=TestSoef.search_success_response)
+        return aiohttp.web.Response(text=TestSoef.generic_success_response)
+
+
+class TestSoefStandInServer:
+    """Tests of the soef connection against a local stand-in SOEF."""
+
+    def setup(self):
+        """Set up."""
+        self.skill_id = "some_author/some_skill:0.1.0"
+        self.crypto = make_crypto(DEFAULT_LEDGER)
+        self.oef_search_dialogues = OefSearchDialogues(self.skill_id)
+        self.data_dir = tempfile.mkdtemp()
+
+    def teardown(self):
+        """Tear down."""
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+
+    def make_connection(self, port: int, **config: Any) -> SOEFConnection:
+        """Make a connection to the stand-in SOEF."""
+        configuration = ConnectionConfig(
+            api_key="TwiCIriSl0mLahw17pyqoA",
+            soef_addr="127.0.0.1",
+            soef_port=port,
+            is_https=False,
+            restricted_to_protocols={OefSearchMessage.protocol_specification_id},
+            connection_id=SOEFConnection.connection_id,
+            **config,
+        )
+        connection = SOEFConnection(
+            configuration=configuration,
+            data_dir=self.data_dir,
+            identity=Identity("identity", address=self.crypto.address),
+        )
+        connection.channel.FIND_AROUND_ME_REQUEST_DELAY = 0
+        return connection
+
+    def make_search_envelope(self, radius: float) -> Envelope:
+        """Make the envelope of a search around a location."""
+        close_to_my_service = Constraint(
+            "location",
+            ConstraintType("distance", (Location(52.2057092, 2.1183431), radius)),
+        )
+        message, _ = self.oef_search_dialogues.create(
+            counterparty=str(SOEFConnection.connection_id.to_any()),
+            performative=OefSearchMessage.Performative.SEARCH_SERVICES,
+            query=Query([close_to_my_service]),
+        )
+        return Envelope(to=message.to, sender=message.sender, message=message)
+
+    @pytest.mark.asyncio
+    async def test_commands_run_in_order(self):
+        """Test the sent commands run in the background, in order."""
+        server = StandInSOEF(latency=0.05)
+        await server.start()
+        connection = self.make_connection(server.port)
+        await connection.connect()
+        try:
+            keys = [f"key_{i}" for i in range(5)]
+            for key in keys:
+                service_description = Description(
+                    {"key": key, "value": "value"},
+                    data_model=models.SET_SERVICE_KEY_MODEL,
+                )
+                message, _ = self.oef_search_dialogues.create(
+                    counterparty=str(SOEFConnection.connection_id.to_any()),
+                    performative=OefSearchMessage.Performative.REGISTER_SERVICE,
+                    service_description=service_description,
+                )
+                envelope = Envelope(
+                    to=message.to, sender=message.sender, message=message
+                )
+                await asyncio.wait_for(connection.send(envelope), timeout=0.01)
+
+            for _ in keys:
+                response = await asyncio.wait_for(connection.receive(), timeout=5)
+                assert (
+                    response.message.performative
+                    == OefSearchMessage.Performative.SUCCESS
+                )
+            commands = [command for command in server.commands if command != "ping"]
+            registration = ["acknowledge", "set_personality_piece"]
+            assert commands == registration + ["set_service_key"] * len(keys)
+        finally:
+            await connection.disconnect()
+            await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_request_retried(self):
+        """Test the requests are retried on unavailable server responses."""
+        server = StandInSOEF(unavailable_responses=2)
+        await server.start()
+        connection = self.make_connection(
+            server.port, retry_backoff=0.01, connection_check_max_retries=1
+        )
+        try:
+            await connection.connect()
+            assert connection.is_connected
+            assert server.requests_count == 3
+            await connection.disconnect()
+
+            server.unavailable_responses = 5
+            with pytest.raises(
+                SOEFServerBadResponseError, match="Bad server response: code 503"
+            ):
+                await connection.connect()
+        finally:
+            await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_identical_searches_coalesced(self):
+        """Test identical searches pending at the same time are sent once."""
+        server = StandInSOEF(latency=0.1)
+        await server.start()
+        connection = self.make_connection(server.port)
+        connection.channel.unique_page_address = server.page_address
+        await connection.connect()
+        try:
+            connection.channel.unique_page_address = server.page_address
+            envelopes = [self.make_search_envelope(0.1) for _ in range(5)] + [
+                self.make_search_envelope(0.2)
+            ]
+            for envelope in envelopes:
+                await connection.send(envelope)
+
+            for _ in envelopes:
+                response = await asyncio.wait_for(connection.receive(), timeout=5)
+                assert (
+                    response.message.performative
+                    == OefSearchMessage.Performative.SEARCH_RESULT
+                )
+                assert len(response.message.agents) == 2
+            assert server.commands.count("find_around_me") == 2
+        finally:
+            await connection.disconnect()
+            await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_search_queue_bounded(self):
+        """Test the searches exceeding the queue get an error response."""
+        server = StandInSOEF(latency=0.1)
+        await server.start()
+        connection = self.make_connection(server.port, find_around_me_queue_size=1)
+        await connection.connect()
+        try:
+            connection.channel.unique_page_address = server.page_address
+            envelopes = [
+                self.make_search_envelope(radius) for radius in [1.0, 2.0, 3.0]
+            ]
+            for envelope in envelopes:
+                await connection.send(envelope)
+
+            performatives = []
+            for _ in envelopes:
+                response = await asyncio.wait_for(connection.receive(), timeout=5)
+                performatives.append(response.message.performative)
+                if (
+                    response.message.performative
+                    == OefSearchMessage.Performative.OEF_ERROR
+                ):
+                    assert (
+                        response.message.oef_error_operation
+                        == OefSearchMessage.OefErrorOperation.SEARCH_SERVICES
+                    )
+            assert OefSearchMessage.Performative.SEARCH_RESULT in performatives
+            assert OefSearchMessage.Performative.OEF_ERROR in performatives
+        finally:
+            await connection.disconnect()
+            await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_search_cached(self):
+        """Test a repeated search is answered from the cache, till the agent unregisters."""
+        server = StandInSOEF()
+        await server.start()
+        connection = self.make_connection(server.port, search_cache_ttl=60.0)
+        await connection.connect()
+        try:
+            connection.channel.unique_page_address = server.page_address
+            for _ in range(3):
+                await connection.send(self.make_search_envelope(1.0))
+                response = await asyncio.wait_for(connection.receive(), timeout=5)
+                assert (
+                    response.message.performative
+                    == OefSearchMessage.Performative.SEARCH_RESULT
+                )
+                assert len(response.message.agents) == 2
+            assert server.commands.count("find_around_me") == 1
+
+            connection.channel._invalidate_search_cache()
+            await connection.send(self.make_search_envelope(1.0))
+            await asyncio.wait_for(connection.receive(), timeout=5)
+            assert server.commands.count("find_around_me") == 2
+        finally:
+            await connection.disconnect()
+            await server.stop()
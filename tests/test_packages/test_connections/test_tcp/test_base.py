@@ -25,8 +25,12 @@ from asyncio import CancelledError
 
 import pytest
 
+from aea.configurations.base import ConnectionConfig
+from aea.exceptions import AEAEnforceError
+from aea.identity.base import Identity
 from aea.mail.base import Envelope
 
+from packages.fetchai.connections.tcp.tcp_server import TCPServerConnection
 from packages.fetchai.protocols.default.message import DefaultMessage
 
 from tests.conftest import (
@@ -118,3 +122,19 @@ async def test_send_cancelled():
 
     await tcp_client.disconnect()
     await tcp_server.disconnect()
+
+
+def test_bad_max_frame_size():
+    """Test the max frame size is checked."""
+    configuration = ConnectionConfig(
+        address="127.0.0.1",
+        port=get_unused_tcp_port(),
+        max_frame_size=0,
+        connection_id=TCPServerConnection.connection_id,
+    )
+    with pytest.raises(AEAEnforceError, match="Max frame size must be positive."):
+        TCPServerConnection(
+            configuration=configuration,
+            data_dir=unittest.mock.MagicMock(),
+            identity=Identity("name", "address"),
+        )
@@ -25,9 +25,13 @@ import unittest.mock
 
 import pytest
 
+from aea.configurations.base import ConnectionConfig
+from aea.identity.base import Identity
 from aea.mail.base import Envelope
 from aea.multiplexer import Multiplexer
 
+from packages.fetchai.connections.tcp.tcp_client import TCPClientConnection
+from packages.fetchai.connections.tcp.tcp_server import TCPServerConnection
 from packages.fetchai.protocols.default.message import DefaultMessage
 
 from tests.conftest import (
@@ -261,3 +265,123 @@ class TestTCPServerConnection:
 
         await tcp_client.disconnect()
         await tcp_server.disconnect()
+
+
+class TestTCPFraming:
+    """Test the framing of the envelopes."""
+
+    def setup(self):
+        """Set up the test."""
+        self.port = get_unused_tcp_port()
+
+    def make_connection(self, connection_class, address, **config):
+        """Make a server or client connection, with a configuration."""
+        return connection_class(
+            configuration=ConnectionConfig(
+                address="127.0.0.1",
+                port=self.port,
+                connection_id=connection_class.connection_id,
+                **config,
+            ),
+            data_dir=unittest.mock.MagicMock(),
+            identity=Identity("name", address),
+        )
+
+    @staticmethod
+    def make_envelope(to, sender, size):
+        """Make an envelope with a message of a size."""
+        return Envelope(
+            to=to,
+            sender=sender,
+            protocol_specification_id=DefaultMessage.protocol_specification_id,
+            message=b"x" * size,
+        )
+
+    @pytest.mark.asyncio
+    async def test_send_batch(self):
+        """Test a batch of envelopes is written and drained at once, and received in order."""
+        tcp_server = self.make_connection(TCPServerConnection, "address_server")
+        tcp_client = self.make_connection(TCPClientConnection, "address_client")
+        await tcp_server.connect()
+        await tcp_client.connect()
+        await asyncio.sleep(0.1)
+        try:
+            envelopes = [
+                self.make_envelope("address_server", "address_client", size)
+                for size in [0, 10, 2 ** 20, 10]
+            ]
+            with unittest.mock.patch.object(
+                tcp_client._writer, "drain", wraps=tcp_client._writer.drain
+            ) as mock_drain:
+                await tcp_client.send_batch(envelopes)
+            mock_drain.assert_called_once()
+
+            for envelope in envelopes:
+                received = await asyncio.wait_for(tcp_server.receive(), timeout=5.0)
+                assert received == envelope
+        finally:
+            await tcp_client.disconnect()
+            await tcp_server.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_server_max_frame_size(self):
+        """Test the server closes the connection of a client sending a frame too large."""
+        tcp_server = self.make_connection(
+            TCPServerConnection, "address_server", max_frame_size=1000
+        )
+        tcp_client = self.make_connection(TCPClientConnection, "address_client")
+        await tcp_server.connect()
+        await tcp_client.connect()
+        await asyncio.sleep(0.1)
+        try:
+            await tcp_client.send(
+                self.make_envelope("address_server", "address_client", 100)
+            )
+            assert await asyncio.wait_for(tcp_server.receive(), timeout=5.0)
+
+            await tcp_client.send(
+                self.make_envelope("address_server", "address_client", 1000)
+            )
+            with unittest.mock.patch.object(tcp_server.logger, "error") as mock_logger:
+                assert await asyncio.wait_for(tcp_server.receive(), timeout=5.0) is None
+            assert "exceeds the maximum frame size of 1000 bytes" in str(
+                mock_logger.call_args
+            )
+            assert "address_client" not in tcp_server.connections
+        finally:
+            await tcp_client.disconnect()
+            await tcp_server.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_client_max_frame_size(self):
+        """Test the client disconnects from a server sending a frame too large."""
+        tcp_server = self.make_connection(TCPServerConnection, "address_server")
+        tcp_client = self.make_connection(
+            TCPClientConnection, "address_client", max_frame_size=1000
+        )
+        await tcp_server.connect()
+        await tcp_client.connect()
+        await asyncio.sleep(0.1)
+        try:
+            await tcp_server.send(
+                self.make_envelope("address_client", "address_server", 1000)
+            )
+            assert await asyncio.wait_for(tcp_client.receive(), timeout=5.0) is None
+            assert tcp_client.is_disconnected
+        finally:
+            await tcp_server.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_client_closed(self):
+        """Test the server closes the connection of a client closing its stream."""
+        tcp_server = self.make_connection(TCPServerConnection, "address_server")
+        tcp_client = self.make_connection(TCPClientConnection, "address_client")
+        await tcp_server.connect()
+        await tcp_client.connect()
+        await asyncio.sleep(0.1)
+        try:
+            await tcp_client.disconnect()
+            assert await asyncio.wait_for(tcp_server.receive(), timeout=5.0) is None
+            assert "address_client" not in tcp_server.connections
+        finally:
+            await tcp_server.disconnect()
@@ -26,16 +26,18 @@ from copy import copy
 from enum import Enum
 from pathlib import Path
 from typing import Callable, List, Tuple, Type
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from google.protobuf.struct_pb2 import Struct
 
+from aea.configurations.base import ComponentType
+from aea.configurations.loader import load_component_configuration
 from aea.exceptions import AEAEnforceError
 from aea.mail.base import Envelope
 from aea.mail.base_pb2 import DialogueMessage as Pb2DialogueMessage
 from aea.mail.base_pb2 import Message as ProtobufMessage
-from aea.protocols.base import Message, Protocol, Serializer
+from aea.protocols.base import DecodedMessageCache, Message, Protocol, Serializer
 from aea.protocols.dialogue.base import Dialogue, DialogueLabel
 
 from packages.fetchai.protocols.default.dialogues import (
@@ -315,6 +317,98 @@ class TestMessageEncode:
         msg.encode()
 
 
+class TestConsistencyCheckOnDecode:
+    """Test the consistency check of decoded messages can be skipped."""
+
+    def test_check_consistency_on_decode(self):
+        """Test the consistency check runs on decode unless disabled for the protocol."""
+        data = DefaultMessage(
+            DefaultMessage.Performative.BYTES, content=b"hello"
+        ).encode()
+        with patch.object(
+            DefaultMessage, "_is_consistent", return_value=True
+        ) as is_consistent_mock:
+            DefaultMessage.decode(data)
+            assert is_consistent_mock.call_count == 1
+
+            with patch.object(DefaultMessage, "check_consistency_on_decode", False):
+                message = DefaultMessage.decode(data)
+                DefaultMessage(DefaultMessage.Performative.BYTES, content=b"hello")
+            assert is_consistent_mock.call_count == 2
+        assert message.content == b"hello"
+        assert message._is_consistent()
+
+    def test_check_consistency_on_decode_from_configuration(self):
+        """Test the consistency check on decode is set from the protocol configuration."""
+        directory = Path(ROOT_DIR, "packages", "fetchai", "protocols", "default")
+        configuration = load_component_configuration(ComponentType.PROTOCOL, directory)
+        configuration.directory = directory
+        assert configuration.check_consistency_on_decode is None
+        configuration.update({"check_consistency_on_decode": False})
+        assert configuration.json["check_consistency_on_decode"] is False
+        data = DefaultMessage(
+            DefaultMessage.Performative.BYTES, content=b"hello"
+        ).encode()
+        with patch.object(DefaultMessage, "check_consistency_on_decode", True):
+            Protocol.from_config(configuration)
+            assert DefaultMessage.check_consistency_on_decode is False
+            with patch.object(
+                DefaultMessage, "_is_consistent", return_value=True
+            ) as is_consistent_mock:
+                DefaultMessage.decode(data)
+            is_consistent_mock.assert_not_called()
+
+
+class TestDecodedMessageCache:
+    """Test the decoded message cache."""
+
+    def test_decode(self):
+        """Test identical messages are decoded once."""
+        message = DefaultMessage(DefaultMessage.Performative.BYTES, content=b"hello")
+        data = message.encode()
+        serializer = Mock(wraps=DefaultMessage.serializer)
+        cache = DecodedMessageCache(max_size=2)
+
+        first = cache.decode(DefaultMessage.protocol_id, serializer, data)
+        first.sender = "sender"
+        first.to = "to"
+        second = cache.decode(DefaultMessage.protocol_id, serializer, data)
+        assert serializer.decode.call_count == 1
+        assert first is not second
+        assert not second.has_sender and not second.has_to
+        assert second.content == b"hello"
+        assert (cache.hits, cache.misses, cache.hit_rate) == (1, 1, 0.5)
+
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.hit_rate == 0.0
+
+    def test_lru_eviction(self):
+        """Test the least recently used message is evicted."""
+        cache = DecodedMessageCache(max_size=2)
+        encoded = [
+            DefaultMessage(DefaultMessage.Performative.BYTES, content=content).encode()
+            for content in (b"a", b"b", b"c")
+        ]
+        serializer = Mock(wraps=DefaultMessage.serializer)
+        for data in (encoded[0], encoded[1], encoded[0], encoded[2]):
+            cache.decode(DefaultMessage.protocol_id, serializer, data)
+        assert len(cache) == cache.max_size == 2
+        assert serializer.decode.call_count == 3
+
+        cache.decode(DefaultMessage.protocol_id, serializer, encoded[0])
+        assert serializer.decode.call_count == 3
+        cache.decode(DefaultMessage.protocol_id, serializer, encoded[1])
+        assert serializer.decode.call_count == 4
+
+    def test_max_size_validated(self):
+        """Test the max size must be positive."""
+        with pytest.raises(
+            AEAEnforceError, match="Max size must be a positive integer."
+        ):
+            DecodedMessageCache(max_size=0)
+
+
 class TestProtocolFromDir:
     """Test the 'Protocol.from_dir' method."""
 
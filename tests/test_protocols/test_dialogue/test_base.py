@@ -19,6 +19,7 @@
 """This module contains the tests for the dialogue/base.py module."""
 import re
 import sys
+import time
 from typing import FrozenSet, Tuple, Type, cast
 from unittest import mock
 from unittest.mock import Mock, patch
@@ -1203,6 +1204,49 @@ class TestDialoguesBase:
         assert dialogue.last_message.performative == DefaultMessage.Performative.BYTES
         assert dialogue.last_message.content == b"Hello back"
 
+    def test_compact_message_history(self):
+        """Test a dialogue keeping only the most recent message bodies."""
+        msg, own_dialogue = self.own_dialogues.create(
+            self.opponent_address, DefaultMessage.Performative.BYTES, content=b"0"
+        )
+        own_dialogue.max_message_bodies = 1
+        opponent_dialogue = self.opponent_dialogues.update(msg)
+        for i in range(1, 6):
+            msg = opponent_dialogue.reply(
+                target_message=opponent_dialogue.last_message,
+                performative=DefaultMessage.Performative.BYTES,
+                content=str(i).encode(),
+            )
+            assert self.own_dialogues.update(msg) is own_dialogue
+            msg = own_dialogue.reply(
+                target_message=own_dialogue.last_message,
+                performative=DefaultMessage.Performative.BYTES,
+                content=str(i).encode(),
+            )
+            assert self.opponent_dialogues.update(msg) is opponent_dialogue
+
+        assert len(own_dialogue._ordered_message_ids) == 11
+        assert len(own_dialogue._messages) == 2
+        assert own_dialogue.get_message_by_id(1) is None
+        assert own_dialogue._has_message_id(1)
+        assert own_dialogue.last_message.content == b"5"
+        assert own_dialogue.last_incoming_message.content == b"5"
+        assert own_dialogue._outgoing_messages == [own_dialogue.last_outgoing_message]
+        assert str(own_dialogue).count("message_id=") == 11
+
+        restored = own_dialogue.__class__.from_json(
+            own_dialogue.message_class, own_dialogue.json()
+        )
+        assert restored == own_dialogue
+        assert restored.max_message_bodies == 1
+        assert restored._validate_message_target(msg) is None
+
+        own_dialogue.max_message_bodies = None
+        assert len(own_dialogue._messages) == 2
+
+        with pytest.raises(AEAEnforceError, match="must be non negative"):
+            own_dialogue.max_message_bodies = -1
+
     def test_update_positive_existing_dialogue_2(self):
         """Positive test for the 'update' method: the input message is for an existing dialogue from the original sender."""
         msg_1, dialogue = self.own_dialogues.create(
@@ -1801,6 +1845,139 @@ class TestPersistDialoguesStorage:
             is None
         )
 
+    def test_evicted_dialogues_offloaded(self):
+        """Test evicted dialogues in terminal state are put to the storage."""
+        dialogues_storage = PersistDialoguesStorage(self.dialogues)
+        dialogues_storage._skill_component = self.skill_component
+        dialogues_storage.set_terminal_state_eviction_policy(max_dialogues=0)
+        self.dialogues._dialogues_storage = dialogues_storage
+        msg, dialogue = self.dialogues.create(
+            self.opponent_address, DefaultMessage.Performative.BYTES, content=b"Hello"
+        )
+        dialogue.reply(
+            target_message=msg,
+            performative=DefaultMessage.Performative.ERROR,
+            error_code=ErrorCode.UNSUPPORTED_PROTOCOL,
+            error_msg="oops",
+            error_data={},
+        )
+        assert not dialogues_storage.dialogues_in_terminal_state
+        assert not dialogues_storage.dialogues_in_active_state
+        dialogues_storage.flush()
+        assert (
+            dialogues_storage._terminal_dialogues_collection.get(
+                str(dialogue.dialogue_label)
+            )
+            == dialogue.json()
+        )
+
+    def test_write_behind(self):
+        """Test changed dialogues are buffered and flushed incrementally."""
+        dialogues_storage = PersistDialoguesStorage(self.dialogues)
+        dialogues_storage._skill_component = self.skill_component
+        dialogues_storage.WRITE_BEHIND_FLUSH_INTERVAL = 1000
+        self.dialogues._dialogues_storage = dialogues_storage
+        active_collection = dialogues_storage._active_dialogues_collection
+        terminal_collection = dialogues_storage._terminal_dialogues_collection
+
+        msg, dialogue = self.dialogues.create(
+            self.opponent_address, DefaultMessage.Performative.BYTES, content=b"Hello"
+        )
+        label = str(dialogue.dialogue_label)
+        assert active_collection.get(label) is None
+
+        dialogues_storage.flush()
+        assert active_collection.get(label) == dialogue.json()
+
+        dialogue.reply(
+            target_message=msg,
+            performative=DefaultMessage.Performative.ERROR,
+            error_code=ErrorCode.UNSUPPORTED_PROTOCOL,
+            error_msg="oops",
+            error_data={},
+        )
+        assert active_collection.get(label) is not None
+        assert terminal_collection.get(label) is None
+
+        with patch.object(
+            active_collection, "put", wraps=active_collection.put
+        ) as put_mock:
+            dialogues_storage.teardown()
+        put_mock.assert_called_once_with(
+            dialogues_storage.INCOMPLETE_DIALOGUES_OBJECT_NAME, []
+        )
+        assert active_collection.get(label) is None
+        assert terminal_collection.get(label) == dialogue.json()
+
+        with patch.object(terminal_collection, "put_many") as put_many_mock:
+            dialogues_storage.flush()
+        put_many_mock.assert_not_called()
+
+    def test_write_behind_max_pending_writes(self):
+        """Test the buffer is flushed when full."""
+        dialogues_storage = PersistDialoguesStorage(self.dialogues)
+        dialogues_storage._skill_component = self.skill_component
+        dialogues_storage.WRITE_BEHIND_FLUSH_INTERVAL = 1000
+        dialogues_storage.WRITE_BEHIND_MAX_PENDING_WRITES = 2
+        self.dialogues._dialogues_storage = dialogues_storage
+        active_collection = dialogues_storage._active_dialogues_collection
+
+        _, dialogue_1 = self.dialogues.create(
+            self.opponent_address, DefaultMessage.Performative.BYTES, content=b"Hello"
+        )
+        assert active_collection.get(str(dialogue_1.dialogue_label)) is None
+        _, dialogue_2 = self.dialogues.create(
+            self.opponent_address, DefaultMessage.Performative.BYTES, content=b"Hello"
+        )
+        assert active_collection.get(str(dialogue_1.dialogue_label)) is not None
+        assert active_collection.get(str(dialogue_2.dialogue_label)) is not None
+
+        # removing an unflushed dialogue only drops its pending write
+        _, dialogue_3 = self.dialogues.create(
+            self.opponent_address, DefaultMessage.Performative.BYTES, content=b"Hello"
+        )
+        with patch.object(active_collection, "remove") as remove_mock:
+            dialogues_storage.remove(dialogue_3.dialogue_label)
+        remove_mock.assert_not_called()
+        assert not dialogues_storage._pending_writes
+
+        dialogues_storage.remove(dialogue_1.dialogue_label)
+        assert active_collection.get(str(dialogue_1.dialogue_label)) is None
+
+    def test_write_behind_flushed_when_idle(self):
+        """Test the pending writes are flushed when due, without new messages."""
+        dialogues_storage = PersistDialoguesStorage(self.dialogues)
+        dialogues_storage._skill_component = self.skill_component
+        dialogues_storage.WRITE_BEHIND_FLUSH_INTERVAL = 0.1
+        self.dialogues._dialogues_storage = dialogues_storage
+        active_collection = dialogues_storage._active_dialogues_collection
+
+        _, dialogue = self.dialogues.create(
+            self.opponent_address, DefaultMessage.Performative.BYTES, content=b"Hello",
+        )
+        label = str(dialogue.dialogue_label)
+        self.dialogues.flush_if_due()
+        assert active_collection.get(label) is None
+
+        time.sleep(dialogues_storage.WRITE_BEHIND_FLUSH_INTERVAL)
+        self.dialogues.flush_if_due()
+        assert active_collection.get(label) == dialogue.json()
+
+    def test_write_behind_serializes_on_schedule(self):
+        """Test the dialogues are serialized when their write is scheduled, not on flush."""
+        dialogues_storage = PersistDialoguesStorage(self.dialogues)
+        dialogues_storage._skill_component = self.skill_component
+        self.dialogues._dialogues_storage = dialogues_storage
+        active_collection = dialogues_storage._active_dialogues_collection
+
+        _, dialogue = self.dialogues.create(
+            self.opponent_address, DefaultMessage.Performative.BYTES, content=b"Hello",
+        )
+        body = dialogue.json()
+        with patch.object(dialogue, "json", side_effect=RuntimeError("live dialogue")):
+            dialogues_storage.flush()
+        assert active_collection.get(str(dialogue.dialogue_label)) == body
+
 
 class TestPersistDialoguesStorageOffloading:
     """Test PersistDialoguesStorage."""
@@ -2004,6 +2181,133 @@ class TestBaseDialoguesStorage:
         assert not self.storage.dialogues_in_active_state
         assert not self.storage.dialogues_in_terminal_state
 
+    def test_indexes(self):
+        """Test the counterparty, state and reference indexes."""
+        self.storage.add(self.dialogue)
+        self.storage.add(self.dialogue_opponent_started)
+        self.storage.set_incomplete_dialogue(
+            self.dialogue_label_opponent_started.get_incomplete_version(),
+            self.dialogue_label_opponent_started,
+        )
+        assert self.storage.get_dialogues_with_counterparty(self.opponent_address) == [
+            self.dialogue,
+            self.dialogue_opponent_started,
+        ]
+        assert len(self.storage.dialogues_in_active_state) == 2
+
+        # self initiated dialogues take precedence
+        assert (
+            self.storage.get_dialogue_label_by_reference(
+                self.incomplete_reference, self.opponent_address, self.agent_address
+            )
+            == self.dialogue_label
+        )
+        assert (
+            self.storage.get_dialogue_label_by_reference(
+                self.complete_reference, self.opponent_address, self.agent_address
+            )
+            == self.dialogue_label_opponent_started
+        )
+
+        self.storage.remove(self.dialogue_label)
+        assert self.storage.get_dialogues_with_counterparty(self.opponent_address) == [
+            self.dialogue_opponent_started
+        ]
+        assert (
+            self.storage.get_dialogue_label_by_reference(
+                self.incomplete_reference, self.opponent_address, self.agent_address
+            )
+            == self.dialogue_label_opponent_started
+        )
+
+        self.storage.remove(self.dialogue_label_opponent_started)
+        assert self.storage.get_dialogues_with_counterparty(self.opponent_address) == []
+        assert not self.storage.dialogues_in_active_state
+        assert (
+            self.storage.get_dialogue_label_by_reference(
+                self.incomplete_reference, self.opponent_address, self.agent_address
+            )
+            is None
+        )
+        assert not self.storage._dialogue_labels_by_reference
+        assert not self.storage._dialogue_by_address
+
+    def test_terminal_state_eviction_by_count(self):
+        """Test the least recently terminated dialogues are evicted first."""
+        self.storage.set_terminal_state_eviction_policy(max_dialogues=1)
+        self.storage.add(self.dialogue)
+        self.storage.add(self.dialogue_opponent_started)
+
+        self.storage._set_terminal_state(self.dialogue_label)
+        assert self.storage.dialogues_in_terminal_state == [self.dialogue]
+
+        self.storage._set_terminal_state(self.dialogue_label_opponent_started)
+        assert self.storage.dialogues_in_terminal_state == [
+            self.dialogue_opponent_started
+        ]
+        assert self.storage.get(self.dialogue_label) is None
+        assert self.storage.get_dialogues_with_counterparty(self.opponent_address) == [
+            self.dialogue_opponent_started
+        ]
+
+    def test_terminal_state_eviction_by_age(self):
+        """Test expired dialogues in terminal state are swept."""
+        self.storage.set_terminal_state_eviction_policy(max_age=10)
+        self.storage.add(self.dialogue)
+        self.storage.add(self.dialogue_opponent_started)
+        self.storage._set_terminal_state(self.dialogue_label)
+
+        self.storage.sweep()
+        assert self.storage.dialogues_in_terminal_state == [self.dialogue]
+
+        with patch("time.monotonic", return_value=time.monotonic() + 11):
+            self.storage.sweep()
+        assert not self.storage.dialogues_in_terminal_state
+        assert self.storage.dialogues_in_active_state == [
+            self.dialogue_opponent_started
+        ]
+
+    def test_terminal_state_eviction_by_last_message(self):
+        """Test a new message refreshes the age of a dialogue in terminal state."""
+        self.storage.set_terminal_state_eviction_policy(max_age=10)
+        self.storage.add(self.dialogue)
+        self.storage.add(self.dialogue_opponent_started)
+        self.storage._set_terminal_state(self.dialogue_label)
+        self.storage._set_terminal_state(self.dialogue_label_opponent_started)
+
+        now = time.monotonic()
+        with patch("time.monotonic", return_value=now + 5):
+            self.storage.dialogue_update_callback(self.dialogue)
+        assert self.storage.dialogues_in_terminal_state == [
+            self.dialogue_opponent_started,
+            self.dialogue,
+        ]
+
+        with patch("time.monotonic", return_value=now + 11):
+            self.storage.sweep()
+        assert self.storage.dialogues_in_terminal_state == [self.dialogue]
+
+    def test_terminal_state_eviction_sweeper(self):
+        """Test the background sweeper evicts expired dialogues in terminal state."""
+        self.storage.set_terminal_state_eviction_policy(max_age=0.1)
+        self.storage.setup()
+        try:
+            self.storage.add(self.dialogue)
+            self.storage._set_terminal_state(self.dialogue_label)
+            wait_for_condition(
+                lambda: not self.storage.dialogues_in_terminal_state, timeout=5
+            )
+        finally:
+            self.storage.teardown()
+        assert self.storage._sweeper is None
+
+    def test_terminal_state_eviction_policy_bad_values(self):
+        """Test the eviction policy values are validated."""
+        with pytest.raises(AEAEnforceError, match="must be non negative"):
+            self.storage.set_terminal_state_eviction_policy(max_dialogues=-1)
+        with pytest.raises(AEAEnforceError, match="must be positive"):
+            self.storage.set_terminal_state_eviction_policy(max_age=0)
+
     def teardown(self):
         """Tear down the environment to test BaseDialogueStorage."""
 
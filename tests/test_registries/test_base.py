@@ -665,6 +665,26 @@ class TestComponentRegistry:
 
         self.registry.unregister(skill_component_id)
 
+    def test_callbacks(self):
+        """Test callbacks are notified of registrations and unregistrations."""
+        callback = MagicMock()
+        self.registry.add_callback(callback)
+        skill_id = PublicId.from_str("author/skill:0.1.0")
+        item_1, item_2 = MagicMock(), MagicMock()
+        try:
+            self.registry.register((skill_id, "item_1"), item_1)
+            self.registry.register((skill_id, "item_2"), item_2)
+            self.registry.unregister((skill_id, "item_1"))
+            self.registry.unregister_by_skill(skill_id)
+        finally:
+            self.registry.remove_callback(callback)
+        assert [c[0] for c in callback.call_args_list] == [
+            (item_1, True),
+            (item_2, True),
+            (item_1, False),
+            (item_2, False),
+        ]
+
     def test_unregister_when_item_not_registered(self):
         """Test 'unregister' in case the item is not registered."""
         with pytest.raises(ValueError):
@@ -67,6 +67,77 @@ class TestFilter:
         )
         assert len(active_handlers) == 0
 
+    def test_get_active_handlers_cached(self):
+        """Test active handlers are cached till handlers or skills status change."""
+        skill = Skill(
+            SkillConfig("name", "author", "0.1.0"),
+            handlers={},
+            behaviours={},
+            models={},
+        )
+        self.resources.add_skill(skill)
+        handler = DummyHandler(name="dummy", skill_context=skill.skill_context)
+        protocol_id = DummyHandler.SUPPORTED_PROTOCOL
+        try:
+            assert self.filter.get_active_handlers(protocol_id) == ()
+            stats = self.filter.get_active_handlers_cache_stats()
+            assert self.filter.get_active_handlers(protocol_id) == ()
+            assert self.filter.get_active_handlers_cache_stats()["hits"] == (
+                stats["hits"] + 1
+            )
+
+            self.resources.handler_registry.register(
+                (skill.public_id, handler.name), handler
+            )
+            active_handlers = self.filter.get_active_handlers(protocol_id)
+            assert active_handlers == (handler,)
+            assert self.filter.get_active_handlers(protocol_id) is active_handlers
+            assert self.filter.get_active_handlers(protocol_id, skill.public_id) == (
+                handler,
+            )
+
+            skill.skill_context.is_active = False
+            assert self.filter.get_active_handlers(protocol_id) == ()
+            assert self.filter.get_active_handlers(protocol_id, skill.public_id) == ()
+            skill.skill_context.is_active = True
+            assert self.filter.get_active_handlers(protocol_id) == (handler,)
+
+            self.resources.handler_registry.unregister((skill.public_id, handler.name))
+            assert self.filter.get_active_handlers(protocol_id) == ()
+            stats = self.filter.get_active_handlers_cache_stats()
+            assert stats["size"] == 1
+            assert stats["invalidations"] >= 4
+        finally:
+            self.resources.remove_skill(skill.public_id)
+
+    def test_active_handlers_cache_scoped_to_agent(self):
+        """Test the status changes of the skills of another agent do not invalidate the active handlers cache."""
+        other_resources = Resources()
+        skill = Skill(
+            SkillConfig("other", "author", "0.1.0"),
+            handlers={},
+            behaviours={},
+            models={},
+        )
+        other_resources.add_skill(skill)
+        handler = DummyHandler(name="dummy", skill_context=skill.skill_context)
+        other_resources.handler_registry.register(
+            (skill.public_id, handler.name), handler
+        )
+        other_filter = Filter(other_resources, AsyncFriendlyQueue())
+        protocol_id = DummyHandler.SUPPORTED_PROTOCOL
+        assert other_filter.get_active_handlers(protocol_id) == (handler,)
+        self.filter.get_active_handlers(protocol_id)
+        invalidations = self.filter.get_active_handlers_cache_stats()["invalidations"]
+
+        skill.skill_context.is_active = False
+        assert other_filter.get_active_handlers(protocol_id) == ()
+        assert other_filter.get_active_handlers_cache_stats()["invalidations"] == 1
+        assert (
+            self.filter.get_active_handlers_cache_stats()["invalidations"]
+            == invalidations
+        )
+
     def test_get_active_behaviours(self):
         """Test get active behaviours."""
         active_behaviours = self.filter.get_active_behaviours()
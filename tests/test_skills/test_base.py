@@ -263,6 +263,21 @@ class SkillContextTestCase(TestCase):
         obj.is_active = "value"
         debug_mock.assert_called_once()
 
+    @mock.patch("aea.skills.base.SkillContext.skill_id")
+    def test_status_callbacks(self, skill_id_mock):
+        """Test the status callbacks are notified of the changes of status only."""
+        obj = SkillContext("agent_context")
+        callback = mock.Mock()
+        obj.add_status_callback(callback)
+        obj.is_active = True
+        callback.assert_not_called()
+        obj.is_active = False
+        callback.assert_called_once_with(obj, False)
+
+        obj.remove_status_callback(callback)
+        obj.is_active = True
+        callback.assert_called_once()
+
     def test_task_manager_positive(self):
         """Test task_manager property positive result"""
         agent_context = mock.Mock()